@@ -0,0 +1,164 @@
+"""
+Deduplication store benchmark
+
+Compares the compact ProcessedEntry representation with the previous
+dict-backed implementation: memory per entry, load time and save time.
+
+Usage:
+    python -m benchmarks.bench_deduplication --entries 100000
+"""
+
+import argparse
+import gc
+import hashlib
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from src.clients.search_client import normalize_url
+from src.core.deduplication import DeduplicationManager
+
+from .synthetic import generate_store
+
+
+class LegacyProcessedEntry:
+    """The dict-backed entry used before the compact representation"""
+
+    def __init__(self, url: str, title: str, site_name: str,
+                 issue_number: Optional[int] = None, processed_at: Optional[datetime] = None):
+        self.url = url
+        self.normalized_url = normalize_url(url)
+        self.title = title
+        self.site_name = site_name
+        self.issue_number = issue_number
+        self.processed_at = processed_at or datetime.utcnow()
+        content = f"{self.normalized_url}|{self.title.lower().strip()}"
+        self.content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'url': self.url,
+            'normalized_url': self.normalized_url,
+            'title': self.title,
+            'site_name': self.site_name,
+            'issue_number': self.issue_number,
+            'processed_at': self.processed_at.isoformat(),
+            'content_hash': self.content_hash
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LegacyProcessedEntry':
+        entry = cls(
+            url=data['url'],
+            title=data['title'],
+            site_name=data['site_name'],
+            issue_number=data.get('issue_number'),
+            processed_at=datetime.fromisoformat(data['processed_at'])
+        )
+        if 'content_hash' in data:
+            entry.content_hash = data['content_hash']
+        return entry
+
+
+def legacy_load(path: str) -> Tuple[Dict[str, LegacyProcessedEntry], Dict[str, str], Set[str]]:
+    """Load a store and its indexes the way DeduplicationManager used to"""
+    with open(path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    entries = {}
+    url_to_hash = {}
+    title_hashes = set()
+    for entry_data in data.get('entries', []):
+        entry = LegacyProcessedEntry.from_dict(entry_data)
+        entries[entry.content_hash] = entry
+        url_to_hash[entry.normalized_url] = entry.content_hash
+        title_hashes.add(entry.content_hash)
+    return entries, url_to_hash, title_hashes
+
+
+def legacy_save(path: str, entries: Dict[str, LegacyProcessedEntry]) -> None:
+    """Save a store the way DeduplicationManager used to"""
+    data = {
+        'metadata': {'last_updated': datetime.utcnow().isoformat(), 'total_entries': len(entries)},
+        'entries': [entry.to_dict() for entry in entries.values()]
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, indent=2, ensure_ascii=False)
+
+
+def measure(func: Callable[[], Any]) -> Dict[str, Any]:
+    """
+    Run ``func`` twice: once timed, once under tracemalloc.
+
+    Returns:
+        Wall time, memory retained by the result and the result itself
+    """
+    gc.collect()
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'result': result, 'seconds': elapsed, 'retained_bytes': retained}
+
+
+def timed(func: Callable[[], Any]) -> float:
+    """Wall time of one call"""
+    gc.collect()
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def run(count: int) -> List[Dict[str, Any]]:
+    """Benchmark both implementations on a synthetic store"""
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = os.path.join(temp_dir, "processed_urls.json")
+        generate_store(store, count)
+
+        # Both sides include the url_to_hash and title_hashes indexes
+        legacy = measure(lambda: legacy_load(store))
+        legacy_entries = legacy['result'][0]
+        rows.append({
+            'implementation': 'legacy',
+            'load_seconds': legacy['seconds'],
+            'save_seconds': timed(lambda: legacy_save(os.path.join(temp_dir, "legacy.json"), legacy_entries)),
+            'bytes_per_entry': legacy['retained_bytes'] / count,
+        })
+        del legacy, legacy_entries
+
+        # Retention is wide enough that no synthetic entry is dropped
+        compact = measure(lambda: DeduplicationManager(storage_path=store, retention_days=3650))
+        manager = compact['result']
+        manager.storage_path = manager.storage_path.with_name("compact.json")
+        rows.append({
+            'implementation': 'compact',
+            'load_seconds': compact['seconds'],
+            'save_seconds': timed(manager.save_processed_entries),
+            'bytes_per_entry': compact['retained_bytes'] / count,
+        })
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the deduplication store")
+    parser.add_argument('--entries', type=int, default=100000, help="Number of synthetic entries")
+    args = parser.parse_args()
+
+    print(f"{'implementation':<16}{'load (s)':>10}{'save (s)':>10}{'bytes/entry':>14}")
+    for row in run(args.entries):
+        print(f"{row['implementation']:<16}{row['load_seconds']:>10.2f}{row['save_seconds']:>10.2f}"
+              f"{row['bytes_per_entry']:>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
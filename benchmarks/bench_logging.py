@@ -0,0 +1,83 @@
+"""
+Logging overhead benchmark
+
+Processes a batch of synthetic issues (the ``batch.process`` pipeline
+benchmark) under several logging configurations and reports how much each
+adds per processed issue compared with logging switched off. Console output
+is left out, since terminal speed would dominate.
+
+Usage:
+    python -m benchmarks.bench_logging --issues 30 --workers 3
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from src.utils.logging_config import setup_logging, shutdown_logging
+
+from .bench_pipeline import PROJECT_ROOT, BenchParams, Workspace, bench_batch_processing, measure
+from .fakes import FakeModelsServer
+
+
+# Mode name -> setup_logging arguments; None switches logging off
+MODES: Dict[str, Optional[Dict[str, Any]]] = {
+    'disabled': None,
+    'sync': {},
+    'sync, file at DEBUG': {'file_log_level': 'DEBUG'},
+    'queue': {'use_queue': True},
+    'queue, file at DEBUG': {'use_queue': True, 'file_log_level': 'DEBUG'},
+    'queue, DEBUG sampled 10%': {'use_queue': True, 'file_log_level': 'DEBUG', 'debug_sample_rate': 0.1},
+}
+
+
+def run(params: BenchParams, rounds: int = 3) -> List[Dict[str, Any]]:
+    """
+    Time batch processing under every logging mode
+
+    Returns:
+        One row per mode with the median batch time and the overhead per issue
+    """
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir, FakeModelsServer(params.profile()) as server:
+        ws = Workspace(params, temp_dir, server)
+        for mode, options in MODES.items():
+            if options is None:
+                logging.disable(logging.CRITICAL)
+            else:
+                log_file = os.path.join(temp_dir, f"{len(rows)}.log")
+                setup_logging(log_level="INFO", log_file=log_file, enable_console=False, **options)
+            try:
+                result = measure(mode, bench_batch_processing, ws, rounds)
+            finally:
+                logging.disable(logging.NOTSET)
+                shutdown_logging()
+            rows.append({'mode': mode, 'median_seconds': statistics.median(result.rounds)})
+
+    baseline = rows[0]['median_seconds']
+    for row in rows:
+        row['overhead_ms_per_issue'] = (row['median_seconds'] - baseline) * 1000 / params.issues
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark logging overhead during batch processing")
+    parser.add_argument('--issues', type=int, default=30, help="Issues per batch")
+    parser.add_argument('--workers', type=int, default=3, help="Concurrent batch processing workers")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Latency of the fake services")
+    parser.add_argument('--rounds', type=int, default=3, help="Timed rounds per mode")
+    args = parser.parse_args()
+
+    os.chdir(PROJECT_ROOT)
+    params = BenchParams(urls=0, issues=args.issues, latency_ms=args.latency_ms, workers=args.workers)
+
+    print(f"{'mode':<28}{'batch (s)':>10}{'overhead/issue (ms)':>21}")
+    for row in run(params, args.rounds):
+        print(f"{row['mode']:<28}{row['median_seconds']:>10.3f}{row['overhead_ms_per_issue']:>21.2f}")
+
+
+if __name__ == '__main__':
+    main()
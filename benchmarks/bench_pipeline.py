@@ -0,0 +1,497 @@
+"""
+End-to-end pipeline benchmarks
+
+Drives the monitoring cycle, batch issue processing, template rendering,
+content validation, the deduplication store and workflow matching on
+synthetic data, against in-process fakes of Google Custom Search, GitHub and
+GitHub Models (see ``benchmarks.fakes``). Each run is appended to
+``benchmarks/results/history.jsonl`` together with the commit it measured,
+and compared with the previous run at the same parameters so regressions
+between commits show up as a percentage.
+
+Usage:
+    python -m benchmarks.bench_pipeline --scale small
+    python -m benchmarks.bench_pipeline --scale medium --only dedup --rounds 5
+    python -m benchmarks.bench_pipeline --issues 50 --latency-ms 40 --rate-limit 20
+    python -m benchmarks.bench_pipeline --scale small --fail-on-regression 25
+"""
+
+import argparse
+import gc
+import json
+import logging
+import math
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+from src.clients.search_client import SearchResult
+from src.core.batch_processor import BatchConfig, BatchProcessor, BatchProgressReporter
+from src.core.deduplication import DeduplicationManager
+from src.core.issue_processor import IssueProcessor
+from src.core.site_monitor import SiteMonitorService
+from src.agents.content_extraction_agent import ContentExtractionAgent
+from src.utils.config_manager import (
+    AIConfig, DeduplicationConfig, GitHubConfig, MonitorConfig, SearchConfig, SiteConfig
+)
+from src.utils.content_validator import ContentValidator
+from src.workflow.template_engine import TemplateEngine
+from src.workflow.workflow_matcher import WorkflowMatcher
+
+from .fakes import FakeGitHub, FakeModelsServer, FakeSearchService, ServiceProfile
+from .synthetic import (
+    SITE_COUNT, analysis_document, analysis_sections, generate_store, search_items, synthetic_issue
+)
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_FILE = PROJECT_ROOT / "benchmarks" / "results" / "history.jsonl"
+
+SCALES = {
+    'tiny': {'urls': 200, 'issues': 3},
+    'small': {'urls': 1000, 'issues': 10},
+    'medium': {'urls': 100000, 'issues': 100},
+    'large': {'urls': 1000000, 'issues': 1000},
+}
+
+# The Custom Search free tier caps a cycle at this many queries
+MAX_SITES = 90
+
+# Content validation costs about a quarter of a second per document, so
+# larger scales validate a fixed sample
+MAX_VALIDATED_DOCUMENTS = 50
+
+
+@dataclass
+class BenchParams:
+    """Everything a result depends on besides the code"""
+    urls: int
+    issues: int
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_limit: int = 0
+    rate_window: float = 1.0
+    workers: int = 3
+    new_ratio: float = 0.5
+
+    def profile(self) -> ServiceProfile:
+        return ServiceProfile(self.latency_ms, self.jitter_ms, self.rate_limit, self.rate_window)
+
+
+@dataclass
+class BenchResult:
+    """Timings of one benchmark over several rounds"""
+    name: str
+    ops: int
+    rounds: List[float] = field(default_factory=list)
+    # Operations that failed in the last round, e.g. because a service throttled
+    failures: int = 0
+    services: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def min_seconds(self) -> float:
+        return min(self.rounds)
+
+    @property
+    def median_seconds(self) -> float:
+        return statistics.median(self.rounds)
+
+    @property
+    def mean_seconds(self) -> float:
+        return statistics.fmean(self.rounds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'ops': self.ops,
+            'min_seconds': self.min_seconds,
+            'median_seconds': self.median_seconds,
+            'mean_seconds': self.mean_seconds,
+            'rounds': self.rounds,
+            'failures': self.failures,
+            'services': self.services,
+        }
+
+
+class Workspace:
+    """Shared inputs for one run: a temporary directory, the synthetic store and the models server"""
+
+    def __init__(self, params: BenchParams, root: str, models_server: FakeModelsServer):
+        self.params = params
+        self.root = Path(root)
+        self.models_server = models_server
+        self.store = self.root / "store.json"
+        generate_store(str(self.store), params.urls)
+        self._counter = 0
+
+    def fresh_dir(self, name: str) -> Path:
+        """A new empty directory for one round"""
+        self._counter += 1
+        path = self.root / f"{name}-{self._counter}"
+        path.mkdir()
+        return path
+
+    def fresh_store(self) -> Path:
+        """A copy of the synthetic store a round may modify"""
+        path = self.fresh_dir("store") / "processed_urls.json"
+        shutil.copyfile(self.store, path)
+        return path
+
+    def site_count(self) -> int:
+        return min(max(math.ceil(self.params.issues / 10), 1), MAX_SITES)
+
+    def search_results(self) -> Dict[str, List[SearchResult]]:
+        """One page of search results per site, part of them already stored"""
+        results = {}
+        for site in range(self.site_count()):
+            items = search_items(site, 0, 10, self.params.urls, self.params.new_ratio)
+            results[f"Site {site % SITE_COUNT}"] = [
+                SearchResult(item['title'], item['link'], item['snippet'], item['displayLink'])
+                for item in items
+            ]
+        return results
+
+
+@dataclass
+class Prepared:
+    """A benchmark round set up and ready to time"""
+    run: Callable[[], Any]
+    ops: int
+    # Failed operations in the value returned by ``run``
+    failures: Callable[[Any], int] = lambda value: 0
+    # Service name -> callable returning its call statistics
+    services: Dict[str, Callable[[], Dict[str, int]]] = field(default_factory=dict)
+
+
+# A benchmark prepares a round (untimed) and says how many operations it times
+Benchmark = Callable[[Workspace], Prepared]
+
+
+def bench_dedup_load(ws: Workspace) -> Prepared:
+    def run():
+        manager = DeduplicationManager(storage_path=str(ws.store), retention_days=3650)
+        return len(manager.processed_entries)
+    return Prepared(run=run, ops=ws.params.urls)
+
+
+def bench_dedup_filter(ws: Workspace) -> Prepared:
+    manager = DeduplicationManager(storage_path=str(ws.store), retention_days=3650)
+    len(manager.processed_entries)
+    results = ws.search_results()
+
+    def run():
+        return sum(len(manager.filter_new_results(site_results, site_name))
+                   for site_name, site_results in results.items())
+    return Prepared(run=run, ops=sum(len(site_results) for site_results in results.values()))
+
+
+def bench_dedup_save(ws: Workspace) -> Prepared:
+    manager = DeduplicationManager(storage_path=str(ws.fresh_store()), retention_days=3650)
+    results = ws.search_results()
+    for site_name, site_results in results.items():
+        for result in manager.filter_new_results(site_results, site_name):
+            manager.mark_result_processed(result, site_name)
+    return Prepared(run=manager.save_processed_entries, ops=1)
+
+
+def bench_workflow_match(ws: Workspace) -> Prepared:
+    matcher = WorkflowMatcher("docs/workflow/deliverables")
+    label_sets = [synthetic_issue(number)['labels'] for number in range(1, ws.params.issues + 1)]
+
+    def run():
+        return [matcher.get_best_workflow_match(labels)[0] for labels in label_sets]
+    return Prepared(run=run, ops=len(label_sets))
+
+
+def bench_template_render(ws: Workspace) -> Prepared:
+    engine = TemplateEngine("templates")
+    contexts = []
+    for number in range(1, ws.params.issues + 1):
+        issue = synthetic_issue(number)
+        contexts.append({
+            'issue': dict(issue, created_at=None, author='bench'),
+            'deliverable': {'name': 'research_analysis', 'title': 'Research Analysis',
+                            'description': 'Synthetic', 'type': 'document', 'format': 'markdown'},
+            'workflow': {'name': 'Research Analysis', 'description': 'Synthetic'},
+            'research': {'sources': [f"https://site{n}.example.com" for n in range(5)]},
+            'timestamp': '2025-01-01T00:00:00', 'processing_id': f"bench-{number}",
+        })
+    sections = analysis_sections(paragraphs=3)
+
+    def run():
+        return [engine.render_template("research_analysis", context, sections) for context in contexts]
+    return Prepared(run=run, ops=len(contexts))
+
+
+def bench_content_validate(ws: Workspace) -> Prepared:
+    validator = ContentValidator()
+    documents = [analysis_document(paragraphs=4, seed=seed)
+                 for seed in range(min(ws.params.issues, MAX_VALIDATED_DOCUMENTS))]
+
+    def run():
+        return [validator.validate_content(document, document_type="intelligence_analysis")
+                for document in documents]
+    return Prepared(run=run, ops=len(documents))
+
+
+def bench_monitoring_cycle(ws: Workspace) -> Prepared:
+    params = ws.params
+    sites = [SiteConfig(url=f"https://site{site}.example.com", name=f"Site {site}", max_results=10)
+             for site in range(ws.site_count())]
+    config = MonitorConfig(
+        sites=sites,
+        github=GitHubConfig(repository="example/repo"),
+        search=SearchConfig(api_key="bench", search_engine_id="bench"),
+        storage_path=str(ws.fresh_store()),
+        log_level="WARNING",
+        deduplication=DeduplicationConfig(retention_days=3650),
+    )
+    github = FakeGitHub(params.profile())
+    search = FakeSearchService(params.profile(), known_urls=params.urls, new_ratio=params.new_ratio)
+    with mock.patch('src.core.site_monitor.GitHubIssueCreator', lambda token, repository: github):
+        service = SiteMonitorService(config, github_token="bench")
+    service.search_client._service = search
+    service.search_client.rate_limiter.min_interval = 0
+
+    def run():
+        # Only the fakes' latency should count, not the client's courtesy pauses
+        with mock.patch('src.clients.search_client.time', SimpleNamespace(time=time.time, sleep=_no_sleep)):
+            results = service.run_monitoring_cycle()
+        if not results['success']:
+            raise RuntimeError(results['error'])
+        return results
+    return Prepared(run=run, ops=len(sites),
+                    failures=lambda results: results['new_results_found'] - results['individual_issues_created'],
+                    services={'search': search.throttle.stats, 'github': github.throttle.stats})
+
+
+def bench_batch_processing(ws: Workspace) -> Prepared:
+    params = ws.params
+    server = ws.models_server
+    output_dir = ws.fresh_dir("output")
+    config_path = ws.root / "agent-config.yaml"
+    if not config_path.exists():
+        config_path.write_text(
+            "sites:\n  - url: https://site0.example.com\n    name: Site 0\n"
+            "github:\n  repository: example/repo\n"
+            "search:\n  api_key: bench\n  search_engine_id: bench\n"
+            "agent:\n  username: bench-agent\n  workflow_directory: docs/workflow/deliverables\n"
+            "  template_directory: templates\n"
+            "ai:\n  enabled: true\n",
+            encoding='utf-8'
+        )
+    processor = IssueProcessor(config_path=str(config_path), output_base_dir=str(output_dir),
+                               enable_git=False, enable_state_saving=False)
+    agent = ContentExtractionAgent("bench", AIConfig(enabled=True))
+    agent.ai_client.BASE_URL = server.url
+    agent.ai_client.RETRY_DELAY = 0
+    processor.content_extraction_agent = agent
+    processor.enable_ai_extraction = True
+
+    github = FakeGitHub(params.profile())
+    batch = BatchProcessor(
+        processor, github,
+        BatchConfig(max_batch_size=10, max_concurrent_workers=params.workers,
+                    retry_count=1, retry_delay_seconds=0, rate_limit_delay=0),
+        BatchProgressReporter(verbose=False)
+    )
+    issue_numbers = list(range(1, params.issues + 1))
+
+    def run():
+        return batch.process_issues(issue_numbers)[0]
+    return Prepared(run=run, ops=len(issue_numbers), failures=lambda metrics: metrics.error_count,
+                    services={'github': github.throttle.stats, 'models': server.throttle.stats})
+
+
+def _no_sleep(seconds: float) -> None:
+    pass
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    'dedup.load': bench_dedup_load,
+    'dedup.filter': bench_dedup_filter,
+    'dedup.save': bench_dedup_save,
+    'workflow.match': bench_workflow_match,
+    'template.render': bench_template_render,
+    'content.validate': bench_content_validate,
+    'monitor.cycle': bench_monitoring_cycle,
+    'batch.process': bench_batch_processing,
+}
+
+
+def measure(name: str, benchmark: Benchmark, ws: Workspace, rounds: int) -> BenchResult:
+    """Prepare and time ``rounds`` rounds of one benchmark"""
+    result = None
+    for _ in range(rounds):
+        prepared = benchmark(ws)
+        if result is None:
+            result = BenchResult(name=name, ops=prepared.ops)
+        gc.collect()
+        started = time.perf_counter()
+        value = prepared.run()
+        result.rounds.append(time.perf_counter() - started)
+    result.failures = prepared.failures(value)
+    result.services = {service: stats() for service, stats in prepared.services.items()}
+    return result
+
+
+def run(params: BenchParams, rounds: int = 3, only: Optional[List[str]] = None) -> List[BenchResult]:
+    """
+    Run the selected benchmarks
+
+    Args:
+        params: Data sizes and service behaviour
+        rounds: Timed rounds per benchmark
+        only: Name prefixes to run; all benchmarks if empty
+
+    Returns:
+        One result per benchmark, in definition order
+    """
+    selected = [name for name in BENCHMARKS
+                if not only or any(name.startswith(prefix) for prefix in only)]
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir, \
+            FakeModelsServer(params.profile()) as models_server:
+        ws = Workspace(params, temp_dir, models_server)
+        for name in selected:
+            results.append(measure(name, BENCHMARKS[name], ws, rounds))
+    return results
+
+
+def _git(*args: str) -> str:
+    try:
+        completed = subprocess.run(['git', *args], cwd=PROJECT_ROOT, capture_output=True,
+                                   text=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return completed.stdout.strip() if completed.returncode == 0 else ""
+
+
+def build_record(params: BenchParams, results: List[BenchResult]) -> Dict[str, Any]:
+    """History record for a run"""
+    return {
+        'commit': _git('rev-parse', '--short', 'HEAD') or 'unknown',
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+        'recorded_at': datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'params': asdict(params),
+        'results': {result.name: result.to_dict() for result in results},
+    }
+
+
+def previous_record(params: BenchParams, path: Path = RESULTS_FILE) -> Optional[Dict[str, Any]]:
+    """Most recent stored run with the same parameters"""
+    if not path.exists():
+        return None
+    wanted = asdict(params)
+    previous = None
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get('params') == wanted:
+                previous = record
+    return previous
+
+
+def append_record(record: Dict[str, Any], path: Path = RESULTS_FILE) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write(json.dumps(record) + "\n")
+
+
+def regressions(record: Dict[str, Any], previous: Optional[Dict[str, Any]],
+                threshold_percent: float) -> List[str]:
+    """Benchmarks whose median got slower than the previous run by more than the threshold"""
+    if not previous:
+        return []
+    slower = []
+    for name, result in record['results'].items():
+        before = previous['results'].get(name)
+        if before and before['median_seconds'] > 0:
+            change = (result['median_seconds'] / before['median_seconds'] - 1) * 100
+            if change > threshold_percent:
+                slower.append(name)
+    return slower
+
+
+def print_report(record: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> None:
+    if previous:
+        print(f"Compared with {previous['commit']} ({previous['recorded_at'][:19]})")
+    print(f"{'benchmark':<18}{'ops':>7}{'failed':>8}{'min (s)':>10}{'median (s)':>12}{'ops/s':>11}{'change':>9}"
+          f"  services")
+    for name, result in record['results'].items():
+        change = ""
+        before = (previous or {}).get('results', {}).get(name)
+        if before and before['median_seconds'] > 0:
+            change = f"{(result['median_seconds'] / before['median_seconds'] - 1) * 100:+.1f}%"
+        rate = result['ops'] / result['median_seconds'] if result['median_seconds'] else 0
+        services = ", ".join(
+            f"{service} {stats['calls']} calls/{stats['throttled']} throttled"
+            for service, stats in result['services'].items()
+        )
+        print(f"{name:<18}{result['ops']:>7}{result['failures']:>8}{result['min_seconds']:>10.3f}{result['median_seconds']:>12.3f}"
+              f"{rate:>11.1f}{change:>9}  {services}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the monitoring and processing pipeline")
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small',
+                        help="Preset data sizes (overridden by --urls/--issues)")
+    parser.add_argument('--urls', type=int, help="Entries in the synthetic deduplication store")
+    parser.add_argument('--issues', type=int, help="Issues to process and render")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Latency of every fake service")
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help="Random extra latency per call")
+    parser.add_argument('--rate-limit', type=int, default=0,
+                        help="Calls each fake service allows per window (0 for unlimited)")
+    parser.add_argument('--rate-window', type=float, default=1.0, help="Rate limit window in seconds")
+    parser.add_argument('--workers', type=int, default=3, help="Concurrent batch processing workers")
+    parser.add_argument('--rounds', type=int, default=3, help="Timed rounds per benchmark")
+    parser.add_argument('--only', action='append', help="Run benchmarks with this name prefix (repeatable)")
+    parser.add_argument('--no-save', action='store_true', help="Don't append the run to the history")
+    parser.add_argument('--fail-on-regression', type=float, metavar='PERCENT',
+                        help="Exit with status 1 if a median is this much slower than the previous run")
+    parser.add_argument('--verbose', action='store_true', help="Keep application logging")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    scale = SCALES[args.scale]
+    params = BenchParams(
+        urls=args.urls if args.urls is not None else scale['urls'],
+        issues=args.issues if args.issues is not None else scale['issues'],
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit, rate_window=args.rate_window, workers=args.workers,
+    )
+
+    os.chdir(PROJECT_ROOT)
+    record = build_record(params, run(params, rounds=args.rounds, only=args.only))
+    previous = previous_record(params)
+    print_report(record, previous)
+    if not args.no_save:
+        append_record(record)
+
+    if args.fail_on_regression is not None:
+        slower = regressions(record, previous, args.fail_on_regression)
+        if slower:
+            print(f"Regressed by more than {args.fail_on_regression:g}%: {', '.join(slower)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+In-process stand-ins for the external services
+
+The fakes answer the way Google Custom Search, the GitHub REST API and
+GitHub Models do, after a configurable latency, and refuse calls past a
+configurable rate limit the way the real services do (HTTP 429 or a GitHub
+rate-limit error). They let the pipeline benchmarks measure this project's
+own overhead, and how it behaves under slow or throttled backends, without
+network access or tokens.
+"""
+
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Any, Deque, Dict, List, Optional
+
+from src.clients.github_issue_creator import GitHubIssueCreator
+
+from .synthetic import extraction_payload, search_items, synthetic_issue
+
+
+@dataclass
+class ServiceProfile:
+    """Latency and rate limit of a fake service"""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    # Calls allowed per window; 0 means unlimited
+    rate_limit: int = 0
+    window_seconds: float = 1.0
+
+
+class _Throttle:
+    """Sleeps for the profile's latency and tracks calls in a sliding window"""
+
+    def __init__(self, profile: ServiceProfile, seed: int = 0):
+        self.profile = profile
+        self.calls = 0
+        self.throttled = 0
+        self._recent: Deque[float] = deque()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __call__(self) -> bool:
+        """
+        Simulate one call
+
+        Returns:
+            False if the call exceeds the rate limit and must be refused
+        """
+        profile = self.profile
+        with self._lock:
+            self.calls += 1
+            delay = profile.latency_ms + self._random.uniform(0, profile.jitter_ms)
+            allowed = True
+            if profile.rate_limit:
+                now = time.monotonic()
+                while self._recent and now - self._recent[0] >= profile.window_seconds:
+                    self._recent.popleft()
+                if len(self._recent) >= profile.rate_limit:
+                    self.throttled += 1
+                    allowed = False
+                else:
+                    self._recent.append(now)
+        if delay:
+            time.sleep(delay / 1000)
+        return allowed
+
+    def stats(self) -> Dict[str, int]:
+        return {'calls': self.calls, 'throttled': self.throttled}
+
+
+class FakeSearchService:
+    """
+    Stand-in for the ``customsearch`` service built by googleapiclient
+
+    Assign it to ``GoogleCustomSearchClient._service``. Queries restricted to
+    ``site:siteN.example.com`` return synthetic articles from that site, a
+    share of which are already in a store made by ``generate_store``.
+    """
+
+    _SITE_PATTERN = re.compile(r'site:site(\d+)\.example\.com')
+
+    def __init__(self, profile: Optional[ServiceProfile] = None,
+                 known_urls: int = 0, new_ratio: float = 0.5):
+        """
+        Initialize the fake
+
+        Args:
+            profile: Latency and rate limit
+            known_urls: Size of the deduplication store the results overlap with
+            new_ratio: Fraction of each page that is not in the store yet
+        """
+        self.throttle = _Throttle(profile or ServiceProfile())
+        self.known_urls = known_urls
+        self.new_ratio = new_ratio
+        self._queries = itertools.count()
+
+    def cse(self) -> 'FakeSearchService':
+        return self
+
+    def list(self, **params: Any) -> SimpleNamespace:
+        return SimpleNamespace(execute=lambda: self._execute(params))
+
+    def _execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        from googleapiclient.errors import HttpError
+        import httplib2
+
+        if not self.throttle():
+            raise HttpError(httplib2.Response({'status': 429}), b'{"error": {"code": 429}}')
+        match = self._SITE_PATTERN.search(params.get('q', ''))
+        site = int(match.group(1)) if match else 0
+        items = search_items(site, next(self._queries), params.get('num', 10),
+                             self.known_urls, self.new_ratio)
+        return {'items': items, 'searchInformation': {'totalResults': str(len(items))}}
+
+
+class FakeGitHub(GitHubIssueCreator):
+    """
+    In-memory GitHub issue creator
+
+    Inherits the real request building and response shaping and only replaces
+    the calls that would reach the API. Issues it did not create are
+    synthesized on demand by ``synthetic_issue``.
+    """
+
+    def __init__(self, profile: Optional[ServiceProfile] = None,
+                 repository: str = "example/repo"):
+        self.repository = repository
+        self.throttle = _Throttle(profile or ServiceProfile(), seed=1)
+        self.issues: Dict[int, SimpleNamespace] = {}
+        self._numbers = itertools.count(100000)
+        self._lock = threading.Lock()
+
+    def _call(self) -> None:
+        if not self.throttle():
+            raise RuntimeError("GitHub API rate limit exceeded (403)")
+
+    def create_issue(self, title: str, body: str = "", labels: Optional[List[str]] = None,
+                     assignees: Optional[List[str]] = None):
+        self._call()
+        with self._lock:
+            number = next(self._numbers)
+            issue = _issue(number, title, body, labels or [], assignees or [])
+            self.issues[number] = issue
+        return issue
+
+    def get_issue(self, issue_number: int):
+        self._call()
+        issue = self.issues.get(issue_number)
+        if issue is None:
+            data = synthetic_issue(issue_number)
+            issue = _issue(issue_number, data['title'], data['body'], data['labels'], data['assignees'])
+        return issue
+
+    def add_comment(self, issue_number: int, comment_body: str):
+        self._call()
+
+    def assign_issue(self, issue_number: int, assignees: List[str]) -> bool:
+        self._call()
+        return True
+
+    def unassign_issue(self, issue_number: int, assignees: List[str]) -> bool:
+        self._call()
+        return True
+
+
+def _issue(number: int, title: str, body: str, labels: List[str], assignees: List[str]) -> SimpleNamespace:
+    """An object with the attributes read from PyGithub issues"""
+    now = datetime.utcnow()
+    return SimpleNamespace(
+        number=number, title=title, body=body, state='open',
+        labels=[SimpleNamespace(name=name) for name in labels],
+        assignees=[SimpleNamespace(login=login) for login in assignees],
+        created_at=now, updated_at=now,
+        html_url=f"https://github.com/example/repo/issues/{number}"
+    )
+
+
+class FakeModelsServer:
+    """
+    Local HTTP server speaking the GitHub Models chat completions API
+
+    Runs on an ephemeral port; point clients at it with
+    ``client.BASE_URL = server.url``. Every completion returns a synthetic
+    content extraction, and throttled calls get ``429`` with ``Retry-After: 0``
+    so the client's retry path is exercised without waiting.
+    """
+
+    def __init__(self, profile: Optional[ServiceProfile] = None):
+        self.throttle = _Throttle(profile or ServiceProfile(), seed=2)
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                self.rfile.read(length)
+                if not server.throttle():
+                    self._reply(429, {'error': {'code': 'RateLimitReached'}}, {'Retry-After': '0'})
+                    return
+                content = json.dumps(extraction_payload(server.throttle.calls))
+                self._reply(200, {
+                    'choices': [{'message': {'role': 'assistant', 'content': content},
+                                 'finish_reason': 'stop'}],
+                    'usage': {'prompt_tokens': 900, 'completion_tokens': 300, 'total_tokens': 1200},
+                })
+
+            def _reply(self, status: int, payload: Dict[str, Any],
+                       headers: Optional[Dict[str, str]] = None) -> None:
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> 'FakeModelsServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
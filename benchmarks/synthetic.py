@@ -0,0 +1,179 @@
+"""
+Synthetic benchmark data
+
+Deterministic generators for deduplication stores, search results, issues and
+analysis documents, so every run at a given scale sees the same inputs.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from src.core.deduplication import ProcessedEntry
+
+
+SITE_COUNT = 20
+
+# Label sets for the bundled workflows, including one that matches none
+ISSUE_LABEL_SETS = [
+    ['site-monitor', 'research'],
+    ['site-monitor', 'analysis', 'deep-dive'],
+    ['site-monitor', 'technical-review', 'security-review'],
+    ['site-monitor', 'intelligence'],
+    ['site-monitor', 'target-profiler', 'corporate'],
+    ['site-monitor', 'automated'],
+]
+
+_WORDS = (
+    "actor campaign infrastructure domain analysis threat vendor exposure report "
+    "network credential malware disclosure timeline assessment indicator access "
+    "supplier breach research operation patch advisory evidence source"
+).split()
+
+
+def site_domain(site: int) -> str:
+    """Domain of synthetic site ``site``"""
+    return f"site{site % SITE_COUNT}.example.com"
+
+
+def synthetic_url(index: int) -> str:
+    """URL of synthetic article ``index``, with tracking parameters to normalize"""
+    return f"https://{site_domain(index)}/articles/{index}?utm_source=feed&page={index % 7}"
+
+
+def synthetic_title(index: int) -> str:
+    """Title of synthetic article ``index``"""
+    return f"Article {index} about topic {index % 97}"
+
+
+def synthetic_snippet(index: int) -> str:
+    """Snippet of synthetic article ``index``"""
+    rng = random.Random(index)
+    return " ".join(rng.choice(_WORDS) for _ in range(24))
+
+
+def generate_store(path: str, count: int) -> None:
+    """Write a synthetic store with ``count`` entries spread over 20 sites"""
+    now = datetime.utcnow()
+    entries = []
+    for index in range(count):
+        entry = ProcessedEntry(
+            url=synthetic_url(index),
+            title=synthetic_title(index),
+            site_name=f"Site {index % SITE_COUNT}",
+            issue_number=index if index % 3 == 0 else None,
+            processed_at=now - timedelta(minutes=index % 20000)
+        )
+        entries.append(entry.to_dict())
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump({'metadata': {'total_entries': count}, 'entries': entries}, file)
+
+
+def search_items(site: int, start: int, count: int, known: int, new_ratio: float) -> List[Dict[str, Any]]:
+    """
+    Custom Search API items for one query against a synthetic site
+
+    Args:
+        site: Site number the query was restricted to
+        start: Sequence number of the query, so repeated queries find fresh articles
+        count: Number of items to return
+        known: Number of articles already in the deduplication store
+        new_ratio: Fraction of items that are not in the store yet
+
+    Returns:
+        Items in the shape returned by ``cse().list().execute()``
+    """
+    rng = random.Random(start * 7919 + site)
+    new_items = round(count * new_ratio)
+    items = []
+    for offset in range(count):
+        if offset < new_items or known < SITE_COUNT:
+            # Fresh articles live past the end of the store
+            index = known + (start * count + offset) * SITE_COUNT + site % SITE_COUNT
+        else:
+            index = rng.randrange(known // SITE_COUNT) * SITE_COUNT + site % SITE_COUNT
+        items.append({
+            'title': synthetic_title(index),
+            'link': synthetic_url(index),
+            'snippet': synthetic_snippet(index),
+            'displayLink': site_domain(index),
+            'formattedUrl': synthetic_url(index),
+        })
+    return items
+
+
+def synthetic_issue(number: int) -> Dict[str, Any]:
+    """Issue data in the shape returned by ``GitHubIssueCreator.get_issue_data``"""
+    created = datetime(2025, 1, 1) + timedelta(minutes=number)
+    return {
+        'number': number,
+        'title': f"📄 Site {number % SITE_COUNT}: {synthetic_title(number)}",
+        'body': f"# New Update Found\n\n**🔗 URL**: {synthetic_url(number)}\n\n"
+                f"**📝 Snippet**: {synthetic_snippet(number)}\n",
+        'labels': list(ISSUE_LABEL_SETS[number % len(ISSUE_LABEL_SETS)]),
+        'assignees': [],
+        'created_at': created.isoformat(),
+        'updated_at': created.isoformat(),
+        'url': f"https://github.com/example/repo/issues/{number}",
+        'state': 'open',
+    }
+
+
+def extraction_payload(seed: int) -> Dict[str, Any]:
+    """Structured content as the content extraction prompt asks the model to return it"""
+    rng = random.Random(seed)
+    actors = [f"Actor {rng.randrange(1000)}" for _ in range(3)]
+    return {
+        'summary': " ".join(rng.choice(_WORDS) for _ in range(40)),
+        'entities': {
+            'organizations': [f"Vendor {rng.randrange(1000)}" for _ in range(3)],
+            'people': actors,
+            'technologies': ["VPN appliance", "mail gateway"],
+        },
+        'relationships': [
+            {'entity1': actors[0], 'entity2': actors[1], 'relationship': 'collaborates_with',
+             'confidence': 0.7}
+        ],
+        'events': [
+            {'description': "Disclosure of a new campaign", 'timestamp': "2025-01-01",
+             'entities_involved': actors[:2], 'confidence': 0.8}
+        ],
+        'indicators': [
+            {'type': 'domain', 'value': f"c2-{rng.randrange(1000)}.example.net", 'confidence': 0.9}
+        ],
+        'key_topics': rng.sample(_WORDS, 4),
+        'urgency_level': 'medium',
+        'content_type': 'research',
+        'confidence_score': 0.82,
+    }
+
+
+def analysis_sections(paragraphs: int, seed: int = 0) -> Dict[str, str]:
+    """Section bodies for the research analysis template"""
+    rng = random.Random(seed)
+    names = ['executive_summary', 'research_scope', 'methodology', 'timeline',
+             'literature_review', 'findings', 'analysis', 'recommendations',
+             'limitations', 'next_steps', 'references']
+    return {name: "\n\n".join(_paragraph(rng) for _ in range(paragraphs)) for name in names}
+
+
+def analysis_document(paragraphs: int, seed: int = 0) -> str:
+    """An intelligence analysis document with the sections the validator looks for"""
+    rng = random.Random(seed)
+    headings = ['Executive Summary', 'Key Findings', 'Analysis', 'Assessment',
+                'Confidence Levels', 'Recommendations', 'Sources']
+    parts = ["# Intelligence Analysis"]
+    for heading in headings:
+        parts.append(f"## {heading}")
+        parts.extend(_paragraph(rng) for _ in range(paragraphs))
+    return "\n\n".join(parts)
+
+
+def _paragraph(rng: random.Random) -> str:
+    sentences = []
+    for _ in range(5):
+        words = [rng.choice(_WORDS) for _ in range(14)]
+        sentences.append(" ".join(words).capitalize() + ", with high confidence according to sources.")
+    return " ".join(sentences)
+
@@ -7,19 +7,10 @@ Main entry point for the application with site monitoring capabilities
 import os
 import sys
 import argparse
+import importlib
 from datetime import datetime
 from dotenv import load_dotenv
 
-from src.clients.github_issue_creator import GitHubIssueCreator
-from src.core.batch_processor import BatchMetrics
-from src.core.issue_processor import (
-    GitHubIntegratedIssueProcessor, 
-    IssueProcessingStatus, 
-    ProcessingResult
-)
-from src.core.processing_orchestrator import ProcessingOrchestrator
-from src.core.site_monitor import create_monitor_service_from_config
-from src.agents.ai_workflow_assignment_agent import AIWorkflowAssignmentAgent
 from src.utils.cli_helpers import (
     ConfigValidator, 
     ProgressReporter, 
@@ -33,6 +24,54 @@ from src.utils.specialist_config_cli import (
     handle_specialist_config_command
 )
 from src.utils.logging_config import setup_logging
+from src.utils.metrics import setup_metrics
+from src.utils.tracing import export_on_exit
+
+
+# Command dependencies imported the first time a command needs them, so that
+# --help and cheap commands don't pay for PyGithub, the Google API client and
+# the workflow stack
+_LAZY_IMPORTS = {
+    'GitHubIssueCreator': 'src.clients.github_issue_creator',
+    'BatchMetrics': 'src.core.batch_processor',
+    'merge_deduplication_files': 'src.core.deduplication',
+    'GitHubIntegratedIssueProcessor': 'src.core.issue_processor',
+    'IssueProcessingStatus': 'src.core.issue_processor',
+    'ProcessingResult': 'src.core.issue_processor',
+    'ProcessingOrchestrator': 'src.core.processing_orchestrator',
+    'create_monitor_service_from_config': 'src.core.site_monitor',
+    'AIWorkflowAssignmentAgent': 'src.agents.ai_workflow_assignment_agent',
+    'ServiceDaemon': 'src.core.daemon',
+    'build_daemon_components': 'src.core.daemon',
+}
+
+
+def __getattr__(name: str):
+    """Import a lazily loaded command dependency on first attribute access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(*names: str):
+    """
+    Resolve lazily imported names from inside a command handler.
+    
+    Names already bound in the module (including ones patched by tests) are
+    returned as-is.
+    
+    Args:
+        names: Names listed in ``_LAZY_IMPORTS``
+        
+    Returns:
+        The object for a single name, or a tuple of objects
+    """
+    module_globals = globals()
+    values = tuple(module_globals[name] if name in module_globals else __getattr__(name) for name in names)
+    return values[0] if len(values) == 1 else values
 
 
 def setup_argument_parser() -> argparse.ArgumentParser:
@@ -46,6 +85,22 @@ def setup_argument_parser() -> argparse.ArgumentParser:
         description='Speculum Principum - GitHub Operations & Site Monitoring',
         prog='speculum-principum'
     )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Profile CPU time and memory of the command and write the results to --profile-dir'
+    )
+    parser.add_argument(
+        '--profile-dir',
+        default='profiles',
+        help='Directory for profile output (default: profiles)'
+    )
+    parser.add_argument(
+        '--profile-interval',
+        type=float,
+        default=10.0,
+        help='Stack sampling interval in milliseconds for flame graphs; 0 disables sampling'
+    )
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # Legacy issue creation command
@@ -56,6 +111,8 @@ def setup_argument_parser() -> argparse.ArgumentParser:
     setup_setup_parser(subparsers)
     setup_status_parser(subparsers)
     setup_cleanup_parser(subparsers)
+    setup_merge_dedup_parser(subparsers)
+    setup_serve_parser(subparsers)
     
     # Issue processing commands
     setup_process_issues_parser(subparsers)
@@ -148,6 +205,83 @@ def setup_cleanup_parser(subparsers) -> None:
     )
 
 
+def setup_merge_dedup_parser(subparsers) -> None:
+    """Set up merge-dedup command parser."""
+    merge_parser = subparsers.add_parser(
+        'merge-dedup', 
+        help='Merge deduplication storage files from several runs'
+    )
+    merge_parser.add_argument(
+        'files', 
+        nargs='+', 
+        help='Deduplication storage files to merge'
+    )
+    merge_parser.add_argument(
+        '--output', 
+        required=True, 
+        help='Path of the merged storage file'
+    )
+    merge_parser.add_argument(
+        '--retention-days', 
+        type=int, 
+        default=30, 
+        help='Drop entries older than this many days (0 keeps all)'
+    )
+    merge_parser.add_argument(
+        '--chunk-size', 
+        type=int, 
+        default=50000, 
+        help='Maximum number of entries held in memory while merging'
+    )
+
+
+def setup_serve_parser(subparsers) -> None:
+    """Set up serve command parser."""
+    serve_parser = subparsers.add_parser(
+        'serve', 
+        help='Run monitoring and issue processing continuously in one resident process'
+    )
+    serve_parser.add_argument(
+        '--config', 
+        default='config.yaml', 
+        help='Configuration file path (reloaded on SIGHUP)'
+    )
+    serve_parser.add_argument(
+        '--monitor-interval', 
+        type=float, 
+        default=3600, 
+        help='Seconds between monitoring cycles (0 disables monitoring)'
+    )
+    serve_parser.add_argument(
+        '--process-interval', 
+        type=float, 
+        default=900, 
+        help='Seconds between issue processing runs (0 disables processing)'
+    )
+    serve_parser.add_argument(
+        '--checkpoint-interval', 
+        type=float, 
+        default=300, 
+        help='Seconds between writing processing state to disk'
+    )
+    serve_parser.add_argument(
+        '--batch-size', 
+        type=int, 
+        default=10, 
+        help='Maximum issues per processing run'
+    )
+    serve_parser.add_argument(
+        '--no-individual-issues', 
+        action='store_true',
+        help='Skip creating individual issues for each search result'
+    )
+    serve_parser.add_argument(
+        '--once', 
+        action='store_true',
+        help='Run each job once and exit'
+    )
+
+
 def setup_process_issues_parser(subparsers) -> None:
     """Set up process-issues command parser."""
     process_parser = subparsers.add_parser(
@@ -288,6 +422,12 @@ def setup_assign_workflows_parser(subparsers) -> None:
         action='store_true', 
         help='Disable AI analysis and use label-based matching only (fallback mode)'
     )
+    assign_parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Maximum issues analyzed at the same time'
+    )
 
 
 def validate_environment() -> tuple[str, str]:
@@ -316,6 +456,7 @@ def validate_environment() -> tuple[str, str]:
 
 def handle_create_issue_command(args, github_token: str, repo_name: str) -> None:
     """Handle create-issue command."""
+    GitHubIssueCreator = _lazy('GitHubIssueCreator')
     creator = GitHubIssueCreator(github_token, repo_name)
     issue = creator.create_issue(
         title=args.title,
@@ -329,6 +470,7 @@ def handle_create_issue_command(args, github_token: str, repo_name: str) -> None
 
 def handle_monitor_command(args, github_token: str) -> None:
     """Handle monitor command."""
+    create_monitor_service_from_config = _lazy('create_monitor_service_from_config')
     if not os.path.exists(args.config):
         print(f"Error: Configuration file not found: {args.config}", file=sys.stderr)
         sys.exit(1)
@@ -347,8 +489,34 @@ def handle_monitor_command(args, github_token: str) -> None:
         sys.exit(1)
 
 
+def handle_serve_command(args, github_token: str, repo_name: str) -> None:
+    """Handle serve command."""
+    ServiceDaemon, build_daemon_components = _lazy('ServiceDaemon', 'build_daemon_components')
+    if not os.path.exists(args.config):
+        print(f"Error: Configuration file not found: {args.config}", file=sys.stderr)
+        sys.exit(1)
+    
+    daemon = ServiceDaemon(
+        build=lambda: build_daemon_components(args.config, github_token, repo_name),
+        monitor_interval=args.monitor_interval,
+        process_interval=args.process_interval,
+        checkpoint_interval=args.checkpoint_interval,
+        batch_size=args.batch_size,
+        create_individual_issues=not args.no_individual_issues,
+        metrics_file=os.getenv('SPECULUM_METRICS_FILE')
+    )
+    daemon.install_signal_handlers()
+    daemon.run(once=args.once)
+    
+    failed = [job['name'] for job in daemon.scheduler.status() if job['last_error']]
+    if args.once and failed:
+        print(f"❌ Failed jobs: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
 def handle_setup_command(args, github_token: str) -> None:
     """Handle setup command."""
+    create_monitor_service_from_config = _lazy('create_monitor_service_from_config')
     if not os.path.exists(args.config):
         print(f"Error: Configuration file not found: {args.config}", file=sys.stderr)
         sys.exit(1)
@@ -360,6 +528,7 @@ def handle_setup_command(args, github_token: str) -> None:
 
 def handle_status_command(args, github_token: str) -> None:
     """Handle status command."""
+    create_monitor_service_from_config = _lazy('create_monitor_service_from_config')
     if not os.path.exists(args.config):
         print(f"Error: Configuration file not found: {args.config}", file=sys.stderr)
         sys.exit(1)
@@ -373,10 +542,19 @@ def handle_status_command(args, github_token: str) -> None:
     print(f"Rate limit: {rate_status['calls_remaining']}/{rate_status['daily_limit']} calls remaining")
     dedup_stats = status['deduplication_stats']
     print(f"Processed entries: {dedup_stats['total_entries']}")
+    github_api = status['github_api_status']
+    github_core = github_api['rate_limit']['resources'].get('core')
+    if github_core:
+        print(f"GitHub API: {github_core['remaining']}/{github_core['limit']} requests remaining "
+              f"(resets {github_core['reset_time']})")
+    cache_stats = github_api['cache']
+    print(f"GitHub cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+          f"({cache_stats['hit_rate']:.1%} hit rate)")
 
 
 def handle_cleanup_command(args, github_token: str) -> None:
     """Handle cleanup command."""
+    create_monitor_service_from_config = _lazy('create_monitor_service_from_config')
     if not os.path.exists(args.config):
         print(f"Error: Configuration file not found: {args.config}", file=sys.stderr)
         sys.exit(1)
@@ -397,8 +575,36 @@ def handle_cleanup_command(args, github_token: str) -> None:
         sys.exit(1)
 
 
+def handle_merge_dedup_command(args) -> None:
+    """Handle merge-dedup command."""
+    merge_deduplication_files = _lazy('merge_deduplication_files')
+    
+    def show_progress(progress: dict) -> None:
+        if progress['phase'] == 'read':
+            print(f"📥 [{progress['files_done']}/{progress['files_total']}] {progress['file']}: "
+                  f"{progress['entries_read']} entries read, {progress['expired_entries']} expired")
+        elif progress['phase'] == 'merge':
+            print(f"🔀 Merged {progress['unique_entries']} unique entries from {progress['runs']} runs")
+    
+    stats = merge_deduplication_files(
+        args.files,
+        args.output,
+        retention_days=args.retention_days or None,
+        chunk_size=args.chunk_size,
+        progress_callback=show_progress
+    )
+    print(f"✅ Wrote {stats['unique_entries']} unique entries to {args.output} "
+          f"({stats['entries_read']} read, {stats['expired_entries']} expired, "
+          f"{stats['invalid_entries']} invalid)")
+
+
 def handle_process_issues_command(args, github_token: str, repo_name: str) -> None:
     """Handle process-issues command."""
+    (GitHubIntegratedIssueProcessor, IssueProcessingStatus, ProcessingResult,
+     ProcessingOrchestrator, BatchMetrics, create_monitor_service_from_config) = _lazy(
+        'GitHubIntegratedIssueProcessor', 'IssueProcessingStatus', 'ProcessingResult',
+        'ProcessingOrchestrator', 'BatchMetrics', 'create_monitor_service_from_config'
+    )
     
     def process_issues_command() -> CliResult:
         # Validate configuration and environment
@@ -696,6 +902,7 @@ def handle_process_issues_command(args, github_token: str, repo_name: str) -> No
 
 def handle_process_copilot_issues_command(args, github_token: str, repo_name: str) -> None:
     """Handle process-copilot-issues command."""
+    GitHubIntegratedIssueProcessor = _lazy('GitHubIntegratedIssueProcessor')
     
     def process_copilot_issues_command() -> CliResult:
         # Validate configuration and environment
@@ -848,6 +1055,7 @@ def handle_process_copilot_issues_command(args, github_token: str, repo_name: st
 
 def handle_assign_workflows_command(args, github_token: str, repo_name: str) -> None:
     """Handle assign-workflows command."""
+    AIWorkflowAssignmentAgent = _lazy('AIWorkflowAssignmentAgent')
     
     def assign_workflows_command() -> CliResult:
         # Validate configuration and environment
@@ -916,6 +1124,23 @@ def handle_assign_workflows_command(args, github_token: str, repo_name: str) ->
                     f""
                 ])
                 
+                fast_path = stats.get('fast_path')
+                if fast_path:
+                    stats_lines.extend([
+                        f"**Local Classifier:**",
+                        f"  Trained on: {fast_path['classifier_examples']} assignments",
+                        f""
+                    ])
+                
+                history = stats.get('history')
+                if history and history['records']:
+                    stats_lines.append(f"**Assignment History ({history['records']} records):**")
+                    for workflow, summary in history['workflows'].items():
+                        stats_lines.append(
+                            f"  {workflow}: {summary['success_rate']:.0%} success over {summary['records']} processed issues"
+                        )
+                    stats_lines.append("")
+                
                 if stats['workflow_breakdown']:
                     stats_lines.extend([
                         f"**Workflow Breakdown:**"
@@ -944,7 +1169,8 @@ def handle_assign_workflows_command(args, github_token: str, repo_name: str) ->
                 
                 result = agent.process_issues_batch(
                     limit=args.limit,
-                    dry_run=args.dry_run
+                    dry_run=args.dry_run,
+                    max_workers=args.concurrency
                 )
                 
                 if 'error' in result:
@@ -978,7 +1204,30 @@ def handle_assign_workflows_command(args, github_token: str, repo_name: str) ->
                         if count > 0:
                             action_name = action.replace('_', ' ').title()
                             result_lines.append(f"  {action_name}: {count}")
-                
+
+                write_stats = result.get('write_stats')
+                if write_stats and write_stats['requested_operations']:
+                    result_lines.append(
+                        f"  GitHub writes: {write_stats['api_calls']} API calls for "
+                        f"{write_stats['requested_operations']} operations "
+                        f"({write_stats['calls_saved']} saved)"
+                    )
+
+                fast_path = result.get('fast_path')
+                if fast_path and (fast_path['ai_calls'] or fast_path['ai_calls_avoided']):
+                    result_lines.append(
+                        f"  AI calls: {fast_path['ai_calls']} "
+                        f"({fast_path['ai_calls_avoided']} avoided by local classifier)"
+                    )
+
+                throughput = result.get('throughput')
+                if throughput:
+                    line = (f"  Throughput: {throughput['issues_per_minute']:.1f} issues/min "
+                            f"({throughput['max_workers']} workers)")
+                    if throughput['ai_p95_ms'] is not None:
+                        line += f", AI p95 {throughput['ai_p95_ms']:.0f} ms"
+                    result_lines.append(line)
+
                 # Add details if verbose
                 if args.verbose and result['results']:
                     result_lines.extend([
@@ -1041,6 +1290,14 @@ def main():
         parser.print_help()
         sys.exit(1)
     
+    if args.profile:
+        from src.utils.profiling import profile_until_exit
+        profile_until_exit(
+            args.profile_dir,
+            f"{args.command}-{datetime.now():%Y%m%d-%H%M%S}",
+            sample_interval_ms=args.profile_interval
+        )
+    
     # Set up logging configuration
     log_level = os.getenv('LOG_LEVEL', 'INFO')
     log_file = os.getenv('LOG_FILE', None)
@@ -1050,12 +1307,33 @@ def main():
         setup_logging(
             log_level=log_level,
             log_file=log_file,
-            enable_console=enable_console
+            enable_console=enable_console,
+            file_log_level=os.getenv('LOG_FILE_LEVEL'),
+            use_queue=os.getenv('LOG_QUEUE', '').lower() in ('1', 'true', 'yes'),
+            debug_sample_rate=float(os.getenv('LOG_DEBUG_SAMPLE_RATE', '1'))
         )
     except Exception as e:
         print(f"Warning: Failed to set up logging: {e}", file=sys.stderr)
         # Continue without proper logging rather than failing
     
+    trace_file = os.getenv('SPECULUM_TRACE_FILE')
+    if trace_file:
+        export_on_exit(trace_file)
+    
+    try:
+        setup_metrics(os.getenv('SPECULUM_METRICS_PORT'), os.getenv('SPECULUM_METRICS_FILE'))
+    except (OSError, ValueError) as e:
+        print(f"Warning: Failed to set up metrics: {e}", file=sys.stderr)
+    
+    # Local file maintenance needs no GitHub access
+    if args.command == 'merge-dedup':
+        try:
+            handle_merge_dedup_command(args)
+        except Exception as e:
+            print(f"Error: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
     # Validate environment
     github_token, repo_name = validate_environment()
     
@@ -1071,6 +1349,8 @@ def main():
             handle_status_command(args, github_token)
         elif args.command == 'cleanup':
             handle_cleanup_command(args, github_token)
+        elif args.command == 'serve':
+            handle_serve_command(args, github_token, repo_name)
         elif args.command == 'process-issues':
             handle_process_issues_command(args, github_token, repo_name)
         elif args.command == 'process-copilot-issues':
@@ -13,6 +13,7 @@ Key improvements over label-based matching:
 
 import json
 import logging
+import threading
 import time
 import os
 from typing import Dict, List, Optional, Tuple, Any
@@ -27,8 +28,20 @@ from github import Github
 
 from ..workflow.workflow_matcher import WorkflowMatcher, WorkflowInfo, WorkflowMatcherError
 from ..clients.github_issue_creator import GitHubIssueCreator
-from ..utils.config_manager import ConfigManager
+from ..clients.github_mutation_queue import GitHubMutationQueue, apply_issue_updates
+from ..clients.issue_discovery import IssueQuery, NO_ASSIGNEE
+from ..utils.config_manager import AIHistoryConfig, AIPreclassifierConfig, ConfigManager
 from ..utils.logging_config import get_logger, log_exception
+from ..utils.metrics import get_registry
+from ..utils.tracing import span
+from .assignment_engine import DEFAULT_MAX_WORKERS, ConcurrentAssignmentEngine
+from .assignment_history import AssignmentHistoryStore, AssignmentRecord
+from .workflow_preclassifier import TrainingExample, WorkflowPreclassifier
+
+
+_ASSIGNMENT_DECISIONS = get_registry().counter(
+    'speculum_workflow_assignment_decisions_total',
+    "Workflow assignment analyses by where they were decided", ['path'])
 
 
 @dataclass
@@ -41,6 +54,7 @@ class ContentAnalysis:
     technical_indicators: List[str]
     urgency_level: str  # low, medium, high, critical
     content_type: str  # research, bug, feature, security, documentation
+    source: str = "ai"  # ai, or local when the pre-classifier decided
 
 
 class GitHubModelsClient:
@@ -186,13 +200,14 @@ Return response as valid JSON only:
         }
         
         try:
-            response = requests.post(
-                endpoint,
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
-            response.raise_for_status()
+            with span('ai.completion', model=self.model):
+                response = requests.post(
+                    endpoint,
+                    headers=self.headers,
+                    json=payload,
+                    timeout=30
+                )
+                response.raise_for_status()
             
             result = response.json()
             
@@ -285,12 +300,18 @@ class AIWorkflowAssignmentAgent:
         self.github = GitHubIssueCreator(github_token, repo_name)
         self.repo_name = repo_name
         self.enable_ai = enable_ai
+        # Set while a batch is running so label and comment writes are coalesced
+        self.mutation_queue: Optional[GitHubMutationQueue] = None
         
         # Load configuration
+        preclassifier_config = None
+        history_config = None
         try:
             self.config = ConfigManager.load_config(config_path)
             # Load AI configuration if available
             ai_config = getattr(self.config, 'ai', None)
+            preclassifier_config = getattr(ai_config, 'preclassifier', None)
+            history_config = getattr(ai_config, 'history', None)
             if ai_config:
                 self.enable_ai = ai_config.get('enabled', enable_ai)
                 self.HIGH_CONFIDENCE_THRESHOLD = ai_config.get('confidence_thresholds', {}).get('auto_assign', 0.8)
@@ -312,8 +333,22 @@ class AIWorkflowAssignmentAgent:
             self.ai_client = None
             
         # Load learning data from previous assignments
+        self.history_config = history_config or AIHistoryConfig()
         self.assignment_history = self._load_assignment_history()
         
+        # Local classifier that decides obvious issues without an AI call
+        self.preclassifier_config = preclassifier_config or AIPreclassifierConfig()
+        if self.preclassifier_config.enabled:
+            self.preclassifier: Optional[WorkflowPreclassifier] = WorkflowPreclassifier.load(
+                self.preclassifier_config.model_path
+            )
+        else:
+            self.preclassifier = None
+        self.fast_path_stats = {'ai_calls': 0, 'ai_calls_avoided': 0}
+        self._new_training_examples: List[TrainingExample] = []
+        # Batches analyze issues concurrently; guards the counters and examples above
+        self._learning_lock = threading.Lock()
+        
         self.logger.info(
             f"Initialized AI workflow agent (AI={'enabled' if self.enable_ai else 'disabled'}, "
             f"model={ai_model if self.enable_ai else 'none'})"
@@ -330,39 +365,13 @@ class AIWorkflowAssignmentAgent:
             List of issue data dictionaries
         """
         try:
-            # Get all open site-monitor issues
-            issues = self.github.get_issues_with_labels(['site-monitor'], state='open')
-            
-            candidate_issues = []
-            for issue in issues:
-                issue_labels = {label.name for label in issue.labels}
-                
-                # Skip if already assigned
-                if issue.assignee is not None:
-                    continue
-                
-                # Skip if has exclusion labels
-                if issue_labels.intersection(self.SKIP_LABELS):
-                    continue
-                
-                # Convert to dictionary format
-                issue_data = {
-                    'number': issue.number,
-                    'title': issue.title,
-                    'body': issue.body or "",
-                    'labels': list(issue_labels),
-                    'assignee': None,
-                    'created_at': issue.created_at.isoformat() if issue.created_at else None,
-                    'updated_at': issue.updated_at.isoformat() if issue.updated_at else None,
-                    'url': issue.html_url,
-                    'user': issue.user.login if issue.user else None
-                }
-                
-                candidate_issues.append(issue_data)
-                
-                # Apply limit
-                if limit and len(candidate_issues) >= limit:
-                    break
+            # Read unassigned open site-monitor issues from the incrementally synced mirror
+            query = IssueQuery(labels=['site-monitor'], assignee=NO_ASSIGNEE, state='open')
+            candidate_issues = self.github.get_mirrored_issues(
+                query,
+                limit=limit,
+                exclude_labels=list(self.SKIP_LABELS)
+            )
             
             self.logger.info(f"Found {len(candidate_issues)} candidate issues for AI workflow assignment")
             return candidate_issues
@@ -387,6 +396,14 @@ class AIWorkflowAssignmentAgent:
         """
         available_workflows = self.workflow_matcher.get_available_workflows()
         
+        # Obvious issues are decided locally, which needs neither the API nor Actions
+        local_result = self._classify_locally(issue_data, available_workflows)
+        if local_result is not None:
+            with self._learning_lock:
+                self.fast_path_stats['ai_calls_avoided'] += 1
+            _ASSIGNMENT_DECISIONS.inc(path='local')
+            return local_result
+        
         # Check if we're in GitHub Actions environment
         is_github_actions = os.getenv('GITHUB_ACTIONS') == 'true'
         
@@ -404,6 +421,9 @@ class AIWorkflowAssignmentAgent:
                 "Please enable AI in configuration or run in GitHub Actions environment."
             )
         
+        with self._learning_lock:
+            self.fast_path_stats['ai_calls'] += 1
+        _ASSIGNMENT_DECISIONS.inc(path='ai')
         try:
             analysis = self.ai_client.analyze_issue_content(
                 title=issue_data.get('title', ''),
@@ -426,6 +446,115 @@ class AIWorkflowAssignmentAgent:
                 f"This feature requires a working connection to GitHub Models API."
             ) from e
     
+    def _classify_locally(self,
+                          issue_data: Dict[str, Any],
+                          available_workflows: List[WorkflowInfo]) -> Optional[Tuple[WorkflowInfo, ContentAnalysis, str]]:
+        """
+        Decide the workflow with the local pre-classifier when it is confident.
+        
+        Args:
+            issue_data: Issue data dictionary
+            available_workflows: Currently defined workflows
+            
+        Returns:
+            Same tuple as ``analyze_issue_with_ai``, or None to escalate to the AI
+        """
+        if self.preclassifier is None or not available_workflows:
+            return None
+        
+        config = self.preclassifier_config
+        with span('workflow.preclassify', issue=issue_data.get('number')) as current:
+            decision = self.preclassifier.decide(
+                title=issue_data.get('title', ''),
+                body=issue_data.get('body', ''),
+                labels=issue_data.get('labels', []),
+                # Never decide locally below the auto-assign bar
+                threshold=max(config.decide_threshold, self.HIGH_CONFIDENCE_THRESHOLD),
+                min_margin=config.min_margin,
+                min_examples=config.min_examples,
+                allowed_workflows=[wf.name for wf in available_workflows]
+            )
+            current.set(decided=decision.decided, confidence=round(decision.confidence, 4))
+        
+        if not decision.decided:
+            self.logger.debug(f"Escalating issue #{issue_data.get('number')} to AI: {decision.reason}")
+            return None
+        
+        workflow = next(wf for wf in available_workflows if wf.name == decision.workflow)
+        analysis = ContentAnalysis(
+            summary="Decided by the local workflow classifier",
+            key_topics=[],
+            suggested_workflows=[workflow.name],
+            confidence_scores={name: round(score, 4) for name, score in decision.scores.items()},
+            technical_indicators=[],
+            urgency_level="medium",
+            content_type=self.preclassifier.content_types.get(workflow.name, "unknown"),
+            source="local"
+        )
+        message = (
+            f"Local classifier selected '{workflow.name}' "
+            f"(confidence: {decision.confidence:.2f}, margin: {decision.margin:.2f})"
+        )
+        return workflow, analysis, message
+    
+    def _learn_from_assignment(self, issue_data: Dict[str, Any], workflow_name: str, analysis: ContentAnalysis) -> None:
+        """Keep an AI auto-assignment as a training example for the pre-classifier"""
+        if self.preclassifier is None or analysis.source != "ai":
+            return
+        example = TrainingExample(
+            title=issue_data.get('title', ''),
+            body=issue_data.get('body', '') or '',
+            labels=list(issue_data.get('labels', [])),
+            workflow=workflow_name,
+            content_type=analysis.content_type
+        )
+        with self._learning_lock:
+            self.preclassifier.add_example(example)
+            self._new_training_examples.append(example)
+    
+    def update_preclassifier(self) -> bool:
+        """
+        Update the pre-classifier with the new examples and save it.
+        
+        The new examples update the current weights; the model is trained from
+        scratch on all stored examples once ``retrain_every`` examples have
+        been learned that way.
+        
+        Returns:
+            True if new examples were trained on and saved
+        """
+        if self.preclassifier is None or not self._new_training_examples:
+            return False
+        new_examples = self._new_training_examples
+        classifier = self.preclassifier
+        try:
+            if classifier.incremental_examples + len(new_examples) >= self.preclassifier_config.retrain_every:
+                trained = classifier.fit()
+                action = "retrained"
+            else:
+                trained = classifier.partial_fit(new_examples)
+                action = "updated"
+            classifier.save(self.preclassifier_config.model_path)
+        except Exception as e:
+            log_exception(self.logger, "Failed to update workflow classifier", e)
+            return False
+        self.logger.info(
+            f"Workflow classifier {action}, trained on {trained} examples "
+            f"({len(new_examples)} new)"
+        )
+        self._new_training_examples = []
+        return True
+    
+    def _flush_assignment_history(self) -> None:
+        """Append the batch's assignment records to the history file"""
+        try:
+            written = self.assignment_history.flush()
+        except OSError as e:
+            log_exception(self.logger, "Failed to write assignment history", e)
+            return
+        if written:
+            self.logger.info(f"Recorded {written} assignments in {self.history_config.file_path}")
+    
     def _combine_ai_and_label_analysis(self,
                                       issue_data: Dict[str, Any],
                                       ai_analysis: ContentAnalysis,
@@ -510,26 +639,41 @@ class AIWorkflowAssignmentAgent:
         Returns:
             Success rate between 0 and 1
         """
-        # This would query historical assignment data stored in GitHub
-        # For now, return a default value based on content type matching
-        if workflow_name == "Research Analysis" and content_type in ["research", "analysis"]:
-            return 0.8
-        elif workflow_name == "Technical Review" and content_type in ["technical", "code", "security"]:
-            return 0.8
-        else:
-            return 0.5
+        return self.assignment_history.success_rate(workflow_name, content_type)
     
-    def _load_assignment_history(self) -> Dict[str, Any]:
+    def _load_assignment_history(self) -> AssignmentHistoryStore:
         """
-        Load historical assignment data from GitHub.
+        Load historical assignment data from the repository history file.
         
-        Could be stored as:
-        - GitHub Gist
-        - Repository file
-        - GitHub Actions artifacts
+        Returns:
+            Store with success rates aggregated from past assignments
         """
-        # Placeholder - would load from GitHub storage
-        return {}
+        if self.history_config.storage_type != 'repo_file':
+            self.logger.warning(
+                f"Assignment history storage '{self.history_config.storage_type}' is not supported, "
+                f"using repository file {self.history_config.file_path}"
+            )
+        try:
+            return AssignmentHistoryStore(self.history_config.file_path)
+        except OSError as e:
+            self.logger.warning(f"Could not load assignment history, starting empty: {e}")
+            return AssignmentHistoryStore(None)
+    
+    def _record_assignment(self, issue_number: int, result: Dict[str, Any], ai_analysis: ContentAnalysis) -> None:
+        """Buffer the outcome of an assignment in the history store"""
+        workflow_name = result['assigned_workflow']
+        if workflow_name is None and ai_analysis.confidence_scores:
+            workflow_name = max(ai_analysis.confidence_scores, key=ai_analysis.confidence_scores.get)
+        if workflow_name is None:
+            return
+        self.assignment_history.record(AssignmentRecord(
+            issue_number=issue_number,
+            workflow=workflow_name,
+            content_type=ai_analysis.content_type,
+            confidence=round(ai_analysis.confidence_scores.get(workflow_name, 0.0), 4),
+            outcome=result['action_taken'],
+            source=ai_analysis.source
+        ))
     
     def process_issue_with_ai(self,
                              issue_data: Dict[str, Any],
@@ -567,6 +711,8 @@ class AIWorkflowAssignmentAgent:
             result['action_taken'] = 'auto_assigned'
             result['assigned_workflow'] = workflow.name
             result['labels_added'] = labels_added
+            if not dry_run:
+                self._learn_from_assignment(issue_data, workflow.name, ai_analysis)
             
         elif ai_analysis.suggested_workflows:
             # Medium confidence - request human review
@@ -584,6 +730,9 @@ class AIWorkflowAssignmentAgent:
             result['action_taken'] = 'clarification_requested'
             result['labels_added'] = labels_added
         
+        if not dry_run:
+            self._record_assignment(issue_number, result, ai_analysis)
+        
         return result
     
     def _assign_workflow_with_ai_context(self,
@@ -602,7 +751,6 @@ class AIWorkflowAssignmentAgent:
             # Add workflow labels that aren't already present
             for label in workflow.trigger_labels:
                 if label not in current_labels:
-                    issue.add_to_labels(label)
                     labels_added.append(label)
             
             # Add AI analysis as comment
@@ -626,7 +774,7 @@ class AIWorkflowAssignmentAgent:
 ---
 *This assignment was made using GitHub Models AI analysis combined with label matching.*
 """
-            issue.create_comment(comment)
+            apply_issue_updates(self.mutation_queue, issue, issue_number, labels_added, comment)
         else:
             # In dry run, just return what labels would be added
             current_issue = self.github.repo.get_issue(issue_number)
@@ -648,7 +796,6 @@ class AIWorkflowAssignmentAgent:
             current_labels = {label.name for label in issue.labels}
             
             if 'needs-review' not in current_labels:
-                issue.add_to_labels('needs-review')
                 labels_added.append('needs-review')
             
             # Build suggestion list with confidence scores
@@ -676,7 +823,7 @@ Please review and either:
 ---
 *Analysis powered by GitHub Models AI*
 """
-            issue.create_comment(comment)
+            apply_issue_updates(self.mutation_queue, issue, issue_number, labels_added, comment)
         else:
             # In dry run, check what labels would be added
             current_issue = self.github.repo.get_issue(issue_number)
@@ -699,7 +846,6 @@ Please review and either:
             current_labels = {label.name for label in issue.labels}
             
             if 'needs clarification' not in current_labels:
-                issue.add_to_labels('needs clarification')
                 labels_added.append('needs clarification')
             
             comment = f"""🤖 **Additional Information Needed**
@@ -725,7 +871,7 @@ Available workflow types:
 ---
 *Analysis powered by GitHub Models AI*
 """
-            issue.create_comment(comment)
+            apply_issue_updates(self.mutation_queue, issue, issue_number, labels_added, comment)
         else:
             # In dry run, check what labels would be added
             current_issue = self.github.repo.get_issue(issue_number)
@@ -737,16 +883,21 @@ Available workflow types:
     
     def process_issues_batch(self, 
                            limit: Optional[int] = None,
-                           dry_run: bool = False) -> Dict[str, Any]:
+                           dry_run: bool = False,
+                           max_workers: int = DEFAULT_MAX_WORKERS) -> Dict[str, Any]:
         """
         Process a batch of issues using AI-enhanced workflow assignment.
         
+        Issues are analyzed concurrently, at most ``max_workers`` at a time,
+        while their label and comment writes are flushed in the background.
+        
         Args:
             limit: Maximum number of issues to process
             dry_run: If True, don't make actual changes
+            max_workers: Maximum issues analyzed at the same time
             
         Returns:
-            Dictionary with processing statistics and results
+            Dictionary with processing statistics, results and a throughput report
         """
         start_time = time.time()
         self.logger.info(f"Starting AI workflow assignment batch processing (limit: {limit}, dry_run: {dry_run})")
@@ -770,8 +921,6 @@ Available workflow types:
                     'duration_seconds': time.time() - start_time
                 }
             
-            # Process each issue
-            results = []
             statistics = {
                 'auto_assigned': 0,
                 'review_requested': 0,
@@ -779,34 +928,61 @@ Available workflow types:
                 'errors': 0
             }
             
-            for issue_data in issues:
-                try:
-                    result = self.process_issue_with_ai(issue_data, dry_run)
-                    results.append(result)
-                    
-                    action = result.get('action_taken', 'error')
-                    if action in statistics:
-                        statistics[action] += 1
-                    else:
-                        statistics['errors'] += 1
-                    
-                    # Add small delay between issues to be respectful to APIs
-                    time.sleep(0.5)  # Slightly longer delay for AI calls
-                    
-                except Exception as e:
-                    error_result = {
-                        'issue_number': issue_data['number'],
-                        'action_taken': 'error',
-                        'message': f"Processing error: {e}",
-                        'ai_analysis': {},
-                        'assigned_workflow': None,
-                        'labels_added': [],
-                        'dry_run': dry_run
-                    }
-                    results.append(error_result)
+            write_stats = None
+            if not dry_run:
+                self.mutation_queue = GitHubMutationQueue(self.github)
+            fast_path_before = dict(self.fast_path_stats)
+            
+            def error_result(issue_data: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+                return {
+                    'issue_number': issue_data['number'],
+                    'action_taken': 'error',
+                    'message': f"Processing error: {error}",
+                    'ai_analysis': {},
+                    'assigned_workflow': None,
+                    'labels_added': [],
+                    'dry_run': dry_run
+                }
+            
+            # Bounded concurrency replaces the old fixed delay between AI calls;
+            # GitHub writes are queued and paced by the transport
+            try:
+                results, throughput = ConcurrentAssignmentEngine(max_workers=max_workers).run(
+                    issues,
+                    lambda issue_data: self.process_issue_with_ai(issue_data, dry_run),
+                    error_result,
+                    mutation_queue=self.mutation_queue
+                )
+            finally:
+                if self.mutation_queue is not None:
+                    write_stats = self.mutation_queue.flush()
+                    self.mutation_queue = None
+                if not dry_run:
+                    self.update_preclassifier()
+                    self._flush_assignment_history()
+            
+            fast_path = {
+                key: self.fast_path_stats[key] - fast_path_before[key]
+                for key in self.fast_path_stats
+            }
+            
+            for result in results:
+                action = result.get('action_taken', 'error')
+                if action in statistics:
+                    statistics[action] += 1
+                else:
+                    statistics['errors'] += 1
+            
+            if write_stats:
+                for result in results:
+                    failure = write_stats['failed_issues'].get(result['issue_number'])
+                    if failure is None or result.get('action_taken') == 'error':
+                        continue
+                    if result.get('action_taken') in statistics:
+                        statistics[result['action_taken']] -= 1
                     statistics['errors'] += 1
-                    
-                    log_exception(self.logger, f"Failed to process issue #{issue_data['number']}", e)
+                    result['action_taken'] = 'error'
+                    result['message'] = f"Failed to apply changes: {failure}"
             
             duration = time.time() - start_time
             
@@ -819,13 +995,21 @@ Available workflow types:
             for action, count in statistics.items():
                 if count > 0:
                     self.logger.info(f"  {action}: {count}")
+            if fast_path['ai_calls_avoided']:
+                self.logger.info(f"  AI calls avoided by local classifier: {fast_path['ai_calls_avoided']}")
+            self.logger.info(f"  Throughput: {throughput.issues_per_minute:.1f} issues/min "
+                             f"with {throughput.max_workers} workers"
+                             + (f", AI p95 {throughput.ai_p95_ms:.0f} ms" if throughput.ai_p95_ms is not None else ""))
             
             return {
                 'total_issues': len(issues),
                 'processed': processed_count,
                 'results': results,
                 'statistics': statistics,
-                'duration_seconds': duration
+                'duration_seconds': duration,
+                'write_stats': write_stats,
+                'fast_path': fast_path,
+                'throughput': throughput.to_dict()
             }
             
         except Exception as e:
@@ -864,7 +1048,12 @@ Available workflow types:
                 'feature_labeled': 0,
                 'workflow_breakdown': {},
                 'label_distribution': {},
-                'ai_enabled': self.enable_ai
+                'ai_enabled': self.enable_ai,
+                'fast_path': {
+                    **self.fast_path_stats,
+                    'classifier_examples': self.preclassifier.trained_examples if self.preclassifier else 0
+                },
+                'history': self.assignment_history.summary()
             }
             
             for issue in all_issues:
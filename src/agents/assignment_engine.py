@@ -0,0 +1,199 @@
+"""
+Concurrent Assignment Engine
+
+Runs workflow assignment for a batch of issues on a bounded thread pool, so a
+batch takes roughly the slowest analyses rather than the sum of all of them.
+
+Each issue's analysis (an AI call, or a GitHub read for label matching) runs
+on one of ``max_workers`` threads; that bound is what keeps the AI API from
+being flooded. The label and comment writes the workers queue on a
+``GitHubMutationQueue`` are flushed by a separate writer thread every
+``flush_every`` issues, so GitHub writes overlap with analysis instead of all
+waiting for the end of the batch. The caller still flushes the queue once
+more after the run for whatever is left.
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from ..utils.logging_config import get_logger, log_exception
+from ..utils.tracing import get_tracer, percentile, stage_statistics
+
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_FLUSH_EVERY = 25
+
+# Stage whose latency is reported as the AI latency
+AI_STAGE = 'ai.completion'
+
+T = TypeVar('T')
+
+
+@dataclass
+class ThroughputReport:
+    """How fast a batch went through the engine"""
+    issues: int
+    max_workers: int
+    duration_seconds: float
+    issue_p50_ms: float = 0.0
+    issue_p95_ms: float = 0.0
+    issue_max_ms: float = 0.0
+    write_flushes: int = 0
+    stage_timings: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def issues_per_minute(self) -> float:
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.issues * 60.0 / self.duration_seconds
+
+    @property
+    def ai_p95_ms(self) -> Optional[float]:
+        stage = self.stage_timings.get(AI_STAGE)
+        return stage['p95_ms'] if stage else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'issues': self.issues,
+            'max_workers': self.max_workers,
+            'duration_seconds': round(self.duration_seconds, 3),
+            'issues_per_minute': round(self.issues_per_minute, 2),
+            'issue_p50_ms': round(self.issue_p50_ms, 3),
+            'issue_p95_ms': round(self.issue_p95_ms, 3),
+            'issue_max_ms': round(self.issue_max_ms, 3),
+            'ai_calls': self.stage_timings.get(AI_STAGE, {}).get('count', 0),
+            'ai_p95_ms': self.ai_p95_ms,
+            'write_flushes': self.write_flushes,
+            'stage_timings': self.stage_timings,
+        }
+
+
+class ConcurrentAssignmentEngine:
+    """Bounded-concurrency analysis with an independent write stage"""
+
+    def __init__(self,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 flush_every: int = DEFAULT_FLUSH_EVERY):
+        """
+        Initialize the engine
+
+        Args:
+            max_workers: Issues analyzed at the same time
+            flush_every: Completed issues between background write flushes
+        """
+        self.max_workers = max(max_workers, 1)
+        self.flush_every = max(flush_every, 1)
+
+    def run(self,
+            issues: List[Dict[str, Any]],
+            process: Callable[[Dict[str, Any]], T],
+            on_error: Callable[[Dict[str, Any], Exception], T],
+            mutation_queue: Optional[Any] = None) -> Tuple[List[T], ThroughputReport]:
+        """
+        Process every issue
+
+        Args:
+            issues: Issue data dictionaries
+            process: Assigns one issue and returns its result
+            on_error: Builds the result for an issue whose ``process`` raised
+            mutation_queue: Queue the workers write to, flushed in the background
+
+        Returns:
+            Results in the same order as ``issues``, and the throughput report
+        """
+        started = time.perf_counter()
+        tracer = get_tracer()
+        mark = tracer.mark()
+        writer = _WriteStage(mutation_queue, self.flush_every) if mutation_queue is not None else None
+        latencies: List[float] = []
+        latency_lock = threading.Lock()
+
+        def run_one(issue_data: Dict[str, Any]) -> T:
+            issue_started = time.perf_counter()
+            try:
+                return process(issue_data)
+            except Exception as e:
+                log_exception(logger, f"Failed to process issue #{issue_data.get('number')}", e)
+                return on_error(issue_data, e)
+            finally:
+                with latency_lock:
+                    latencies.append((time.perf_counter() - issue_started) * 1000)
+                if writer is not None:
+                    writer.issue_done()
+
+        if writer is not None:
+            writer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, max(len(issues), 1)),
+                                    thread_name_prefix='assign') as executor:
+                # Each worker runs in a copy of this context so spans nest under the caller's
+                futures = [executor.submit(contextvars.copy_context().run, run_one, issue_data)
+                           for issue_data in issues]
+                results = [future.result() for future in futures]
+        finally:
+            if writer is not None:
+                writer.stop()
+
+        latencies.sort()
+        report = ThroughputReport(
+            issues=len(issues),
+            max_workers=self.max_workers,
+            duration_seconds=time.perf_counter() - started,
+            write_flushes=writer.flushes if writer is not None else 0,
+            stage_timings=stage_statistics(tracer.spans(mark)),
+        )
+        if latencies:
+            report.issue_p50_ms = percentile(latencies, 50)
+            report.issue_p95_ms = percentile(latencies, 95)
+            report.issue_max_ms = latencies[-1]
+        return results, report
+
+
+class _WriteStage:
+    """Background thread flushing a mutation queue as issues complete"""
+
+    def __init__(self, mutation_queue: Any, flush_every: int):
+        self.mutation_queue = mutation_queue
+        self.flush_every = flush_every
+        self.flushes = 0
+        self._completed = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name='assign-writer', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def issue_done(self) -> None:
+        with self._lock:
+            self._completed += 1
+            due = self._completed >= self.flush_every
+        if due:
+            self._wake.set()
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._wake.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._stopping:
+                # The caller's final flush writes the rest
+                return
+            with self._lock:
+                self._completed = 0
+            try:
+                self.mutation_queue.flush()
+                self.flushes += 1
+            except Exception as e:
+                log_exception(logger, "Background flush of queued GitHub writes failed", e)
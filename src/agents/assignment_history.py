@@ -0,0 +1,213 @@
+"""
+Assignment History
+
+Append-only record of workflow assignments and their outcomes, used to weight
+future assignments by how well each workflow has fared for a content type.
+
+Two kinds of records share the file. Assignment decisions (``auto_assigned``,
+``review_requested``, ``clarification_requested``) say what was chosen, and
+never count toward success rates, so the assignment agent cannot confirm its
+own picks. Outcome records (``completed``, ``failed``, ``reassigned``) are
+written once an issue has actually been processed, and are the only records
+aggregated; until a workflow has outcomes its rate stays at the prior.
+
+Records are stored as JSON lines in a file that lives in the repository
+(``ai.history.file_path``), so committing it shares the history between
+runs and machines. The file is read once when the store is opened; success
+rates are aggregated as records arrive, so a lookup during scoring is a
+dictionary read. New records are buffered and appended in one write by
+``flush``, typically once per batch.
+"""
+
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from ..utils.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Outcomes that count as the workflow having been the right call, or not
+SUCCESS_OUTCOMES = frozenset({'completed'})
+FAILURE_OUTCOMES = frozenset({'failed', 'reassigned'})
+
+# Success rate assumed for unseen workflows, and how many records it is worth
+PRIOR_SUCCESS_RATE = 0.5
+PRIOR_WEIGHT = 2.0
+
+ANY_CONTENT_TYPE = '*'
+
+
+@dataclass
+class AssignmentRecord:
+    """Outcome of one workflow assignment"""
+    issue_number: int
+    workflow: str
+    content_type: str
+    confidence: float
+    outcome: str  # A decision (auto_assigned, review_requested, ...) or completed, failed, reassigned
+    source: str = "ai"  # ai, local when the pre-classifier decided, or human
+    recorded_at: float = field(default_factory=time.time)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.outcome in SUCCESS_OUTCOMES
+
+    @property
+    def is_outcome(self) -> bool:
+        return self.outcome in SUCCESS_OUTCOMES or self.outcome in FAILURE_OUTCOMES
+
+
+class AssignmentHistoryStore:
+    """Assignment records with precomputed per-workflow success rates"""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Open the store, loading any existing records
+
+        Args:
+            path: JSON lines file; None keeps the history in memory only
+        """
+        self.path = Path(path) if path else None
+        self._counts: Dict[Tuple[str, str], List[int]] = {}
+        self._rates: Dict[Tuple[str, str], float] = {}
+        self._decisions: Dict[int, AssignmentRecord] = {}
+        self._pending: List[AssignmentRecord] = []
+        self._total_records = 0
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        skipped = 0
+        with open(self.path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    self._aggregate(AssignmentRecord(**json.loads(line)))
+                except (ValueError, TypeError):
+                    skipped += 1
+        if skipped:
+            logger.warning(f"Skipped {skipped} unreadable assignment history records in {self.path}")
+        logger.debug(f"Loaded {self._total_records} assignment history records from {self.path}")
+
+    def _aggregate(self, record: AssignmentRecord) -> None:
+        self._total_records += 1
+        if not record.is_outcome:
+            self._decisions[record.issue_number] = record
+            return
+        self._decisions.pop(record.issue_number, None)
+        for key in ((record.workflow, record.content_type), (record.workflow, ANY_CONTENT_TYPE)):
+            counts = self._counts.setdefault(key, [0, 0])
+            counts[0] += record.succeeded
+            counts[1] += 1
+            self._rates[key] = ((counts[0] + PRIOR_SUCCESS_RATE * PRIOR_WEIGHT)
+                                / (counts[1] + PRIOR_WEIGHT))
+
+    def record(self, record: AssignmentRecord) -> None:
+        """Add a record; it is written to disk by the next ``flush``"""
+        with self._lock:
+            self._aggregate(record)
+            self._pending.append(record)
+
+    def record_outcome(self, issue_number: int, workflow: str, succeeded: bool) -> List[AssignmentRecord]:
+        """
+        Record how processing an issue with a workflow turned out
+
+        The content type and confidence come from the issue's last assignment
+        decision. If the issue was processed with a different workflow than
+        the one assigned, a human changed the label, and the assigned
+        workflow is recorded as ``reassigned``.
+
+        Args:
+            issue_number: Processed issue
+            workflow: Workflow the issue was processed with
+            succeeded: Whether processing completed
+
+        Returns:
+            The records added
+        """
+        with self._lock:
+            decision = self._decisions.get(issue_number)
+            records = []
+            if decision is not None and decision.workflow != workflow:
+                records.append(AssignmentRecord(
+                    issue_number=issue_number,
+                    workflow=decision.workflow,
+                    content_type=decision.content_type,
+                    confidence=decision.confidence,
+                    outcome='reassigned',
+                    source=decision.source
+                ))
+            assigned = decision is not None and decision.workflow == workflow
+            records.append(AssignmentRecord(
+                issue_number=issue_number,
+                workflow=workflow,
+                content_type=decision.content_type if decision is not None else 'unknown',
+                confidence=decision.confidence if assigned else 0.0,
+                outcome='completed' if succeeded else 'failed',
+                source=decision.source if assigned else 'human'
+            ))
+            for record in records:
+                self._aggregate(record)
+            self._pending.extend(records)
+        return records
+
+    def success_rate(self, workflow: str, content_type: str) -> float:
+        """
+        Smoothed success rate of a workflow for a content type
+
+        Falls back to the workflow's rate over all content types, then to the
+        prior, when there is no history for the combination.
+
+        Args:
+            workflow: Workflow name
+            content_type: Content type from the analysis
+
+        Returns:
+            Success rate between 0 and 1
+        """
+        rate = self._rates.get((workflow, content_type))
+        if rate is None:
+            rate = self._rates.get((workflow, ANY_CONTENT_TYPE), PRIOR_SUCCESS_RATE)
+        return rate
+
+    def flush(self) -> int:
+        """
+        Append buffered records to the history file
+
+        Returns:
+            Number of records written
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending or self.path is None:
+            return 0
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as file:
+                file.write(''.join(json.dumps(asdict(record)) + '\n' for record in pending))
+        except OSError:
+            with self._lock:
+                self._pending = pending + self._pending
+            raise
+        return len(pending)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def summary(self) -> Dict[str, object]:
+        """Record count and per-workflow outcome counts and success rates"""
+        with self._lock:
+            workflows = {
+                workflow: {'records': counts[1], 'success_rate': round(self._rates[(workflow, content_type)], 3)}
+                for (workflow, content_type), counts in sorted(self._counts.items())
+                if content_type == ANY_CONTENT_TYPE
+            }
+            return {'records': self._total_records, 'workflows': workflows}
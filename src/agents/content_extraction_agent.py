@@ -6,8 +6,9 @@ and preparing data for specialist analysis workflows.
 """
 
 import json
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+from collections import Counter
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime
 
 from ..clients.github_models_client import GitHubModelsClient, AIResponse
@@ -16,7 +17,26 @@ from ..utils.ai_prompt_builder import (
     PromptType, SpecialistType
 )
 from ..utils.logging_config import get_logger, log_exception
-from ..utils.config_manager import AIConfig
+from ..utils.config_manager import AIConfig, AIPreExtractionConfig
+from ..utils.metrics import get_registry
+from ..utils.pattern_extractor import LocalExtraction, extract_patterns
+from ..utils.tracing import current_span, span, traced
+
+
+_EXTRACTIONS = get_registry().counter(
+    'speculum_ai_extractions_total', "Issue content extractions by outcome", ['outcome'])
+
+# Entity types for locally extracted kinds, matching the AI response keys
+_LOCAL_ENTITY_TYPES = {
+    'organization': 'organizations',
+    'domain': 'domains',
+    'date': 'other',
+    'money': 'other',
+}
+# Confidence in locally extracted values: indicator patterns are exact,
+# organization names are a capitalization heuristic
+_LOCAL_INDICATOR_CONFIDENCE = 0.95
+_LOCAL_ENTITY_CONFIDENCE = {'organization': 0.7}
 
 
 @dataclass
@@ -139,9 +159,12 @@ class ContentExtractionAgent:
             ai_config.confidence_thresholds.entity_extraction 
             if ai_config.confidence_thresholds else 0.7
         )
+        self.pre_extraction_config = getattr(ai_config, 'pre_extraction', None) or AIPreExtractionConfig()
+        self.pre_extraction_stats = {'ai_calls': 0, 'ai_calls_avoided': 0, 'indicators': 0}
         
         self.logger.info(f"Initialized ContentExtractionAgent with model: {model}")
     
+    @traced("ai.extract")
     def extract_content(self,
                        issue_data: Dict[str, Any],
                        extraction_focus: Optional[ExtractionFocus] = None,
@@ -158,29 +181,60 @@ class ContentExtractionAgent:
             ExtractionResult with structured content or error information
         """
         start_time = datetime.now()
+        current_span().set(issue_number=issue_data.get('number'))
         
         try:
             # Convert issue data to structured format
             issue_content = self._convert_issue_data(issue_data)
             
+            # Extract indicators and simple entities locally first
+            local = None
+            if self.pre_extraction_config.enabled:
+                with span("ai.pre_extract") as pre_extract_span:
+                    local = extract_patterns(f"{issue_content.title}\n\n{issue_content.body or ''}")
+                    pre_extract_span.set(indicators=len(local.indicators))
+                self.pre_extraction_stats['indicators'] += len(local.indicators)
+                
+                if self._is_indicator_only(local, issue_content):
+                    structured_content = self._build_local_content(issue_content, local)
+                    self.pre_extraction_stats['ai_calls_avoided'] += 1
+                    _EXTRACTIONS.inc(outcome='local')
+                    processing_time = (datetime.now() - start_time).total_seconds() * 1000
+                    
+                    return ExtractionResult(
+                        success=True,
+                        structured_content=structured_content,
+                        processing_time_ms=int(processing_time),
+                        ai_response_metadata={"model": None, "source": "local"}
+                    )
+            
             # Build extraction prompt
-            prompt_data = self.prompt_builder.build_content_extraction_prompt(
-                issue=issue_content,
-                focus=extraction_focus,
-                specialist_context=specialist_context
-            )
+            with span("ai.prompt"):
+                prompt_issue, pre_extracted = self._prepare_prompt_input(issue_content, local)
+                prompt_data = self.prompt_builder.build_content_extraction_prompt(
+                    issue=prompt_issue,
+                    focus=extraction_focus,
+                    specialist_context=specialist_context,
+                    pre_extracted=pre_extracted
+                )
             
             # Call AI for content extraction
+            self.pre_extraction_stats['ai_calls'] += 1
             ai_response = self._call_ai_extraction(prompt_data)
             
             # Parse AI response into structured content
-            structured_content = self._parse_extraction_response(ai_response.content)
+            with span("ai.parse"):
+                structured_content = self._parse_extraction_response(ai_response.content)
+                if local is not None:
+                    structured_content = self._apply_local_extraction(structured_content, local)
             
             # Validate extracted content if enabled
             if self.enable_validation:
-                self._validate_extracted_content(structured_content)
+                with span("ai.validate"):
+                    self._validate_extracted_content(structured_content)
             
             processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            _EXTRACTIONS.inc(outcome='success')
             
             return ExtractionResult(
                 success=True,
@@ -195,6 +249,7 @@ class ContentExtractionAgent:
             
         except Exception as e:
             log_exception(self.logger, f"Content extraction failed for issue {issue_data.get('number', 'unknown')}", e)
+            _EXTRACTIONS.inc(outcome='failure')
             
             processing_time = (datetime.now() - start_time).total_seconds() * 1000
             
@@ -595,6 +650,132 @@ class ContentExtractionAgent:
             extraction_timestamp=datetime.utcnow().isoformat()
         )
     
+    def _is_indicator_only(self, local: LocalExtraction, issue_content: IssueContent) -> bool:
+        """Whether the issue body is little more than a list of indicators"""
+        config = self.pre_extraction_config
+        return (len(local.indicators) >= config.min_indicators and
+                local.indicator_coverage(start=len(issue_content.title) + 2) >= config.skip_ai_coverage)
+    
+    def _prepare_prompt_input(self,
+                              issue_content: IssueContent,
+                              local: Optional[LocalExtraction]
+                              ) -> Tuple[IssueContent, Optional[Dict[str, List[str]]]]:
+        """
+        Issue content and already-extracted values for the AI prompt
+        
+        With redaction enabled, indicators in the body are replaced by short
+        references, so long hashes and URLs are not sent to the model.
+        
+        Args:
+            issue_content: Issue content
+            local: Local extraction over the title and body, if it ran
+            
+        Returns:
+            Tuple of the issue content to prompt with and the values to list
+            as already extracted (None when there are none)
+        """
+        if local is None or not local.matches:
+            return issue_content, None
+        
+        pre_extracted = local.by_kind()
+        if self.pre_extraction_config.redact_indicators and local.indicators:
+            issue_content = replace(issue_content, body=local.redact(start=len(issue_content.title) + 2))
+            references: Dict[str, List[str]] = {}
+            for reference, (kind, _) in local.references().items():
+                references.setdefault(kind, []).append(reference)
+            pre_extracted.update(references)
+        return issue_content, pre_extracted
+    
+    def _apply_local_extraction(self,
+                                content: StructuredContent,
+                                local: LocalExtraction) -> StructuredContent:
+        """
+        Resolve indicator references in the AI's answer and add local findings
+        
+        Args:
+            content: Structured content parsed from the AI response
+            local: Local extraction the prompt was built from
+            
+        Returns:
+            The same content, with references replaced by values and every
+            locally extracted indicator and entity present once
+        """
+        resolve = local.resolve
+        content.summary = resolve(content.summary)
+        for entity in content.entities:
+            entity.name = resolve(entity.name)
+        for relationship in content.relationships:
+            relationship.entity1 = resolve(relationship.entity1)
+            relationship.entity2 = resolve(relationship.entity2)
+            relationship.context = resolve(relationship.context)
+        for event in content.events:
+            event.description = resolve(event.description)
+            if event.entities_involved:
+                event.entities_involved = [resolve(name) for name in event.entities_involved]
+        for indicator in content.indicators:
+            indicator.value = resolve(indicator.value)
+        
+        local_content = self._local_findings(local)
+        indicator_values = {indicator.value.lower() for indicator in content.indicators}
+        for indicator in local_content.indicators:
+            if indicator.value.lower() not in indicator_values:
+                content.indicators.append(indicator)
+                indicator_values.add(indicator.value.lower())
+        entity_names = {entity.name.lower() for entity in content.entities}
+        for entity in local_content.entities:
+            if entity.name.lower() not in entity_names:
+                content.entities.append(entity)
+                entity_names.add(entity.name.lower())
+        return content
+    
+    def _build_local_content(self,
+                             issue_content: IssueContent,
+                             local: LocalExtraction) -> StructuredContent:
+        """Structured content for an issue extracted without the AI"""
+        content = self._local_findings(local)
+        counts = Counter(kind for kind, _ in local.indicators)
+        content.summary = (
+            f"Indicator list for issue #{issue_content.number}: "
+            + ", ".join(f"{count} {kind}" for kind, count in counts.items())
+        )
+        content.key_topics = list(counts)
+        return content
+    
+    def _local_findings(self, local: LocalExtraction) -> StructuredContent:
+        """Locally extracted indicators and entities as structured content"""
+        indicators = [
+            Indicator(
+                type='vulnerability' if kind == 'cve' else 'IOC',
+                value=value,
+                confidence=_LOCAL_INDICATOR_CONFIDENCE,
+                description=kind,
+                source='local'
+            )
+            for kind, value in local.indicators
+        ]
+        entities = [
+            Entity(
+                name=value,
+                type=entity_type,
+                confidence=_LOCAL_ENTITY_CONFIDENCE.get(kind, _LOCAL_INDICATOR_CONFIDENCE),
+                attributes={'kind': kind, 'source': 'local'}
+            )
+            for kind, entity_type in _LOCAL_ENTITY_TYPES.items()
+            for value in local.values(kind)
+        ]
+        return StructuredContent(
+            summary="",
+            entities=entities,
+            relationships=[],
+            events=[],
+            indicators=indicators,
+            key_topics=[],
+            urgency_level="medium",
+            content_type="security",
+            confidence_score=0.9,
+            extraction_timestamp=datetime.utcnow().isoformat()
+        )
+    
     def _convert_issue_data(self, issue_data: Dict[str, Any]) -> IssueContent:
         """Convert GitHub issue data to IssueContent format"""
         return IssueContent(
@@ -765,6 +946,10 @@ class ContentExtractionAgent:
             "ai_model": self.ai_client.model,
             "confidence_threshold": self.confidence_threshold,
             "validation_enabled": self.enable_validation,
+            "pre_extraction": {
+                "enabled": self.pre_extraction_config.enabled,
+                **self.pre_extraction_stats
+            },
             "rate_limit_status": self.ai_client.get_rate_limit_status()
         }
     
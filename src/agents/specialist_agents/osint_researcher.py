@@ -20,6 +20,11 @@ from typing import Any, Dict, List, Optional
 from . import SpecialistAgent, SpecialistType, AnalysisResult, AnalysisStatus
 from ...utils.ai_prompt_builder import AIPromptBuilder, PromptType
 from ...clients.github_models_client import GitHubModelsClient
+from ...utils.pattern_extractor import extract_patterns
+
+
+# Locally extracted kinds that are part of a digital footprint
+DIGITAL_FOOTPRINT_KINDS = ('domain', 'email', 'ipv4', 'url')
 
 
 class OSINTResearcherAgent(SpecialistAgent):
@@ -418,6 +423,15 @@ class OSINTResearcherAgent(SpecialistAgent):
             if entity_type in ['domain', 'email', 'phone', 'organization', 'technology']:
                 digital_entities.extend([e.get('name', '') for e in entity_list])
         
+        # Add domains, addresses and URLs found in the issue text itself
+        known = {name.lower() for name in digital_entities}
+        local = extract_patterns(self._extract_content_text(issue_data))
+        for kind in DIGITAL_FOOTPRINT_KINDS:
+            for value in local.values(kind):
+                if value.lower() not in known:
+                    digital_entities.append(value)
+                    known.add(value.lower())
+        
         # Identify verification opportunities
         verification_targets = []
         for entity_type, entity_list in entities.items():
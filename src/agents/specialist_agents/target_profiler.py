@@ -6,12 +6,31 @@ and business intelligence for comprehensive target profiling in intelligence ope
 """
 
 import logging
+import re
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from . import SpecialistAgent, SpecialistType, AnalysisResult, AnalysisStatus
 from ...clients.github_models_client import GitHubModelsClient, AIResponse
+from ...utils.keyword_matcher import get_keyword_matcher, register_keywords
 from ...utils.logging_config import get_logger, log_exception
+from ...utils.pattern_extractor import ORGANIZATION_SUFFIXES, extract_patterns
+
+
+FINANCIAL_TERMS = register_keywords('target_profiler.financial', [
+    'revenue', 'profit', 'funding', 'investment', 'valuation', 'budget',
+    'financial', 'earnings', 'costs', 'expenses', 'income', 'capital'
+])
+
+# Acronyms like FBI or CIA, matched case-sensitively
+_ACRONYM_PATTERN = re.compile(r'\b[A-Z][A-Z0-9]{1,9}\b')
+_EXECUTIVE_TITLES = r'(?i:CEO|CTO|CFO|Director|Manager|President|VP|Vice President|Executive)'
+_PERSON_NAME = r'[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*'
+# A title followed by a name ("CEO Jane Doe") or a name followed by a title ("Jane Doe, CEO")
+_PERSONNEL_PATTERN = re.compile(
+    rf'\b{_EXECUTIVE_TITLES}\s+({_PERSON_NAME})'
+    rf'|\b({_PERSON_NAME}),?\s+(?i:CEO|CTO|CFO|Director|Manager|President)\b'
+)
 
 
 class TargetProfilerAgent(SpecialistAgent):
@@ -488,51 +507,25 @@ Focus on actionable intelligence for decision-makers and strategic planning."""
     
     def _extract_organizations(self, content: str) -> List[str]:
         """Extract organizational names using pattern matching."""
-        import re
-        
-        # Common organizational suffixes
-        org_patterns = [
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:Inc|Corp|Company|Corporation|LLC|Ltd|Agency|Department|Division)\b',
-            r'\b([A-Z][A-Z0-9]+)\b',  # Acronyms like FBI, CIA, etc.
-        ]
-        
-        organizations = set()
-        for pattern in org_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            organizations.update(matches)
+        # Names with an organizational suffix, then acronyms
+        organizations = dict.fromkeys(extract_patterns(content).values('organization'))
+        for acronym in _ACRONYM_PATTERN.findall(content):
+            if acronym not in ORGANIZATION_SUFFIXES:
+                organizations.setdefault(acronym)
             
         return list(organizations)[:10]  # Limit results
     
     def _extract_personnel(self, content: str) -> List[str]:
         """Extract personnel names and titles using pattern matching.""" 
-        import re
-        
-        # Look for titles followed by names
-        title_patterns = [
-            r'(?:CEO|CTO|CFO|Director|Manager|President|VP|Vice President|Executive)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),?\s+(?:CEO|CTO|CFO|Director|Manager|President)'
-        ]
-        
-        personnel = set()
-        for pattern in title_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            personnel.update(matches)
+        # Look for titles next to names
+        personnel = dict.fromkeys(
+            after_title or before_title
+            for after_title, before_title in _PERSONNEL_PATTERN.findall(content)
+        )
             
         return list(personnel)[:10]  # Limit results
     
     def _extract_financial_indicators(self, content: str) -> List[str]:
         """Extract financial indicators and terms."""
-        
-        financial_terms = [
-            'revenue', 'profit', 'funding', 'investment', 'valuation', 'budget',
-            'financial', 'earnings', 'costs', 'expenses', 'income', 'capital'
-        ]
-        
-        found_terms = []
-        content_lower = content.lower()
-        
-        for term in financial_terms:
-            if term in content_lower:
-                found_terms.append(term)
-                
+        found_terms = get_keyword_matcher().scan(content, ['target_profiler.financial'])['target_profiler.financial']
         return found_terms[:5]  # Limit results
\ No newline at end of file
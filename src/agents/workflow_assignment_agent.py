@@ -25,6 +25,8 @@ from enum import Enum
 
 from ..workflow.workflow_matcher import WorkflowMatcher, WorkflowInfo, WorkflowMatcherError
 from ..clients.github_issue_creator import GitHubIssueCreator
+from ..clients.github_mutation_queue import GitHubMutationQueue, apply_issue_updates
+from .assignment_engine import DEFAULT_MAX_WORKERS, ConcurrentAssignmentEngine
 from ..utils.config_manager import ConfigManager
 from ..utils.logging_config import get_logger, log_exception
 
@@ -90,6 +92,8 @@ class WorkflowAssignmentAgent:
         self.logger = get_logger(__name__)
         self.github = GitHubIssueCreator(github_token, repo_name)
         self.repo_name = repo_name
+        # Set while a batch is running so label and comment writes are coalesced
+        self.mutation_queue: Optional[GitHubMutationQueue] = None
         
         # Load configuration
         try:
@@ -230,10 +234,6 @@ class WorkflowAssignmentAgent:
                 )
             
             if not dry_run:
-                # Add the workflow trigger labels
-                for label in labels_to_add:
-                    current_issue.add_to_labels(label)
-                
                 # Add comment explaining the assignment
                 comment_body = (
                     f"🤖 **Workflow Assignment**\n\n"
@@ -243,7 +243,7 @@ class WorkflowAssignmentAgent:
                     f"If this assignment is incorrect, please remove the workflow labels and add "
                     f"more specific labels to help with proper classification."
                 )
-                current_issue.create_comment(comment_body)
+                apply_issue_updates(self.mutation_queue, current_issue, issue_number, labels_to_add, comment_body)
             
             message = f"Assigned workflow '{workflow.name}' (labels: {', '.join(labels_to_add)})"
             self.logger.info(f"Issue #{issue_number}: {message}")
@@ -298,10 +298,6 @@ class WorkflowAssignmentAgent:
                 labels_to_add.append(self.NEEDS_CLARIFICATION_LABEL)
             
             if not dry_run:
-                # Add labels
-                for label in labels_to_add:
-                    current_issue.add_to_labels(label)
-                
                 # Create clarification comment
                 comment_parts = [
                     "🤖 **Workflow Clarification Needed**\n",
@@ -332,7 +328,7 @@ class WorkflowAssignmentAgent:
                 )
                 
                 comment_body = "".join(comment_parts)
-                current_issue.create_comment(comment_body)
+                apply_issue_updates(self.mutation_queue, current_issue, issue_number, labels_to_add, comment_body)
             
             message = f"Requested clarification: {reason}"
             self.logger.info(f"Issue #{issue_number}: {message}")
@@ -412,18 +408,37 @@ class WorkflowAssignmentAgent:
                 message=error_msg
             )
     
+    @staticmethod
+    def _mark_failed_writes(results: List[AssignmentResult],
+                            statistics: Dict[str, int],
+                            failed_issues: Dict[int, str]) -> None:
+        """Turn results whose queued writes failed into errors"""
+        for index, result in enumerate(results):
+            if result.issue_number not in failed_issues or result.action == AssignmentAction.ERROR:
+                continue
+            statistics[result.action.value] -= 1
+            statistics[AssignmentAction.ERROR.value] += 1
+            results[index] = AssignmentResult(
+                issue_number=result.issue_number,
+                action=AssignmentAction.ERROR,
+                workflow_name=result.workflow_name,
+                message=f"Failed to apply changes: {failed_issues[result.issue_number]}"
+            )
+    
     def process_issues_batch(self, 
                            limit: Optional[int] = None,
-                           dry_run: bool = False) -> Dict[str, Any]:
+                           dry_run: bool = False,
+                           max_workers: int = DEFAULT_MAX_WORKERS) -> Dict[str, Any]:
         """
         Process a batch of issues for workflow assignment.
         
         Args:
             limit: Maximum number of issues to process
             dry_run: If True, don't make actual changes
+            max_workers: Maximum issues processed at the same time
             
         Returns:
-            Dictionary with processing statistics and results
+            Dictionary with processing statistics, results and a throughput report
         """
         start_time = time.time()
         self.logger.info(f"Starting workflow assignment batch processing (limit: {limit}, dry_run: {dry_run})")
@@ -442,29 +457,37 @@ class WorkflowAssignmentAgent:
                     'duration_seconds': time.time() - start_time
                 }
             
-            # Process each issue
-            results = []
+            # Process issues concurrently; label and comment writes are queued and
+            # flushed in batches (pacing is handled by the GitHub transport)
             statistics = {action.value: 0 for action in AssignmentAction}
+            write_stats = None
+            if not dry_run:
+                self.mutation_queue = GitHubMutationQueue(self.github)
+            
+            def error_result(issue_data: Dict[str, Any], error: Exception) -> AssignmentResult:
+                return AssignmentResult(
+                    issue_number=issue_data['number'],
+                    action=AssignmentAction.ERROR,
+                    message=f"Processing error: {error}"
+                )
+            
+            try:
+                results, throughput = ConcurrentAssignmentEngine(max_workers=max_workers).run(
+                    issues,
+                    lambda issue_data: self.process_issue_assignment(issue_data, dry_run),
+                    error_result,
+                    mutation_queue=self.mutation_queue
+                )
+            finally:
+                if self.mutation_queue is not None:
+                    write_stats = self.mutation_queue.flush()
+                    self.mutation_queue = None
+            
+            for result in results:
+                statistics[result.action.value] += 1
             
-            for issue_data in issues:
-                try:
-                    result = self.process_issue_assignment(issue_data, dry_run)
-                    results.append(result)
-                    statistics[result.action.value] += 1
-                    
-                    # Add small delay between issues to be respectful to GitHub API
-                    time.sleep(0.1)
-                    
-                except Exception as e:
-                    error_result = AssignmentResult(
-                        issue_number=issue_data['number'],
-                        action=AssignmentAction.ERROR,
-                        message=f"Processing error: {e}"
-                    )
-                    results.append(error_result)
-                    statistics[AssignmentAction.ERROR.value] += 1
-                    
-                    log_exception(self.logger, f"Failed to process issue #{issue_data['number']}", e)
+            if write_stats:
+                self._mark_failed_writes(results, statistics, write_stats['failed_issues'])
             
             duration = time.time() - start_time
             
@@ -479,13 +502,17 @@ class WorkflowAssignmentAgent:
             for action, count in statistics.items():
                 if count > 0:
                     self.logger.info(f"  {action}: {count}")
+            self.logger.info(f"  Throughput: {throughput.issues_per_minute:.1f} issues/min "
+                             f"with {throughput.max_workers} workers")
             
             return {
                 'total_issues': len(issues),
                 'processed': processed_count,
                 'results': results,
                 'statistics': statistics,
-                'duration_seconds': duration
+                'duration_seconds': duration,
+                'write_stats': write_stats,
+                'throughput': throughput.to_dict()
             }
             
         except Exception as e:
@@ -0,0 +1,375 @@
+"""
+Workflow Pre-classifier
+
+Local linear classifier that decides workflow assignments for the obvious
+issues before they reach the GitHub Models API.
+
+Issues are turned into hashed unigram and bigram features from the title,
+body and labels, and a multinomial logistic regression model trained on
+past AI assignments predicts a workflow. When the model is confident, the
+prediction is used directly and no AI call is made; everything else is
+escalated to the model as before.
+
+Training examples and weights are stored together in one JSON file, so the
+classifier keeps learning from the assignments the AI makes in each run. New
+assignments update the current weights (``partial_fit``); training from
+scratch on all stored examples (``fit``) is only needed occasionally.
+"""
+
+import heapq
+import json
+import math
+import os
+import random
+import re
+import tempfile
+import zlib
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from ..utils.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_FEATURE_BITS = 16
+MAX_STORED_EXAMPLES = 2000
+MAX_STORED_BODY_CHARS = 2000
+# Only the largest weights of each workflow are saved; smaller ones barely
+# move a prediction
+MAX_STORED_WEIGHTS = 5000
+MIN_STORED_WEIGHT = 1e-4
+
+_TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9_\-]+')
+
+
+@dataclass
+class TrainingExample:
+    """One past assignment"""
+    title: str
+    body: str
+    labels: List[str]
+    workflow: str
+    content_type: str = "unknown"
+
+
+@dataclass
+class PreclassifierDecision:
+    """Outcome of a local classification"""
+    workflow: Optional[str]
+    confidence: float
+    margin: float
+    decided: bool
+    reason: str
+    scores: Dict[str, float] = field(default_factory=dict)
+
+
+def _hash(token: str, mask: int) -> int:
+    # crc32 is stable across processes, unlike the salted built-in hash()
+    return zlib.crc32(token.encode('utf-8')) & mask
+
+
+def extract_features(title: str, body: str, labels: Iterable[str],
+                     feature_bits: int = DEFAULT_FEATURE_BITS) -> Dict[int, float]:
+    """
+    Hashed, L2-normalized n-gram features for an issue
+
+    Args:
+        title: Issue title
+        body: Issue body
+        labels: Issue labels
+        feature_bits: Feature space size as a power of two
+
+    Returns:
+        Feature index -> weight
+    """
+    mask = (1 << feature_bits) - 1
+    counts: Counter = Counter()
+    for prefix, text in (('t', title or ''), ('b', body or '')):
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        for token in tokens:
+            counts[_hash(f"{prefix}:{token}", mask)] += 1
+        for first, second in zip(tokens, tokens[1:]):
+            counts[_hash(f"{prefix}:{first} {second}", mask)] += 1
+    for label in labels or ():
+        counts[_hash(f"l:{label.lower()}", mask)] += 1
+
+    # Sublinear term frequency keeps long bodies from drowning the title
+    features = {index: 1.0 + math.log(count) for index, count in counts.items()}
+    norm = math.sqrt(sum(value * value for value in features.values()))
+    if norm:
+        features = {index: value / norm for index, value in features.items()}
+    return features
+
+
+def _stored_weights(weights: Dict[int, float]) -> Dict[str, float]:
+    largest = heapq.nlargest(MAX_STORED_WEIGHTS, weights.items(), key=lambda item: abs(item[1]))
+    return {str(index): round(value, 5) for index, value in largest if abs(value) >= MIN_STORED_WEIGHT}
+
+
+class WorkflowPreclassifier:
+    """Multinomial logistic regression over hashed n-gram features"""
+
+    def __init__(self,
+                 feature_bits: int = DEFAULT_FEATURE_BITS,
+                 epochs: int = 15,
+                 learning_rate: float = 0.5,
+                 l2: float = 1e-4):
+        """
+        Initialize an untrained classifier
+
+        Args:
+            feature_bits: Feature space size as a power of two
+            epochs: Passes over the examples per training run
+            learning_rate: SGD step size
+            l2: L2 regularization strength
+        """
+        self.feature_bits = feature_bits
+        self.epochs = epochs
+        self.learning_rate = learning_rate
+        self.l2 = l2
+
+        self.examples: List[TrainingExample] = []
+        self.classes: List[str] = []
+        self.weights: Dict[str, Dict[int, float]] = {}
+        self.bias: Dict[str, float] = {}
+        self.content_types: Dict[str, str] = {}
+        self.trained_examples = 0
+        self.incremental_examples = 0  # Learned by partial_fit since the last fit
+
+    @property
+    def is_trained(self) -> bool:
+        return len(self.classes) > 1 and self.trained_examples > 0
+
+    def add_example(self, example: TrainingExample) -> None:
+        """Store an example for the next ``fit``, dropping the oldest beyond the limit"""
+        example.body = (example.body or '')[:MAX_STORED_BODY_CHARS]
+        self.examples.append(example)
+        if len(self.examples) > MAX_STORED_EXAMPLES:
+            del self.examples[:len(self.examples) - MAX_STORED_EXAMPLES]
+
+    def fit(self, examples: Optional[List[TrainingExample]] = None) -> int:
+        """
+        Train from scratch on the stored examples (or the given ones)
+
+        Args:
+            examples: Examples to train on instead of the stored ones
+
+        Returns:
+            Number of examples trained on
+        """
+        examples = self.examples if examples is None else examples
+        self.classes = sorted({example.workflow for example in examples})
+        self.weights = {name: {} for name in self.classes}
+        self.bias = {name: 0.0 for name in self.classes}
+        self.content_types = {}
+        self.trained_examples = 0
+        self.incremental_examples = 0
+        if len(self.classes) < 2:
+            # A single class gives the model nothing to separate
+            return 0
+
+        self._train(examples, [self.learning_rate / (1.0 + epoch) for epoch in range(self.epochs)])
+        self._update_content_types(examples)
+        self.trained_examples = len(examples)
+        return self.trained_examples
+
+    def partial_fit(self, examples: List[TrainingExample]) -> int:
+        """
+        Update the current weights with new examples
+
+        Only the new examples are visited, at the small step size the last
+        epoch of ``fit`` ends with, so earlier training is adjusted rather
+        than overwritten. An untrained model is trained from scratch on its
+        stored examples instead.
+
+        Args:
+            examples: Examples not yet trained on
+
+        Returns:
+            Number of examples the model has been trained on
+        """
+        if not self.is_trained:
+            return self.fit()
+        for name in sorted({example.workflow for example in examples} - set(self.classes)):
+            self.classes.append(name)
+            self.weights[name] = {}
+            self.bias[name] = 0.0
+        self.classes.sort()
+
+        self._train(examples, [self.learning_rate / (1.0 + self.epochs)] * self.epochs)
+        self._update_content_types(self.examples)
+        self.trained_examples += len(examples)
+        self.incremental_examples += len(examples)
+        return self.trained_examples
+
+    def _train(self, examples: List[TrainingExample], rates: List[float]) -> None:
+        # One shuffled SGD pass per learning rate
+        vectors = [
+            (extract_features(example.title, example.body, example.labels, self.feature_bits),
+             example.workflow)
+            for example in examples
+        ]
+        order = list(range(len(vectors)))
+        rng = random.Random(0)
+        for rate in rates:
+            rng.shuffle(order)
+            for position in order:
+                features, target = vectors[position]
+                probabilities = self._probabilities(features)
+                for name in self.classes:
+                    gradient = probabilities[name] - (1.0 if name == target else 0.0)
+                    weights = self.weights[name]
+                    for index, value in features.items():
+                        weight = weights.get(index, 0.0)
+                        weight -= rate * (gradient * value + self.l2 * weight)
+                        if weight:
+                            weights[index] = weight
+                        else:
+                            weights.pop(index, None)
+                    self.bias[name] -= rate * gradient
+
+    def _update_content_types(self, examples: List[TrainingExample]) -> None:
+        by_workflow: Dict[str, Counter] = {}
+        for example in examples:
+            by_workflow.setdefault(example.workflow, Counter())[example.content_type] += 1
+        self.content_types.update(
+            {name: counts.most_common(1)[0][0] for name, counts in by_workflow.items()})
+
+    def _probabilities(self, features: Dict[int, float]) -> Dict[str, float]:
+        logits = {}
+        for name in self.classes:
+            weights = self.weights[name]
+            logits[name] = self.bias[name] + sum(
+                weights.get(index, 0.0) * value for index, value in features.items()
+            )
+        top = max(logits.values())
+        exponentials = {name: math.exp(logit - top) for name, logit in logits.items()}
+        total = sum(exponentials.values())
+        return {name: value / total for name, value in exponentials.items()}
+
+    def predict(self, title: str, body: str, labels: Iterable[str]) -> Dict[str, float]:
+        """
+        Workflow probabilities for an issue
+
+        Returns:
+            Workflow name -> probability, empty while untrained
+        """
+        if not self.is_trained:
+            return {}
+        return self._probabilities(extract_features(title, body, labels, self.feature_bits))
+
+    def decide(self,
+               title: str,
+               body: str,
+               labels: Iterable[str],
+               threshold: float,
+               min_margin: float,
+               min_examples: int,
+               allowed_workflows: Optional[Iterable[str]] = None) -> PreclassifierDecision:
+        """
+        Decide an issue locally, or say why it should be escalated
+
+        Args:
+            title: Issue title
+            body: Issue body
+            labels: Issue labels
+            threshold: Minimum probability of the top workflow
+            min_margin: Minimum lead of the top workflow over the runner-up
+            min_examples: Examples the model must have been trained on
+            allowed_workflows: Workflows that currently exist; others are never chosen
+
+        Returns:
+            The decision; ``decided`` is False when the issue should go to the AI
+        """
+        if self.trained_examples < min_examples or not self.is_trained:
+            return PreclassifierDecision(None, 0.0, 0.0, False,
+                                         f"model trained on {self.trained_examples} examples")
+        scores = self.predict(title, body, labels)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        workflow, confidence = ranked[0]
+        margin = confidence - (ranked[1][1] if len(ranked) > 1 else 0.0)
+        if allowed_workflows is not None and workflow not in set(allowed_workflows):
+            return PreclassifierDecision(workflow, confidence, margin, False,
+                                         f"'{workflow}' is no longer available", scores)
+        if confidence < threshold:
+            return PreclassifierDecision(workflow, confidence, margin, False,
+                                         f"confidence {confidence:.2f} below {threshold:.2f}", scores)
+        if margin < min_margin:
+            return PreclassifierDecision(workflow, confidence, margin, False,
+                                         f"margin {margin:.2f} below {min_margin:.2f}", scores)
+        return PreclassifierDecision(workflow, confidence, margin, True,
+                                     f"confidence {confidence:.2f}, margin {margin:.2f}", scores)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'feature_bits': self.feature_bits,
+            'epochs': self.epochs,
+            'learning_rate': self.learning_rate,
+            'l2': self.l2,
+            'trained_examples': self.trained_examples,
+            'incremental_examples': self.incremental_examples,
+            'classes': self.classes,
+            'bias': self.bias,
+            # JSON object keys are strings; rounding and pruning keep the file small
+            'weights': {name: _stored_weights(weights) for name, weights in self.weights.items()},
+            'content_types': self.content_types,
+            'examples': [asdict(example) for example in self.examples],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> 'WorkflowPreclassifier':
+        classifier = cls(
+            feature_bits=data.get('feature_bits', DEFAULT_FEATURE_BITS),
+            epochs=data.get('epochs', 15),
+            learning_rate=data.get('learning_rate', 0.5),
+            l2=data.get('l2', 1e-4),
+        )
+        classifier.examples = [TrainingExample(**example) for example in data.get('examples', [])]
+        classifier.classes = list(data.get('classes', []))
+        classifier.bias = {name: float(value) for name, value in data.get('bias', {}).items()}
+        classifier.weights = {
+            name: {int(index): float(value) for index, value in weights.items()}
+            for name, weights in data.get('weights', {}).items()
+        }
+        classifier.content_types = dict(data.get('content_types', {}))
+        classifier.trained_examples = int(data.get('trained_examples', 0))
+        classifier.incremental_examples = int(data.get('incremental_examples', 0))
+        return classifier
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the model and its examples atomically"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(self.to_dict(), file, separators=(',', ':'))
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'WorkflowPreclassifier':
+        """
+        Load a saved classifier
+
+        Args:
+            path: Model file
+
+        Returns:
+            The saved classifier, or an untrained one if the file is missing or unreadable
+        """
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                return cls.from_dict(json.load(file))
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Could not load workflow classifier from {path}, starting untrained: {e}")
+            return cls()
@@ -0,0 +1,210 @@
+"""
+GitHub GraphQL Module
+GraphQL queries used to batch GitHub reads that would otherwise need one REST call per issue
+"""
+
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+ISSUES_WITH_COMMENTS_QUERY = """
+query IssuesWithComments($owner: String!, $name: String!, $labels: [String!], $states: [IssueState!],
+                         $since: DateTime, $orderBy: IssueOrder, $first: Int!, $after: String,
+                         $comments: Int!) {
+  repository(owner: $owner, name: $name) {
+    issues(labels: $labels, states: $states, filterBy: {since: $since}, orderBy: $orderBy,
+           first: $first, after: $after) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        databaseId
+        number
+        title
+        body
+        url
+        state
+        locked
+        createdAt
+        updatedAt
+        closedAt
+        author { __typename login }
+        assignees(first: 10) { nodes { login } }
+        labels(first: 50) { nodes { name } }
+        comments(last: $comments) {
+          totalCount
+          nodes { body createdAt author { __typename login } }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+class GitHubGraphQLClient:
+    """Runs GraphQL queries through a PyGithub requester"""
+
+    def __init__(self, requester: Any, repository: str):
+        """
+        Initialize the GraphQL client
+
+        Args:
+            requester: PyGithub requester (``Github.requester``), so queries share
+                authentication, the caching transport and rate-limit scheduling
+            repository: Repository name in format 'owner/repo'
+        """
+        self.requester = requester
+        self.owner, _, self.name = repository.partition('/')
+
+    def query(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a GraphQL query
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            The ``data`` section of the response
+
+        Raises:
+            GithubException: If the request fails or GraphQL returns errors
+        """
+        _, response = self.requester.graphql_query(query, variables)
+        return response.get('data') or {}
+
+    def execute(self, query: str, variables: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Execute a GraphQL document and return partial results alongside errors.
+
+        Unlike :meth:`query`, GraphQL-level errors do not raise, so callers that
+        send several aliased operations in one document can tell which of them
+        failed from each error's ``path``.
+
+        Args:
+            query: GraphQL document
+            variables: Document variables
+
+        Returns:
+            Tuple of (``data`` section, list of GraphQL errors)
+
+        Raises:
+            GithubException: If the HTTP request fails
+        """
+        _, response = self.requester.requestJsonAndCheck(
+            "POST", self.requester.graphql_url, input={'query': query, 'variables': variables}
+        )
+        return response.get('data') or {}, response.get('errors') or []
+
+    def iter_issues_with_comments(self,
+                                  labels: Optional[List[str]] = None,
+                                  states: Optional[List[str]] = None,
+                                  comment_window: int = 20,
+                                  page_size: int = 50,
+                                  since: Optional[str] = None,
+                                  order_by: str = 'CREATED_AT',
+                                  direction: str = 'DESC') -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over issues together with their most recent comments.
+
+        Each page returns up to ``page_size`` issues and the last ``comment_window``
+        comments of every issue in a single request.
+
+        Args:
+            labels: Only include issues with these labels
+            states: Issue states (GraphQL enum values, default ``['OPEN']``)
+            comment_window: Number of most recent comments to fetch per issue
+            page_size: Issues per request (GitHub allows up to 100)
+            since: Only include issues updated at or after this ISO 8601 timestamp
+            order_by: Issue ordering field ('CREATED_AT', 'UPDATED_AT' or 'COMMENTS')
+            direction: Ordering direction ('ASC' or 'DESC')
+
+        Yields:
+            Issue dictionaries in the shape of :func:`graphql_issue_to_rest`
+        """
+        variables = {
+            'owner': self.owner,
+            'name': self.name,
+            'labels': labels,
+            'states': states or ['OPEN'],
+            'since': since,
+            'orderBy': {'field': order_by, 'direction': direction},
+            'first': min(max(page_size, 1), 100),
+            'after': None,
+            'comments': min(max(comment_window, 0), 100),
+        }
+
+        while True:
+            data = self.query(ISSUES_WITH_COMMENTS_QUERY, variables)
+            issues = ((data.get('repository') or {}).get('issues')) or {}
+
+            for node in issues.get('nodes') or []:
+                if node:
+                    yield graphql_issue_to_rest(node)
+
+            page_info = issues.get('pageInfo') or {}
+            if not page_info.get('hasNextPage'):
+                break
+            variables['after'] = page_info.get('endCursor')
+
+
+def graphql_issue_to_rest(node: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a GraphQL issue node into REST-style issue attributes.
+
+    The ``comments`` key holds the fetched comments as ``{'login', 'type', 'body',
+    'created_at'}`` dictionaries and ``comment_count`` the total number of comments
+    on the issue. Author ``type`` is the GraphQL type name ('User', 'Bot', ...),
+    which matches the REST ``user.type``; GraphQL bot logins have no ``[bot]`` suffix.
+
+    Args:
+        node: Issue node from :data:`ISSUES_WITH_COMMENTS_QUERY`
+
+    Returns:
+        Dictionary with REST field names
+    """
+    assignees = [
+        {'login': assignee['login']}
+        for assignee in (node.get('assignees') or {}).get('nodes') or []
+        if assignee
+    ]
+    comments = node.get('comments') or {}
+
+    return {
+        'id': node.get('databaseId'),
+        'number': node.get('number'),
+        'title': node.get('title') or '',
+        'body': node.get('body') or '',
+        'html_url': node.get('url') or '',
+        'state': (node.get('state') or '').lower(),
+        'locked': bool(node.get('locked')),
+        'created_at': node.get('createdAt'),
+        'updated_at': node.get('updatedAt'),
+        'closed_at': node.get('closedAt'),
+        'user': _author(node.get('author')),
+        'labels': [
+            {'name': label['name']}
+            for label in (node.get('labels') or {}).get('nodes') or []
+            if label
+        ],
+        'assignees': assignees,
+        'assignee': assignees[0] if assignees else None,
+        'comment_count': comments.get('totalCount', 0),
+        'comments': [
+            {
+                **_author(comment.get('author')),
+                'body': comment.get('body') or '',
+                'created_at': comment.get('createdAt')
+            }
+            for comment in comments.get('nodes') or []
+            if comment
+        ],
+    }
+
+
+def _author(author: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    # Deleted accounts come back as a null author
+    author = author or {}
+    return {'login': author.get('login') or '', 'type': author.get('__typename') or ''}
@@ -5,28 +5,70 @@ Handles GitHub API operations for Speculum Principum
 
 from github import Github, Auth
 from github.GithubException import GithubException
-from typing import List, Optional, Dict, Any
+from github.Issue import Issue
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Union
 from unittest.mock import Mock
 from datetime import datetime, timedelta
 import logging
+import time
+
+from .github_graphql import GitHubGraphQLClient
+from .github_transport import get_shared_transport
+from .issue_discovery import IssueDiscovery, IssueQuery
+from ..storage.agent_activity_index import AgentActivityIndex
+from ..storage.issue_mirror import IssueMirror
+from ..utils.keyword_matcher import get_keyword_matcher, register_keywords
+from ..utils.tracing import current_span, traced
 
 logger = logging.getLogger(__name__)
 
 
+# Comment text that marks an issue as already handled by the automated agent
+AGENT_ACTIVITY_INDICATORS = register_keywords('github.agent_activity', [
+    'github-actions[bot]',
+    'automated workflow',
+    '🤖',  # Robot emoji commonly used by agents
+    'deliverable generated',
+    'workflow matched'
+])
+
+
 class GitHubIssueCreator:
     """Handles creation and management of GitHub issues"""
     
-    def __init__(self, token: str, repository: str):
+    def __init__(self, token: str, repository: str,
+                 activity_index_path: str = ".agent_activity_index.json",
+                 activity_comment_window: int = 20,
+                 issue_mirror_path: str = ".issue_mirror.sqlite3"):
         """
         Initialize the GitHub issue creator
         
         Args:
             token: GitHub personal access token
             repository: Repository name in format 'owner/repo'
+            activity_index_path: File used to remember issues with agent activity
+            activity_comment_window: Recent comments inspected per issue when
+                scanning for agent activity
+            issue_mirror_path: SQLite file for the local issue mirror
         """
         self.github = Github(auth=Auth.Token(token))
+        self.transport = get_shared_transport()
+        self.transport.install(self.github)
         self.repository = repository
         self.repo = self.github.get_repo(repository)
+        self.graphql = GitHubGraphQLClient(self.github.requester, repository)
+        self.discovery = IssueDiscovery(self.github, repository, self.repo)
+        self.activity_index = AgentActivityIndex(activity_index_path)
+        self.activity_comment_window = activity_comment_window
+        self.issue_mirror_path = issue_mirror_path
+        self._issue_mirror: Optional[IssueMirror] = None
+        self._mirror_synced_at: Optional[float] = None
+    
+    def close(self) -> None:
+        """Close the HTTP connections and drop the issue mirror handle"""
+        self.github.close()
+        self._issue_mirror = None
+        self._mirror_synced_at = None
     
     def _extract_github_error_message(self, e: GithubException) -> str:
         """
@@ -117,6 +159,15 @@ class GitHubIssueCreator:
         except GithubException as e:
             raise RuntimeError(f"Failed to get repository info: {self._extract_github_error_message(e)}") from e
 
+    def get_api_usage_stats(self) -> Dict[str, Any]:
+        """
+        Get GitHub API response cache and rate-limit statistics
+        
+        Returns:
+            Dictionary with 'cache' and 'rate_limit' sections
+        """
+        return self.transport.get_stats()
+    
     def get_issue(self, issue_number: int):
         """
         Get a specific issue by number
@@ -165,6 +216,83 @@ class GitHubIssueCreator:
         except Exception as e:
             raise RuntimeError(f"Unexpected error getting issues with labels {labels}: {str(e)}") from e
 
+    def discover_issues(self,
+                        queries: Union[IssueQuery, Iterable[IssueQuery]],
+                        limit: Optional[int] = None) -> Iterator[Any]:
+        """
+        Lazily find issues matching server-side search filters
+        
+        Args:
+            queries: A query, or several queries whose results are concatenated
+            limit: Maximum number of issues to yield (None for all)
+            
+        Yields:
+            GitHub issue objects
+            
+        Raises:
+            RuntimeError: If the search fails
+        """
+        try:
+            yield from self.discovery.iter_issues(queries, limit)
+        except GithubException as e:
+            raise RuntimeError(f"Failed to discover issues: {self._extract_github_error_message(e)}") from e
+
+    @property
+    def issue_mirror(self) -> IssueMirror:
+        """Local issue mirror, opened on first use"""
+        if self._issue_mirror is None:
+            self._issue_mirror = IssueMirror(self.issue_mirror_path, self.repository)
+        return self._issue_mirror
+
+    def sync_issue_mirror(self, max_age_seconds: float = 0) -> Dict[str, Any]:
+        """
+        Pull issues changed since the last sync into the local mirror
+        
+        Args:
+            max_age_seconds: Skip the sync if this client synced more recently
+            
+        Returns:
+            Sync statistics
+            
+        Raises:
+            RuntimeError: If the sync fails and the mirror has never been synced
+        """
+        if (self._mirror_synced_at is not None and
+                time.monotonic() - self._mirror_synced_at < max_age_seconds):
+            return {'updated': 0, 'cursor': self.issue_mirror.cursor, 'skipped': True}
+        
+        try:
+            stats = self.issue_mirror.sync(self.graphql)
+        except GithubException as e:
+            if self.issue_mirror.cursor is None:
+                raise RuntimeError(f"Failed to sync issue mirror: {self._extract_github_error_message(e)}") from e
+            logger.warning(f"Issue mirror sync failed, using data from {self.issue_mirror.last_synced_at}: "
+                           f"{self._extract_github_error_message(e)}")
+            return {'updated': 0, 'cursor': self.issue_mirror.cursor, 'stale': True}
+        
+        self._mirror_synced_at = time.monotonic()
+        return stats
+
+    def get_mirrored_issues(self,
+                            query: IssueQuery,
+                            limit: Optional[int] = None,
+                            exclude_labels: Optional[List[str]] = None,
+                            max_age_seconds: float = 60) -> List[Dict[str, Any]]:
+        """
+        Get issues from the local mirror after an incremental sync
+        
+        Args:
+            query: Filters to apply
+            limit: Maximum number of issues to return
+            exclude_labels: Skip issues carrying any of these labels
+            max_age_seconds: Reuse a sync performed by this client within this window
+            
+        Returns:
+            List of issue data dictionaries
+        """
+        self.sync_issue_mirror(max_age_seconds)
+        return self.issue_mirror.query(query, limit=limit, exclude_labels=exclude_labels)
+
     def assign_issue(self, issue_number: int, assignees: List[str]) -> bool:
         """
         Assign an issue to specific users
@@ -211,6 +339,7 @@ class GitHubIssueCreator:
         except Exception as e:
             raise RuntimeError(f"Unexpected error unassigning issue #{issue_number}: {str(e)}") from e
 
+    @traced("github.issue_create")
     def create_individual_result_issue(self, site_name: str, result: Any, 
                                       labels: Optional[List[str]] = None) -> Any:
         """
@@ -242,6 +371,7 @@ class GitHubIssueCreator:
             labels=all_labels
         )
         
+        current_span().set(site=site_name, issue_number=issue.number)
         logger.info(f"Created individual result issue #{issue.number} for {site_name}")
         return issue
     
@@ -323,6 +453,11 @@ This site monitoring issue is being automatically closed as it's older than {day
         """
         Get site-monitor labeled issues that haven't been processed by the agent.
         
+        Issues and their most recent comments are fetched in pages with a single
+        GraphQL query, and issues already known to have agent activity are
+        answered from the local activity index. The REST API is used as a
+        fallback if the GraphQL query fails.
+        
         Args:
             limit: Maximum number of issues to return (None for all)
             force_reprocess: Whether to include already assigned issues
@@ -330,6 +465,53 @@ This site monitoring issue is being automatically closed as it's older than {day
         Returns:
             List of GitHub issue objects ready for processing
         """
+        try:
+            unprocessed_issues = self._get_unprocessed_issues_graphql(limit, force_reprocess)
+        except GithubException as e:
+            logger.warning(f"GraphQL issue scan failed, falling back to REST: {self._extract_github_error_message(e)}")
+            unprocessed_issues = self._get_unprocessed_issues_rest(limit, force_reprocess)
+        
+        logger.info(f"Found {len(unprocessed_issues)} unprocessed site-monitor issues")
+        return unprocessed_issues
+
+    def _get_unprocessed_issues_graphql(self, limit: Optional[int],
+                                        force_reprocess: bool) -> List[Any]:
+        """Scan open site-monitor issues and their recent comments via GraphQL"""
+        unprocessed_issues = []
+        index_updated = False
+        
+        for issue_data in self.graphql.iter_issues_with_comments(
+                labels=['site-monitor'],
+                comment_window=self.activity_comment_window):
+            if limit and len(unprocessed_issues) >= limit:
+                break
+            
+            number = issue_data['number']
+            if not force_reprocess:
+                if issue_data['assignee']:
+                    logger.debug(f"Skipping assigned issue #{number}")
+                    continue
+                
+                if self.activity_index.has_activity(number):
+                    logger.debug(f"Skipping issue #{number} with indexed agent activity")
+                    continue
+                
+                if any(self._comment_indicates_agent_activity(comment['login'], comment['body'], comment['type'])
+                       for comment in issue_data['comments']):
+                    self.activity_index.record_activity(number, 'scan', save=False)
+                    index_updated = True
+                    logger.debug(f"Skipping issue #{number} with existing agent activity")
+                    continue
+            
+            unprocessed_issues.append(self._issue_from_graphql(issue_data))
+        
+        if index_updated:
+            self.activity_index.save()
+        return unprocessed_issues
+
+    def _get_unprocessed_issues_rest(self, limit: Optional[int],
+                                     force_reprocess: bool) -> List[Any]:
+        """Scan open site-monitor issues via the REST API"""
         try:
             # Search for open site-monitor issues
             issues = self.repo.get_issues(
@@ -351,19 +533,57 @@ This site monitoring issue is being automatically closed as it's older than {day
                     continue
                 
                 # Check if issue has been processed (look for agent comments)
-                if self._issue_has_agent_activity(issue) and not force_reprocess:
+                if not force_reprocess and self._issue_has_agent_activity(issue):
                     logger.debug(f"Skipping issue #{issue.number} with existing agent activity")
                     continue
                 
                 unprocessed_issues.append(issue)
             
-            logger.info(f"Found {len(unprocessed_issues)} unprocessed site-monitor issues")
             return unprocessed_issues
             
         except GithubException as e:
             logger.error(f"Failed to get unprocessed monitoring issues: {e}")
             raise RuntimeError(f"Failed to get unprocessed monitoring issues: {self._extract_github_error_message(e)}") from e
 
+    def _issue_from_graphql(self, issue_data: Dict[str, Any]) -> Issue:
+        """
+        Build a complete PyGithub issue from GraphQL data
+        
+        The issue is marked completed, so reading it never triggers a REST
+        request; fields the GraphQL query does not fetch read as None.
+        """
+        attributes = {
+            key: value for key, value in issue_data.items()
+            if key not in ('comments', 'comment_count')
+        }
+        attributes['comments'] = issue_data['comment_count']
+        attributes['url'] = f"{self.repo.url}/issues/{issue_data['number']}"
+        attributes['repository_url'] = self.repo.url
+        return Issue(self.github.requester, {}, attributes, completed=True)
+
+    @staticmethod
+    def _comment_indicates_agent_activity(login: str, body: str, author_type: str = '') -> bool:
+        """
+        Check whether a single comment was left by the automated agent.
+        
+        Args:
+            login: Comment author login
+            body: Comment text
+            author_type: Author account type ('User', 'Bot', ...); GraphQL bot
+                logins lack the REST ``[bot]`` suffix, so this is the reliable signal
+            
+        Returns:
+            True if the comment shows signs of agent processing
+        """
+        # Check if comment is from a bot user
+        if author_type == 'Bot':
+            return True
+        if any(bot_name in (login or '') for bot_name in ['[bot]', 'github-actions']):
+            return True
+        
+        # Check if comment contains agent indicators
+        return get_keyword_matcher().contains_any(body or '', 'github.agent_activity')
+
     def _issue_has_agent_activity(self, issue) -> bool:
         """
         Check if an issue has comments or activity from the automated agent.
@@ -374,26 +594,15 @@ This site monitoring issue is being automatically closed as it's older than {day
         Returns:
             True if the issue shows signs of agent processing
         """
+        if self.activity_index.has_activity(issue.number):
+            return True
+        
         try:
-            # Check for comments from known agent users
-            agent_indicators = [
-                'github-actions[bot]',
-                'automated workflow',
-                '🤖',  # Robot emoji commonly used by agents
-                'deliverable generated',
-                'workflow matched'
-            ]
-            
             for comment in issue.get_comments():
-                comment_body = comment.body.lower()
                 comment_user = comment.user.login if comment.user else ''
-                
-                # Check if comment is from a bot user
-                if any(bot_name in comment_user for bot_name in ['[bot]', 'github-actions']):
-                    return True
-                
-                # Check if comment contains agent indicators
-                if any(indicator in comment_body for indicator in agent_indicators):
+                comment_user_type = comment.user.type if comment.user else ''
+                if self._comment_indicates_agent_activity(comment_user, comment.body, comment_user_type):
+                    self.activity_index.record_activity(issue.number, 'scan')
                     return True
             
             return False
@@ -520,7 +729,9 @@ This site monitoring issue is being automatically closed as it's older than {day
         """
         try:
             issue = self.get_issue(issue_number)
-            return issue.create_comment(comment_body)
+            comment = issue.create_comment(comment_body)
+            self.activity_index.record_activity(issue_number, 'comment')
+            return comment
         except GithubException as e:
             raise RuntimeError(f"Failed to add comment to issue #{issue_number}: {self._extract_github_error_message(e)}") from e
         except Exception as e:
@@ -568,6 +779,7 @@ This site monitoring issue is being automatically closed as it's older than {day
         except Exception as e:
             raise RuntimeError(f"Unexpected error updating labels on issue #{issue_number}: {str(e)}") from e
 
+    @traced("github.fetch")
     def get_issue_data(self, issue_number: int) -> Dict[str, Any]:
         """
         Get standardized issue data for processing
@@ -581,6 +793,7 @@ This site monitoring issue is being automatically closed as it's older than {day
         Raises:
             RuntimeError: If issue retrieval fails
         """
+        current_span().set(issue_number=issue_number)
         try:
             issue = self.get_issue(issue_number)
             
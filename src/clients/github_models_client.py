@@ -7,13 +7,24 @@ workflow assignment, and document generation.
 """
 
 import json
+import logging
 import time
 import requests
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 
-from ..utils.logging_config import get_logger, log_exception
+from ..utils.logging_config import LazyFormat, get_logger, log_exception
+from ..utils.metrics import get_registry
+from ..utils.tracing import current_span, traced
+
+
+_REQUESTS = get_registry().counter(
+    'speculum_ai_requests_total', "GitHub Models chat completions by outcome", ['model', 'outcome'])
+_REQUEST_SECONDS = get_registry().histogram(
+    'speculum_ai_request_seconds', "GitHub Models chat completion latency, retries included", ['model'])
+_TOKENS = get_registry().counter(
+    'speculum_ai_tokens_total', "Tokens used by GitHub Models completions", ['model', 'kind'])
 
 
 @dataclass
@@ -104,6 +115,7 @@ class GitHubModelsClient:
         if self.max_retries < 0:
             raise ValueError("Max retries must be non-negative")
     
+    @traced("ai.completion")
     def chat_completion(self,
                        messages: List[Dict[str, str]],
                        temperature: float = 0.3,
@@ -150,20 +162,40 @@ class GitHubModelsClient:
         
         start_time = time.time()
         
-        if self.enable_logging:
-            self.logger.debug(f"GitHub Models request: {json.dumps(payload, indent=2)}")
+        # Payloads are only serialized if a handler actually emits the record
+        log_payloads = self.enable_logging and self.logger.isEnabledFor(logging.DEBUG)
+        if log_payloads:
+            self.logger.debug("GitHub Models request: %s", LazyFormat(json.dumps, payload, indent=2))
         
         # Make request with retries
-        response_data = self._make_request_with_retries(payload)
+        try:
+            response_data = self._make_request_with_retries(payload)
+        except Exception:
+            _REQUESTS.inc(model=self.model, outcome='error')
+            raise
         
         end_time = time.time()
         response_time_ms = int((end_time - start_time) * 1000)
+        _REQUESTS.inc(model=self.model, outcome='ok')
+        _REQUEST_SECONDS.observe(end_time - start_time, model=self.model)
         
         # Parse response
         ai_response = self._parse_chat_response(response_data, response_time_ms)
+        usage = ai_response.usage or {}
+        current_span().set(
+            model=ai_response.model,
+            prompt_tokens=usage.get("prompt_tokens"),
+            completion_tokens=usage.get("completion_tokens"),
+            total_tokens=usage.get("total_tokens"),
+            response_ms=response_time_ms,
+        )
+        for kind in ('prompt', 'completion'):
+            tokens = usage.get(f"{kind}_tokens")
+            if isinstance(tokens, (int, float)) and tokens > 0:
+                _TOKENS.inc(tokens, model=self.model, kind=kind)
         
-        if self.enable_logging:
-            self.logger.debug(f"GitHub Models response: {asdict(ai_response)}")
+        if log_payloads:
+            self.logger.debug("GitHub Models response: %s", LazyFormat(asdict, ai_response))
         
         # Update rate limiting info
         self._update_rate_limit()
@@ -0,0 +1,499 @@
+"""
+GitHub Mutation Queue
+Coalesces issue label, assignee and comment writes and applies them in batched GraphQL mutations
+
+Applying workflow assignment results one REST call at a time (one call per
+label, one per comment, one per assignee change) makes writes dominate large
+assignment runs and trips GitHub's secondary rate limits. The queue collects
+all changes for an issue, merges them into one set of operations per issue,
+and flushes many issues per GraphQL request. Batch size adapts to rate
+limiting: it is halved whenever GitHub pushes back and grows again after
+successful batches. Request pacing itself is handled by the shared transport.
+
+Only rate-limited writes are retried, and each issue's changes are retried at
+most ``max_retries`` times. When a mutation request fails without a
+response, some of its writes may have been applied. The changes are then
+replayed over REST: label and assignee changes are idempotent, and a comment
+is only posted if it does not already appear on the issue.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from github.GithubException import GithubException, RateLimitExceededException, UnknownObjectException
+
+
+logger = logging.getLogger(__name__)
+
+
+# Separator placed between comments queued for the same issue
+COMMENT_SEPARATOR = "\n\n---\n\n"
+
+# Allowance for clock skew when looking for comments a failed request may have posted
+COMMENT_CHECK_SKEW = timedelta(minutes=5)
+
+
+@dataclass
+class PendingIssueChanges:
+    """Coalesced changes waiting to be written to one issue"""
+    issue_number: int
+    add_labels: List[str] = field(default_factory=list)
+    remove_labels: List[str] = field(default_factory=list)
+    assignees: List[str] = field(default_factory=list)
+    comments: List[str] = field(default_factory=list)
+    requested_operations: int = 0
+    retries: int = 0  # Rate-limited attempts so far
+
+    @property
+    def comment_body(self) -> Optional[str]:
+        """All queued comments merged into a single comment"""
+        return COMMENT_SEPARATOR.join(self.comments) if self.comments else None
+
+    def is_empty(self) -> bool:
+        return not (self.add_labels or self.remove_labels or self.assignees or self.comments)
+
+
+@dataclass
+class MutationQueueStats:
+    """Write statistics for a mutation queue"""
+    issues_flushed: int = 0
+    requested_operations: int = 0
+    graphql_requests: int = 0
+    rest_calls: int = 0
+    rate_limit_retries: int = 0
+    failed_issues: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def api_calls(self) -> int:
+        return self.graphql_requests + self.rest_calls
+
+    @property
+    def calls_saved(self) -> int:
+        return max(self.requested_operations - self.api_calls, 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'issues_flushed': self.issues_flushed,
+            'requested_operations': self.requested_operations,
+            'api_calls': self.api_calls,
+            'graphql_requests': self.graphql_requests,
+            'rest_calls': self.rest_calls,
+            'calls_saved': self.calls_saved,
+            'rate_limit_retries': self.rate_limit_retries,
+            'failed_issues': dict(self.failed_issues)
+        }
+
+
+class GitHubMutationQueue:
+    """Queue of issue writes flushed through batched GraphQL mutations"""
+
+    def __init__(self,
+                 github_client: Any,
+                 batch_size: int = 10,
+                 max_batch_size: int = 25,
+                 max_retries: int = 3,
+                 retry_delay_seconds: float = 5.0):
+        """
+        Initialize the mutation queue
+
+        Args:
+            github_client: GitHubIssueCreator used for GraphQL and REST fallbacks
+            batch_size: Initial number of issues written per GraphQL request
+            max_batch_size: Upper bound for the adaptive batch size
+            max_retries: Rate-limited retries allowed for each issue's changes before giving up
+            retry_delay_seconds: Base delay before retrying a rate-limited batch
+        """
+        self.github_client = github_client
+        self.batch_size = max(batch_size, 1)
+        self.max_batch_size = max(max_batch_size, self.batch_size)
+        self.max_retries = max_retries
+        self.retry_delay_seconds = retry_delay_seconds
+        self.stats = MutationQueueStats()
+
+        self._pending: Dict[int, PendingIssueChanges] = {}
+        self._lock = threading.Lock()
+        self._label_ids: Dict[str, Optional[str]] = {}
+        self._user_ids: Dict[str, Optional[str]] = {}
+
+    def _changes_for(self, issue_number: int) -> PendingIssueChanges:
+        changes = self._pending.get(issue_number)
+        if changes is None:
+            changes = self._pending[issue_number] = PendingIssueChanges(issue_number)
+        return changes
+
+    def add_labels(self, issue_number: int, labels: List[str]) -> None:
+        """Queue labels to add to an issue (one REST call each if applied directly)"""
+        with self._lock:
+            changes = self._changes_for(issue_number)
+            for label in labels:
+                if label in changes.remove_labels:
+                    changes.remove_labels.remove(label)
+                if label not in changes.add_labels:
+                    changes.add_labels.append(label)
+                changes.requested_operations += 1
+                self.stats.requested_operations += 1
+
+    def remove_labels(self, issue_number: int, labels: List[str]) -> None:
+        """Queue labels to remove from an issue"""
+        with self._lock:
+            changes = self._changes_for(issue_number)
+            for label in labels:
+                if label in changes.add_labels:
+                    changes.add_labels.remove(label)
+                if label not in changes.remove_labels:
+                    changes.remove_labels.append(label)
+                changes.requested_operations += 1
+                self.stats.requested_operations += 1
+
+    def add_assignees(self, issue_number: int, logins: List[str]) -> None:
+        """Queue assignees to add to an issue"""
+        with self._lock:
+            changes = self._changes_for(issue_number)
+            for login in logins:
+                if login not in changes.assignees:
+                    changes.assignees.append(login)
+            changes.requested_operations += 1
+            self.stats.requested_operations += 1
+
+    def add_comment(self, issue_number: int, body: str) -> None:
+        """Queue a comment; several comments on one issue are posted as one"""
+        with self._lock:
+            changes = self._changes_for(issue_number)
+            changes.comments.append(body)
+            changes.requested_operations += 1
+            self.stats.requested_operations += 1
+
+    @property
+    def pending_count(self) -> int:
+        """Number of issues with queued changes"""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> Dict[str, Any]:
+        """
+        Write all queued changes.
+
+        Returns:
+            Queue statistics, including API calls made and saved and any
+            issues whose changes could not be applied
+        """
+        with self._lock:
+            queue: Deque[PendingIssueChanges] = deque(
+                changes for changes in self._pending.values() if not changes.is_empty()
+            )
+            self._pending.clear()
+
+        while queue:
+            batch = [queue.popleft() for _ in range(min(self.batch_size, len(queue)))]
+            try:
+                requeue = self._flush_batch(batch)
+            except GithubException as e:
+                if not self._is_rate_limited(e):
+                    # Raised while resolving node IDs, before anything was written
+                    logger.warning(f"Batched GraphQL write failed, applying {len(batch)} issues via REST: "
+                                   f"{self.github_client._extract_github_error_message(e)}")
+                    for changes in batch:
+                        self._apply_rest(changes)
+                    continue
+                requeue = batch
+
+            if not requeue:
+                self.batch_size = min(self.batch_size + 1, self.max_batch_size)
+                continue
+
+            self.stats.rate_limit_retries += 1
+            self.batch_size = max(self.batch_size // 2, 1)
+            retry = []
+            for changes in requeue:
+                changes.retries += 1
+                if changes.retries > self.max_retries:
+                    self.stats.failed_issues[changes.issue_number] = "Rate limited"
+                else:
+                    retry.append(changes)
+            if retry:
+                logger.warning(f"GitHub rate limited batched writes, retrying {len(retry)} issues "
+                               f"with batch size {self.batch_size}")
+                time.sleep(self.retry_delay_seconds * max(changes.retries for changes in retry))
+                queue.extendleft(reversed(retry))
+
+        self._save_activity()
+        stats = self.stats.to_dict()
+        logger.info(f"Flushed writes for {stats['issues_flushed']} issues: {stats['api_calls']} API calls "
+                    f"for {stats['requested_operations']} operations ({stats['calls_saved']} saved)")
+        return stats
+
+    @staticmethod
+    def _is_rate_limited(error: Any) -> bool:
+        """Whether a GithubException or GraphQL error reports rate limiting"""
+        if isinstance(error, RateLimitExceededException):
+            return True
+        if isinstance(error, GithubException):
+            message = str(error).lower()
+            return error.status in (403, 429) and 'rate limit' in message
+        if isinstance(error, dict):
+            return error.get('type') == 'RATE_LIMITED' or 'rate limit' in str(error.get('message', '')).lower()
+        return False
+
+    def _flush_batch(self, batch: List[PendingIssueChanges]) -> List[PendingIssueChanges]:
+        """
+        Write one batch: resolve node IDs, then apply all mutations in one request.
+
+        Returns:
+            Changes that were rate limited and should be retried
+
+        Raises:
+            GithubException: If resolving node IDs fails, or the mutation
+                request is rate limited as a whole
+        """
+        issue_ids = self._resolve_ids(batch)
+
+        definitions: List[str] = []
+        operations: List[str] = []
+        variables: Dict[str, Any] = {}
+        alias_owner: Dict[str, Tuple[PendingIssueChanges, str]] = {}
+        rest_fallbacks: List[PendingIssueChanges] = []
+        resolved: List[PendingIssueChanges] = []
+
+        for index, changes in enumerate(batch):
+            issue_id = issue_ids.get(changes.issue_number)
+            if not issue_id:
+                self.stats.failed_issues[changes.issue_number] = "Issue not found"
+                continue
+
+            prefix = f"i{index}"
+            variables[prefix] = issue_id
+            definitions.append(f"${prefix}: ID!")
+            fallback = PendingIssueChanges(changes.issue_number)
+
+            add_ids = self._ids_for(changes.add_labels, self._label_ids, fallback.add_labels)
+            remove_ids = [self._label_ids[label] for label in changes.remove_labels if self._label_ids.get(label)]
+            assignee_ids = self._ids_for(changes.assignees, self._user_ids, fallback.assignees)
+
+            if add_ids:
+                self._add_operation(prefix, 'labels', 'addLabelsToLabelable',
+                                    f"labelableId: ${prefix}, labelIds: ${prefix}_labels",
+                                    ('labels', '[ID!]!', add_ids), changes,
+                                    definitions, operations, variables, alias_owner)
+            if remove_ids:
+                self._add_operation(prefix, 'unlabels', 'removeLabelsFromLabelable',
+                                    f"labelableId: ${prefix}, labelIds: ${prefix}_unlabels",
+                                    ('unlabels', '[ID!]!', remove_ids), changes,
+                                    definitions, operations, variables, alias_owner)
+            if assignee_ids:
+                self._add_operation(prefix, 'assignees', 'addAssigneesToAssignable',
+                                    f"assignableId: ${prefix}, assigneeIds: ${prefix}_assignees",
+                                    ('assignees', '[ID!]!', assignee_ids), changes,
+                                    definitions, operations, variables, alias_owner)
+            if changes.comments:
+                self._add_operation(prefix, 'comment', 'addComment',
+                                    f"subjectId: ${prefix}, body: ${prefix}_comment",
+                                    ('comment', 'String!', changes.comment_body), changes,
+                                    definitions, operations, variables, alias_owner)
+
+            if not fallback.is_empty():
+                rest_fallbacks.append(fallback)
+            resolved.append(changes)
+
+        requeue: Dict[int, PendingIssueChanges] = {}
+        if operations:
+            document = f"mutation ApplyIssueChanges({', '.join(definitions)}) {{\n" + "\n".join(operations) + "\n}"
+            self.stats.graphql_requests += 1
+            sent_at = datetime.now(timezone.utc)
+            try:
+                _, errors = self.github_client.graphql.execute(document, variables)
+            except GithubException as e:
+                if self._is_rate_limited(e):
+                    raise
+                # Some mutations may have been applied before the request failed
+                logger.warning(f"Batched GraphQL write failed, applying {len(resolved)} issues via REST: "
+                               f"{self.github_client._extract_github_error_message(e)}")
+                for changes in resolved:
+                    self._apply_rest(changes, posted_since=sent_at - COMMENT_CHECK_SKEW)
+                self.stats.issues_flushed += len(resolved)
+                return []
+
+            for error in errors:
+                alias = (error.get('path') or [None])[0]
+                if alias not in alias_owner:
+                    logger.warning(f"GraphQL mutation error: {error.get('message')}")
+                    continue
+                changes, kind = alias_owner.pop(alias)
+                if self._is_rate_limited(error):
+                    retry = requeue.setdefault(changes.issue_number,
+                                               PendingIssueChanges(changes.issue_number, retries=changes.retries))
+                    self._copy_part(changes, retry, kind)
+                else:
+                    self.stats.failed_issues[changes.issue_number] = error.get('message', 'Mutation failed')
+
+            for changes, kind in alias_owner.values():
+                if kind == 'comment' and changes.issue_number not in requeue:
+                    self.github_client.activity_index.record_activity(changes.issue_number, 'comment', save=False)
+
+        for fallback in rest_fallbacks:
+            self._apply_rest(fallback)
+
+        self.stats.issues_flushed += len(resolved) - len(requeue)
+        return list(requeue.values())
+
+    @staticmethod
+    def _add_operation(prefix: str, kind: str, mutation: str, arguments: str,
+                       variable: Tuple[str, str, Any], changes: PendingIssueChanges,
+                       definitions: List[str], operations: List[str],
+                       variables: Dict[str, Any], alias_owner: Dict[str, Tuple[PendingIssueChanges, str]]) -> None:
+        """Append one aliased mutation for an issue"""
+        suffix, graphql_type, value = variable
+        alias = f"{prefix}_{kind}"
+        variables[f"{prefix}_{suffix}"] = value
+        definitions.append(f"${prefix}_{suffix}: {graphql_type}")
+        operations.append(f"  {alias}: {mutation}(input: {{{arguments}}}) {{ clientMutationId }}")
+        alias_owner[alias] = (changes, kind)
+
+    @staticmethod
+    def _copy_part(source: PendingIssueChanges, target: PendingIssueChanges, kind: str) -> None:
+        """Copy one kind of change into a retry entry"""
+        if kind == 'labels':
+            target.add_labels.extend(source.add_labels)
+        elif kind == 'unlabels':
+            target.remove_labels.extend(source.remove_labels)
+        elif kind == 'assignees':
+            target.assignees.extend(source.assignees)
+        elif kind == 'comment':
+            target.comments.extend(source.comments)
+
+    @staticmethod
+    def _ids_for(names: List[str], cache: Dict[str, Optional[str]], unresolved: List[str]) -> List[str]:
+        """Map names to cached node IDs, collecting names without an ID"""
+        ids = []
+        for name in names:
+            node_id = cache.get(name)
+            if node_id:
+                ids.append(node_id)
+            else:
+                unresolved.append(name)
+        return ids
+
+    def _resolve_ids(self, batch: List[PendingIssueChanges]) -> Dict[int, Optional[str]]:
+        """Look up issue, label and user node IDs for a batch in one query"""
+        labels = sorted({label for changes in batch
+                         for label in changes.add_labels + changes.remove_labels} - set(self._label_ids))
+        users = sorted({login for changes in batch for login in changes.assignees} - set(self._user_ids))
+
+        definitions = ["$owner: String!", "$name: String!"]
+        variables: Dict[str, Any] = {'owner': self.github_client.graphql.owner,
+                                     'name': self.github_client.graphql.name}
+        repository_fields = []
+        root_fields = []
+
+        for index, changes in enumerate(batch):
+            definitions.append(f"$n{index}: Int!")
+            variables[f"n{index}"] = changes.issue_number
+            repository_fields.append(f"    i{index}: issue(number: $n{index}) {{ id }}")
+        for index, label in enumerate(labels):
+            definitions.append(f"$l{index}: String!")
+            variables[f"l{index}"] = label
+            repository_fields.append(f"    l{index}: label(name: $l{index}) {{ id }}")
+        for index, login in enumerate(users):
+            definitions.append(f"$u{index}: String!")
+            variables[f"u{index}"] = login
+            root_fields.append(f"  u{index}: user(login: $u{index}) {{ id }}")
+
+        document = (f"query ResolveIssueNodes({', '.join(definitions)}) {{\n"
+                    f"  repository(owner: $owner, name: $name) {{\n" + "\n".join(repository_fields) +
+                    "\n  }\n" + "\n".join(root_fields) + "\n}")
+        self.stats.graphql_requests += 1
+        data, errors = self.github_client.graphql.execute(document, variables)
+        if errors and not data:
+            raise GithubException(400, {'message': errors[0].get('message', 'GraphQL error'), 'errors': errors})
+
+        repository = data.get('repository') or {}
+        for index, label in enumerate(labels):
+            self._label_ids[label] = (repository.get(f"l{index}") or {}).get('id')
+        for index, login in enumerate(users):
+            self._user_ids[login] = (data.get(f"u{index}") or {}).get('id')
+
+        return {
+            changes.issue_number: (repository.get(f"i{index}") or {}).get('id')
+            for index, changes in enumerate(batch)
+        }
+
+    def _apply_rest(self, changes: PendingIssueChanges, posted_since: Optional[datetime] = None) -> None:
+        """
+        Apply changes with individual REST calls (labels that do not exist yet, bot assignees)
+
+        Args:
+            changes: Changes to apply
+            posted_since: When a failed request may already have posted the comment;
+                it is only posted if no identical comment was added since then
+        """
+        try:
+            issue = self.github_client.repo.get_issue(changes.issue_number)
+            self.stats.rest_calls += 1
+            if changes.add_labels:
+                issue.add_to_labels(*changes.add_labels)
+                self.stats.rest_calls += 1
+            for label in changes.remove_labels:
+                try:
+                    issue.remove_from_labels(label)
+                except UnknownObjectException:
+                    pass  # Not on the issue (any more)
+                self.stats.rest_calls += 1
+            if changes.assignees:
+                issue.add_to_assignees(*changes.assignees)
+                self.stats.rest_calls += 1
+            if changes.comments:
+                body = changes.comment_body
+                if posted_since is not None and self._has_comment(issue, body, posted_since):
+                    logger.info(f"Comment on issue #{changes.issue_number} was already posted")
+                else:
+                    issue.create_comment(body)
+                    self.stats.rest_calls += 1
+                self.github_client.activity_index.record_activity(changes.issue_number, 'comment', save=False)
+        except GithubException as e:
+            message = self.github_client._extract_github_error_message(e)
+            logger.error(f"Failed to apply changes to issue #{changes.issue_number}: {message}")
+            self.stats.failed_issues[changes.issue_number] = message
+
+    def _has_comment(self, issue: Any, body: str, since: datetime) -> bool:
+        """Whether a comment with this body was added to the issue since a time"""
+        self.stats.rest_calls += 1
+        return any(comment.body == body for comment in issue.get_comments(since=since))
+
+    def _save_activity(self) -> None:
+        """Persist agent activity recorded during the flush"""
+        activity_index = getattr(self.github_client, 'activity_index', None)
+        if activity_index is not None:
+            activity_index.save()
+
+
+def apply_issue_updates(mutation_queue: Optional[GitHubMutationQueue],
+                        issue: Any,
+                        issue_number: int,
+                        labels: List[str],
+                        comment: str) -> None:
+    """
+    Add labels and a comment to an issue
+
+    During a batch the writes are queued and flushed as batched GraphQL
+    mutations; otherwise they are applied immediately over REST.
+
+    Args:
+        mutation_queue: Queue of the running batch, or None to write directly
+        issue: PyGithub issue object (used only without a queue)
+        issue_number: GitHub issue number
+        labels: Labels to add
+        comment: Comment body to post
+    """
+    if mutation_queue is not None:
+        if labels:
+            mutation_queue.add_labels(issue_number, labels)
+        mutation_queue.add_comment(issue_number, comment)
+        return
+
+    for label in labels:
+        issue.add_to_labels(label)
+    issue.create_comment(comment)
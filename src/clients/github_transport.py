@@ -0,0 +1,534 @@
+"""
+GitHub Transport Module
+Caching HTTP transport and rate-limit scheduling for GitHub REST API calls
+
+PyGithub performs every request through a ``requests`` session owned by its
+connection class. This module provides a drop-in connection class whose
+session is mounted with a caching adapter that:
+
+- stores ETag / Last-Modified validators and bodies for successful GETs
+- revalidates cached entries with conditional requests, so ``304 Not Modified``
+  responses are served from the cache without consuming primary rate limit
+- reads ``X-RateLimit-*`` headers and paces write requests across threads to
+  stay clear of GitHub's primary and secondary rate limits
+
+A single process-wide transport is shared by every ``GitHubIssueCreator`` so
+cache entries and rate-limit state are not duplicated between components.
+Cached responses are keyed by URL, ``Accept`` header and a hash of the
+``Authorization`` header, the request headers GitHub varies its responses on,
+so clients with different tokens never see each other's responses.
+
+PyGithub has no public hook for a per-client connection class, so
+``install`` sets a private Requester attribute. ``_set_connection_class`` is
+the only place that does, and only for PyGithub versions it is known to work
+with; elsewhere the transport is not installed and caching is disabled.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import requests
+import requests.adapters
+from requests.structures import CaseInsensitiveDict
+from github.Requester import HTTPSRequestsConnectionClass
+
+from ..utils.metrics import get_registry
+
+
+logger = logging.getLogger(__name__)
+
+
+# Methods that modify state on GitHub and are subject to write pacing
+WRITE_METHODS = {'POST', 'PATCH', 'PUT', 'DELETE'}
+
+# Response headers that describe the original transfer and must not be replayed
+_HOP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+# Private Requester attribute holding the connection class, and the PyGithub
+# versions [minimum, maximum) it is known to exist in
+_CONNECTION_CLASS_ATTRIBUTE = '_Requester__connectionClass'
+_SUPPORTED_PYGITHUB = ((1, 59), (3, 0))
+
+_REQUESTS = get_registry().counter(
+    'speculum_github_requests_total', "GitHub REST requests sent", ['kind'])
+_CACHE_LOOKUPS = get_registry().counter(
+    'speculum_github_cache_lookups_total', "Cacheable GitHub GETs by cache result", ['result'])
+_RATE_LIMIT_REMAINING = get_registry().gauge(
+    'speculum_github_rate_limit_remaining', "Requests left in GitHub's primary rate limit", ['resource'])
+_THROTTLE_WAIT = get_registry().counter(
+    'speculum_github_throttle_wait_seconds_total', "Time requests were held back by rate-limit pacing")
+_SECONDARY_LIMIT_HITS = get_registry().counter(
+    'speculum_github_secondary_limit_hits_total', "Responses asking the client to back off")
+
+
+@dataclass
+class CachedResponse:
+    """A cached GET response together with its validators"""
+    url: str
+    body: bytes
+    headers: Dict[str, str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    encoding: Optional[str] = None
+    stored_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class RateLimitBucket:
+    """Latest rate-limit state reported by GitHub for one resource"""
+    limit: int = -1
+    remaining: int = -1
+    used: int = -1
+    reset_at: float = 0.0
+    updated_at: float = 0.0
+
+
+def cache_key(url: str, headers: Mapping[str, str]) -> str:
+    """
+    Cache key for a GET request
+
+    Args:
+        url: Request URL
+        headers: Request headers
+
+    Returns:
+        Key combining the URL, the Accept header and a hash of the credentials
+    """
+    authorization = headers.get('Authorization') or ''
+    credentials = hashlib.sha256(authorization.encode('utf-8')).hexdigest()[:16] if authorization else '-'
+    return f"{url} {headers.get('Accept') or '*/*'} {credentials}"
+
+
+class GitHubResponseCache:
+    """Thread-safe LRU cache of GitHub GET responses keyed by ``cache_key``"""
+
+    def __init__(self, max_entries: int = 2048):
+        """
+        Initialize the response cache
+
+        Args:
+            max_entries: Maximum number of responses to keep before evicting
+        """
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for a key, if any"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: str, response: requests.Response) -> None:
+        """Store a successful GET response if it carries a validator"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        headers = {
+            key: value for key, value in response.headers.items()
+            if key.lower() not in _HOP_HEADERS
+        }
+        entry = CachedResponse(
+            url=response.url,
+            body=response.content,
+            headers=headers,
+            etag=etag,
+            last_modified=last_modified,
+            encoding=response.encoding
+        )
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self.stores += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def record_hit(self) -> None:
+        """Record that a request was answered from the cache"""
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        """Record that a GET request required a full response"""
+        with self._lock:
+            self.misses += 1
+
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits / lookups) if lookups else 0.0
+            }
+
+
+class RateLimitScheduler:
+    """
+    Paces GitHub requests using the rate-limit headers returned by the API.
+
+    Writes are spaced at least ``min_write_interval`` seconds apart across all
+    threads (GitHub's guidance for avoiding secondary rate limits). When the
+    remaining primary budget runs low, writes are spread evenly over the time
+    left until the reset, and once the budget is exhausted every request waits
+    for the reset. Secondary rate-limit responses (``Retry-After``) block all
+    requests until the indicated time.
+    """
+
+    def __init__(self,
+                 min_write_interval: float = 1.0,
+                 reserve_requests: int = 50,
+                 max_wait_seconds: float = 900.0):
+        """
+        Initialize the scheduler
+
+        Args:
+            min_write_interval: Minimum seconds between write requests
+            reserve_requests: Remaining budget below which writes are spread out
+            max_wait_seconds: Upper bound for a single scheduling delay
+        """
+        self.min_write_interval = min_write_interval
+        self.reserve_requests = reserve_requests
+        self.max_wait_seconds = max_wait_seconds
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, RateLimitBucket] = {}
+        self._next_write_at = 0.0
+        self._blocked_until = 0.0
+
+        self.requests_made = 0
+        self.writes_made = 0
+        self.delayed_requests = 0
+        self.total_wait_seconds = 0.0
+        self.secondary_limit_hits = 0
+
+    @staticmethod
+    def resource_for_url(url: str) -> str:
+        """Determine which rate-limit resource a request URL is billed against"""
+        path = url.split('://', 1)[-1]
+        path = path[path.find('/'):] if '/' in path else ''
+        if path.startswith('/graphql') or path.startswith('/api/graphql'):
+            return 'graphql'
+        if path.startswith('/search') or path.startswith('/api/v3/search'):
+            return 'search'
+        return 'core'
+
+    def before_request(self, method: str, url: str, is_write: Optional[bool] = None) -> float:
+        """
+        Block until the request may be sent.
+
+        Args:
+            method: HTTP method of the request
+            url: Request URL
+            is_write: Whether the request modifies state (defaults to a method check)
+
+        Returns:
+            Seconds spent waiting
+        """
+        method = method.upper()
+        resource = self.resource_for_url(url)
+        if is_write is None:
+            is_write = method in WRITE_METHODS
+        now = time.time()
+
+        with self._lock:
+            start_at = max(now, self._blocked_until)
+
+            bucket = self._buckets.get(resource)
+            if bucket and bucket.remaining == 0 and bucket.reset_at > start_at:
+                start_at = bucket.reset_at
+
+            if is_write:
+                interval = self._write_interval(bucket, now)
+                start_at = max(start_at, self._next_write_at)
+                self._next_write_at = start_at + interval
+                self.writes_made += 1
+
+            self.requests_made += 1
+            wait = min(max(start_at - now, 0.0), self.max_wait_seconds)
+            if wait > 0:
+                self.delayed_requests += 1
+                self.total_wait_seconds += wait
+
+        if wait > 0:
+            _THROTTLE_WAIT.inc(wait)
+            logger.debug(f"Rate-limit scheduler delaying {method} {resource} request by {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    def _write_interval(self, bucket: Optional[RateLimitBucket], now: float) -> float:
+        """Spacing to apply after a write, given the current budget"""
+        interval = self.min_write_interval
+        if bucket and 0 <= bucket.remaining <= self.reserve_requests and bucket.reset_at > now:
+            spread = (bucket.reset_at - now) / max(bucket.remaining, 1)
+            interval = max(interval, spread)
+        return interval
+
+    def update_from_response(self, url: str, status_code: int, headers: Any) -> None:
+        """
+        Record rate-limit information from a response.
+
+        Args:
+            url: Request URL
+            status_code: HTTP status code of the response
+            headers: Response headers (case-insensitive mapping)
+        """
+        now = time.time()
+        resource = headers.get('X-RateLimit-Resource') or self.resource_for_url(url)
+
+        with self._lock:
+            if 'X-RateLimit-Remaining' in headers:
+                bucket = self._buckets.setdefault(resource, RateLimitBucket())
+                try:
+                    bucket.limit = int(headers.get('X-RateLimit-Limit', bucket.limit))
+                    bucket.remaining = int(headers['X-RateLimit-Remaining'])
+                    bucket.used = int(headers.get('X-RateLimit-Used', bucket.used))
+                    bucket.reset_at = float(headers.get('X-RateLimit-Reset', bucket.reset_at))
+                    bucket.updated_at = now
+                    _RATE_LIMIT_REMAINING.set(bucket.remaining, resource=resource)
+                except (TypeError, ValueError):
+                    logger.debug(f"Ignoring malformed rate-limit headers for {resource}")
+
+            if status_code in (403, 429):
+                retry_after = headers.get('Retry-After')
+                if retry_after is not None:
+                    try:
+                        self._blocked_until = max(self._blocked_until, now + float(retry_after))
+                        self.secondary_limit_hits += 1
+                        _SECONDARY_LIMIT_HITS.inc()
+                        logger.warning(f"GitHub secondary rate limit hit, backing off {retry_after}s")
+                    except (TypeError, ValueError):
+                        pass
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get current budget and pacing statistics"""
+        with self._lock:
+            resources = {}
+            for name, bucket in self._buckets.items():
+                resources[name] = {
+                    'limit': bucket.limit,
+                    'remaining': bucket.remaining,
+                    'used': bucket.used,
+                    'reset_time': (datetime.fromtimestamp(bucket.reset_at, tz=timezone.utc).isoformat()
+                                   if bucket.reset_at else None)
+                }
+            return {
+                'resources': resources,
+                'requests_made': self.requests_made,
+                'writes_made': self.writes_made,
+                'delayed_requests': self.delayed_requests,
+                'total_wait_seconds': round(self.total_wait_seconds, 3),
+                'secondary_limit_hits': self.secondary_limit_hits
+            }
+
+
+class CachingHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTP adapter that adds conditional GETs and rate-limit scheduling"""
+
+    def __init__(self, cache: GitHubResponseCache, scheduler: RateLimitScheduler, **kwargs):
+        self.cache = cache
+        self.scheduler = scheduler
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        method = (request.method or 'GET').upper()
+        url = request.url or ''
+        cacheable = method == 'GET' and not kwargs.get('stream', False)
+        key = cache_key(url, request.headers) if cacheable else None
+
+        cached = self.cache.get(key) if cacheable else None
+        if cached is not None:
+            if cached.etag and 'If-None-Match' not in request.headers:
+                request.headers['If-None-Match'] = cached.etag
+            elif cached.last_modified and 'If-Modified-Since' not in request.headers:
+                request.headers['If-Modified-Since'] = cached.last_modified
+
+        is_write = self._is_write(request)
+        self.scheduler.before_request(method, url, is_write=is_write)
+        _REQUESTS.inc(kind='write' if is_write else 'read')
+        response = super().send(request, **kwargs)
+        self.scheduler.update_from_response(url, response.status_code, response.headers)
+
+        if not cacheable:
+            return response
+
+        if response.status_code == 304 and cached is not None:
+            self.cache.record_hit()
+            _CACHE_LOOKUPS.inc(result='hit')
+            return self._build_cached_response(request, cached, response)
+
+        self.cache.record_miss()
+        _CACHE_LOOKUPS.inc(result='miss')
+        if response.status_code == 200:
+            self.cache.store(key, response)
+        return response
+
+    @staticmethod
+    def _is_write(request: requests.PreparedRequest) -> bool:
+        """Whether a request modifies state; GraphQL queries are POSTs but read-only"""
+        method = (request.method or 'GET').upper()
+        if method not in WRITE_METHODS:
+            return False
+        if RateLimitScheduler.resource_for_url(request.url or '') != 'graphql':
+            return True
+        try:
+            query = json.loads(request.body or b'{}').get('query', '')
+        except (TypeError, ValueError, AttributeError):
+            return True
+        return query.lstrip().startswith('mutation')
+
+    @staticmethod
+    def _build_cached_response(request: requests.PreparedRequest,
+                               cached: CachedResponse,
+                               not_modified: requests.Response) -> requests.Response:
+        """Materialize a 200 response from a cache entry and a 304 revalidation"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = cached.url
+        response.request = request
+        response.encoding = cached.encoding
+        response._content = cached.body
+        response._content_consumed = True
+
+        headers = CaseInsensitiveDict(cached.headers)
+        # Fresh rate-limit and date headers come from the revalidation response
+        for key, value in not_modified.headers.items():
+            if key.lower() not in _HOP_HEADERS:
+                headers[key] = value
+        response.headers = headers
+        response.elapsed = not_modified.elapsed
+        response.connection = not_modified.connection
+        return response
+
+
+class GitHubTransport:
+    """Shared response cache and rate-limit scheduler for GitHub API clients"""
+
+    def __init__(self,
+                 cache: Optional[GitHubResponseCache] = None,
+                 scheduler: Optional[RateLimitScheduler] = None):
+        self.cache = cache or GitHubResponseCache()
+        self.scheduler = scheduler or RateLimitScheduler()
+        self.connection_class = self._build_connection_class()
+
+    def _build_connection_class(self) -> type:
+        """Create a PyGithub connection class bound to this transport"""
+        transport = self
+
+        class CachingHTTPSConnectionClass(HTTPSRequestsConnectionClass):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.adapter = transport.create_adapter(
+                    max_retries=self.retry,
+                    pool_connections=self.pool_size,
+                    pool_maxsize=self.pool_size
+                )
+                self.session.mount('https://', self.adapter)
+
+        return CachingHTTPSConnectionClass
+
+    def create_adapter(self, **kwargs) -> CachingHTTPAdapter:
+        """Create a caching adapter that shares this transport's state"""
+        return CachingHTTPAdapter(self.cache, self.scheduler, **kwargs)
+
+    def install(self, github_client: Any) -> bool:
+        """
+        Route a PyGithub client's requests through this transport.
+
+        Args:
+            github_client: ``github.Github`` instance
+
+        Returns:
+            True if the transport was installed
+        """
+        requester = getattr(github_client, 'requester', None)
+        if requester is None or not _set_connection_class(requester, self.connection_class):
+            logger.warning("PyGithub requester not recognised; GitHub response caching disabled")
+            return False
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get combined cache and rate-limit statistics"""
+        return {
+            'cache': self.cache.get_stats(),
+            'rate_limit': self.scheduler.get_status()
+        }
+
+
+def _pygithub_version() -> Optional[Tuple[int, ...]]:
+    try:
+        return tuple(int(part) for part in version('PyGithub').split('.')[:2])
+    except (PackageNotFoundError, ValueError):
+        return None
+
+
+def _set_connection_class(requester: Any, connection_class: type) -> bool:
+    """
+    Make one PyGithub requester open its connections with ``connection_class``
+
+    Args:
+        requester: ``github.Github.requester``
+        connection_class: Connection class to use
+
+    Returns:
+        False if this PyGithub version or requester does not have the
+        private attribute, in which case nothing is changed
+    """
+    installed = _pygithub_version()
+    minimum, maximum = _SUPPORTED_PYGITHUB
+    if installed is None or not minimum <= installed < maximum:
+        logger.debug(f"PyGithub {installed} is outside the supported range {minimum}-{maximum}")
+        return False
+    # The requester's own attributes, so a stand-in object never qualifies
+    if _CONNECTION_CLASS_ATTRIBUTE not in getattr(requester, '__dict__', {}):
+        return False
+    setattr(requester, _CONNECTION_CLASS_ATTRIBUTE, connection_class)
+    return True
+
+
+_shared_transport: Optional[GitHubTransport] = None
+_shared_transport_lock = threading.Lock()
+
+
+def get_shared_transport() -> GitHubTransport:
+    """Get the process-wide GitHub transport, creating it on first use"""
+    global _shared_transport
+
+    if _shared_transport is None:
+        with _shared_transport_lock:
+            if _shared_transport is None:
+                _shared_transport = GitHubTransport()
+    return _shared_transport
@@ -0,0 +1,217 @@
+"""
+Issue Discovery Module
+Compiles issue filters into GitHub search queries and pages through matches lazily
+
+Listing every open issue and filtering in Python makes discovery cost grow with
+the size of the repository. The filters used by the processors (labels,
+assignee, unassigned, updated-since) are all expressible as GitHub issue search
+qualifiers, so they are evaluated server-side and only matching issues are
+transferred.
+
+Search has two gaps that the repository issue list endpoint does not. It
+returns at most 1000 results per query, and its index trails issue changes by
+up to a few minutes. A query that matches 1000 or more issues is therefore
+answered from the list endpoint instead. Issues updated within the index lag
+are always also read from the list endpoint, which is one extra request per
+query. Search requests additionally count against a separate limit of 30 per
+minute, which the shared transport's scheduler tracks.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+# Value accepted for ``IssueQuery.assignee`` that selects unassigned issues
+NO_ASSIGNEE = 'none'
+
+# Most results GitHub search returns for one query
+SEARCH_RESULT_CAP = 1000
+
+# How far the search index may trail issue changes
+SEARCH_INDEX_LAG = timedelta(minutes=5)
+
+
+@dataclass
+class IssueQuery:
+    """Issue filters that can be compiled into a GitHub search query"""
+    labels: List[str] = field(default_factory=list)       # Issue must have every label
+    any_labels: List[str] = field(default_factory=list)   # Issue must have at least one label
+    assignee: Optional[str] = None                        # Login, or NO_ASSIGNEE for unassigned issues
+    state: str = 'open'                                   # 'open', 'closed' or 'all'
+    updated_since: Optional[datetime] = None
+    sort: str = 'created-desc'
+
+    def to_search_query(self, repository: str) -> str:
+        """
+        Compile the filters into a GitHub issue search query.
+
+        Args:
+            repository: Repository name in format 'owner/repo'
+
+        Returns:
+            Search query string for ``GET /search/issues``
+        """
+        parts = [f'repo:{repository}', 'is:issue']
+
+        if self.state in ('open', 'closed'):
+            parts.append(f'state:{self.state}')
+
+        for label in self.labels:
+            parts.append(f'label:{_quote(label)}')
+
+        if self.any_labels:
+            # Comma-separated values within one qualifier are ORed by GitHub search
+            parts.append('label:' + ','.join(_quote(label) for label in self.any_labels))
+
+        if self.assignee == NO_ASSIGNEE:
+            parts.append('no:assignee')
+        elif self.assignee:
+            parts.append(f'assignee:{self.assignee}')
+
+        if self.updated_since:
+            updated = self.updated_since
+            if updated.tzinfo is not None:
+                updated = updated.astimezone(timezone.utc).replace(tzinfo=None)
+            parts.append(f'updated:>={updated.strftime("%Y-%m-%dT%H:%M:%SZ")}')
+
+        if self.sort:
+            parts.append(f'sort:{self.sort}')
+
+        return ' '.join(parts)
+
+    def to_list_parameters(self, since: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Translate the filters into ``Repository.get_issues`` arguments.
+
+        ``any_labels`` has no list endpoint equivalent; check it with ``matches``.
+
+        Args:
+            since: Only include issues updated at or after this time,
+                overriding ``updated_since``
+
+        Returns:
+            Keyword arguments for ``Repository.get_issues``
+        """
+        parameters: Dict[str, Any] = {'state': self.state}
+        if self.labels:
+            parameters['labels'] = list(self.labels)
+        if self.assignee:
+            parameters['assignee'] = self.assignee
+        since = since or self.updated_since
+        if since:
+            parameters['since'] = since
+        field_name, _, direction = (self.sort or '').partition('-')
+        if field_name in ('created', 'updated', 'comments'):
+            parameters['sort'] = field_name
+            parameters['direction'] = direction or 'desc'
+        return parameters
+
+    def matches(self, issue: Any) -> bool:
+        """Check the filters the list endpoint cannot apply (pull requests, ``any_labels``)"""
+        if getattr(issue, 'pull_request', None) is not None:
+            return False
+        if self.any_labels:
+            names = {label.name for label in issue.labels}
+            return any(label in names for label in self.any_labels)
+        return True
+
+
+def _quote(value: str) -> str:
+    """Quote a qualifier value when it contains whitespace"""
+    return f'"{value}"' if any(char.isspace() for char in value) else value
+
+
+class IssueDiscovery:
+    """Finds issues matching :class:`IssueQuery` filters using GitHub search"""
+
+    def __init__(self, github: Any, repository: str, repo: Any = None):
+        """
+        Initialize issue discovery
+
+        Args:
+            github: PyGithub ``Github`` client
+            repository: Repository name in format 'owner/repo'
+            repo: PyGithub repository for list endpoint reads (looked up lazily if omitted)
+        """
+        self.github = github
+        self.repository = repository
+        self._repo = repo
+
+    @property
+    def repo(self) -> Any:
+        if self._repo is None:
+            self._repo = self.github.get_repo(self.repository, lazy=True)
+        return self._repo
+
+    def iter_issues(self,
+                    queries: Union[IssueQuery, Iterable[IssueQuery]],
+                    limit: Optional[int] = None) -> Iterator[Any]:
+        """
+        Lazily yield issues matching one or more queries.
+
+        Pages are requested only as the generator is consumed, and iteration
+        stops as soon as ``limit`` issues have been yielded. Issues matched by
+        more than one query are yielded once.
+
+        Args:
+            queries: A query, or several queries whose results are concatenated
+            limit: Maximum number of issues to yield (None for all)
+
+        Yields:
+            GitHub issue objects
+        """
+        if isinstance(queries, IssueQuery):
+            queries = [queries]
+        if limit is not None and limit <= 0:
+            return
+
+        seen = set()
+        for query in queries:
+            for issue in self._iter_query(query):
+                if issue.number in seen:
+                    continue
+                seen.add(issue.number)
+                yield issue
+
+                if limit is not None and len(seen) >= limit:
+                    return
+
+    def _iter_query(self, query: IssueQuery) -> Iterator[Any]:
+        """Issues for one query: recently updated ones from the list endpoint, then search results"""
+        fresh_since = datetime.now(timezone.utc) - SEARCH_INDEX_LAG
+        if query.updated_since and _as_utc(query.updated_since) >= fresh_since:
+            # Everything the query asks for may still be missing from the index
+            yield from self._list_issues(query)
+            return
+        yield from self._list_issues(query, since=fresh_since)
+
+        search_query = query.to_search_query(self.repository)
+        logger.debug(f"Searching issues: {search_query}")
+        results = self.github.search_issues(search_query)
+        iterator = iter(results)
+        first = next(iterator, None)
+        if first is None:
+            return
+        # Known once the first page has been read, so this costs no request
+        total = getattr(results, 'totalCount', None)
+        if isinstance(total, int) and total >= SEARCH_RESULT_CAP:
+            logger.info(f"Search matched {total} issues, more than it returns; listing issues instead")
+            yield from self._list_issues(query)
+            return
+        yield first
+        yield from iterator
+
+    def _list_issues(self, query: IssueQuery, since: Optional[datetime] = None) -> Iterator[Any]:
+        """Issues matching a query from the repository issue list endpoint"""
+        for issue in self.repo.get_issues(**query.to_list_parameters(since)):
+            if query.matches(issue):
+                yield issue
+
+
+def _as_utc(moment: datetime) -> datetime:
+    return moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment
@@ -10,15 +10,27 @@ from urllib.parse import urlparse, urljoin, parse_qs, urlencode, urlunparse
 import time
 import re
 
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from google.auth.exceptions import GoogleAuthError
-
 from ..utils.config_manager import SiteConfig, SearchConfig
+from ..utils.metrics import get_registry
+from ..utils.tracing import current_span, traced
 
 
 logger = logging.getLogger(__name__)
 
+_QUERIES = get_registry().counter(
+    'speculum_search_queries_total', "Custom Search queries by outcome", ['outcome'])
+_RESULTS = get_registry().counter(
+    'speculum_search_results_total', "Results returned by Custom Search")
+_QUOTA_REMAINING = get_registry().gauge(
+    'speculum_search_quota_remaining', "Custom Search queries left in today's quota")
+
+
+def build(*args, **kwargs):
+    """``googleapiclient.discovery.build``, imported on first use because the
+    API client library is slow to import"""
+    from googleapiclient.discovery import build as build_service
+    return build_service(*args, **kwargs)
+
 
 class SearchResult:
     """Represents a single search result"""
@@ -86,14 +98,22 @@ class GoogleCustomSearchClient:
     def __init__(self, search_config: SearchConfig):
         self.config = search_config
         self.rate_limiter = RateLimiter(search_config.daily_query_limit)
-        
-        try:
-            self.service = build('customsearch', 'v1', developerKey=search_config.api_key)
-        except GoogleAuthError as e:
-            raise ValueError(f"Failed to initialize Google Custom Search API: {e}") from e
+        self._service = None
         
         logger.info(f"Initialized Google Custom Search client with engine ID: {search_config.search_engine_id}")
     
+    @property
+    def service(self):
+        """Custom Search API service, built on first use"""
+        if self._service is None:
+            from google.auth.exceptions import GoogleAuthError
+            try:
+                self._service = build('customsearch', 'v1', developerKey=self.config.api_key)
+            except GoogleAuthError as e:
+                raise ValueError(f"Failed to initialize Google Custom Search API: {e}") from e
+        return self._service
+    
+    @traced("search.query")
     def search_site_for_updates(self, site_config: SiteConfig) -> List[SearchResult]:
         """
         Search a specific site for recent updates
@@ -107,7 +127,10 @@ class GoogleCustomSearchClient:
         Raises:
             RuntimeError: If the search fails or rate limit is exceeded
         """
+        from googleapiclient.errors import HttpError
+        
         if not self.rate_limiter.can_make_request():
+            _QUERIES.inc(outcome='quota_exceeded')
             raise RuntimeError(f"Daily API rate limit ({self.config.daily_query_limit}) exceeded")
         
         # Build search query
@@ -132,21 +155,25 @@ class GoogleCustomSearchClient:
             # Execute search
             result = self.service.cse().list(**search_params).execute()
             self.rate_limiter.record_request()
+            _QUOTA_REMAINING.set(self.rate_limiter.daily_limit - self.rate_limiter.calls_today)
 
-            logger.info(f"---")
-            logger.info(f"Raw API response: {result}")
-            logger.info(f"---")
+            logger.debug("Raw API response: %s", result)
             
             # Parse results
             search_results = self._parse_search_results(result, site_config)
+            current_span().set(site=site_config.name, results=len(search_results))
+            _QUERIES.inc(outcome='ok')
+            _RESULTS.inc(len(search_results))
             
             logger.info(f"Found {len(search_results)} results for site '{site_config.name}'")
             return search_results
             
         except HttpError as e:
+            _QUERIES.inc(outcome='api_error')
             logger.error(f"Google Search API error for site '{site_config.name}': {e}")
             raise RuntimeError(f"Search API error: {e}") from e
         except Exception as e:
+            _QUERIES.inc(outcome='error')
             logger.error(f"Unexpected error searching site '{site_config.name}': {e}")
             raise RuntimeError(f"Unexpected search error: {e}") from e
     
@@ -20,6 +20,7 @@ Key features:
 - Integration with existing issue processor infrastructure
 """
 
+import contextvars
 import logging
 import time
 from typing import Dict, List, Optional, Set, Tuple, Any, Callable
@@ -31,7 +32,12 @@ import json
 
 from .issue_processor import IssueProcessor, IssueProcessingStatus, ProcessingResult, IssueData
 from ..clients.github_issue_creator import GitHubIssueCreator
+from ..clients.issue_discovery import IssueQuery, NO_ASSIGNEE
+from ..storage.git_manager import GitManager
 from ..utils.config_manager import ConfigManager
+from ..utils.metrics import get_registry
+from ..utils.profiling import active_session, profile_scope
+from ..utils.tracing import get_tracer, stage_statistics, traced
 
 
 @dataclass
@@ -48,6 +54,16 @@ class BatchConfig:
     priority_labels: List[str] = field(default_factory=lambda: ['urgent', 'high-priority'])
 
 
+_ISSUES_PROCESSED = get_registry().counter(
+    'speculum_issues_processed_total', "Issues processed by batch runs, by final status", ['status'])
+_ISSUE_SECONDS = get_registry().histogram(
+    'speculum_issue_processing_seconds', "Time spent processing one issue")
+_QUEUE_DEPTH = get_registry().gauge(
+    'speculum_batch_queue_depth', "Issues submitted to batch workers and not yet finished")
+_THROUGHPUT = get_registry().gauge(
+    'speculum_batch_issues_per_second', "Issues processed per second by the last batch run")
+
+
 @dataclass
 class BatchMetrics:
     """Metrics and statistics for batch processing operations."""
@@ -60,6 +76,8 @@ class BatchMetrics:
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     processing_times: List[float] = field(default_factory=list)
+    # Stage name -> count, total, p50, p95 and max milliseconds from tracing spans
+    stage_timings: Dict[str, Dict[str, float]] = field(default_factory=dict)
     
     @property
     def duration_seconds(self) -> float:
@@ -163,6 +181,11 @@ class BatchProgressReporter:
         if self.verbose:
             self.logger.info(message)
             self.logger.info(f"Average processing time: {metrics.average_processing_time:.2f}s")
+            for stage, timing in list(metrics.stage_timings.items())[:5]:
+                self.logger.info(
+                    f"Stage {stage}: {timing['count']} spans, p50 {timing['p50_ms']:.1f}ms, "
+                    f"p95 {timing['p95_ms']:.1f}ms, total {timing['total_ms']:.0f}ms"
+                )
         
         if self.progress_callback:
             self.progress_callback({
@@ -281,6 +304,7 @@ class BatchProcessor:
         
         return self.process_issues(issue_numbers, dry_run=dry_run)
     
+    @traced("batch.process")
     def process_issues(self, 
                       issue_numbers: List[int],
                       dry_run: bool = False) -> Tuple[BatchMetrics, List[ProcessingResult]]:
@@ -305,6 +329,13 @@ class BatchProcessor:
         
         all_results = []
         self._cancelled = False
+        trace_mark = get_tracer().mark()
+        
+        # Commit and push the branches of each batch together instead of once per issue
+        git_manager = self._git_manager()
+        if git_manager and not dry_run:
+            git_manager.defer_pushes = True
+            git_manager.defer_commits = True
         
         # Report processing start
         self.progress_reporter.report_start(
@@ -328,6 +359,10 @@ class BatchProcessor:
                 # Update metrics
                 self._update_metrics_from_batch(metrics, batch_results)
                 
+                if git_manager and not dry_run:
+                    git_manager.flush_commits()
+                    git_manager.flush_pushes()
+                
                 # Report batch completion
                 self.progress_reporter.report_batch_complete(batch_number, metrics)
                 
@@ -345,7 +380,18 @@ class BatchProcessor:
             self.logger.error(f"Batch processing failed: {e}")
             raise
         finally:
+            if git_manager:
+                if not dry_run:
+                    git_manager.flush_commits()
+                    git_manager.flush_pushes()
+                    git_manager.defer_commits = False
+                    git_manager.defer_pushes = False
+                git_manager.close_worktrees()
             metrics.end_time = datetime.now(timezone.utc)
+            metrics.stage_timings = stage_statistics(get_tracer().spans(trace_mark))
+            if metrics.duration_seconds > 0:
+                _THROUGHPUT.set(metrics.processed_count / metrics.duration_seconds)
+            self._processing_state['stage_timings'] = metrics.stage_timings
             self.progress_reporter.report_final_summary(metrics)
         
         return metrics, all_results
@@ -366,53 +412,27 @@ class BatchProcessor:
             List of issue numbers matching criteria
         """
         try:
-            # Query GitHub for site-monitor issues
-            query_parts = ['label:site-monitor', 'state:open']
+            query = IssueQuery(labels=['site-monitor'], state='open')
             
             # Add assignee filter if specified
             if filters.get('assignee'):
-                if filters['assignee'] == 'none':
-                    query_parts.append('no:assignee')
-                else:
-                    query_parts.append(f'assignee:{filters["assignee"]}')
+                query.assignee = filters['assignee']
             elif not self.config.include_assigned:
                 # By default, skip assigned issues to avoid conflicts
-                query_parts.append('no:assignee')
+                query.assignee = NO_ASSIGNEE
             
-            # Add additional label filters
+            # Issues must carry at least one of the additional labels
             if filters.get('additional_labels'):
-                for label in filters['additional_labels']:
-                    query_parts.append(f'label:{label}')
+                query.any_labels = list(filters['additional_labels'])
             
-            # Execute search using get_issues_with_labels
-            issues = self.github_client.get_issues_with_labels(['site-monitor'], state='open')
+            if filters.get('updated_since'):
+                query.updated_since = filters['updated_since']
             
-            # Filter based on assignee criteria
-            filtered_issues = []
-            for issue in issues:
-                # Check assignee filter
-                if filters.get('assignee'):
-                    if filters['assignee'] == 'none':
-                        if issue.assignee is not None:
-                            continue
-                    else:
-                        if not issue.assignee or issue.assignee.login != filters['assignee']:
-                            continue
-                elif not self.config.include_assigned:
-                    # By default, skip assigned issues to avoid conflicts
-                    if issue.assignee is not None:
-                        continue
-                
-                # Check additional label filters
-                if filters.get('additional_labels'):
-                    issue_labels = [label.name for label in issue.labels]
-                    if not any(label in issue_labels for label in filters['additional_labels']):
-                        continue
-                
-                filtered_issues.append(issue)
+            # Read from the local issue mirror, which only pulls issues changed since the last sync
+            filtered_issues = self.github_client.get_mirrored_issues(query)
             
             # Extract issue numbers
-            issue_numbers = [issue.number for issue in filtered_issues]
+            issue_numbers = [issue['number'] for issue in filtered_issues]
             
             # Apply priority sorting if configured
             if self.config.priority_labels:
@@ -426,9 +446,12 @@ class BatchProcessor:
             return []
     
     def _sort_by_priority(self, issue_numbers: List[int], issues: List[Any]) -> List[int]:
-        """Sort issues by priority labels."""
+        """Sort issues (mirrored issue dictionaries or GitHub issue objects) by priority labels."""
         def get_priority_score(issue: Any) -> int:
-            labels = [label.name for label in issue.labels]
+            if isinstance(issue, dict):
+                labels = issue.get('labels', [])
+            else:
+                labels = [label.name for label in issue.labels]
             for i, priority_label in enumerate(self.config.priority_labels):
                 if priority_label in labels:
                     return len(self.config.priority_labels) - i
@@ -436,7 +459,7 @@ class BatchProcessor:
         
         # Create mapping for sorting
         issue_priority_map = {
-            issue.number: get_priority_score(issue) 
+            (issue['number'] if isinstance(issue, dict) else issue.number): get_priority_score(issue)
             for issue in issues
         }
         
@@ -467,15 +490,24 @@ class BatchProcessor:
         """
         batch_results = []
         
+        # Worktree and direct-commit modes never pull per issue; fetch the
+        # base branch once here instead
+        git_manager = self._batch_git_manager()
+        if git_manager and not dry_run:
+            git_manager.prepare_batch()
+        
         # Use thread pool for parallel processing
         max_workers = min(self.config.max_concurrent_workers, len(issue_numbers))
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all issues for processing
+            # Submit all issues for processing; each worker runs in a copy of
+            # this context so its spans nest under the batch span
             future_to_issue = {
-                executor.submit(self._process_single_issue_with_retry, issue_number, dry_run): issue_number
+                executor.submit(contextvars.copy_context().run,
+                                self._process_issue_in_worker, issue_number, dry_run): issue_number
                 for issue_number in issue_numbers
             }
+            _QUEUE_DEPTH.inc(len(future_to_issue))
             
             # Collect results as they complete
             for future in as_completed(future_to_issue):
@@ -508,9 +540,32 @@ class BatchProcessor:
                     
                     batch_results.append(error_result)
                     self.logger.error(f"Failed to process issue #{issue_number}: {e}")
+                
+                _QUEUE_DEPTH.dec()
+                finished = batch_results[-1]
+                _ISSUES_PROCESSED.inc(status=finished.status.value)
+                if finished.processing_time_seconds:
+                    _ISSUE_SECONDS.observe(finished.processing_time_seconds)
         
         return batch_results
     
+    def _git_manager(self) -> Optional[GitManager]:
+        """The issue processor's git manager, if git operations are enabled."""
+        git_manager = getattr(self.issue_processor, 'git_manager', None)
+        return git_manager if isinstance(git_manager, GitManager) else None
+    
+    def _batch_git_manager(self) -> Optional[GitManager]:
+        """The issue processor's git manager if it prepares the base once per batch."""
+        git_manager = self._git_manager()
+        if git_manager and (git_manager.use_worktrees or git_manager.direct_commits):
+            return git_manager
+        return None
+    
+    def _process_issue_in_worker(self, issue_number: int, dry_run: bool = False) -> ProcessingResult:
+        """Process one issue on a worker thread, attributed to the issue when profiling."""
+        with profile_scope(f"issue-{issue_number}"):
+            return self._process_single_issue_with_retry(issue_number, dry_run)
+    
     def _process_single_issue_with_retry(self, 
                                         issue_number: int, 
                                         dry_run: bool = False) -> ProcessingResult:
@@ -614,6 +669,7 @@ class BatchProcessor:
             results_data = {
                 'timestamp': datetime.now(timezone.utc).isoformat(),
                 'total_issues': len(results),
+                'stage_timings': self._processing_state.get('stage_timings', {}),
                 'results': [
                     {
                         'issue_number': r.issue_number,
@@ -631,6 +687,14 @@ class BatchProcessor:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
+            # Profile of the run so far, written next to the results
+            session = active_session()
+            if session:
+                results_data['profile'] = {
+                    'files': session.write(output_file.parent, f"{output_file.stem}.profile"),
+                    'issues': session.scope_report()
+                }
+            
             with open(output_file, 'w') as f:
                 json.dump(results_data, f, indent=2)
             
@@ -0,0 +1,240 @@
+"""
+Bloom Filters
+Compact probabilistic membership filters with day-bucket rotation
+
+A Bloom filter answers "definitely not seen" or "possibly seen" for a key
+using a few bits per key. :class:`DailyBloomFilter` keeps one filter per UTC
+day on disk so that keys older than the retention window age out by deleting
+whole day buckets instead of rebuilding the filter.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import struct
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+_HEADER = struct.Struct('<4sQIQQd')
+_MAGIC = b'BLM1'
+_BUCKET_FILE = re.compile(r"^(\d{4}-\d{2}-\d{2})\.(\d+)\.bloom$")
+MANIFEST_NAME = "manifest.json"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter"""
+
+    def __init__(self, capacity: int, error_rate: float = 1e-4):
+        """
+        Initialize an empty filter
+
+        Args:
+            capacity: Number of keys the filter is sized for
+            error_rate: False-positive rate at capacity
+        """
+        if capacity < 1:
+            raise ValueError("Bloom filter capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        """Bit positions for a key (Kirsch-Mitzenmacher double hashing)"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        num_bits = self.num_bits
+        return ((first + i * second) % num_bits for i in range(self.num_hashes))
+
+    def add(self, key: str) -> None:
+        """Add a key"""
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the filter holds as many keys as it was sized for"""
+        return self.count >= self.capacity
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter"""
+        header = _HEADER.pack(_MAGIC, self.num_bits, self.num_hashes, self.capacity,
+                              self.count, self.error_rate)
+        return header + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BloomFilter':
+        """Deserialize a filter written by :meth:`to_bytes`"""
+        magic, num_bits, num_hashes, capacity, count, error_rate = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Not a Bloom filter file")
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.error_rate = error_rate
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.count = count
+        bloom._bits = bytearray(data[_HEADER.size:])
+        if len(bloom._bits) != (num_bits + 7) // 8:
+            raise ValueError("Truncated Bloom filter file")
+        return bloom
+
+
+class DailyBloomFilter:
+    """Bloom filters bucketed by UTC day, persisted in a directory
+
+    Each day bucket grows by adding another filter once the current one is
+    full, so the false-positive rate stays bounded on busy days. Buckets
+    older than the retention window are dropped by :meth:`rotate`.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 retention_days: int = 30,
+                 capacity_per_day: int = 20000,
+                 error_rate: float = 1e-4):
+        """
+        Initialize the filter, loading any buckets already on disk
+
+        Args:
+            directory: Directory holding the bucket files and manifest
+            retention_days: Days of buckets to keep
+            capacity_per_day: Keys per filter before a day bucket grows
+            error_rate: False-positive rate of each filter
+        """
+        self.directory = Path(directory)
+        self.retention_days = retention_days
+        self.capacity_per_day = capacity_per_day
+        self.error_rate = error_rate
+        self.metadata: Dict[str, Any] = {}
+        self._buckets: Dict[str, List[BloomFilter]] = {}
+        self._dirty: set = set()
+        self._load()
+
+    def _load(self) -> None:
+        """Read the manifest and bucket files"""
+        manifest_path = self.directory / MANIFEST_NAME
+        if not manifest_path.exists():
+            return
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as file:
+                self.metadata = json.load(file).get('metadata', {})
+            for path in sorted(self.directory.iterdir()):
+                match = _BUCKET_FILE.match(path.name)
+                if match:
+                    self._buckets.setdefault(match.group(1), []).append(
+                        BloomFilter.from_bytes(path.read_bytes())
+                    )
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Discarding unreadable Bloom filter in {self.directory}: {e}")
+            self.metadata = {}
+            self._buckets = {}
+
+    @property
+    def exists(self) -> bool:
+        """Whether a saved filter was loaded"""
+        return bool(self.metadata)
+
+    def __len__(self) -> int:
+        return sum(bloom.count for filters in self._buckets.values() for bloom in filters)
+
+    @staticmethod
+    def _day_key(day: Optional[date]) -> str:
+        return (day or datetime.utcnow().date()).isoformat()
+
+    def add(self, key: str, day: Optional[date] = None) -> None:
+        """
+        Add a key to a day bucket
+
+        Args:
+            key: Key to add
+            day: UTC day the key belongs to (defaults to today)
+        """
+        day_key = self._day_key(day)
+        filters = self._buckets.setdefault(day_key, [])
+        if not filters or filters[-1].is_full:
+            filters.append(BloomFilter(self.capacity_per_day, self.error_rate))
+        filters[-1].add(key)
+        self._dirty.add(day_key)
+
+    def might_contain(self, key: str) -> bool:
+        """False if the key was definitely never added within the retention window"""
+        return any(key in bloom for filters in self._buckets.values() for bloom in filters)
+
+    def rotate(self, today: Optional[date] = None) -> int:
+        """
+        Drop buckets older than the retention window
+
+        Args:
+            today: Current UTC day (defaults to today)
+
+        Returns:
+            Number of day buckets dropped
+        """
+        cutoff = ((today or datetime.utcnow().date()) - timedelta(days=self.retention_days)).isoformat()
+        expired = [day_key for day_key in self._buckets if day_key < cutoff]
+        for day_key in expired:
+            del self._buckets[day_key]
+            self._dirty.discard(day_key)
+            for path in self.directory.glob(f"{day_key}.*.bloom"):
+                path.unlink()
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove all keys (and bucket files on the next save)"""
+        for path in self.directory.glob("*.bloom"):
+            path.unlink()
+        self._buckets = {}
+        self._dirty = set()
+        self.metadata = {}
+
+    def save(self, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Write changed buckets and the manifest
+
+        Args:
+            metadata: Caller metadata stored in the manifest (e.g. the state of
+                the store the filter describes)
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for day_key in sorted(self._dirty):
+            for index, bloom in enumerate(self._buckets.get(day_key, [])):
+                path = self.directory / f"{day_key}.{index}.bloom"
+                temp_path = f"{path}.tmp"
+                with open(temp_path, 'wb') as file:
+                    file.write(bloom.to_bytes())
+                os.replace(temp_path, path)
+        self._dirty = set()
+
+        if metadata is not None:
+            self.metadata = metadata
+        manifest = {
+            'metadata': self.metadata,
+            'retention_days': self.retention_days,
+            'updated_at': datetime.utcnow().isoformat(),
+            'keys': len(self),
+            'days': sorted(self._buckets)
+        }
+        temp_path = self.directory / f"{MANIFEST_NAME}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=2)
+        os.replace(temp_path, self.directory / MANIFEST_NAME)
@@ -0,0 +1,363 @@
+"""
+Service Daemon
+Resident process that runs monitoring cycles and issue processing on a schedule
+
+One-shot CLI runs rebuild everything on every invocation: imports, config,
+parsed workflows, the deduplication index, processing state and API clients.
+``ServiceDaemon`` builds them once and keeps them warm between runs:
+
+- the deduplication index and processing state stay in memory
+- GitHub and search clients keep their pooled connections and caches
+- processing state is checkpointed on an interval instead of after every
+  status change
+- ``SIGHUP`` reloads the configuration and rebuilds the components;
+  ``SIGTERM`` and ``SIGINT`` checkpoint and stop
+
+Jobs run one at a time on the daemon thread, so a monitoring cycle and a
+processing run never touch the repository or state files concurrently.
+"""
+
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from ..utils.logging_config import get_logger, log_exception
+from ..utils.metrics import get_registry, write_textfile
+from ..utils.tracing import span
+
+
+logger = get_logger(__name__)
+
+_JOB_RUNS = get_registry().counter(
+    'speculum_scheduler_job_runs_total', "Scheduled daemon job runs by outcome", ['job', 'outcome'])
+_JOB_LAST_SUCCESS = get_registry().gauge(
+    'speculum_scheduler_job_last_success_timestamp_seconds', "Unix time a daemon job last succeeded", ['job'])
+_RELOADS = get_registry().counter(
+    'speculum_daemon_reloads_total', "Configuration reloads by outcome", ['outcome'])
+
+
+@dataclass
+class ScheduledJob:
+    """A job run every ``interval_seconds``"""
+    name: str
+    interval_seconds: float
+    action: Callable[[], Any]
+    next_run: float = 0.0
+    runs: int = 0
+    failures: int = 0
+    last_duration_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class Scheduler:
+    """Runs jobs at fixed intervals on the calling thread"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the scheduler
+
+        Args:
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.clock = clock
+        self.jobs: List[ScheduledJob] = []
+
+    def add_job(self, name: str, interval_seconds: float, action: Callable[[], Any],
+                run_immediately: bool = True) -> ScheduledJob:
+        """
+        Register a job
+
+        Args:
+            name: Job name used in logs and metrics
+            interval_seconds: Time between the starts of consecutive runs
+            action: Called with no arguments; exceptions count as failures
+            run_immediately: Run on the first ``run_pending`` instead of after one interval
+
+        Returns:
+            The scheduled job
+        """
+        if interval_seconds <= 0:
+            raise ValueError(f"Interval for job '{name}' must be positive")
+        now = self.clock()
+        job = ScheduledJob(
+            name=name,
+            interval_seconds=interval_seconds,
+            action=action,
+            next_run=now if run_immediately else now + interval_seconds
+        )
+        self.jobs.append(job)
+        return job
+
+    def run_pending(self) -> List[str]:
+        """
+        Run every job that is due, earliest first
+
+        Returns:
+            Names of the jobs that ran
+        """
+        ran = []
+        due = sorted((job for job in self.jobs if job.next_run <= self.clock()),
+                     key=lambda job: job.next_run)
+        for job in due:
+            self._run(job)
+            ran.append(job.name)
+        return ran
+
+    def run_all(self) -> None:
+        """Run every job once, in registration order"""
+        for job in self.jobs:
+            self._run(job)
+
+    def seconds_until_next(self) -> float:
+        """Time until the next job is due (0 if one is overdue)"""
+        if not self.jobs:
+            return float('inf')
+        return max(min(job.next_run for job in self.jobs) - self.clock(), 0.0)
+
+    def _run(self, job: ScheduledJob) -> None:
+        started = self.clock()
+        logger.info(f"Running scheduled job '{job.name}'")
+        try:
+            with span(f"job.{job.name}"):
+                job.action()
+        except Exception as e:
+            job.failures += 1
+            job.last_error = str(e)
+            _JOB_RUNS.inc(job=job.name, outcome='failure')
+            log_exception(logger, f"Scheduled job '{job.name}' failed", e)
+        else:
+            job.last_error = None
+            _JOB_RUNS.inc(job=job.name, outcome='success')
+            _JOB_LAST_SUCCESS.set(time.time(), job=job.name)
+        finally:
+            job.runs += 1
+            finished = self.clock()
+            job.last_duration_seconds = finished - started
+            # Fixed rate, but never queue up runs missed while a job overran
+            job.next_run = max(started + job.interval_seconds, finished)
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Per-job run counts, timings and next run"""
+        now = self.clock()
+        return [
+            {
+                'name': job.name,
+                'interval_seconds': job.interval_seconds,
+                'runs': job.runs,
+                'failures': job.failures,
+                'last_duration_seconds': job.last_duration_seconds,
+                'last_error': job.last_error,
+                'next_run_in_seconds': max(job.next_run - now, 0.0)
+            }
+            for job in self.jobs
+        ]
+
+
+@dataclass
+class DaemonComponents:
+    """Long-lived objects shared by the daemon's jobs"""
+    monitor_service: Any
+    processor: Any
+    orchestrator: Any
+
+    def close(self) -> None:
+        """Release worktrees and HTTP connections; failures are logged, not raised"""
+        for name, resource in (('processor', self.processor),
+                               ('monitor GitHub client', self.monitor_service.github_client)):
+            try:
+                resource.close()
+            except Exception as e:
+                log_exception(logger, f"Failed to close {name}", e)
+
+
+def build_daemon_components(config_path: str, github_token: str, repository: str) -> DaemonComponents:
+    """
+    Build the monitoring and processing components from configuration
+
+    The monitor service hands the issues it creates to the same processor the
+    processing job uses, so there is one in-memory copy of processing state.
+
+    Args:
+        config_path: Path to the YAML configuration file
+        github_token: GitHub token
+        repository: Repository in 'owner/repo' format
+
+    Returns:
+        Components ready to run jobs
+    """
+    from .issue_processor import GitHubIntegratedIssueProcessor
+    from .processing_orchestrator import ProcessingOrchestrator
+    from .site_monitor import create_monitor_service_from_config
+
+    monitor_service = create_monitor_service_from_config(config_path, github_token)
+    processor = GitHubIntegratedIssueProcessor(
+        github_token=github_token,
+        repository=repository,
+        config_path=config_path
+    )
+    if monitor_service.issue_processor is not None:
+        monitor_service.issue_processor = processor
+    return DaemonComponents(
+        monitor_service=monitor_service,
+        processor=processor,
+        orchestrator=ProcessingOrchestrator(processor)
+    )
+
+
+class ServiceDaemon:
+    """Keeps the pipeline's components warm and runs it on a schedule"""
+
+    def __init__(self,
+                 build: Callable[[], DaemonComponents],
+                 monitor_interval: float = 3600.0,
+                 process_interval: float = 900.0,
+                 checkpoint_interval: float = 300.0,
+                 batch_size: int = 10,
+                 create_individual_issues: bool = True,
+                 metrics_file: Optional[str] = None,
+                 scheduler: Optional[Scheduler] = None):
+        """
+        Initialize the daemon
+
+        Args:
+            build: Builds the components; called at start and on every reload
+            monitor_interval: Seconds between monitoring cycles (0 disables)
+            process_interval: Seconds between issue processing runs (0 disables)
+            checkpoint_interval: Seconds between state checkpoints
+            batch_size: Maximum issues per processing run
+            create_individual_issues: Whether monitoring creates an issue per result
+            metrics_file: Textfile-collector file rewritten at every checkpoint
+            scheduler: Scheduler to use (a new one by default)
+        """
+        self.build = build
+        self.monitor_interval = monitor_interval
+        self.process_interval = process_interval
+        self.checkpoint_interval = checkpoint_interval
+        self.batch_size = batch_size
+        self.create_individual_issues = create_individual_issues
+        self.metrics_file = metrics_file
+        self.scheduler = scheduler or Scheduler()
+
+        self.components: Optional[DaemonComponents] = None
+        self._wake = threading.Event()
+        self._stop_requested = False
+        self._reload_requested = False
+
+    def start(self) -> None:
+        """Build the components and schedule the jobs"""
+        self.components = self._build()
+        if self.monitor_interval > 0:
+            self.scheduler.add_job('monitor', self.monitor_interval, self.run_monitoring)
+        if self.process_interval > 0:
+            self.scheduler.add_job('process', self.process_interval, self.run_processing)
+        self.scheduler.add_job('checkpoint', self.checkpoint_interval, self.checkpoint,
+                               run_immediately=False)
+
+    def _build(self) -> DaemonComponents:
+        components = self.build()
+        components.processor.defer_state_saves = True
+        return components
+
+    def run_monitoring(self) -> Dict[str, Any]:
+        """Run one monitoring cycle"""
+        results = self.components.monitor_service.run_monitoring_cycle(
+            create_individual_issues=self.create_individual_issues
+        )
+        if not results.get('success'):
+            raise RuntimeError(f"Monitoring cycle failed: {results.get('error')}")
+        logger.info(f"Monitoring cycle found {results['new_results_found']} new results, "
+                    f"created {results['individual_issues_created']} issues")
+        return results
+
+    def run_processing(self) -> Any:
+        """Process open site-monitor issues"""
+        metrics, _ = self.components.orchestrator.process_all_site_monitor_issues(
+            batch_size=self.batch_size
+        )
+        logger.info(f"Processed {metrics.processed_count}/{metrics.total_issues} issues, "
+                    f"{metrics.error_count} errors")
+        return metrics
+
+    def checkpoint(self) -> None:
+        """Write in-memory state to disk"""
+        if self.components is None:
+            return
+        if self.components.processor.flush_processing_state():
+            logger.info("Checkpointed processing state")
+        self.components.monitor_service.dedup_manager.save_processed_entries()
+        if self.metrics_file:
+            write_textfile(self.metrics_file)
+
+    def request_reload(self) -> None:
+        """Reload configuration before the next job (safe to call from a signal handler)"""
+        self._reload_requested = True
+        self._wake.set()
+
+    def request_stop(self) -> None:
+        """Stop after the running job (safe to call from a signal handler)"""
+        self._stop_requested = True
+        self._wake.set()
+
+    def reload(self) -> bool:
+        """
+        Checkpoint, then rebuild the components from the current configuration
+
+        The old components are closed once the new ones are built, and kept
+        if the new configuration fails to load.
+
+        Returns:
+            True if the components were replaced
+        """
+        self._reload_requested = False
+        logger.info("Reloading configuration")
+        self.checkpoint()
+        try:
+            components = self._build()
+        except Exception as e:
+            _RELOADS.inc(outcome='failure')
+            log_exception(logger, "Configuration reload failed, keeping the previous configuration", e)
+            return False
+        previous, self.components = self.components, components
+        if previous is not None:
+            previous.close()
+        _RELOADS.inc(outcome='success')
+        logger.info("Configuration reloaded")
+        return True
+
+    def install_signal_handlers(self) -> None:
+        """Reload on SIGHUP and stop on SIGTERM/SIGINT (main thread only)"""
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, lambda signum, frame: self.request_reload())
+        signal.signal(signal.SIGTERM, lambda signum, frame: self.request_stop())
+        signal.signal(signal.SIGINT, lambda signum, frame: self.request_stop())
+
+    def run(self, once: bool = False) -> None:
+        """
+        Run jobs until stopped
+
+        Args:
+            once: Run each job a single time, checkpoint and return
+        """
+        if self.components is None:
+            self.start()
+        try:
+            if once:
+                self.scheduler.run_all()
+                return
+            logger.info(f"Daemon started with jobs: {', '.join(job.name for job in self.scheduler.jobs)}")
+            while not self._stop_requested:
+                if self._reload_requested:
+                    self.reload()
+                self.scheduler.run_pending()
+                if self._stop_requested:
+                    break
+                wait = self.scheduler.seconds_until_next()
+                self._wake.wait(None if wait == float('inf') else wait)
+                self._wake.clear()
+        finally:
+            logger.info("Daemon stopping")
+            self.checkpoint()
+            if self.components is not None:
+                self.components.close()
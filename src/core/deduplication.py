@@ -6,38 +6,97 @@ Manages tracking of processed URLs and prevents duplicate GitHub issues
 import json
 import logging
 import hashlib
+import heapq
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Set, Optional, Any
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from json.encoder import encode_basestring as _json_string
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 
 from ..clients.search_client import SearchResult, normalize_url
+from .bloom_filter import DailyBloomFilter
+from .near_duplicate import (
+    MinHashLSHIndex, NearDuplicateMatch, decode_signature, encode_signature, result_signature
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+# Timestamps are held as integer microseconds since this (naive UTC) epoch
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Read size for streaming storage files
+_READ_CHUNK = 1 << 16
+
+# Template used by ProcessedEntry.to_json; field order matches to_dict. The
+# MinHash signature is only stored when near-duplicate detection computed one.
+_ENTRY_JSON = ('{"url": %s, "normalized_url": %s, "title": %s, "site_name": %s, '
+               '"issue_number": %s, "processed_at": "%s", "content_hash": %s%s}')
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """Convert a naive UTC (or aware) datetime to integer microseconds since the epoch"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch_us(value: int) -> datetime:
+    """Convert integer microseconds since the epoch to a naive UTC datetime"""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _content_hash(normalized_url: str, title: str) -> str:
+    """Deduplication key for a result: hash of its normalized URL and title"""
+    content = f"{normalized_url}|{title.lower().strip()}"
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
+
 class ProcessedEntry:
-    """Represents a processed search result entry"""
+    """Represents a processed search result entry
+    
+    Entries are slotted and keep their timestamp as integer microseconds,
+    and site names are interned, so large deduplication stores stay compact.
+    """
+    
+    __slots__ = ('url', 'normalized_url', 'title', 'site_name', 'issue_number',
+                 'processed_us', 'content_hash', 'minhash')
     
     def __init__(self, url: str, title: str, site_name: str, 
-                 issue_number: Optional[int] = None, processed_at: Optional[datetime] = None):
-        self.url = url
-        self.normalized_url = normalize_url(url)
+                 issue_number: Optional[int] = None, processed_at: Optional[datetime] = None,
+                 normalized_url: Optional[str] = None, content_hash: Optional[str] = None,
+                 minhash: Optional[bytes] = None):
+        self.normalized_url = normalized_url if normalized_url is not None else normalize_url(url)
+        # Most stored URLs are already normalized; share the string when they are
+        self.url = self.normalized_url if url == self.normalized_url else url
         self.title = title
-        self.site_name = site_name
+        self.site_name = sys.intern(site_name)
         self.issue_number = issue_number
-        self.processed_at = processed_at or datetime.utcnow()
-        self.content_hash = self._generate_content_hash()
+        self.processed_us = _to_epoch_us(processed_at or datetime.utcnow())
+        self.content_hash = content_hash or self._generate_content_hash()
+        # Title + snippet signature for near-duplicate detection
+        self.minhash = minhash
+    
+    @property
+    def processed_at(self) -> datetime:
+        """Processing time as a naive UTC datetime"""
+        return _from_epoch_us(self.processed_us)
+    
+    @processed_at.setter
+    def processed_at(self, value: datetime) -> None:
+        self.processed_us = _to_epoch_us(value)
     
     def _generate_content_hash(self) -> str:
         """Generate hash from URL and title for deduplication"""
-        content = f"{self.normalized_url}|{self.title.lower().strip()}"
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+        return _content_hash(self.normalized_url, self.title)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return {
+        data = {
             'url': self.url,
             'normalized_url': self.normalized_url,
             'title': self.title,
@@ -46,21 +105,40 @@ class ProcessedEntry:
             'processed_at': self.processed_at.isoformat(),
             'content_hash': self.content_hash
         }
+        if self.minhash is not None:
+            data['minhash'] = encode_signature(self.minhash)
+        return data
+    
+    def to_json(self) -> str:
+        """Serialize to a JSON object string (equivalent to ``json.dumps(self.to_dict())``)"""
+        return _ENTRY_JSON % (
+            _json_string(self.url),
+            _json_string(self.normalized_url),
+            _json_string(self.title),
+            _json_string(self.site_name),
+            'null' if self.issue_number is None else int(self.issue_number),
+            self.processed_at.isoformat(),
+            _json_string(self.content_hash),
+            '' if self.minhash is None else ', "minhash": ' + _json_string(encode_signature(self.minhash))
+        )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ProcessedEntry':
-        """Create ProcessedEntry from dictionary"""
-        entry = cls(
+        """Create ProcessedEntry from dictionary
+        
+        Stored normalized URLs and content hashes are trusted as-is; they are
+        only computed for entries written by older versions without them.
+        """
+        return cls(
             url=data['url'],
             title=data['title'],
             site_name=data['site_name'],
             issue_number=data.get('issue_number'),
-            processed_at=datetime.fromisoformat(data['processed_at'])
+            processed_at=datetime.fromisoformat(data['processed_at']),
+            normalized_url=data.get('normalized_url'),
+            content_hash=data.get('content_hash'),
+            minhash=decode_signature(data.get('minhash'))
         )
-        # Use stored hash if available, otherwise regenerate
-        if 'content_hash' in data:
-            entry.content_hash = data['content_hash']
-        return entry
     
     def __str__(self):
         return f"ProcessedEntry(url='{self.url}', site='{self.site_name}', issue=#{self.issue_number})"
@@ -69,99 +147,390 @@ class ProcessedEntry:
         return self.__str__()
 
 
+def _write_entries_file(path: str, metadata: Dict[str, Any], entries: Iterable[ProcessedEntry]) -> None:
+    """
+    Write a deduplication storage file.
+    
+    Each entry is serialized on its own line with ``ProcessedEntry.to_json``,
+    which is much faster than ``json.dump(..., indent=2)`` for large stores
+    while keeping the file line-oriented for diffs.
+    
+    Args:
+        path: File to write
+        metadata: Metadata block
+        entries: Entries to store
+    """
+    _write_entry_lines(path, metadata, (entry.to_json() for entry in entries))
+
+
+def _write_entry_lines(path: str, metadata: Dict[str, Any], entry_lines: Iterable[str]) -> None:
+    """Write a deduplication storage file from already serialized entries"""
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('{\n  "metadata": ')
+        file.write(json.dumps(metadata, ensure_ascii=False))
+        file.write(',\n  "entries": [')
+        separator = '\n    '
+        for line in entry_lines:
+            file.write(separator)
+            file.write(line)
+            separator = ',\n    '
+        file.write('\n  ]\n}\n')
+
+
+class _JsonStream:
+    """Pull parser over a JSON document read in fixed-size chunks"""
+    
+    def __init__(self, file, chunk_size: int = _READ_CHUNK):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+    
+    def _fill(self) -> bool:
+        """Read another chunk, dropping consumed input; False at end of file"""
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at end of file)"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos:self._pos + 1]
+    
+    def expect(self, char: str) -> None:
+        """Consume a structural character"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found or 'end of file'!r}")
+        self._pos += 1
+    
+    def value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self._buffer) or not self._fill():
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+
+
+def iter_stored_entries(file_path: str, chunk_size: int = _READ_CHUNK) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the raw entry dictionaries of a deduplication storage file
+    
+    Reads the file incrementally, so memory use does not grow with the
+    number of entries. Other top-level keys (such as the metadata block)
+    are parsed and skipped.
+    
+    Args:
+        file_path: Storage file to read
+        chunk_size: Number of characters read at a time
+        
+    Yields:
+        Entry dictionaries as accepted by ``ProcessedEntry.from_dict``
+        
+    Raises:
+        ValueError: If the file is not a valid storage file
+    """
+    with open(file_path, 'r', encoding='utf-8') as file:
+        stream = _JsonStream(file, chunk_size)
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+        while True:
+            key = stream.value()
+            stream.expect(':')
+            if key == 'entries':
+                stream.expect('[')
+                if stream.peek() == ']':
+                    stream.expect(']')
+                else:
+                    while True:
+                        yield stream.value()
+                        if stream.peek() != ',':
+                            stream.expect(']')
+                            break
+                        stream.expect(',')
+            else:
+                stream.value()
+            if stream.peek() != ',':
+                stream.expect('}')
+                return
+            stream.expect(',')
+
+
+def _iter_journal_entries(journal_path: str) -> Iterator[Dict[str, Any]]:
+    """Stream the entry dictionaries of a store's journal file"""
+    with open(journal_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
 class DeduplicationManager:
-    """Manages deduplication of search results and GitHub issues"""
+    """Manages deduplication of search results and GitHub issues
+    
+    With ``prefilter`` enabled, a day-bucketed Bloom filter persisted next to
+    the store answers "definitely new" for most results, and the entry set is
+    only loaded when a result might already be processed (or when stats or a
+    full save need it). Entries marked while the store is not loaded are
+    appended to a journal file that is merged on the next full load.
+    """
     
     def __init__(self, storage_path: str = "processed_urls.json", 
-                 retention_days: int = 30):
+                 retention_days: int = 30,
+                 near_duplicate_threshold: Optional[float] = None,
+                 prefilter: bool = False):
+        """
+        Initialize the deduplication manager
+        
+        Args:
+            storage_path: JSON file holding processed entries
+            retention_days: Days to keep processed entries
+            near_duplicate_threshold: Minimum title/snippet similarity (0-1) at which a
+                result counts as a near-duplicate of a processed one; None disables
+                near-duplicate detection
+            prefilter: Keep a Bloom filter next to the store and load entries lazily
+        """
         self.storage_path = Path(storage_path)
+        self.journal_path = Path(f"{storage_path}.journal")
         self.retention_days = retention_days
-        self.processed_entries: Dict[str, ProcessedEntry] = {}
-        self.url_to_hash: Dict[str, str] = {}  # Maps normalized URLs to content hashes
-        self.title_hashes: Set[str] = set()  # Track similar titles
+        self._entries: Dict[str, ProcessedEntry] = {}
+        self._url_to_hash: Dict[str, str] = {}  # Maps normalized URLs to content hashes
+        self._title_hashes: Set[str] = set()  # Track similar titles
+        self.near_duplicate_index: Optional[MinHashLSHIndex] = (
+            MinHashLSHIndex(near_duplicate_threshold) if near_duplicate_threshold is not None else None
+        )
+        self.near_duplicates_detected = 0
+        # Near-duplicates found by the most recent filter_new_results call
+        self.last_near_duplicates: List[Tuple[SearchResult, NearDuplicateMatch]] = []
+        
+        self.prefilter: Optional[DailyBloomFilter] = None
+        self.prefilter_stats = {'definitely_new': 0, 'possible_matches': 0}
+        self._pending: List[ProcessedEntry] = []
+        self._loaded = False
+        
+        if prefilter:
+            self.prefilter = DailyBloomFilter(f"{storage_path}.bloom", retention_days=retention_days)
+            self.prefilter.rotate()
+            if self.prefilter.exists and self.prefilter.metadata == self._prefilter_metadata():
+                logger.info(f"Initialized deduplication manager with Bloom prefilter "
+                            f"({len(self.prefilter)} keys); entries load on demand")
+                return
+            logger.info("Bloom prefilter missing or stale, rebuilding from the store")
         
+        self._ensure_loaded()
+        if self.prefilter is not None:
+            self._rebuild_prefilter()
+        logger.info(f"Initialized deduplication manager with {len(self._entries)} entries")
+    
+    @property
+    def processed_entries(self) -> Dict[str, ProcessedEntry]:
+        """Processed entries keyed by content hash (loads the store if needed)"""
+        self._ensure_loaded()
+        return self._entries
+    
+    @property
+    def url_to_hash(self) -> Dict[str, str]:
+        """Normalized URL to content hash index (loads the store if needed)"""
+        self._ensure_loaded()
+        return self._url_to_hash
+    
+    @property
+    def title_hashes(self) -> Set[str]:
+        """Content hashes of processed entries (loads the store if needed)"""
+        self._ensure_loaded()
+        return self._title_hashes
+    
+    def _ensure_loaded(self) -> None:
+        """Load the store and journal once, then apply entries marked in the meantime"""
+        if self._loaded:
+            return
+        self._loaded = True
         self._load_processed_entries()
-        logger.info(f"Initialized deduplication manager with {len(self.processed_entries)} entries")
+        for entry in self._pending:
+            self._index_entry(entry)
+        self._pending = []
     
     def _load_processed_entries(self) -> None:
         """Load processed entries from storage file"""
         if not self.storage_path.exists():
             logger.info(f"Storage file {self.storage_path} doesn't exist, starting fresh")
+        else:
+            try:
+                with open(self.storage_path, 'r', encoding='utf-8') as file:
+                    data = json.load(file)
+                
+                entries_data = data.get('entries', [])
+                for entry_data in entries_data:
+                    try:
+                        self._index_entry(ProcessedEntry.from_dict(entry_data))
+                    except Exception as e:
+                        logger.warning(f"Error loading processed entry: {e}")
+                        continue
+                
+                logger.info(f"Loaded {len(self._entries)} processed entries from storage")
+                
+            except json.JSONDecodeError as e:
+                logger.error(f"Error parsing storage file {self.storage_path}: {e}")
+                # Backup corrupted file and start fresh
+                backup_path = f"{self.storage_path}.backup.{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+                self.storage_path.rename(backup_path)
+                logger.warning(f"Corrupted storage file backed up to {backup_path}")
+            except Exception as e:
+                logger.error(f"Error loading processed entries: {e}")
+        
+        self._load_journal()
+        
+        # Clean up old entries
+        self._cleanup_old_entries()
+    
+    def _load_journal(self) -> None:
+        """Apply entries appended to the journal since the last full save"""
+        if not self.journal_path.exists():
             return
         
-        try:
-            with open(self.storage_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-            
-            entries_data = data.get('entries', [])
-            for entry_data in entries_data:
+        count = 0
+        with open(self.journal_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if not line.strip():
+                    continue
                 try:
-                    entry = ProcessedEntry.from_dict(entry_data)
-                    self.processed_entries[entry.content_hash] = entry
-                    self.url_to_hash[entry.normalized_url] = entry.content_hash
-                    self.title_hashes.add(entry.content_hash)
+                    self._index_entry(ProcessedEntry.from_dict(json.loads(line)))
+                    count += 1
                 except Exception as e:
-                    logger.warning(f"Error loading processed entry: {e}")
-                    continue
-            
-            logger.info(f"Loaded {len(self.processed_entries)} processed entries from storage")
-            
-            # Clean up old entries
-            self._cleanup_old_entries()
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing storage file {self.storage_path}: {e}")
-            # Backup corrupted file and start fresh
-            backup_path = f"{self.storage_path}.backup.{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
-            self.storage_path.rename(backup_path)
-            logger.warning(f"Corrupted storage file backed up to {backup_path}")
-        except Exception as e:
-            logger.error(f"Error loading processed entries: {e}")
+                    logger.warning(f"Error loading journal entry: {e}")
+        logger.info(f"Applied {count} journaled entries from {self.journal_path}")
+    
+    def _index_entry(self, entry: ProcessedEntry) -> None:
+        """Store an entry and add it to the lookup indexes"""
+        self._entries[entry.content_hash] = entry
+        self._url_to_hash[entry.normalized_url] = entry.content_hash
+        self._title_hashes.add(entry.content_hash)
+        if self.near_duplicate_index is not None and entry.minhash is not None:
+            self.near_duplicate_index.add(entry.content_hash, entry.minhash)
+    
+    def _prefilter_keys(self, normalized_url: str, content_hash: str,
+                        signature: Optional[bytes]) -> List[str]:
+        """Keys recorded in the prefilter for an entry or looked up for a result"""
+        keys = [f"url:{normalized_url}", f"hash:{content_hash}"]
+        if self.near_duplicate_index is not None and signature is not None:
+            keys.extend(f"lsh:{key}" for key in self.near_duplicate_index.band_keys(signature))
+        return keys
+    
+    def _add_to_prefilter(self, entry: ProcessedEntry) -> None:
+        for key in self._prefilter_keys(entry.normalized_url, entry.content_hash, entry.minhash):
+            self.prefilter.add(key, entry.processed_at.date())
+    
+    def _prefilter_metadata(self) -> Dict[str, Any]:
+        """State of the store the prefilter must agree with to be trusted"""
+        def file_state(path: Path) -> Optional[List[int]]:
+            if not path.exists():
+                return None
+            stat = path.stat()
+            return [stat.st_mtime_ns, stat.st_size]
+        
+        return {
+            'store': file_state(self.storage_path),
+            'journal': file_state(self.journal_path),
+            'lsh': ([self.near_duplicate_index.bands, self.near_duplicate_index.rows]
+                    if self.near_duplicate_index is not None else None)
+        }
+    
+    def _rebuild_prefilter(self) -> None:
+        """Recreate the prefilter from the loaded entries"""
+        self.prefilter.clear()
+        for entry in self._entries.values():
+            self._add_to_prefilter(entry)
+        self.prefilter.save(self._prefilter_metadata())
     
     def _cleanup_old_entries(self) -> None:
         """Remove entries older than retention period"""
-        cutoff_date = datetime.utcnow() - timedelta(days=self.retention_days)
+        cutoff = _to_epoch_us(datetime.utcnow() - timedelta(days=self.retention_days))
         old_hashes = [
-            content_hash for content_hash, entry in self.processed_entries.items()
-            if entry.processed_at < cutoff_date
+            content_hash for content_hash, entry in self._entries.items()
+            if entry.processed_us < cutoff
         ]
         
         for content_hash in old_hashes:
-            entry = self.processed_entries.pop(content_hash)
-            self.url_to_hash.pop(entry.normalized_url, None)
-            self.title_hashes.discard(content_hash)
+            entry = self._entries.pop(content_hash)
+            self._url_to_hash.pop(entry.normalized_url, None)
+            self._title_hashes.discard(content_hash)
+            if self.near_duplicate_index is not None:
+                self.near_duplicate_index.remove(content_hash)
         
         if old_hashes:
             logger.info(f"Cleaned up {len(old_hashes)} old entries (older than {self.retention_days} days)")
     
     def save_processed_entries(self) -> None:
-        """Save processed entries to storage file"""
+        """Save processed entries to storage file
+        
+        When the store was never loaded (prefilter mode), new entries are
+        appended to the journal instead of rewriting the store.
+        """
+        if not self._loaded:
+            self._append_to_journal()
+            return
+        
         try:
             # Ensure directory exists
             self.storage_path.parent.mkdir(parents=True, exist_ok=True)
             
-            data = {
-                'metadata': {
-                    'last_updated': datetime.utcnow().isoformat(),
-                    'total_entries': len(self.processed_entries),
-                    'retention_days': self.retention_days
-                },
-                'entries': [entry.to_dict() for entry in self.processed_entries.values()]
+            metadata = {
+                'last_updated': datetime.utcnow().isoformat(),
+                'total_entries': len(self.processed_entries),
+                'retention_days': self.retention_days
             }
             
             # Write to temporary file first, then rename (atomic operation)
             temp_path = f"{self.storage_path}.tmp"
-            with open(temp_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+            _write_entries_file(temp_path, metadata, self.processed_entries.values())
             
             # Atomic rename
             os.rename(temp_path, self.storage_path)
             
+            # The store now contains every journaled entry
+            if self.journal_path.exists():
+                self.journal_path.unlink()
+            
             logger.debug(f"Saved {len(self.processed_entries)} processed entries to {self.storage_path}")
             
         except Exception as e:
             logger.error(f"Error saving processed entries: {e}")
             raise
+        
+        if self.prefilter is not None:
+            self.prefilter.save(self._prefilter_metadata())
+    
+    def _append_to_journal(self) -> None:
+        """Append entries marked since startup to the journal without loading the store"""
+        if self._pending:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, 'a', encoding='utf-8') as file:
+                for entry in self._pending:
+                    file.write(entry.to_json())
+                    file.write('\n')
+            logger.debug(f"Journaled {len(self._pending)} processed entries to {self.journal_path}")
+            self._pending = []
+        
+        if self.prefilter is not None:
+            self.prefilter.save(self._prefilter_metadata())
     
     def is_result_processed(self, result: SearchResult, site_name: str) -> bool:
         """
@@ -174,20 +543,26 @@ class DeduplicationManager:
         Returns:
             True if the result has been processed before
         """
-        # Create temporary entry to generate hash
-        temp_entry = ProcessedEntry(
-            url=result.link,
-            title=result.title,
-            site_name=site_name
-        )
+        normalized_url = normalize_url(result.link)
+        content_hash = _content_hash(normalized_url, result.title)
+        
+        # Without the store loaded, ask the prefilter first: a miss means new
+        if not self._loaded:
+            signature = (result_signature(result.title, result.snippet)
+                         if self.near_duplicate_index is not None else None)
+            keys = self._prefilter_keys(normalized_url, content_hash, signature)
+            if not any(self.prefilter.might_contain(key) for key in keys):
+                self.prefilter_stats['definitely_new'] += 1
+                return False
+            self.prefilter_stats['possible_matches'] += 1
+            self._ensure_loaded()
         
         # Check if we've seen this exact content before
-        if temp_entry.content_hash in self.processed_entries:
+        if content_hash in self.processed_entries:
             logger.debug(f"Result already processed: {result.link}")
             return True
         
         # Check for similar URLs (different query params, etc.)
-        normalized_url = normalize_url(result.link)
         if normalized_url in self.url_to_hash:
             existing_hash = self.url_to_hash[normalized_url]
             existing_entry = self.processed_entries.get(existing_hash)
@@ -195,8 +570,50 @@ class DeduplicationManager:
                 logger.debug(f"Similar URL already processed: {result.link} -> {existing_entry.url}")
                 return True
         
+        # Check for re-titled or syndicated copies of processed results
+        match = self.find_near_duplicate(result)
+        if match:
+            self.near_duplicates_detected += 1
+            self.last_near_duplicates.append((result, match))
+            logger.info(f"Near-duplicate of issue #{match.issue_number} ({match.similarity:.0%} similar): "
+                        f"{result.link} -> {match.url}")
+            return True
+        
         return False
     
+    def find_near_duplicate(self, result: SearchResult) -> Optional[NearDuplicateMatch]:
+        """
+        Find a processed entry whose title and snippet closely match a result
+        
+        Args:
+            result: SearchResult to check
+            
+        Returns:
+            The most similar processed entry, or None if near-duplicate detection is
+            disabled or nothing reaches the similarity threshold
+        """
+        if self.near_duplicate_index is None:
+            return None
+        
+        self._ensure_loaded()
+        signature = result_signature(result.title, result.snippet)
+        if signature is None:
+            return None
+        
+        nearest = self.near_duplicate_index.nearest(signature)
+        if nearest is None:
+            return None
+        
+        content_hash, similarity = nearest
+        entry = self.processed_entries[content_hash]
+        return NearDuplicateMatch(
+            content_hash=content_hash,
+            url=entry.url,
+            title=entry.title,
+            issue_number=entry.issue_number,
+            similarity=similarity
+        )
+    
     def mark_result_processed(self, result: SearchResult, site_name: str, 
                             issue_number: Optional[int] = None) -> ProcessedEntry:
         """
@@ -214,13 +631,18 @@ class DeduplicationManager:
             url=result.link,
             title=result.title,
             site_name=site_name,
-            issue_number=issue_number
+            issue_number=issue_number,
+            minhash=(result_signature(result.title, result.snippet)
+                     if self.near_duplicate_index is not None else None)
         )
         
         # Store the entry
-        self.processed_entries[entry.content_hash] = entry
-        self.url_to_hash[entry.normalized_url] = entry.content_hash
-        self.title_hashes.add(entry.content_hash)
+        if self._loaded:
+            self._index_entry(entry)
+        else:
+            self._pending.append(entry)
+        if self.prefilter is not None:
+            self._add_to_prefilter(entry)
         
         logger.debug(f"Marked result as processed: {result.link} (issue #{issue_number})")
         
@@ -238,6 +660,7 @@ class DeduplicationManager:
             List of new SearchResult objects
         """
         new_results = []
+        self.last_near_duplicates = []
         
         for result in results:
             if not self.is_result_processed(result, site_name):
@@ -255,13 +678,15 @@ class DeduplicationManager:
                 'entries_by_site': {},
                 'entries_with_issues': 0,
                 'oldest_entry': None,
-                'newest_entry': None
+                'newest_entry': None,
+                'near_duplicates_detected': self.near_duplicates_detected,
+                'prefilter': self.prefilter_stats if self.prefilter is not None else None
             }
         
         entries_by_site = {}
         entries_with_issues = 0
-        oldest_entry = min(self.processed_entries.values(), key=lambda e: e.processed_at)
-        newest_entry = max(self.processed_entries.values(), key=lambda e: e.processed_at)
+        oldest_entry = min(self.processed_entries.values(), key=lambda e: e.processed_us)
+        newest_entry = max(self.processed_entries.values(), key=lambda e: e.processed_us)
         
         for entry in self.processed_entries.values():
             site_name = entry.site_name
@@ -278,7 +703,9 @@ class DeduplicationManager:
             'entries_with_issues': entries_with_issues,
             'oldest_entry': oldest_entry.processed_at.isoformat(),
             'newest_entry': newest_entry.processed_at.isoformat(),
-            'retention_days': self.retention_days
+            'retention_days': self.retention_days,
+            'near_duplicates_detected': self.near_duplicates_detected,
+            'prefilter': self.prefilter_stats if self.prefilter is not None else None
         }
     
 
@@ -312,59 +739,147 @@ def create_url_fingerprint(url: str, title: str = "") -> str:
     Returns:
         16-character hash string
     """
-    normalized_url = normalize_url(url)
-    content = f"{normalized_url}|{title.lower().strip()}"
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+    return _content_hash(normalize_url(url), title)
 
 
-def merge_deduplication_files(file_paths: List[str], output_path: str) -> None:
+def merge_deduplication_files(file_paths: List[str], output_path: str,
+                              retention_days: Optional[int] = 30,
+                              chunk_size: int = 50000,
+                              progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+                              ) -> Dict[str, Any]:
     """
     Merge multiple deduplication storage files into one
     
     This is useful if you have multiple instances running or want to
     combine historical data.
     
+    Inputs (and their journals, if present) are streamed rather than loaded.
+    Entries are collected into sorted runs of at most ``chunk_size`` entries
+    that are spilled to temporary files, and the runs are then k-way merged
+    by content hash, keeping the most recent entry for each hash. Memory use
+    is therefore bounded by ``chunk_size`` regardless of the input sizes.
+    
     Args:
         file_paths: List of paths to deduplication files to merge
         output_path: Path where merged file will be saved
+        retention_days: Drop entries older than this many days (None keeps all)
+        chunk_size: Maximum number of entries held in memory at once
+        progress_callback: Optional callback receiving progress dictionaries
+        
+    Returns:
+        Merge statistics
     """
-    all_entries = {}
+    cutoff = (_to_epoch_us(datetime.utcnow() - timedelta(days=retention_days))
+              if retention_days is not None else None)
+    stats = {
+        'files_merged': 0,
+        'entries_read': 0,
+        'expired_entries': 0,
+        'invalid_entries': 0,
+        'unique_entries': 0,
+        'runs': 0
+    }
+    
+    def report(phase: str, **details) -> None:
+        if progress_callback:
+            progress_callback({'phase': phase, **stats, **details})
     
-    for file_path in file_paths:
-        if not os.path.exists(file_path):
-            logger.warning(f"File not found: {file_path}")
-            continue
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_dir, exist_ok=True)
+    
+    with tempfile.TemporaryDirectory(prefix='dedup-merge-', dir=output_dir) as run_dir:
+        run_paths: List[str] = []
+        chunk: Dict[str, ProcessedEntry] = {}
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+        def spill() -> None:
+            run_path = os.path.join(run_dir, f"run-{len(run_paths):05d}")
+            with open(run_path, 'w', encoding='utf-8') as run_file:
+                for content_hash in sorted(chunk):
+                    entry = chunk[content_hash]
+                    run_file.write(f"{content_hash}\t{entry.processed_us}\t{entry.to_json()}\n")
+            run_paths.append(run_path)
+            stats['runs'] += 1
+            chunk.clear()
+        
+        for index, file_path in enumerate(file_paths, 1):
+            if not os.path.exists(file_path):
+                logger.warning(f"File not found: {file_path}")
+                continue
+            
+            sources = [(file_path, iter_stored_entries)]
+            if os.path.exists(f"{file_path}.journal"):
+                sources.append((f"{file_path}.journal", _iter_journal_entries))
             
-            entries_data = data.get('entries', [])
-            for entry_data in entries_data:
+            for source_path, reader in sources:
                 try:
-                    entry = ProcessedEntry.from_dict(entry_data)
-                    # Use the most recent entry if duplicates exist
-                    existing = all_entries.get(entry.content_hash)
-                    if not existing or entry.processed_at > existing.processed_at:
-                        all_entries[entry.content_hash] = entry
+                    for entry_data in reader(source_path):
+                        stats['entries_read'] += 1
+                        try:
+                            entry = ProcessedEntry.from_dict(entry_data)
+                        except Exception as e:
+                            stats['invalid_entries'] += 1
+                            logger.warning(f"Error loading entry from {source_path}: {e}")
+                            continue
+                        
+                        if cutoff is not None and entry.processed_us < cutoff:
+                            stats['expired_entries'] += 1
+                            continue
+                        
+                        # Use the most recent entry if duplicates exist
+                        existing = chunk.get(entry.content_hash)
+                        if not existing or entry.processed_us > existing.processed_us:
+                            chunk[entry.content_hash] = entry
+                        if len(chunk) >= chunk_size:
+                            spill()
                 except Exception as e:
-                    logger.warning(f"Error loading entry from {file_path}: {e}")
-                    
-        except Exception as e:
-            logger.error(f"Error reading file {file_path}: {e}")
-    
-    # Save merged data
-    merged_data = {
-        'metadata': {
+                    logger.error(f"Error reading file {source_path}: {e}")
+            
+            stats['files_merged'] += 1
+            report('read', file=file_path, files_done=index, files_total=len(file_paths))
+        
+        if chunk:
+            spill()
+        
+        # K-way merge of the sorted runs, keeping the latest entry per hash.
+        # Serialized entries go to a temporary file first because the
+        # metadata block (with the final count) precedes them in the output.
+        merged_path = os.path.join(run_dir, "merged")
+        run_files = [open(run_path, 'r', encoding='utf-8') for run_path in run_paths]
+        try:
+            with open(merged_path, 'w', encoding='utf-8') as merged_file:
+                current_hash = None
+                best_us = -1
+                best_json = ''
+                for line in heapq.merge(*run_files, key=lambda line: line.split('\t', 1)[0]):
+                    content_hash, processed_us, entry_json = line.split('\t', 2)
+                    if content_hash != current_hash:
+                        if current_hash is not None:
+                            merged_file.write(best_json)
+                            stats['unique_entries'] += 1
+                            if stats['unique_entries'] % chunk_size == 0:
+                                report('merge')
+                        current_hash, best_us, best_json = content_hash, int(processed_us), entry_json
+                    elif int(processed_us) > best_us:
+                        best_us, best_json = int(processed_us), entry_json
+                if current_hash is not None:
+                    merged_file.write(best_json)
+                    stats['unique_entries'] += 1
+        finally:
+            for run_file in run_files:
+                run_file.close()
+        
+        metadata = {
             'last_updated': datetime.utcnow().isoformat(),
-            'total_entries': len(all_entries),
+            'total_entries': stats['unique_entries'],
             'merged_from': file_paths,
-            'retention_days': 30
-        },
-        'entries': [entry.to_dict() for entry in all_entries.values()]
-    }
-    
-    with open(output_path, 'w', encoding='utf-8') as file:
-        json.dump(merged_data, file, indent=2, ensure_ascii=False)
+            'retention_days': retention_days
+        }
+        temp_path = f"{output_path}.tmp"
+        with open(merged_path, 'r', encoding='utf-8') as merged_file:
+            _write_entry_lines(temp_path, metadata, (line.rstrip('\n') for line in merged_file))
+        os.replace(temp_path, output_path)
     
-    logger.info(f"Merged {len(file_paths)} files into {output_path} with {len(all_entries)} unique entries")
\ No newline at end of file
+    report('done')
+    logger.info(f"Merged {len(file_paths)} files into {output_path} with {stats['unique_entries']} unique entries "
+                f"({stats['expired_entries']} expired, {stats['runs']} sorted runs)")
+    return stats
@@ -21,7 +21,7 @@ import time
 import functools
 import re
 from typing import Dict, List, Optional, Tuple, Any, Union
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime, timezone
@@ -30,9 +30,18 @@ import json
 from ..workflow.workflow_matcher import WorkflowMatcher, WorkflowLoadError
 from ..utils.config_manager import ConfigManager
 from ..clients.github_issue_creator import GitHubIssueCreator
+from ..clients.issue_discovery import IssueQuery
 from ..workflow.deliverable_generator import DeliverableGenerator, DeliverableSpec
 from ..storage.git_manager import GitManager, GitOperationError
+from ..utils.keyword_matcher import get_keyword_matcher, register_keywords
 from ..utils.logging_config import get_logger, log_exception, log_retry_attempt
+from ..utils.tracing import current_span, span, traced
+
+
+# Labels or content that make a Copilot-assigned issue worth processing
+COPILOT_PROCESSING_INDICATORS = register_keywords('copilot.processing_indicators', [
+    'intelligence', 'research', 'analysis', 'target', 'osint', 'site-monitor'
+])
 
 
 class IssueProcessingError(Exception):
@@ -288,7 +297,9 @@ class IssueProcessor:
                 self.git_manager = GitManager(
                     base_branch="main",  # Use default base branch
                     branch_prefix=branch_prefix,
-                    auto_cleanup=True  # Use default auto_cleanup
+                    auto_cleanup=True,  # Use default auto_cleanup
+                    use_worktrees=git_config.worktrees if git_config else False,
+                    direct_commits=git_config.direct_commits if git_config else False
                 )
                 self.logger.info("Git operations enabled")
             except GitOperationError as e:
@@ -318,6 +329,11 @@ class IssueProcessor:
         self._processing_state: Dict[str, Dict[str, Any]] = {}
         self._load_processing_state()
         
+        # Long-running callers write state on their own schedule with
+        # flush_processing_state instead of after every status change
+        self.defer_state_saves = False
+        self._state_dirty = False
+        
         self.logger.info("IssueProcessor initialization completed successfully")
     
     def _load_processing_state(self) -> None:
@@ -378,8 +394,37 @@ class IssueProcessor:
         if cleaned_count > 0:
             self.logger.info(f"Cleaned up {cleaned_count} invalid state entries")
 
-    @retry_on_exception(max_attempts=3, delay_seconds=0.5, exceptions=(OSError, IOError))
     def _save_processing_state(self) -> None:
+        """Save processing state, or mark it for the next flush when saves are deferred."""
+        if self.defer_state_saves:
+            self._state_dirty = True
+            return
+        self._write_processing_state()
+    
+    def flush_processing_state(self) -> bool:
+        """
+        Write processing state changed since saves were deferred.
+        
+        Returns:
+            True if state was written
+        """
+        if not self._state_dirty:
+            return False
+        try:
+            self._write_processing_state()
+        except Exception:
+            self._state_dirty = True
+            raise
+        self._state_dirty = False
+        return True
+    
+    def close(self) -> None:
+        """Remove the idle worktrees pooled by the git manager."""
+        if self.git_manager is not None:
+            self.git_manager.close_worktrees()
+    
+    @retry_on_exception(max_attempts=3, delay_seconds=0.5, exceptions=(OSError, IOError))
+    def _write_processing_state(self) -> None:
         """Save processing state to persistent storage with retry logic."""
         if not self.enable_state_saving:
             return
@@ -409,6 +454,7 @@ class IssueProcessor:
                     pass  # Ignore cleanup errors
             raise
     
+    @traced("issue.process")
     def process_issue(self, issue_data: IssueData) -> ProcessingResult:
         """
         Process a single issue through the complete workflow.
@@ -428,6 +474,7 @@ class IssueProcessor:
         """
         start_time = datetime.now()
         issue_number = issue_data.number
+        current_span().set(issue_number=issue_number)
         
         self.logger.info(f"Starting processing for issue #{issue_number}: {issue_data.title}")
         
@@ -493,6 +540,7 @@ class IssueProcessor:
                 )
             
             workflow_info, status_message = workflow_result
+            current_span().set(workflow=workflow_info.name if workflow_info else None)
             
             if workflow_info is None:
                 # Need clarification
@@ -667,6 +715,7 @@ class IssueProcessor:
             except (ValueError, TypeError) as e:
                 self.logger.warning(f"Invalid started_at timestamp for issue #{issue_number}: {e}")
 
+    @traced("workflow.match")
     @retry_on_exception(max_attempts=3, delay_seconds=1.0, exceptions=(Exception,))
     def _find_workflow_with_retry(self, issue_data: IssueData) -> Tuple:
         """
@@ -837,9 +886,10 @@ This deliverable was generated using basic recovery mode due to processing const
         """
         self.logger.info(f"Executing workflow '{workflow_info.name}' for issue #{issue_data.number}")
         
-        # Create git branch if git operations are enabled
+        # Create git branch if git operations are enabled (direct commits
+        # create the branch ref when committing)
         branch_info = None
-        if self.enable_git and self.git_manager:
+        if self.enable_git and self.git_manager and not self.git_manager.direct_commits:
             try:
                 branch_info = self.git_manager.create_issue_branch(
                     issue_number=issue_data.number,
@@ -850,17 +900,45 @@ This deliverable was generated using basic recovery mode due to processing const
                 self.logger.warning(f"Failed to create git branch: {e}")
                 # Continue without git operations
         
+        try:
+            return self._write_and_commit_deliverables(issue_data, workflow_info, branch_info,
+                                                       extracted_content)
+        finally:
+            if branch_info and branch_info.worktree_path:
+                self.git_manager.release_worktree(branch_info)
+    
+    def _write_and_commit_deliverables(self, issue_data: IssueData, workflow_info,
+                                       branch_info, extracted_content=None) -> Dict[str, Any]:
+        """
+        Generate a workflow's deliverables and commit them to the issue branch.
+        
+        Args:
+            issue_data: Issue data for processing
+            workflow_info: Matched workflow information object
+            branch_info: Issue branch, or None without git operations
+            extracted_content: Optional AI-extracted structured content
+            
+        Returns:
+            Dictionary with execution results including created files
+        """
         # Extract naming conventions from workflow output settings
         output_config = workflow_info.output
         folder_structure = output_config.get('folder_structure', 'issue_{issue_number}')
         file_pattern = output_config.get('file_pattern', '{deliverable_name}.md')
         
         # Create output directory
-        output_dir = self.output_base_dir / folder_structure.format(
+        output_dir = self._output_base_for(branch_info) / folder_structure.format(
             issue_number=issue_data.number,
             title_slug=self._slugify(issue_data.title)
         )
-        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Direct commits take the deliverables from memory, so nothing is
+        # written to the shared working tree
+        direct_commits = bool(self.enable_git and self.git_manager and self.git_manager.direct_commits)
+        branch_dir = self._repo_relative_path(output_dir) if direct_commits else None
+        branch_files: Dict[str, bytes] = {}
+        if branch_dir is None:
+            output_dir.mkdir(parents=True, exist_ok=True)
         
         # Process deliverables
         created_files = []
@@ -877,8 +955,12 @@ This deliverable was generated using basic recovery mode due to processing const
                 # Generate content based on issue and deliverable spec
                 content = self._generate_deliverable_content(issue_data, deliverable, workflow_info, extracted_content)
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                if branch_dir is not None:
+                    branch_files[(PurePosixPath(branch_dir) / file_name).as_posix()] = content.encode('utf-8')
+                else:
+                    with span("file.write", path=str(file_path), bytes=len(content)):
+                        with open(file_path, 'w', encoding='utf-8') as f:
+                            f.write(content)
                 
                 created_files.append(str(file_path))
                 self.logger.info(f"Created deliverable: {file_path}")
@@ -890,21 +972,42 @@ This deliverable was generated using basic recovery mode due to processing const
         
         # Commit deliverables to git if git operations are enabled
         commit_info = None
+        branch_name = branch_info.name if branch_info else None
         if self.enable_git and self.git_manager and created_files:
             try:
-                commit_info = self.git_manager.commit_deliverables(
-                    file_paths=created_files,
-                    issue_number=issue_data.number,
-                    workflow_name=workflow_info.name
-                )
-                self.logger.info(f"Committed deliverables: {commit_info.hash[:8]}")
+                if direct_commits:
+                    if branch_dir is None:
+                        raise GitOperationError(f"Output directory is outside the repository: {output_dir}")
+                    commit = self.git_manager.branch_commit(
+                        files=branch_files,
+                        issue_number=issue_data.number,
+                        workflow_name=workflow_info.name,
+                        title=issue_data.title
+                    )
+                    if self.git_manager.defer_commits:
+                        self.git_manager.queue_commit(commit)
+                        self.logger.info(f"Queued deliverables for commit to {commit.branch_name}")
+                    else:
+                        commit_info = self.git_manager.commit_to_branches([commit])[0]
+                    branch_name = commit.branch_name
+                else:
+                    commit_info = self.git_manager.commit_deliverables(
+                        file_paths=created_files,
+                        issue_number=issue_data.number,
+                        workflow_name=workflow_info.name,
+                        worktree_path=branch_info.worktree_path if branch_info else None
+                    )
+                if commit_info:
+                    self.logger.info(f"Committed deliverables: {commit_info.hash[:8]}")
                 
                 # Push branch if auto_push is enabled
                 git_config = self.config.agent.git if self.config.agent else None
-                if git_config and git_config.auto_push and branch_info:
-                    success = self.git_manager.push_branch(branch_info.name)
-                    if success:
-                        self.logger.info(f"Pushed branch: {branch_info.name}")
+                if git_config and git_config.auto_push and branch_name:
+                    if self.git_manager.defer_pushes:
+                        self.git_manager.queue_push(branch_name)
+                        self.logger.info(f"Queued branch for push: {branch_name}")
+                    elif self.git_manager.push_branch(branch_name):
+                        self.logger.info(f"Pushed branch: {branch_name}")
                 
             except GitOperationError as e:
                 self.logger.warning(f"Failed to commit deliverables: {e}")
@@ -916,14 +1019,37 @@ This deliverable was generated using basic recovery mode due to processing const
             'output_directory': str(output_dir)
         }
         
-        # Add git information if available
-        if branch_info:
-            result['git_branch'] = branch_info.name
+        # Add git information if available (queued direct commits have no hash yet)
+        if branch_name:
+            result['git_branch'] = branch_name
         if commit_info:
             result['git_commit'] = commit_info.hash
         
         return result
     
+    def _repo_relative_path(self, path: Path) -> Optional[str]:
+        """Repository-relative POSIX path, or None when outside the repository."""
+        try:
+            return path.resolve().relative_to(self.git_manager.repo_path.resolve()).as_posix()
+        except ValueError:
+            return None
+    
+    def _output_base_for(self, branch_info) -> Path:
+        """
+        Output directory for an issue's deliverables.
+        
+        In worktree mode deliverables are written to the same relative
+        location inside the issue's worktree so they land on its branch.
+        """
+        if not branch_info or not branch_info.worktree_path:
+            return self.output_base_dir
+        relative = self._repo_relative_path(self.output_base_dir)
+        if relative is None:
+            # Outside the repository: nothing to commit from a worktree
+            return self.output_base_dir
+        return Path(branch_info.worktree_path) / relative
+    
+    @traced("deliverable.generate")
     def _generate_deliverable_content(self, 
                                     issue_data: IssueData, 
                                     deliverable_spec: Dict[str, Any],
@@ -951,8 +1077,8 @@ This deliverable was generated using basic recovery mode due to processing const
             order=deliverable_spec.get('order', 1),
             type=deliverable_spec.get('type', 'document'),
             format=deliverable_spec.get('format', 'markdown'),
-            sections=deliverable_spec.get('required_sections', []),
-            metadata=deliverable_spec.get('metadata', {})
+            sections=list(deliverable_spec.get('required_sections', [])),
+            metadata=dict(deliverable_spec.get('metadata', {}))
         )
         
         # Use the deliverable generator to create content
@@ -1186,6 +1312,20 @@ class GitHubIntegratedIssueProcessor(IssueProcessor):
                 self.logger.warning(f"Failed to initialize AI content extraction agent: {e}")
                 self.enable_ai_extraction = False
                 self.content_extraction_agent = None
+        
+        # Processing outcomes feed the success rates used by AI workflow assignment
+        self.assignment_history: Optional['AssignmentHistoryStore'] = None
+        try:
+            if self.config.ai and getattr(self.config.ai, 'enabled', False):
+                from ..agents.assignment_history import AssignmentHistoryStore
+                self.assignment_history = AssignmentHistoryStore(self.config.ai.history.file_path)
+        except Exception as e:
+            self.logger.warning(f"Could not load assignment history, outcomes will not be recorded: {e}")
+    
+    def close(self) -> None:
+        """Remove idle worktrees and close the GitHub client's connections."""
+        super().close()
+        self.github.close()
     
     def process_github_issue(self, issue_number: int) -> ProcessingResult:
         """
@@ -1368,6 +1508,7 @@ class GitHubIntegratedIssueProcessor(IssueProcessor):
             completion_comment = self._generate_completion_comment(result)
             self.github.add_comment(issue_number, completion_comment)
             self.logger.info(f"Added completion comment to issue #{issue_number}")
+            self._record_outcome(result)
             
         elif result.status == IssueProcessingStatus.ERROR:
             # Add error comment and unassign
@@ -1375,6 +1516,21 @@ class GitHubIntegratedIssueProcessor(IssueProcessor):
             self.github.add_comment(issue_number, error_comment)
             self._unassign_from_agent(issue_number)
             self.logger.info(f"Added error comment to issue #{issue_number}")
+            self._record_outcome(result)
+    
+    def _record_outcome(self, result: ProcessingResult) -> None:
+        """Append whether the issue's workflow completed to the assignment history"""
+        if self.assignment_history is None or not result.workflow_name:
+            return
+        try:
+            self.assignment_history.record_outcome(
+                result.issue_number,
+                result.workflow_name,
+                succeeded=result.status == IssueProcessingStatus.COMPLETED
+            )
+            self.assignment_history.flush()
+        except OSError as e:
+            self.logger.warning(f"Failed to record outcome for issue #{result.issue_number}: {e}")
     
     def _generate_completion_comment(self, result: ProcessingResult) -> str:
         """
@@ -1432,19 +1588,16 @@ class GitHubIntegratedIssueProcessor(IssueProcessor):
             List of Copilot-assigned issue data
         """
         try:
-            # Query issues assigned to Copilot using direct repo access
+            # Query issues assigned to Copilot; assignee filtering happens server-side
             copilot_usernames = ['github-copilot[bot]', 'copilot', 'github-actions[bot]']
+            queries = [IssueQuery(assignee=username, state='open') for username in copilot_usernames]
             
             issues = []
-            # Get all open issues and filter by assignee
-            all_issues = self.github.repo.get_issues(state='open')
-            
-            for issue in all_issues:
-                if issue.assignee and issue.assignee.login in copilot_usernames:
-                    if self._should_process_copilot_issue(issue):
-                        issues.append(self._convert_issue_to_dict(issue))
-                        if limit and len(issues) >= limit:
-                            return issues[:limit]
+            for issue in self.github.discover_issues(queries):
+                if self._should_process_copilot_issue(issue):
+                    issues.append(self._convert_issue_to_dict(issue))
+                    if limit and len(issues) >= limit:
+                        break
             
             self.logger.info(f"Found {len(issues)} Copilot-assigned processable issues")
             return issues
@@ -1484,12 +1637,11 @@ class GitHubIntegratedIssueProcessor(IssueProcessor):
         """
         # Check for required labels or content indicators
         labels = {label.name for label in issue.labels}
-        content_indicators = ['intelligence', 'research', 'analysis', 'target', 'osint', 'site-monitor']
         
         # Must have at least one processing indicator
-        return bool(labels.intersection(content_indicators) or 
-                   any(indicator in (issue.title + issue.body).lower() 
-                       for indicator in content_indicators))
+        return bool(labels.intersection(COPILOT_PROCESSING_INDICATORS) or
+                    get_keyword_matcher().contains_any(issue.title + (issue.body or ''),
+                                                       'copilot.processing_indicators'))
     
     def _convert_issue_to_dict(self, issue) -> Dict[str, Any]:
         """
@@ -1529,42 +1681,14 @@ class GitHubIntegratedIssueProcessor(IssueProcessor):
             List of issue data dictionaries
         """
         try:
-            # Get site-monitor issues
-            issues = self.github.get_issues_with_labels(['site-monitor'], state='open')
-            
-            processable_issues = []
-            for issue in issues:
-                # Apply assignee filter
-                if assignee_filter:
-                    if assignee_filter == 'none':
-                        if issue.assignee is not None:
-                            continue
-                    else:
-                        if not issue.assignee or issue.assignee.login != assignee_filter:
-                            continue
-                
-                # Apply additional label filter
-                if additional_labels:
-                    issue_labels = [label.name for label in issue.labels]
-                    if not any(label in issue_labels for label in additional_labels):
-                        continue
-                
-                # Convert to dictionary format
-                issue_data = {
-                    'number': issue.number,
-                    'title': issue.title,
-                    'labels': [label.name for label in issue.labels],
-                    'assignee': issue.assignee.login if issue.assignee else None,
-                    'created_at': issue.created_at.isoformat(),
-                    'updated_at': issue.updated_at.isoformat(),
-                    'url': issue.html_url
-                }
-                
-                processable_issues.append(issue_data)
-                
-                # Apply limit
-                if limit and len(processable_issues) >= limit:
-                    break
+            # Read site-monitor issues from the incrementally synced mirror
+            query = IssueQuery(
+                labels=['site-monitor'],
+                any_labels=list(additional_labels or []),
+                assignee=assignee_filter,
+                state='open'
+            )
+            processable_issues = self.github.get_mirrored_issues(query, limit=limit)
             
             self.logger.info(f"Found {len(processable_issues)} processable issues")
             return processable_issues
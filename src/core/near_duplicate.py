@@ -0,0 +1,244 @@
+"""
+Near-Duplicate Detection
+MinHash signatures with an LSH index for finding re-titled or syndicated search results
+
+A result is reduced to the set of words in its title and snippet. Its MinHash
+signature estimates the Jaccard similarity between two such sets, and
+locality-sensitive hashing splits the signature into bands so that a lookup
+only compares against entries that share a whole band with the query instead
+of scanning every stored signature. Band sizes are derived from the
+configured similarity threshold.
+
+Signatures keep the lowest 8 bits of each of the 64 minimum hashes (b-bit
+MinHash), so they persist as 64 bytes per entry.
+"""
+
+import base64
+import hashlib
+import random
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+NUM_PERMUTATIONS = 64
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed: signatures are persisted and must stay comparable across runs
+_random = random.Random(1)
+_PERMUTATIONS = [
+    (_random.randint(1, _MERSENNE_PRIME - 1), _random.randint(0, _MERSENNE_PRIME - 1))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+# Probability that two unrelated b-bit MinHash values agree by chance
+_CHANCE_MATCH = 1 / 256
+
+# Minimum probability that a pair exactly at the threshold shares a band
+LSH_TARGET_RECALL = 0.95
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words that carry no signal about which article a result points to
+_STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'in',
+    'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was',
+    'were', 'will', 'with'
+})
+
+
+@dataclass
+class NearDuplicateMatch:
+    """An existing entry that a new result nearly duplicates"""
+    content_hash: str
+    url: str
+    title: str
+    issue_number: Optional[int]
+    similarity: float
+
+
+@lru_cache(maxsize=65536)
+def _token_hash(token: str) -> int:
+    """Stable 64-bit hash of a token"""
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords"""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def minhash_signature(tokens: Iterable[str]) -> Optional[bytes]:
+    """
+    Compute a b-bit MinHash signature for a set of tokens
+
+    Args:
+        tokens: Tokens of the document
+
+    Returns:
+        Signature of ``NUM_PERMUTATIONS`` bytes, or None for an empty token set
+    """
+    hashes = [_token_hash(token) for token in set(tokens)]
+    if not hashes:
+        return None
+    return bytes(
+        min((a * value + b) % _MERSENNE_PRIME & _MAX_HASH for value in hashes) & 0xFF
+        for a, b in _PERMUTATIONS
+    )
+
+
+def result_signature(title: str, snippet: str = "") -> Optional[bytes]:
+    """
+    Signature of a search result's title and snippet
+
+    Args:
+        title: Result title
+        snippet: Result snippet
+
+    Returns:
+        MinHash signature, or None if the result has no usable words
+    """
+    return minhash_signature(tokenize(f"{title} {snippet or ''}"))
+
+
+def estimate_similarity(first: bytes, second: bytes) -> float:
+    """Estimate Jaccard similarity from two signatures"""
+    matches = sum(1 for a, b in zip(first, second) if a == b) / NUM_PERMUTATIONS
+    return max((matches - _CHANCE_MATCH) / (1 - _CHANCE_MATCH), 0.0)
+
+
+def encode_signature(signature: Optional[bytes]) -> Optional[str]:
+    """Encode a signature for JSON storage"""
+    return base64.b64encode(signature).decode('ascii') if signature is not None else None
+
+
+def decode_signature(value: Optional[str]) -> Optional[bytes]:
+    """Decode a stored signature"""
+    return base64.b64decode(value) if value else None
+
+
+def lsh_parameters(threshold: float, recall: float = LSH_TARGET_RECALL) -> Tuple[int, int]:
+    """
+    Choose LSH bands and rows per band for a similarity threshold
+
+    Picks the most selective band size (most rows per band) that still makes a
+    pair at exactly the threshold a candidate with probability
+    ``1 - (1 - threshold ** rows) ** bands >= recall``. Candidates are then
+    verified against the threshold, so wider bands only cost recall.
+
+    Args:
+        threshold: Minimum Jaccard similarity to report
+        recall: Required candidate probability for a pair at the threshold
+
+    Returns:
+        (bands, rows) tuple
+    """
+    if not 0.0 < threshold <= 1.0:
+        raise ValueError("Near-duplicate threshold must be greater than 0 and at most 1")
+    best = (NUM_PERMUTATIONS, 1)
+    for rows in range(1, NUM_PERMUTATIONS + 1):
+        bands = NUM_PERMUTATIONS // rows
+        if 1 - (1 - threshold ** rows) ** bands >= recall:
+            best = (bands, rows)
+    return best
+
+
+class MinHashLSHIndex:
+    """LSH index of MinHash signatures"""
+
+    def __init__(self, threshold: float = 0.7):
+        """
+        Initialize the index
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity reported as a match
+        """
+        self.threshold = threshold
+        self.bands, self.rows = lsh_parameters(threshold)
+        # Band value -> key, or list of keys once a bucket is shared
+        self._buckets: List[Dict[bytes, Union[str, List[str]]]] = [{} for _ in range(self.bands)]
+        self._signatures: Dict[str, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def _band_values(self, signature: bytes) -> Iterable[bytes]:
+        rows = self.rows
+        return (signature[band * rows:(band + 1) * rows] for band in range(self.bands))
+
+    def band_keys(self, signature: bytes) -> List[str]:
+        """
+        String keys for the bands of a signature
+
+        Two signatures can only match if they share at least one band key, so
+        these can be stored in a membership filter to rule out matches
+        without loading the index.
+        """
+        return [f"{band}:{value.hex()}" for band, value in enumerate(self._band_values(signature))]
+
+    def add(self, key: str, signature: bytes) -> None:
+        """Index a signature under ``key`` (replacing any previous one)"""
+        if key in self._signatures:
+            self.remove(key)
+        self._signatures[key] = signature
+        for buckets, value in zip(self._buckets, self._band_values(signature)):
+            existing = buckets.get(value)
+            if existing is None:
+                buckets[value] = key
+            elif isinstance(existing, list):
+                existing.append(key)
+            else:
+                buckets[value] = [existing, key]
+
+    def remove(self, key: str) -> None:
+        """Remove the signature stored under ``key``"""
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for buckets, value in zip(self._buckets, self._band_values(signature)):
+            existing = buckets.get(value)
+            if existing == key:
+                del buckets[value]
+            elif isinstance(existing, list) and key in existing:
+                existing.remove(key)
+                if len(existing) == 1:
+                    buckets[value] = existing[0]
+
+    def query(self, signature: bytes) -> List[Tuple[str, float]]:
+        """
+        Find indexed signatures at or above the similarity threshold
+
+        Args:
+            signature: Signature to look up
+
+        Returns:
+            (key, estimated similarity) pairs, most similar first
+        """
+        candidates = set()
+        for buckets, value in zip(self._buckets, self._band_values(signature)):
+            existing = buckets.get(value)
+            if existing is None:
+                continue
+            if isinstance(existing, list):
+                candidates.update(existing)
+            else:
+                candidates.add(existing)
+
+        matches = []
+        for key in candidates:
+            similarity = estimate_similarity(signature, self._signatures[key])
+            if similarity >= self.threshold:
+                matches.append((key, similarity))
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def nearest(self, signature: bytes) -> Optional[Tuple[str, float]]:
+        """Most similar indexed signature above the threshold, if any"""
+        matches = self.query(signature)
+        return matches[0] if matches else None
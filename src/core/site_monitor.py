@@ -11,17 +11,25 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
-from ..utils.config_manager import MonitorConfig, load_config_with_env_substitution
+from ..utils.config_manager import DeduplicationConfig, MonitorConfig, load_config_with_env_substitution
 from ..clients.search_client import GoogleCustomSearchClient, SearchResult, create_search_summary
 from .deduplication import DeduplicationManager, ProcessedEntry
 from ..clients.github_issue_creator import GitHubIssueCreator
+from ..utils.metrics import get_registry
+from ..utils.tracing import span, traced
 
-# Import issue processor only when needed to avoid circular dependencies
-try:
-    from .issue_processor import IssueProcessor
-    ISSUE_PROCESSOR_AVAILABLE = True
-except ImportError:
-    ISSUE_PROCESSOR_AVAILABLE = False
+# Import issue processor only when needed to avoid circular dependencies and
+# the cost of the workflow stack for commands that never process issues
+IssueProcessor = None
+
+
+def _issue_processor_class():
+    """Import IssueProcessor on first use"""
+    global IssueProcessor
+    if IssueProcessor is None:
+        from .issue_processor import IssueProcessor as issue_processor_class
+        IssueProcessor = issue_processor_class
+    return IssueProcessor
 
 
 # Configure logging
@@ -36,6 +44,15 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+_CYCLES = get_registry().counter(
+    'speculum_monitor_cycles_total', "Site monitoring cycles by outcome", ['outcome'])
+_NEW_RESULTS = get_registry().counter(
+    'speculum_monitor_new_results_total', "Search results not seen in earlier cycles")
+_ISSUES_CREATED = get_registry().counter(
+    'speculum_monitor_issues_created_total', "Issues created for new search results")
+_LAST_SUCCESS = get_registry().gauge(
+    'speculum_monitor_last_success_timestamp_seconds', "Unix time the last monitoring cycle succeeded")
+
 
 class SiteMonitorService:
     """Main service for monitoring sites and creating GitHub issues"""
@@ -46,10 +63,15 @@ class SiteMonitorService:
         
         # Initialize components
         self.search_client = GoogleCustomSearchClient(config.search)
+        dedup_config = getattr(config, 'deduplication', None) or DeduplicationConfig()
         self.dedup_manager = DeduplicationManager(
             storage_path=config.storage_path,
-            retention_days=30
+            retention_days=dedup_config.retention_days,
+            near_duplicate_threshold=dedup_config.near_duplicate_threshold,
+            prefilter=dedup_config.prefilter
         )
+        # Near-duplicates skipped during the current cycle
+        self.near_duplicates: List[Dict[str, Any]] = []
         self.github_client = GitHubIssueCreator(
             token=github_token,
             repository=config.github.repository
@@ -57,11 +79,10 @@ class SiteMonitorService:
         
         # Initialize issue processor if available and enabled
         self.issue_processor = None
-        if (ISSUE_PROCESSOR_AVAILABLE and 
-            hasattr(config, 'agent') and 
+        if (hasattr(config, 'agent') and 
             getattr(config.agent, 'enabled', False)):
             try:
-                self.issue_processor = IssueProcessor(
+                self.issue_processor = _issue_processor_class()(
                     config_path=getattr(config, 'config_path', 'config.yaml'),
                     workflow_dir=getattr(config.agent, 'workflow_dir', None),
                     output_base_dir=getattr(config.agent, 'output_dir', None),
@@ -76,6 +97,7 @@ class SiteMonitorService:
         logging.getLogger().setLevel(getattr(logging, config.log_level))
         logger.info(f"Initialized SiteMonitorService for repository: {config.github.repository}")
     
+    @traced("monitor.cycle")
     def run_monitoring_cycle(self, create_individual_issues: bool = True) -> Dict[str, Any]:
         """
         Run a complete monitoring cycle
@@ -132,6 +154,7 @@ class SiteMonitorService:
                 'sites_monitored': len(self.config.sites),
                 'total_search_results': sum(len(results) for results in all_search_results.values()),
                 'new_results_found': total_new_results,
+                'near_duplicates_skipped': self.near_duplicates,
                 'individual_issues_created': len(individual_issues),
                 'individual_issue_numbers': [issue.number for issue in individual_issues],
                 'issue_processing_results': issue_processing_results,
@@ -140,6 +163,11 @@ class SiteMonitorService:
                 'error': None
             }
             
+            _CYCLES.inc(outcome='success')
+            _NEW_RESULTS.inc(total_new_results)
+            _ISSUES_CREATED.inc(len(individual_issues))
+            _LAST_SUCCESS.set(time.time())
+            
             logger.info(f"Monitoring cycle completed successfully in {cycle_duration:.2f} seconds")
             logger.info(f"Found {total_new_results} new results across {len(self.config.sites)} sites")
             
@@ -147,6 +175,7 @@ class SiteMonitorService:
             
         except Exception as e:
             logger.error(f"Monitoring cycle failed: {e}", exc_info=True)
+            _CYCLES.inc(outcome='failure')
             return {
                 'success': False,
                 'error': str(e),
@@ -157,11 +186,23 @@ class SiteMonitorService:
     def _filter_new_results(self, all_results: Dict[str, List[SearchResult]]) -> Dict[str, List[SearchResult]]:
         """Filter search results to only include new/unprocessed ones"""
         new_results = {}
+        self.near_duplicates = []
         
         for site_name, results in all_results.items():
             if results:
-                filtered_results = self.dedup_manager.filter_new_results(results, site_name)
+                with span("dedup.check", site=site_name, results=len(results)) as check:
+                    filtered_results = self.dedup_manager.filter_new_results(results, site_name)
+                    check.set(new=len(filtered_results))
                 new_results[site_name] = filtered_results
+                for result, match in self.dedup_manager.last_near_duplicates:
+                    self.near_duplicates.append({
+                        'site_name': site_name,
+                        'url': result.link,
+                        'title': result.title,
+                        'original_issue_number': match.issue_number,
+                        'original_url': match.url,
+                        'similarity': round(match.similarity, 3)
+                    })
             else:
                 new_results[site_name] = []
         
@@ -329,6 +370,7 @@ class SiteMonitorService:
             'site_names': [site.name for site in self.config.sites],
             'rate_limit_status': self.search_client.get_rate_limit_status(),
             'deduplication_stats': self.dedup_manager.get_processed_stats(),
+            'github_api_status': self.github_client.get_api_usage_stats(),
             'config': {
                 'daily_query_limit': self.config.search.daily_query_limit,
                 'results_per_query': self.config.search.results_per_query,
@@ -516,6 +558,10 @@ def main():
             print(f"Sites configured: {status['sites_configured']}")
             print(f"Rate limit: {status['rate_limit_status']['calls_remaining']}/{status['rate_limit_status']['daily_limit']} calls remaining")
             print(f"Processed entries: {status['deduplication_stats']['total_entries']}")
+            github_core = status['github_api_status']['rate_limit']['resources'].get('core')
+            if github_core:
+                print(f"GitHub API: {github_core['remaining']}/{github_core['limit']} requests remaining")
+            print(f"GitHub cache hit rate: {status['github_api_status']['cache']['hit_rate']:.1%}")
     
     except Exception as e:
         logger.error(f"Command failed: {e}", exc_info=True)
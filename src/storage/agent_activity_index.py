@@ -0,0 +1,116 @@
+"""
+Agent Activity Index
+Local record of issues the automated agent has already acted on
+
+Answering "has the agent touched this issue?" from GitHub requires reading the
+issue's comments. This index remembers the answer so repeated scans of open
+issues do not need any API calls for issues already known to be processed.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class AgentActivityIndex:
+    """Persistent map of issue numbers to the agent activity recorded for them"""
+
+    def __init__(self, storage_path: str = ".agent_activity_index.json"):
+        """
+        Initialize the index
+
+        Args:
+            storage_path: JSON file used to persist the index
+        """
+        self.storage_path = Path(storage_path)
+        self._entries: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Load the index from disk"""
+        if not self.storage_path.exists():
+            return
+
+        try:
+            with open(self.storage_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            for issue_number, entry in data.get('issues', {}).items():
+                self._entries[int(issue_number)] = entry
+            logger.debug(f"Loaded agent activity for {len(self._entries)} issues")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load agent activity index {self.storage_path}: {e}")
+
+    def has_activity(self, issue_number: int) -> bool:
+        """Check whether agent activity has been recorded for an issue"""
+        with self._lock:
+            return issue_number in self._entries
+
+    def get_activity(self, issue_number: int) -> Optional[Dict[str, Any]]:
+        """Get the recorded activity for an issue, if any"""
+        with self._lock:
+            entry = self._entries.get(issue_number)
+            return dict(entry) if entry else None
+
+    def record_activity(self, issue_number: int, source: str, save: bool = True) -> None:
+        """
+        Record agent activity on an issue
+
+        Args:
+            issue_number: GitHub issue number
+            source: Short description of the activity (e.g. 'comment', 'scan')
+            save: Whether to persist the index immediately
+        """
+        with self._lock:
+            self._entries[issue_number] = {
+                'source': source,
+                'recorded_at': datetime.utcnow().isoformat()
+            }
+        if save:
+            self.save()
+
+    def forget(self, issue_number: int, save: bool = True) -> None:
+        """Remove an issue from the index"""
+        with self._lock:
+            removed = self._entries.pop(issue_number, None)
+        if removed and save:
+            self.save()
+
+    def save(self) -> None:
+        """Persist the index to disk"""
+        # Saves are serialized so a slower, older snapshot cannot replace a newer one
+        with self._save_lock:
+            with self._lock:
+                data = {
+                    'metadata': {
+                        'last_updated': datetime.utcnow().isoformat(),
+                        'total_issues': len(self._entries)
+                    },
+                    'issues': {str(number): entry for number, entry in self._entries.items()}
+                }
+
+            temp_path = None
+            try:
+                self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=str(self.storage_path.parent),
+                                                 prefix=f".{self.storage_path.name}.", suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                    json.dump(data, file, indent=2)
+                os.replace(temp_path, self.storage_path)
+            except OSError as e:
+                if temp_path and os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                logger.warning(f"Could not save agent activity index {self.storage_path}: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -12,6 +12,10 @@ The GitManager class handles:
 - Branch naming conventions and cleanup
 - Git repository state validation
 - Integration with GitHub workflows
+- Optional per-issue worktrees so concurrent workers never share a checkout
+- Optional direct commits that write deliverables straight to branch refs
+  through ``git fast-import`` without any checkout
+- Deferred pushes that send a whole batch of branches in one ``git push``
 
 This maintains a clean git history where each issue's deliverables are
 contained in separate feature branches, allowing for easy tracking and
@@ -22,6 +26,8 @@ import os
 import subprocess
 import logging
 import re
+import threading
+import time
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 from dataclasses import dataclass
@@ -30,6 +36,8 @@ import tempfile
 import shlex
 from urllib.parse import urlparse
 
+from ..utils.tracing import current_span, traced
+
 
 @dataclass
 class BranchInfo:
@@ -40,6 +48,7 @@ class BranchInfo:
     base_branch: str
     commit_count: int = 0
     last_commit_hash: Optional[str] = None
+    worktree_path: Optional[str] = None
 
 
 @dataclass
@@ -50,6 +59,16 @@ class CommitInfo:
     author: str
     timestamp: datetime
     files_changed: List[str]
+    branch: Optional[str] = None
+
+
+@dataclass
+class BranchCommit:
+    """Deliverables to commit directly to a branch ref."""
+    branch_name: str
+    issue_number: int
+    message: str
+    files: Dict[str, bytes]  # Repository-relative path -> file content
 
 
 class GitOperationError(Exception):
@@ -70,7 +89,10 @@ class GitManager:
                  repo_path: Optional[str] = None,
                  base_branch: str = "main",
                  branch_prefix: str = "issue",
-                 auto_cleanup: bool = True):
+                 auto_cleanup: bool = True,
+                 use_worktrees: bool = False,
+                 worktree_dir: Optional[str] = None,
+                 direct_commits: bool = False):
         """
         Initialize the git manager.
         
@@ -79,6 +101,12 @@ class GitManager:
             base_branch: Base branch for creating feature branches
             branch_prefix: Prefix for issue-related branches
             auto_cleanup: Whether to automatically cleanup merged branches
+            use_worktrees: Check out each issue branch in its own worktree from a
+                reusable pool instead of switching the shared working tree
+            worktree_dir: Directory for pooled worktrees (defaults to a
+                directory inside the repository's git dir)
+            direct_commits: Commit deliverables straight to issue branch refs
+                with git plumbing instead of checking branches out
         """
         self.logger = logging.getLogger(__name__)
         
@@ -102,6 +130,32 @@ class GitManager:
         
         # Cache for branch information
         self._branch_cache: Dict[str, BranchInfo] = {}
+        
+        # Worktree pool state (guarded by _worktree_lock)
+        self.use_worktrees = use_worktrees
+        self._worktree_dir = Path(worktree_dir) if worktree_dir else None
+        self._worktree_lock = threading.Lock()
+        self._idle_worktrees: List[Path] = []
+        self._leased_worktrees: Dict[str, Path] = {}
+        self._worktree_counter = 0
+        self._batch_base: Optional[str] = None
+        
+        # Direct commit state
+        self.direct_commits = direct_commits
+        self._committer: Optional[Tuple[str, str]] = None
+        
+        # When set, callers queue pushes for flush_pushes instead of pushing per branch
+        self.defer_pushes = False
+        # Branches waiting for flush_pushes (insertion-ordered, guarded by _push_lock)
+        self._push_lock = threading.Lock()
+        self._pending_pushes: Dict[str, None] = {}
+        
+        # When set, direct commits are queued for flush_commits instead of
+        # being written one fast-import process per issue
+        self.defer_commits = False
+        # Commits waiting for flush_commits, keyed by branch (guarded by _commit_lock)
+        self._commit_lock = threading.Lock()
+        self._pending_commits: Dict[str, BranchCommit] = {}
     
     def _is_git_repository(self) -> bool:
         """Check if the current directory is a git repository."""
@@ -156,13 +210,15 @@ class GitManager:
         except GitOperationError:
             pass  # Continue anyway
     
-    def _run_git_command(self, command: List[str], check_return_code: bool = True) -> str:
+    def _run_git_command(self, command: List[str], check_return_code: bool = True,
+                         cwd: Optional[Path] = None) -> str:
         """
         Run a git command and return the output.
         
         Args:
             command: Git command arguments
             check_return_code: Whether to raise exception on non-zero return code
+            cwd: Working tree to run in (defaults to the repository path)
             
         Returns:
             Command output
@@ -175,7 +231,7 @@ class GitManager:
         try:
             result = subprocess.run(
                 full_command,
-                cwd=self.repo_path,
+                cwd=cwd or self.repo_path,
                 capture_output=True,
                 text=True,
                 timeout=30
@@ -197,6 +253,49 @@ class GitManager:
             self.logger.error(error_msg)
             raise GitOperationError(error_msg)
     
+    def _run_git_with_input(self, command: List[str], data: bytes, timeout: int = 120) -> str:
+        """
+        Run a git command that reads binary data from stdin.
+        
+        Args:
+            command: Git command arguments
+            data: Bytes written to the command's stdin
+            timeout: Seconds before the command is abandoned
+            
+        Returns:
+            Command output
+            
+        Raises:
+            GitOperationError: If the command fails
+        """
+        full_command = ['git'] + command
+        
+        try:
+            result = subprocess.run(
+                full_command,
+                cwd=self.repo_path,
+                input=data,
+                capture_output=True,
+                timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            error_msg = f"Git command timed out: {' '.join(full_command)}"
+            self.logger.error(error_msg)
+            raise GitOperationError(error_msg)
+        except subprocess.SubprocessError as e:
+            error_msg = f"Git command error: {' '.join(full_command)}\nError: {str(e)}"
+            self.logger.error(error_msg)
+            raise GitOperationError(error_msg)
+        
+        if result.returncode != 0:
+            error_msg = (f"Git command failed: {' '.join(full_command)}\n"
+                         f"Error: {result.stderr.decode('utf-8', 'replace')}")
+            self.logger.error(error_msg)
+            raise GitOperationError(error_msg)
+        
+        return result.stdout.decode('utf-8', 'replace')
+    
+    @traced("git.branch")
     def create_issue_branch(self, issue_number: int, title: str = "") -> BranchInfo:
         """
         Create a new feature branch for an issue.
@@ -211,18 +310,14 @@ class GitManager:
         Raises:
             GitOperationError: If branch creation fails
         """
-        # Generate branch name
-        title_slug = self._slugify(title) if title else ""
-        branch_name = f"{self.branch_prefix}-{issue_number}"
-        if title_slug:
-            branch_name += f"-{title_slug}"
-        
-        # Limit branch name length
-        if len(branch_name) > 60:
-            branch_name = f"{self.branch_prefix}-{issue_number}-{title_slug[:30]}"
+        branch_name = self._branch_name(issue_number, title)
+        current_span().set(issue_number=issue_number, branch=branch_name)
         
         self.logger.info(f"Creating branch '{branch_name}' for issue #{issue_number}")
         
+        if self.use_worktrees:
+            return self._create_worktree_branch(branch_name, issue_number)
+        
         try:
             # Ensure we're on the base branch and it's up to date
             self._checkout_base_branch()
@@ -253,11 +348,13 @@ class GitManager:
             self.logger.error(f"Failed to create branch for issue #{issue_number}: {e}")
             raise
     
+    @traced("git.commit")
     def commit_deliverables(self, 
                           file_paths: List[str], 
                           issue_number: int,
                           workflow_name: str,
-                          commit_message: Optional[str] = None) -> CommitInfo:
+                          commit_message: Optional[str] = None,
+                          worktree_path: Optional[str] = None) -> CommitInfo:
         """
         Commit generated deliverable files.
         
@@ -266,6 +363,8 @@ class GitManager:
             issue_number: GitHub issue number
             workflow_name: Name of the workflow that generated the files
             commit_message: Optional custom commit message
+            worktree_path: Worktree the files were written to (from
+                ``BranchInfo.worktree_path``); defaults to the main working tree
             
         Returns:
             CommitInfo object with commit details
@@ -285,28 +384,25 @@ class GitManager:
         if missing_files:
             raise GitOperationError(f"Files not found: {missing_files}")
         
+        current_span().set(issue_number=issue_number, files=len(file_paths))
         self.logger.info(f"Committing {len(file_paths)} deliverable files for issue #{issue_number}")
         
+        cwd = Path(worktree_path) if worktree_path else None
+        
         try:
             # Add files to staging
             for file_path in file_paths:
-                self._run_git_command(['add', file_path])
+                self._run_git_command(['add', file_path], cwd=cwd)
             
             # Generate commit message
             if not commit_message:
-                file_summary = self._generate_file_summary(file_paths)
-                commit_message = (
-                    f"Add {workflow_name} deliverables for issue #{issue_number}\n\n"
-                    f"Generated files:\n{file_summary}\n\n"
-                    f"Workflow: {workflow_name}\n"
-                    f"Issue: #{issue_number}"
-                )
+                commit_message = self._deliverables_commit_message(file_paths, issue_number, workflow_name)
             
             # Commit changes
-            self._run_git_command(['commit', '-m', commit_message])
+            self._run_git_command(['commit', '-m', commit_message], cwd=cwd)
             
             # Get commit information
-            commit_hash = self._run_git_command(['rev-parse', 'HEAD']).strip()
+            commit_hash = self._run_git_command(['rev-parse', 'HEAD'], cwd=cwd).strip()
             commit_details = self._get_commit_details(commit_hash)
             
             self.logger.info(f"Successfully committed deliverables: {commit_hash[:8]}")
@@ -317,6 +413,215 @@ class GitManager:
             self.logger.error(f"Failed to commit deliverables for issue #{issue_number}: {e}")
             raise
     
+    def commit_deliverables_to_branch(self,
+                                      file_paths: List[str],
+                                      issue_number: int,
+                                      workflow_name: str,
+                                      title: str = "",
+                                      commit_message: Optional[str] = None) -> CommitInfo:
+        """
+        Commit deliverable files straight to the issue's branch ref.
+        
+        The working tree, index and current branch are left untouched; the
+        branch is created from the base branch if it does not exist yet.
+        
+        Args:
+            file_paths: Files to commit (must be inside the repository)
+            issue_number: GitHub issue number
+            workflow_name: Name of the workflow that generated the files
+            title: Issue title used for the branch name
+            commit_message: Optional custom commit message
+            
+        Returns:
+            CommitInfo object with commit details (including the branch)
+            
+        Raises:
+            GitOperationError: If commit fails
+        """
+        if not file_paths:
+            raise GitOperationError("No files to commit")
+        
+        missing_files = [file_path for file_path in file_paths if not Path(file_path).exists()]
+        if missing_files:
+            raise GitOperationError(f"Files not found: {missing_files}")
+        
+        repo_root = self.repo_path.resolve()
+        files: Dict[str, bytes] = {}
+        for file_path in file_paths:
+            path = Path(file_path).resolve()
+            try:
+                relative = path.relative_to(repo_root).as_posix()
+            except ValueError:
+                raise GitOperationError(f"File is outside the repository: {file_path}")
+            files[relative] = path.read_bytes()
+        
+        commit = self.branch_commit(files, issue_number, workflow_name, title, commit_message)
+        return self.commit_to_branches([commit])[0]
+    
+    def branch_commit(self,
+                      files: Dict[str, bytes],
+                      issue_number: int,
+                      workflow_name: str,
+                      title: str = "",
+                      commit_message: Optional[str] = None) -> BranchCommit:
+        """
+        Describe a commit of in-memory deliverables to the issue's branch.
+        
+        Args:
+            files: Repository-relative path -> file content
+            issue_number: GitHub issue number
+            workflow_name: Name of the workflow that generated the files
+            title: Issue title used for the branch name
+            commit_message: Optional custom commit message
+            
+        Returns:
+            BranchCommit for commit_to_branches or queue_commit
+            
+        Raises:
+            GitOperationError: If there are no files
+        """
+        if not files:
+            raise GitOperationError("No files to commit")
+        
+        return BranchCommit(
+            branch_name=self._branch_name(issue_number, title),
+            issue_number=issue_number,
+            message=commit_message or self._deliverables_commit_message(list(files), issue_number, workflow_name),
+            files=dict(files)
+        )
+    
+    def queue_commit(self, commit: BranchCommit) -> None:
+        """
+        Queue a direct commit for the next flush_commits call.
+        
+        A second commit queued for the same branch is folded into the first.
+        
+        Args:
+            commit: Commit to write
+        """
+        with self._commit_lock:
+            pending = self._pending_commits.get(commit.branch_name)
+            if pending:
+                pending.files.update(commit.files)
+            else:
+                self._pending_commits[commit.branch_name] = BranchCommit(
+                    branch_name=commit.branch_name,
+                    issue_number=commit.issue_number,
+                    message=commit.message,
+                    files=dict(commit.files)
+                )
+    
+    @property
+    def pending_commits(self) -> List[str]:
+        """Branches with commits queued for the next flush_commits call."""
+        with self._commit_lock:
+            return list(self._pending_commits)
+    
+    def flush_commits(self) -> Dict[str, Optional[CommitInfo]]:
+        """
+        Write every queued commit with a single commit_to_branches call.
+        
+        When the commits cannot be written, pushes queued for their branches
+        are dropped as well.
+        
+        Returns:
+            Mapping of branch name to its CommitInfo, or None if it failed
+        """
+        with self._commit_lock:
+            commits = list(self._pending_commits.values())
+            self._pending_commits = {}
+        if not commits:
+            return {}
+        
+        try:
+            commit_infos = self.commit_to_branches(commits)
+        except GitOperationError as e:
+            branches = [commit.branch_name for commit in commits]
+            self.logger.error(f"Failed to commit deliverables to {len(branches)} branches: {e}")
+            with self._push_lock:
+                for branch in branches:
+                    self._pending_pushes.pop(branch, None)
+            return {branch: None for branch in branches}
+        
+        return {info.branch: info for info in commit_infos}
+    
+    @traced("git.commit")
+    def commit_to_branches(self, commits: List[BranchCommit]) -> List[CommitInfo]:
+        """
+        Commit file contents to several branch refs in one fast-import stream.
+        
+        Each commit's parent is the current tip of its branch, or the base
+        branch (as pinned by prepare_batch) for new branches. The whole batch
+        costs one ``for-each-ref`` and one ``fast-import`` process regardless
+        of the number of commits or files.
+        
+        Args:
+            commits: Commits to create, at most one per branch
+            
+        Returns:
+            CommitInfo for each commit, in order
+            
+        Raises:
+            GitOperationError: If the commits cannot be written
+        """
+        if not commits:
+            return []
+        branch_names = [commit.branch_name for commit in commits]
+        current_span().set(branches=len(branch_names))
+        if len(set(branch_names)) != len(branch_names):
+            raise GitOperationError("Each branch can only be committed to once per batch")
+        
+        refs = self._ref_tips()
+        base_commit = (self._batch_base
+                       or refs.get(f"refs/remotes/origin/{self.base_branch}")
+                       or refs.get(f"refs/heads/{self.base_branch}"))
+        if not base_commit:
+            raise GitOperationError(f"Base branch not found: {self.base_branch}")
+        
+        name, email = self._committer_identity()
+        timestamp = int(time.time())
+        
+        stream = bytearray()
+        for mark, commit in enumerate(commits, 1):
+            message = commit.message.encode('utf-8')
+            parent = refs.get(f"refs/heads/{commit.branch_name}", base_commit)
+            stream += (f"commit refs/heads/{commit.branch_name}\n"
+                       f"mark :{mark}\n"
+                       f"committer {name} <{email}> {timestamp} +0000\n"
+                       f"data {len(message)}\n").encode('utf-8')
+            stream += message
+            stream += f"\nfrom {parent}\n".encode('utf-8')
+            for path, content in commit.files.items():
+                stream += f"M 100644 inline {self._fast_import_path(path)}\ndata {len(content)}\n".encode('utf-8')
+                stream += content
+                stream += b"\n"
+            stream += b"\n"
+        stream += b"done\n"
+        
+        with tempfile.TemporaryDirectory(prefix='git-marks-') as marks_dir:
+            marks_path = Path(marks_dir) / 'marks'
+            self._run_git_with_input(
+                ['fast-import', '--quiet', '--done', f"--export-marks={marks_path}"], bytes(stream)
+            )
+            marks = dict(line.split() for line in marks_path.read_text().splitlines() if line)
+        
+        commit_infos = []
+        for mark, commit in enumerate(commits, 1):
+            commit_hash = marks[f":{mark}"]
+            commit_infos.append(CommitInfo(
+                hash=commit_hash,
+                message=commit.message.split('\n', 1)[0],
+                author=name,
+                timestamp=datetime.fromtimestamp(timestamp),
+                files_changed=sorted(commit.files),
+                branch=commit.branch_name
+            ))
+            self.logger.info(f"Committed deliverables for issue #{commit.issue_number} "
+                             f"to '{commit.branch_name}': {commit_hash[:8]}")
+        
+        return commit_infos
+    
+    @traced("git.push")
     def push_branch(self, branch_name: str, set_upstream: bool = True) -> bool:
         """
         Push a branch to the remote repository.
@@ -328,12 +633,14 @@ class GitManager:
         Returns:
             True if push succeeded, False otherwise
         """
+        current_span().set(branches=1)
         try:
             self.logger.info(f"Pushing branch '{branch_name}' to remote")
             
-            # Ensure we're on the correct branch
-            current_branch = self._get_current_branch()
-            if current_branch != branch_name:
+            # Ensure we're on the correct branch (worktree and direct-commit
+            # branches are pushed by name without a checkout)
+            if (not self.use_worktrees and not self.direct_commits
+                    and self._get_current_branch() != branch_name):
                 self._run_git_command(['checkout', branch_name])
             
             # Push the branch
@@ -349,10 +656,77 @@ class GitManager:
             self.logger.error(f"Failed to push branch '{branch_name}': {e}")
             return False
     
+    def queue_push(self, branch_name: str) -> None:
+        """
+        Queue a branch for the next flush_pushes call.
+        
+        Args:
+            branch_name: Name of the branch to push
+        """
+        with self._push_lock:
+            self._pending_pushes[branch_name] = None
+    
+    @property
+    def pending_pushes(self) -> List[str]:
+        """Branches queued for the next flush_pushes call."""
+        with self._push_lock:
+            return list(self._pending_pushes)
+    
+    @traced("git.push")
+    def flush_pushes(self, set_upstream: bool = True) -> Dict[str, bool]:
+        """
+        Push every queued branch to the remote with a single ``git push``.
+        
+        Args:
+            set_upstream: Whether to set the upstream branches
+            
+        Returns:
+            Mapping of branch name to whether its push succeeded
+        """
+        with self._push_lock:
+            branches = list(self._pending_pushes)
+            self._pending_pushes = {}
+        if not branches:
+            return {}
+        current_span().set(branches=len(branches))
+        
+        self.logger.info(f"Pushing {len(branches)} branches to remote")
+        command = ['push', '--porcelain']
+        if set_upstream:
+            command.append('-u')
+        command.append('origin')
+        command.extend(f"refs/heads/{branch}:refs/heads/{branch}" for branch in branches)
+        
+        try:
+            output = self._run_git_command(command, check_return_code=False)
+        except GitOperationError as e:
+            self.logger.error(f"Failed to push branches: {e}")
+            return {branch: False for branch in branches}
+        
+        # Porcelain lines: "<flag>\t<src>:<dst>\t<summary>"; "!" marks a rejected ref
+        pushed: Dict[str, bool] = {}
+        for line in output.splitlines():
+            parts = line.split('\t')
+            if len(parts) >= 2 and ':' in parts[1]:
+                source = parts[1].split(':', 1)[0]
+                if source.startswith('refs/heads/'):
+                    pushed[source[len('refs/heads/'):]] = parts[0] != '!'
+        
+        results = {branch: pushed.get(branch, False) for branch in branches}
+        failed = [branch for branch, success in results.items() if not success]
+        if failed:
+            self.logger.error(f"Failed to push branches: {', '.join(failed)}")
+        self.logger.info(f"Pushed {len(branches) - len(failed)} of {len(branches)} branches")
+        return results
+    
     def cleanup_merged_branches(self, dry_run: bool = False) -> List[str]:
         """
         Clean up branches that have been merged.
         
+        Merged issue branches are found with one ``for-each-ref`` and deleted
+        in one ``update-ref --stdin`` transaction. Branches checked out in
+        any worktree are kept.
+        
         Args:
             dry_run: If True, only return branches that would be deleted
             
@@ -360,45 +734,183 @@ class GitManager:
             List of branches that were (or would be) deleted
         """
         try:
-            # Get merged branches
-            merged_output = self._run_git_command(['branch', '--merged', self.base_branch])
-            merged_branches = [
-                branch.strip().lstrip('* ') 
-                for branch in merged_output.split('\n') 
-                if branch.strip() and not branch.strip().startswith('*')
-            ]
-            
-            # Filter for issue branches
-            issue_branches = [
-                branch for branch in merged_branches 
-                if branch.startswith(self.branch_prefix) and branch != self.base_branch
-            ]
+            # Get merged branches with their tips
+            merged_output = self._run_git_command([
+                'for-each-ref', f'--merged={self.base_branch}',
+                '--format=%(refname)%00%(objectname)%00%(worktreepath)', 'refs/heads/'
+            ])
+            issue_branches: Dict[str, str] = {}
+            for line in merged_output.splitlines():
+                refname, objectname, worktree_path = line.split('\0')
+                branch = refname[len('refs/heads/'):]
+                # Filter for issue branches that are not checked out anywhere
+                if (branch.startswith(self.branch_prefix) and branch != self.base_branch
+                        and not worktree_path):
+                    issue_branches[branch] = objectname
             
             if dry_run:
                 self.logger.info(f"Would delete {len(issue_branches)} merged branches")
-                return issue_branches
+                return list(issue_branches)
+            
+            if not issue_branches:
+                return []
+            
+            # Delete all merged issue branches atomically, guarded by their expected tips
+            transaction = ''.join(
+                f"delete refs/heads/{branch} {objectname}\n"
+                for branch, objectname in issue_branches.items()
+            )
+            self._run_git_with_input(['update-ref', '--stdin'], transaction.encode('utf-8'))
             
-            # Delete merged issue branches
-            deleted_branches = []
             for branch in issue_branches:
-                try:
-                    self._run_git_command(['branch', '-d', branch])
-                    deleted_branches.append(branch)
-                    self.logger.info(f"Deleted merged branch: {branch}")
-                    
-                    # Remove from cache
-                    if branch in self._branch_cache:
-                        del self._branch_cache[branch]
-                        
-                except GitOperationError as e:
-                    self.logger.warning(f"Failed to delete branch '{branch}': {e}")
-            
-            return deleted_branches
+                self._branch_cache.pop(branch, None)
+            self.logger.info(f"Deleted {len(issue_branches)} merged branches: {', '.join(issue_branches)}")
+            
+            return list(issue_branches)
             
         except GitOperationError as e:
             self.logger.error(f"Failed to cleanup merged branches: {e}")
             return []
     
+    def prepare_batch(self) -> Optional[str]:
+        """
+        Fetch the base branch once for a batch of issues.
+        
+        Issue branches created afterwards start from the fetched commit
+        instead of pulling the base branch for every issue.
+        
+        Returns:
+            Commit the batch's issue branches start from, or None when
+            neither worktrees nor direct commits are enabled
+        """
+        if not self.use_worktrees and not self.direct_commits:
+            return None
+        
+        try:
+            self._run_git_command(['fetch', 'origin', self.base_branch])
+        except GitOperationError:
+            # If fetch fails, continue anyway (might be offline or no remote)
+            self.logger.warning("Failed to fetch latest changes")
+        
+        base_commit = self._run_git_command(
+            ['rev-parse', '--verify', '--quiet', f"origin/{self.base_branch}^{{commit}}"],
+            check_return_code=False
+        ).strip()
+        if not base_commit:
+            base_commit = self._run_git_command(['rev-parse', f"{self.base_branch}^{{commit}}"]).strip()
+        
+        with self._worktree_lock:
+            self._batch_base = base_commit
+        self.logger.info(f"Prepared batch from {self.base_branch} at {base_commit[:8]}")
+        return base_commit
+    
+    def release_worktree(self, branch_info: BranchInfo) -> None:
+        """
+        Return an issue's worktree to the pool.
+        
+        The worktree is reset, cleaned and detached so the branch can be
+        checked out elsewhere; deliverables must be committed before release.
+        
+        Args:
+            branch_info: Branch returned by create_issue_branch in worktree mode
+        """
+        if not branch_info.worktree_path:
+            return
+        
+        path = Path(branch_info.worktree_path)
+        with self._worktree_lock:
+            self._leased_worktrees.pop(branch_info.name, None)
+        
+        try:
+            self._run_git_command(['reset', '--hard', '--quiet'], cwd=path)
+            self._run_git_command(['clean', '-fdq'], cwd=path)
+            self._run_git_command(['checkout', '--detach', '--quiet'], cwd=path)
+        except GitOperationError as e:
+            self.logger.warning(f"Discarding worktree {path} that could not be reset: {e}")
+            self._remove_worktree(path)
+            return
+        
+        with self._worktree_lock:
+            self._idle_worktrees.append(path)
+        branch_info.worktree_path = None
+    
+    def close_worktrees(self) -> None:
+        """Remove the pooled worktrees that are not currently in use."""
+        with self._worktree_lock:
+            idle = self._idle_worktrees
+            self._idle_worktrees = []
+            self._batch_base = None
+            leased = list(self._leased_worktrees)
+        
+        for path in idle:
+            self._remove_worktree(path)
+        if leased:
+            self.logger.warning(f"Leaving {len(leased)} worktrees in use: {', '.join(leased)}")
+        if idle:
+            self._run_git_command(['worktree', 'prune'], check_return_code=False)
+    
+    def _create_worktree_branch(self, branch_name: str, issue_number: int) -> BranchInfo:
+        """Check out an issue branch in a pooled worktree."""
+        base_commit = self._batch_base or self.prepare_batch()
+        path = self._acquire_worktree(base_commit)
+        
+        try:
+            if self._branch_exists(branch_name):
+                self.logger.warning(f"Branch '{branch_name}' already exists")
+                self._run_git_command(['checkout', '--quiet', branch_name], cwd=path)
+            else:
+                self._run_git_command(['checkout', '--quiet', '-b', branch_name, base_commit], cwd=path)
+        except GitOperationError as e:
+            self.logger.error(f"Failed to create branch for issue #{issue_number}: {e}")
+            with self._worktree_lock:
+                self._idle_worktrees.append(path)
+            raise
+        
+        with self._worktree_lock:
+            self._leased_worktrees[branch_name] = path
+        
+        branch_info = BranchInfo(
+            name=branch_name,
+            created_at=datetime.now(),
+            issue_number=issue_number,
+            base_branch=self.base_branch,
+            worktree_path=str(path)
+        )
+        self._branch_cache[branch_name] = branch_info
+        self.logger.info(f"Checked out branch '{branch_name}' in worktree {path}")
+        
+        return branch_info
+    
+    def _acquire_worktree(self, base_commit: str) -> Path:
+        """Take an idle worktree from the pool, or add a new one."""
+        with self._worktree_lock:
+            if self._idle_worktrees:
+                return self._idle_worktrees.pop()
+            
+            # Adding worktrees updates shared administrative files; do it serially
+            root = self._worktree_root()
+            root.mkdir(parents=True, exist_ok=True)
+            path = root / f"worktree-{self._worktree_counter}"
+            self._worktree_counter += 1
+            self._run_git_command(['worktree', 'add', '--detach', '--quiet', str(path), base_commit])
+            return path
+    
+    def _remove_worktree(self, path: Path) -> None:
+        """Delete a pooled worktree."""
+        try:
+            self._run_git_command(['worktree', 'remove', '--force', str(path)])
+        except GitOperationError as e:
+            self.logger.warning(f"Failed to remove worktree {path}: {e}")
+    
+    def _worktree_root(self) -> Path:
+        """Directory holding pooled worktrees."""
+        if self._worktree_dir is None:
+            common_dir = Path(self._run_git_command(['rev-parse', '--git-common-dir']).strip())
+            if not common_dir.is_absolute():
+                common_dir = self.repo_path / common_dir
+            self._worktree_dir = common_dir / 'agent-worktrees'
+        return self._worktree_dir
+    
     def get_branch_status(self, branch_name: str) -> Dict[str, Any]:
         """
         Get status information for a branch.
@@ -453,6 +965,54 @@ class GitManager:
             # If pull fails, continue anyway (might be offline or no remote)
             self.logger.warning("Failed to pull latest changes")
     
+    def _ref_tips(self) -> Dict[str, str]:
+        """Current commit of every local branch and origin remote-tracking branch."""
+        output = self._run_git_command([
+            'for-each-ref', '--format=%(refname) %(objectname)', 'refs/heads/', 'refs/remotes/origin/'
+        ])
+        return dict(line.split(' ', 1) for line in output.splitlines() if line)
+    
+    def _committer_identity(self) -> Tuple[str, str]:
+        """Configured committer name and email (looked up once)."""
+        if self._committer is None:
+            ident = self._run_git_command(['var', 'GIT_COMMITTER_IDENT']).strip()
+            match = re.match(r'^(.*) <(.*)> \d+ [+-]\d{4}$', ident)
+            if not match:
+                raise GitOperationError(f"Unexpected committer identity: {ident}")
+            self._committer = (match.group(1), match.group(2))
+        return self._committer
+    
+    @staticmethod
+    def _fast_import_path(path: str) -> str:
+        """Quote a path for a fast-import file command when required."""
+        if '\n' in path or path.startswith('"'):
+            return '"' + path.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        return path
+    
+    def _deliverables_commit_message(self, file_paths: List[str], issue_number: int,
+                                     workflow_name: str) -> str:
+        """Default commit message for a workflow's deliverables."""
+        file_summary = self._generate_file_summary(file_paths)
+        return (
+            f"Add {workflow_name} deliverables for issue #{issue_number}\n\n"
+            f"Generated files:\n{file_summary}\n\n"
+            f"Workflow: {workflow_name}\n"
+            f"Issue: #{issue_number}"
+        )
+    
+    def _branch_name(self, issue_number: int, title: str = "") -> str:
+        """Generate the branch name for an issue."""
+        title_slug = self._slugify(title) if title else ""
+        branch_name = f"{self.branch_prefix}-{issue_number}"
+        if title_slug:
+            branch_name += f"-{title_slug}"
+        
+        # Limit branch name length
+        if len(branch_name) > 60:
+            branch_name = f"{self.branch_prefix}-{issue_number}-{title_slug[:30]}"
+        
+        return branch_name
+    
     def _branch_exists(self, branch_name: str) -> bool:
         """Check if a branch exists locally."""
         try:
@@ -0,0 +1,324 @@
+"""
+Issue Mirror
+Local SQLite copy of repository issues kept current with incremental syncs
+
+Each sync only requests issues updated since the newest ``updated_at`` seen in
+the previous sync, so commands that need the list of open issues read it from
+disk instead of paginating through every open issue on GitHub.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ..clients.issue_discovery import IssueQuery, NO_ASSIGNEE
+
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    number INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL,
+    state TEXT NOT NULL,
+    author TEXT,
+    assignee TEXT,
+    assignees TEXT NOT NULL,
+    labels TEXT NOT NULL,
+    url TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    last_comment_author TEXT,
+    last_comment_at TEXT,
+    last_comment_excerpt TEXT,
+    synced_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issue_labels (
+    number INTEGER NOT NULL,
+    label TEXT NOT NULL,
+    PRIMARY KEY (number, label)
+);
+CREATE INDEX IF NOT EXISTS idx_issue_labels_label ON issue_labels (label);
+CREATE INDEX IF NOT EXISTS idx_issues_state ON issues (state, assignee);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Mirror sort orders for IssueQuery.sort values
+SORT_ORDERS = {
+    'created-desc': 'created_at DESC',
+    'created-asc': 'created_at ASC',
+    'updated-desc': 'updated_at DESC',
+    'updated-asc': 'updated_at ASC',
+}
+
+COMMENT_EXCERPT_LENGTH = 280
+
+
+class IssueMirror:
+    """SQLite mirror of a repository's issues"""
+
+    def __init__(self, db_path: str = ".issue_mirror.sqlite3", repository: str = ""):
+        """
+        Initialize the mirror
+
+        Args:
+            db_path: SQLite database file
+            repository: Repository name in format 'owner/repo'; a mirror file
+                created for a different repository is reset
+        """
+        self.db_path = Path(db_path)
+        self.repository = repository
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            stored_repository = self._get_state(conn, 'repository')
+            if repository and stored_repository not in (None, repository):
+                logger.warning(f"Issue mirror {self.db_path} belongs to {stored_repository}, resetting")
+                conn.executescript("DELETE FROM issues; DELETE FROM issue_labels; DELETE FROM sync_state;")
+            if repository:
+                self._set_state(conn, 'repository', repository)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _get_state(conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+
+    @staticmethod
+    def _set_state(conn: sqlite3.Connection, key: str, value: Optional[str]) -> None:
+        conn.execute(
+            "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value)
+        )
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """Newest ``updated_at`` timestamp seen by a completed sync"""
+        with self._connect() as conn:
+            return self._get_state(conn, 'cursor')
+
+    @property
+    def last_synced_at(self) -> Optional[str]:
+        """Time of the last completed sync"""
+        with self._connect() as conn:
+            return self._get_state(conn, 'last_synced_at')
+
+    def sync(self, graphql_client: Any, comment_window: int = 5) -> Dict[str, Any]:
+        """
+        Pull issues changed since the last sync.
+
+        The first sync fetches open issues only; later syncs fetch open and
+        closed issues updated since the cursor so that closures are mirrored.
+
+        Args:
+            graphql_client: :class:`GitHubGraphQLClient` for the repository
+            comment_window: Recent comments fetched per issue for the comment summary
+
+        Returns:
+            Sync statistics (issues updated, cursor, whether it was a full sync)
+        """
+        with self._lock:
+            since = self.cursor
+            states = ['OPEN', 'CLOSED'] if since else ['OPEN']
+            newest = since
+            updated = 0
+
+            issues = graphql_client.iter_issues_with_comments(
+                states=states,
+                since=since,
+                order_by='UPDATED_AT',
+                direction='ASC',
+                comment_window=comment_window,
+                page_size=100
+            )
+
+            with self._connect() as conn:
+                for issue in issues:
+                    self._upsert(conn, issue)
+                    updated += 1
+                    if issue.get('updated_at') and (newest is None or issue['updated_at'] > newest):
+                        newest = issue['updated_at']
+
+                self._set_state(conn, 'cursor', newest)
+                self._set_state(conn, 'last_synced_at', datetime.now(timezone.utc).isoformat())
+
+            logger.info(f"Issue mirror sync {'since ' + since if since else '(full)'}: {updated} issues updated")
+            return {'updated': updated, 'cursor': newest, 'full_sync': since is None}
+
+    def upsert_issues(self, issues: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store issues in the mirror
+
+        Args:
+            issues: Issue dictionaries in the shape of ``graphql_issue_to_rest``
+
+        Returns:
+            Number of issues stored
+        """
+        count = 0
+        with self._lock, self._connect() as conn:
+            for issue in issues:
+                self._upsert(conn, issue)
+                count += 1
+        return count
+
+    def _upsert(self, conn: sqlite3.Connection, issue: Dict[str, Any]) -> None:
+        """Insert or replace a single issue and its labels"""
+        labels = [label['name'] for label in issue.get('labels') or []]
+        assignees = [assignee['login'] for assignee in issue.get('assignees') or []]
+        comments = issue.get('comments') or []
+        last_comment = comments[-1] if comments else {}
+
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO issues (
+                number, title, body, state, author, assignee, assignees, labels, url,
+                created_at, updated_at, comment_count, last_comment_author,
+                last_comment_at, last_comment_excerpt, synced_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                issue['number'],
+                issue.get('title') or '',
+                issue.get('body') or '',
+                issue.get('state') or 'open',
+                (issue.get('user') or {}).get('login') or None,
+                assignees[0] if assignees else None,
+                json.dumps(assignees),
+                json.dumps(labels),
+                issue.get('html_url'),
+                issue.get('created_at'),
+                issue.get('updated_at'),
+                issue.get('comment_count', len(comments)),
+                last_comment.get('login'),
+                last_comment.get('created_at'),
+                (last_comment.get('body') or '')[:COMMENT_EXCERPT_LENGTH] or None,
+                datetime.now(timezone.utc).isoformat(),
+            )
+        )
+        conn.execute("DELETE FROM issue_labels WHERE number = ?", (issue['number'],))
+        conn.executemany(
+            "INSERT OR IGNORE INTO issue_labels (number, label) VALUES (?, ?)",
+            [(issue['number'], label) for label in labels]
+        )
+
+    def query(self,
+              query: IssueQuery,
+              limit: Optional[int] = None,
+              exclude_labels: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Find mirrored issues matching a query
+
+        Args:
+            query: Filters to apply
+            limit: Maximum number of issues to return
+            exclude_labels: Skip issues carrying any of these labels
+
+        Returns:
+            List of issue data dictionaries
+        """
+        clauses = []
+        params: List[Any] = []
+
+        if query.state in ('open', 'closed'):
+            clauses.append("state = ?")
+            params.append(query.state)
+
+        for label in query.labels:
+            clauses.append("number IN (SELECT number FROM issue_labels WHERE label = ?)")
+            params.append(label)
+
+        if query.any_labels:
+            placeholders = ','.join('?' * len(query.any_labels))
+            clauses.append(f"number IN (SELECT number FROM issue_labels WHERE label IN ({placeholders}))")
+            params.extend(query.any_labels)
+
+        excluded = list(exclude_labels or [])
+        if excluded:
+            placeholders = ','.join('?' * len(excluded))
+            clauses.append(f"number NOT IN (SELECT number FROM issue_labels WHERE label IN ({placeholders}))")
+            params.extend(excluded)
+
+        if query.assignee == NO_ASSIGNEE:
+            clauses.append("assignee IS NULL")
+        elif query.assignee:
+            clauses.append("EXISTS (SELECT 1 FROM json_each(issues.assignees) WHERE value = ?)")
+            params.append(query.assignee)
+
+        if query.updated_since:
+            updated = query.updated_since
+            if updated.tzinfo is not None:
+                updated = updated.astimezone(timezone.utc).replace(tzinfo=None)
+            clauses.append("updated_at >= ?")
+            params.append(updated.strftime("%Y-%m-%dT%H:%M:%SZ"))
+
+        sql = "SELECT * FROM issues"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {SORT_ORDERS.get(query.sort, SORT_ORDERS['created-desc'])}, number DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a database row into the issue dictionary used by the processors"""
+        return {
+            'number': row['number'],
+            'title': row['title'],
+            'body': row['body'],
+            'state': row['state'],
+            'labels': json.loads(row['labels']),
+            'assignees': json.loads(row['assignees']),
+            'assignee': row['assignee'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at'],
+            'url': row['url'],
+            'user': row['author'],
+            'comment_count': row['comment_count'],
+            'last_comment': {
+                'author': row['last_comment_author'],
+                'created_at': row['last_comment_at'],
+                'excerpt': row['last_comment_excerpt'],
+            } if row['last_comment_author'] is not None else None,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get mirror statistics"""
+        with self._connect() as conn:
+            counts = dict(conn.execute("SELECT state, COUNT(*) FROM issues GROUP BY state").fetchall())
+            return {
+                'path': str(self.db_path),
+                'open_issues': counts.get('open', 0),
+                'closed_issues': counts.get('closed', 0),
+                'cursor': self._get_state(conn, 'cursor'),
+                'last_synced_at': self._get_state(conn, 'last_synced_at'),
+            }
@@ -87,7 +87,8 @@ class AIPromptBuilder:
     def build_content_extraction_prompt(self,
                                       issue: IssueContent,
                                       focus: Optional[ExtractionFocus] = None,
-                                      specialist_context: Optional[str] = None) -> Dict[str, str]:
+                                      specialist_context: Optional[str] = None,
+                                      pre_extracted: Optional[Dict[str, List[str]]] = None) -> Dict[str, str]:
         """
         Build a comprehensive content extraction prompt.
         
@@ -95,6 +96,8 @@ class AIPromptBuilder:
             issue: Issue content to analyze
             focus: Areas to focus extraction on
             specialist_context: Additional context for specialist workflows
+            pre_extracted: Values already extracted locally, by kind; indicators
+                replaced in the issue text by references are listed by reference
             
         Returns:
             Dict with system and user messages
@@ -108,6 +111,7 @@ Your task is to extract structured information from GitHub issue content. Focus
 {self._format_extraction_focus(focus)}
 
 {f"Specialist Context: {specialist_context}" if specialist_context else ""}
+{self._format_pre_extracted(pre_extracted) if pre_extracted else ""}
 
 Return your analysis as valid JSON with the following structure:
 {{
@@ -406,6 +410,16 @@ CONTENT:
         
         return content
     
+    def _format_pre_extracted(self, pre_extracted: Dict[str, List[str]]) -> str:
+        """Format locally extracted values so the AI focuses on what they relate to"""
+        lines = [
+            "Already Extracted (do not repeat these under \"entities\" or \"indicators\"; "
+            "use them as entity names in relationships and events, keeping [IOC-n] references as written):"
+        ]
+        for kind, values in pre_extracted.items():
+            lines.append(f"- {kind}: {', '.join(values)}")
+        return "\n".join(lines)
+    
     def _format_extraction_focus(self, focus: ExtractionFocus) -> str:
         """Format extraction focus areas for prompt"""
         focus_areas = []
@@ -3,11 +3,13 @@ Configuration Management Module
 Handles loading and validation of YAML configuration files for site monitoring
 """
 
+import copy
+import hashlib
+import threading
 import yaml
 import os
 import re
-from typing import Dict, List, Optional, Any
-from jsonschema import validate, ValidationError
+from typing import Callable, Dict, List, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -66,6 +68,10 @@ class AgentGitConfig:
     branch_prefix: str = "agent"
     commit_message_template: str = "Agent: {workflow_name} for issue #{issue_number}"
     auto_push: bool = True
+    # Give each in-flight issue its own git worktree so concurrent workers don't share a checkout
+    worktrees: bool = False
+    # Commit deliverables straight to branch refs with git fast-import (no checkout)
+    direct_commits: bool = False
 
 
 @dataclass
@@ -79,9 +85,29 @@ class AgentValidationConfig:
 @dataclass
 class AIHistoryConfig:
     """AI history storage configuration"""
-    storage_type: str = "gist"
+    storage_type: str = "repo_file"  # gist storage is not implemented
     gist_id: Optional[str] = None
-    file_path: str = ".github/ai_assignment_history.json"
+    file_path: str = ".github/ai_assignment_history.jsonl"
+
+
+@dataclass
+class AIPreclassifierConfig:
+    """Local workflow classifier consulted before the AI"""
+    enabled: bool = False
+    model_path: str = ".workflow_classifier.json"
+    decide_threshold: float = 0.9  # Minimum probability to skip the AI
+    min_margin: float = 0.3  # Minimum lead over the runner-up workflow
+    min_examples: int = 20  # Examples needed before deciding anything locally
+    retrain_every: int = 500  # Incremental updates before training from scratch again
+
+
+@dataclass
+class AIPreExtractionConfig:
+    """Local indicator and entity extraction run before AI content extraction"""
+    enabled: bool = True
+    redact_indicators: bool = True  # Send indicators to the AI as short references
+    skip_ai_coverage: float = 0.8  # Indicator share of the body that makes the AI call unnecessary
+    min_indicators: int = 3  # Indicators needed before skipping the AI call
 
 
 @dataclass
@@ -146,6 +172,8 @@ class AIConfig:
     confidence_thresholds: Optional[AIConfidenceThresholds] = None
     extraction_focus: Optional[AIExtractionFocusConfig] = None
     history: Optional[AIHistoryConfig] = None
+    preclassifier: Optional[AIPreclassifierConfig] = None
+    pre_extraction: Optional[AIPreExtractionConfig] = None
     
     def __post_init__(self):
         """Initialize default values after dataclass creation"""
@@ -159,6 +187,10 @@ class AIConfig:
             self.extraction_focus = AIExtractionFocusConfig()
         if self.history is None:
             self.history = AIHistoryConfig()
+        if self.preclassifier is None:
+            self.preclassifier = AIPreclassifierConfig()
+        if self.pre_extraction is None:
+            self.pre_extraction = AIPreExtractionConfig()
 
 
 @dataclass
@@ -215,6 +247,21 @@ class GitConfig:
     auto_push: bool = False
 
 
+@dataclass
+class DeduplicationConfig:
+    """Deduplication configuration"""
+    retention_days: int = 30
+    # Minimum title/snippet similarity for a near-duplicate; None disables detection
+    near_duplicate_threshold: Optional[float] = None  # Off unless configured
+    # Bloom filter next to the store so runs can skip loading it for new results
+    prefilter: bool = False
+    
+    def __post_init__(self):
+        """Validate deduplication configuration"""
+        if self.near_duplicate_threshold is not None and not 0 < self.near_duplicate_threshold <= 1:
+            raise ValueError("Near-duplicate threshold must be greater than 0 and at most 1")
+
+
 @dataclass
 class MonitorConfig:
     """Complete monitoring configuration"""
@@ -227,6 +274,61 @@ class MonitorConfig:
     log_level: str = "INFO"
     git: Optional[GitConfig] = None
     workflow: Optional[WorkflowConfig] = None
+    deduplication: Optional[DeduplicationConfig] = None
+
+
+# Parsed configurations by hash of their (substituted) YAML text, shared by
+# every component in the process; callers get deep copies
+_CONFIG_CACHE_SIZE = 8
+_config_cache: Dict[str, MonitorConfig] = {}
+_config_cache_lock = threading.Lock()
+
+
+def _cached_config(content: str, build: Callable[[], MonitorConfig]) -> MonitorConfig:
+    """
+    Return the config for some YAML text, building it only on first use
+    
+    Args:
+        content: YAML text the config is parsed from
+        build: Parses and validates ``content`` on a cache miss
+        
+    Returns:
+        A private copy of the cached MonitorConfig
+    """
+    key = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    with _config_cache_lock:
+        config = _config_cache.get(key)
+    if config is None:
+        config = build()
+        with _config_cache_lock:
+            _config_cache[key] = config
+            while len(_config_cache) > _CONFIG_CACHE_SIZE:
+                del _config_cache[next(iter(_config_cache))]
+    return copy.deepcopy(config)
+
+
+def _validate_config_data(config_data: Any) -> None:
+    """
+    Validate parsed configuration against the schema
+    
+    jsonschema is imported here rather than at module level because it is
+    slow to import and most CLI commands never reach validation.
+    
+    Raises:
+        ValueError: If the configuration doesn't match the schema
+    """
+    from jsonschema import validate, ValidationError
+    
+    try:
+        validate(instance=config_data, schema=ConfigLoader.CONFIG_SCHEMA)
+    except ValidationError as e:
+        raise ValueError(f"Configuration validation failed: {e.message}") from e
+
+
+def clear_config_cache() -> None:
+    """Forget all cached configurations"""
+    with _config_cache_lock:
+        _config_cache.clear()
 
 
 class ConfigLoader:
@@ -336,7 +438,9 @@ class ConfigLoader:
                         "properties": {
                             "branch_prefix": {"type": "string"},
                             "commit_message_template": {"type": "string"},
-                            "auto_push": {"type": "boolean"}
+                            "auto_push": {"type": "boolean"},
+                            "worktrees": {"type": "boolean"},
+                            "direct_commits": {"type": "boolean"}
                         },
                         "additionalProperties": False
                     },
@@ -353,6 +457,19 @@ class ConfigLoader:
                 "additionalProperties": False
             },
             "storage_path": {"type": "string"},
+            "deduplication": {
+                "type": "object",
+                "properties": {
+                    "retention_days": {"type": "integer", "minimum": 1},
+                    "near_duplicate_threshold": {
+                        "type": ["number", "null"],
+                        "exclusiveMinimum": 0,
+                        "maximum": 1
+                    },
+                    "prefilter": {"type": "boolean"}
+                },
+                "additionalProperties": False
+            },
             "log_level": {
                 "type": "string",
                 "enum": ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -398,6 +515,28 @@ class ConfigLoader:
                             "file_path": {"type": "string"}
                         },
                         "additionalProperties": False
+                    },
+                    "preclassifier": {
+                        "type": "object",
+                        "properties": {
+                            "enabled": {"type": "boolean"},
+                            "model_path": {"type": "string"},
+                            "decide_threshold": {"type": "number", "minimum": 0, "maximum": 1},
+                            "min_margin": {"type": "number", "minimum": 0, "maximum": 1},
+                            "min_examples": {"type": "integer", "minimum": 1},
+                            "retrain_every": {"type": "integer", "minimum": 1}
+                        },
+                        "additionalProperties": False
+                    },
+                    "pre_extraction": {
+                        "type": "object",
+                        "properties": {
+                            "enabled": {"type": "boolean"},
+                            "redact_indicators": {"type": "boolean"},
+                            "skip_ai_coverage": {"type": "number", "minimum": 0, "maximum": 1},
+                            "min_indicators": {"type": "integer", "minimum": 1}
+                        },
+                        "additionalProperties": False
                     }
                 },
                 "additionalProperties": False
@@ -411,6 +550,9 @@ class ConfigLoader:
         """
         Load and validate configuration from YAML file
         
+        Parsed configs are cached per process by file content, so repeated
+        loads of an unchanged file skip YAML parsing and schema validation.
+        
         Args:
             config_path: Path to the YAML configuration file
             
@@ -426,20 +568,22 @@ class ConfigLoader:
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        try:
-            with open(config_path, 'r', encoding='utf-8') as file:
-                config_data = yaml.safe_load(file)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML in configuration file: {e}") from e
+        with open(config_path, 'r', encoding='utf-8') as file:
+            content = file.read()
         
-        # Validate against schema
-        try:
-            validate(instance=config_data, schema=cls.CONFIG_SCHEMA)
-        except ValidationError as e:
-            raise ValueError(f"Configuration validation failed: {e.message}") from e
+        def parse() -> MonitorConfig:
+            try:
+                config_data = yaml.safe_load(content)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML in configuration file: {e}") from e
+            
+            # Validate against schema
+            _validate_config_data(config_data)
+            
+            # Convert to dataclass objects
+            return cls._build_config(config_data)
         
-        # Convert to dataclass objects
-        return cls._build_config(config_data)
+        return _cached_config(content, parse)
     
     @classmethod
     def _build_config(cls, config_data: Dict[str, Any]) -> MonitorConfig:
@@ -502,7 +646,9 @@ class ConfigLoader:
                     branch_prefix=git_data.get('branch_prefix', 'agent'),
                     commit_message_template=git_data.get('commit_message_template', 
                                                        'Agent: {workflow_name} for issue #{issue_number}'),
-                    auto_push=git_data.get('auto_push', True)
+                    auto_push=git_data.get('auto_push', True),
+                    worktrees=git_data.get('worktrees', False),
+                    direct_commits=git_data.get('direct_commits', False)
                 )
             
             # Build validation config
@@ -542,9 +688,31 @@ class ConfigLoader:
             if 'history' in ai_data:
                 history_data = ai_data['history']
                 history = AIHistoryConfig(
-                    storage_type=history_data.get('storage_type', 'gist'),
+                    storage_type=history_data.get('storage_type', 'repo_file'),
                     gist_id=history_data.get('gist_id'),
-                    file_path=history_data.get('file_path', '.github/ai_assignment_history.json')
+                    file_path=history_data.get('file_path', '.github/ai_assignment_history.jsonl')
+                )
+            
+            preclassifier = None
+            if 'preclassifier' in ai_data:
+                preclassifier_data = ai_data['preclassifier']
+                preclassifier = AIPreclassifierConfig(
+                    enabled=preclassifier_data.get('enabled', False),
+                    model_path=preclassifier_data.get('model_path', '.workflow_classifier.json'),
+                    decide_threshold=preclassifier_data.get('decide_threshold', 0.9),
+                    min_margin=preclassifier_data.get('min_margin', 0.3),
+                    min_examples=preclassifier_data.get('min_examples', 20),
+                    retrain_every=preclassifier_data.get('retrain_every', 500)
+                )
+            
+            pre_extraction = None
+            if 'pre_extraction' in ai_data:
+                pre_extraction_data = ai_data['pre_extraction']
+                pre_extraction = AIPreExtractionConfig(
+                    enabled=pre_extraction_data.get('enabled', True),
+                    redact_indicators=pre_extraction_data.get('redact_indicators', True),
+                    skip_ai_coverage=pre_extraction_data.get('skip_ai_coverage', 0.8),
+                    min_indicators=pre_extraction_data.get('min_indicators', 3)
                 )
             
             # Handle models configuration
@@ -589,9 +757,19 @@ class ConfigLoader:
                 settings=settings,
                 confidence_thresholds=confidence_thresholds,
                 extraction_focus=extraction_focus,
-                history=history
+                history=history,
+                preclassifier=preclassifier,
+                pre_extraction=pre_extraction
             )
         
+        # Build deduplication configuration
+        dedup_data = config_data.get('deduplication', {})
+        deduplication = DeduplicationConfig(
+            retention_days=dedup_data.get('retention_days', 30),
+            near_duplicate_threshold=dedup_data.get('near_duplicate_threshold'),
+            prefilter=dedup_data.get('prefilter', False)
+        )
+        
         return MonitorConfig(
             sites=sites,
             github=github,
@@ -599,7 +777,8 @@ class ConfigLoader:
             agent=agent,
             ai=ai,
             storage_path=config_data.get('storage_path', 'processed_urls.json'),
-            log_level=config_data.get('log_level', 'INFO')
+            log_level=config_data.get('log_level', 'INFO'),
+            deduplication=deduplication
         )
     
 
@@ -626,6 +805,8 @@ def load_config_with_env_substitution(config_path: str) -> MonitorConfig:
     This function allows configuration values to reference environment variables
     using the format: ${ENV_VAR_NAME} or ${ENV_VAR_NAME:default_value}
     
+    Results are cached per process like :meth:`ConfigLoader.load_config`.
+    
     Args:
         config_path: Path to the YAML configuration file
         
@@ -650,16 +831,16 @@ def load_config_with_env_substitution(config_path: str) -> MonitorConfig:
     # Substitute environment variables
     content = env_pattern.sub(replace_env_var, content)
     
-    # Parse the substituted YAML
-    try:
-        config_data = yaml.safe_load(content)
-    except yaml.YAMLError as e:
-        raise ValueError(f"Invalid YAML after environment substitution: {e}") from e
-    
-    # Validate and build config
-    try:
-        validate(instance=config_data, schema=ConfigLoader.CONFIG_SCHEMA)
-    except ValidationError as e:
-        raise ValueError(f"Configuration validation failed: {e.message}") from e
+    def parse() -> MonitorConfig:
+        try:
+            config_data = yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML after environment substitution: {e}") from e
+        
+        # Validate and build config
+        _validate_config_data(config_data)
+        
+        return ConfigLoader._build_config(config_data)
     
-    return ConfigLoader._build_config(config_data)
\ No newline at end of file
+    # Keyed by the substituted text, so changed environment values miss the cache
+    return _cached_config(content, parse)
\ No newline at end of file
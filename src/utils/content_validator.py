@@ -13,6 +13,7 @@ from datetime import datetime
 from enum import Enum
 
 from .logging_config import get_logger, log_exception
+from .tracing import current_span, traced
 
 
 class ValidationLevel(Enum):
@@ -102,6 +103,7 @@ class ContentValidator:
         # Required sections for different document types
         self.required_sections = self._get_required_sections()
     
+    @traced("content.validate")
     def validate_content(self, 
                         content: str,
                         document_type: str = "intelligence_analysis",
@@ -117,6 +119,7 @@ class ContentValidator:
         Returns:
             ValidationResult with quality metrics and issues
         """
+        current_span().set(document_type=document_type, bytes=len(content))
         try:
             self.logger.info(f"Starting validation for {document_type} document")
             
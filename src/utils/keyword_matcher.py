@@ -0,0 +1,166 @@
+"""
+Keyword Matcher
+
+Shared multi-pattern substring matcher for the keyword checks made on issue
+titles, bodies, comments and generated content.
+
+Modules register named keyword dictionaries once, at import time, with
+``register_keywords``. ``get_keyword_matcher`` compiles every registered
+dictionary into one Aho-Corasick automaton, so a scan reports the hits for all
+dictionaries in a single pass over the text. Scan cost grows with the text,
+not with the number of keywords.
+
+Matching is case-insensitive substring matching, the same as the
+``keyword in text.lower()`` checks it replaces.
+"""
+
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over named keyword dictionaries"""
+
+    def __init__(self, dictionaries: Dict[str, Sequence[str]]):
+        """
+        Compile the automaton
+
+        Args:
+            dictionaries: Dictionary name -> keywords; hits are reported in
+                the order the keywords are listed
+        """
+        self.dictionaries = {name: list(keywords) for name, keywords in dictionaries.items()}
+        # Full transition table: state -> character -> next state. Characters
+        # missing from a state's table lead back to the root.
+        self._delta: List[Dict[str, int]] = [{}]
+        # Keywords ending at each state, as (dictionary, index in dictionary)
+        self._outputs: List[Tuple[Tuple[str, int], ...]] = [()]
+        self._build()
+
+    def _build(self) -> None:
+        outputs: List[List[Tuple[str, int]]] = [[]]
+        for name, keywords in self.dictionaries.items():
+            for index, keyword in enumerate(keywords):
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                state = 0
+                for char in keyword:
+                    next_state = self._delta[state].get(char)
+                    if next_state is None:
+                        next_state = len(self._delta)
+                        self._delta[state][char] = next_state
+                        self._delta.append({})
+                        outputs.append([])
+                    state = next_state
+                outputs[state].append((name, index))
+
+        # Breadth-first, so a state's failure target is final before its children
+        fail = [0] * len(self._delta)
+        goto = [dict(edges) for edges in self._delta]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state].extend(outputs[fail[state]])
+            # Inherit the failure state's transitions, turning the trie into a DFA
+            for char, target in self._delta[fail[state]].items():
+                self._delta[state].setdefault(char, target)
+            for char, child in goto[state].items():
+                queue.append(child)
+                # Longest proper suffix of the child's prefix that is also a prefix
+                candidate = fail[state]
+                while candidate and char not in goto[candidate]:
+                    candidate = fail[candidate]
+                fail[child] = goto[candidate].get(char, 0)
+        self._outputs = [tuple(state_outputs) for state_outputs in outputs]
+
+    def scan(self, text: str, dictionaries: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """
+        Find every keyword that occurs in ``text``
+
+        Args:
+            text: Text to search
+            dictionaries: Dictionaries to report (all by default)
+
+        Returns:
+            Dictionary name -> keywords found, in dictionary order; every
+            requested dictionary is present, possibly with an empty list
+        """
+        wanted = set(self.dictionaries if dictionaries is None else dictionaries)
+        found: Dict[str, set] = {name: set() for name in wanted}
+        if text:
+            delta = self._delta
+            outputs = self._outputs
+            state = 0
+            for char in text.lower():
+                state = delta[state].get(char, 0)
+                if outputs[state]:
+                    for name, index in outputs[state]:
+                        if name in found:
+                            found[name].add(index)
+        return {
+            name: [self.dictionaries[name][index] for index in sorted(found[name])]
+            for name in wanted
+        }
+
+    def contains_any(self, text: str, dictionary: str) -> bool:
+        """
+        Whether any keyword of one dictionary occurs in ``text``
+
+        Stops at the first hit.
+
+        Args:
+            text: Text to search
+            dictionary: Dictionary name
+        """
+        if not text:
+            return False
+        delta = self._delta
+        outputs = self._outputs
+        state = 0
+        for char in text.lower():
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                for name, _ in outputs[state]:
+                    if name == dictionary:
+                        return True
+        return False
+
+
+_dictionaries: Dict[str, Tuple[str, ...]] = {}
+_shared_matcher: Optional[KeywordMatcher] = None
+_shared_matcher_lock = threading.Lock()
+
+
+def register_keywords(name: str, keywords: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Add a named dictionary to the shared matcher
+
+    Args:
+        name: Dictionary name, e.g. ``specialist.osint``
+        keywords: Keywords, matched case-insensitively as substrings
+
+    Returns:
+        The keywords, for use as the caller's constant
+    """
+    global _shared_matcher
+    keywords = tuple(keywords)
+    with _shared_matcher_lock:
+        if _dictionaries.get(name) != keywords:
+            _dictionaries[name] = keywords
+            # Rebuilt with the new dictionary on next use
+            _shared_matcher = None
+    return keywords
+
+
+def get_keyword_matcher() -> KeywordMatcher:
+    """Matcher over every registered dictionary, shared by the whole process"""
+    global _shared_matcher
+    matcher = _shared_matcher
+    if matcher is None:
+        with _shared_matcher_lock:
+            if _shared_matcher is None:
+                _shared_matcher = KeywordMatcher(_dictionaries)
+            matcher = _shared_matcher
+    return matcher
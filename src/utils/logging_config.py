@@ -3,13 +3,20 @@ Logging Configuration Module
 
 Provides centralized logging configuration for the Speculum Principum application.
 This simplified version maintains all the functionality while removing unused complexity.
+
+In queue mode, loggers only put records on an in-memory queue and a background
+listener thread formats them and writes them to the console and log file, so
+worker threads never block on log I/O.
 """
 
+import atexit
+import itertools
 import logging
 import logging.handlers
+import queue
 import sys
 import os
-from typing import Optional
+from typing import Any, Callable, List, Optional
 from pathlib import Path
 
 
@@ -40,6 +47,54 @@ DEFAULT_COMPONENT_LEVELS = {
 # Global state to track if logging has been configured
 _logging_configured = False
 
+# Background thread writing queued records in queue mode
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_shutdown_registered = False
+
+
+class LazyFormat:
+    """
+    Log argument that is only computed if the record is actually emitted.
+    
+    Pass it as a ``%s`` argument instead of formatting an expensive payload
+    into an f-string; records dropped by level, filters or sampling never
+    call ``func``.
+    """
+    
+    __slots__ = ('func', 'args', 'kwargs')
+    
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+    
+    def __str__(self) -> str:
+        return str(self.func(*self.args, **self.kwargs))
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps one in every ``1 / rate`` records at or below ``max_level``."""
+    
+    def __init__(self, rate: float, max_level: int = logging.DEBUG):
+        """
+        Initialize the filter.
+        
+        Args:
+            rate: Fraction of records to keep, greater than 0 and at most 1
+            max_level: Records above this level are always kept
+        """
+        if not 0 < rate <= 1:
+            raise ValueError("Sample rate must be greater than 0 and at most 1")
+        super().__init__()
+        self.interval = max(round(1 / rate), 1)
+        self.max_level = max_level
+        self._counter = itertools.count()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        return next(self._counter) % self.interval == 0
+
 
 def _get_default_log_file() -> str:
     """Determine default log file path based on environment."""
@@ -63,7 +118,8 @@ def _create_console_handler(log_level: int) -> Optional[logging.Handler]:
     return console_handler
 
 
-def _create_file_handler(log_file: str, enable_rotation: bool = True) -> Optional[logging.Handler]:
+def _create_file_handler(log_file: str, enable_rotation: bool = True,
+                         log_level: int = logging.DEBUG) -> Optional[logging.Handler]:
     """Create and configure file handler."""
     # Ensure log directory exists
     log_path = Path(log_file)
@@ -79,7 +135,7 @@ def _create_file_handler(log_file: str, enable_rotation: bool = True) -> Optiona
     else:
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
     
-    file_handler.setLevel(logging.DEBUG)
+    file_handler.setLevel(log_level)
     
     file_formatter = logging.Formatter(
         DETAILED_FORMAT,
@@ -101,7 +157,10 @@ def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
     enable_console: bool = True,
-    enable_file_rotation: bool = True
+    enable_file_rotation: bool = True,
+    file_log_level: Optional[str] = None,
+    use_queue: bool = False,
+    debug_sample_rate: float = 1.0
 ) -> bool:
     """
     Set up global logging configuration.
@@ -111,11 +170,14 @@ def setup_logging(
         log_file: Path to log file (if None, uses default based on environment)
         enable_console: Whether to enable console logging
         enable_file_rotation: Whether to use rotating file handler
+        file_log_level: Log level of the file handler (defaults to ``log_level``)
+        use_queue: Whether to hand records to a background thread for formatting and I/O
+        debug_sample_rate: Fraction of DEBUG records to keep
         
     Returns:
         True if logging was successfully configured
     """
-    global _logging_configured
+    global _logging_configured, _queue_listener, _shutdown_registered
     
     if _logging_configured:
         return True
@@ -125,29 +187,46 @@ def setup_logging(
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
-    # Set root logger level
-    root_logger.setLevel(logging.DEBUG)
-    
-    # Convert log level string to logging constant
+    # Convert log level strings to logging constants
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    file_level = getattr(logging, (file_log_level or log_level).upper(), numeric_level)
+    
+    handlers: List[logging.Handler] = []
     
     # Create console handler if requested
     if enable_console:
         console_handler = _create_console_handler(numeric_level)
         if console_handler:
-            root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
     
     # Create file handler if log file is specified
     if log_file:
-        file_handler = _create_file_handler(log_file, enable_file_rotation)
+        file_handler = _create_file_handler(log_file, enable_file_rotation, file_level)
         if file_handler:
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
     elif log_file is None:
         # Use default log file
         default_file = _get_default_log_file()
-        file_handler = _create_file_handler(default_file, enable_file_rotation)
+        file_handler = _create_file_handler(default_file, enable_file_rotation, file_level)
         if file_handler:
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
+    
+    # Records below every handler's level are discarded before they are created
+    root_logger.setLevel(min((handler.level for handler in handlers), default=numeric_level))
+    
+    if use_queue and handlers:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        if not _shutdown_registered:
+            atexit.register(shutdown_logging)
+            _shutdown_registered = True
+        handlers = [logging.handlers.QueueHandler(log_queue)]
+    
+    for handler in handlers:
+        if debug_sample_rate < 1:
+            handler.addFilter(SamplingFilter(debug_sample_rate))
+        root_logger.addHandler(handler)
     
     # Configure component-specific loggers
     _configure_component_loggers()
@@ -163,6 +242,29 @@ def setup_logging(
     return True
 
 
+def shutdown_logging() -> None:
+    """
+    Flush queued records and remove the handlers installed by setup_logging.
+    
+    The next setup_logging or get_logger call configures logging again.
+    """
+    global _logging_configured, _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        handlers = list(_queue_listener.handlers)
+        _queue_listener = None
+    else:
+        handlers = []
+    
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:] + handlers:
+        root_logger.removeHandler(handler)
+        handler.close()
+    
+    _logging_configured = False
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger with the global configuration.
@@ -0,0 +1,444 @@
+"""
+Metrics
+
+A small Prometheus-compatible metrics registry for long-running
+deployments. Components record counters, gauges and histograms (queries
+spent, cache hits, AI latency and tokens, issues processed, queue depth, git
+operations, ...) into a process-wide registry, which renders them in the
+Prometheus text exposition format.
+
+The registry can be exposed two ways:
+
+- ``start_http_server`` serves ``/metrics`` on a local port for scraping
+- ``write_textfile`` writes a file for the node exporter's textfile collector
+
+``main.py`` enables these with ``SPECULUM_METRICS_PORT`` and
+``SPECULUM_METRICS_FILE``.
+"""
+
+import atexit
+import math
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .logging_config import get_logger
+from .tracing import Span, Tracer, get_tracer
+
+
+logger = get_logger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds; covers fast local stages up to slow AI completions and pushes
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if math.isnan(value):
+        return 'NaN'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+class Metric:
+    """Base class for a named metric with optional labels"""
+
+    type_name = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Initialize the metric
+
+        Args:
+            name: Metric name, e.g. ``speculum_search_queries_total``
+            documentation: Help text shown in the exposition
+            labelnames: Names of the labels every sample must carry
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {list(self.labelnames)}, got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:
+        """Yield (sample name, label names, label values, value)"""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Exposition lines for this metric"""
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for sample_name, names, values, value in self.samples():
+            lines.append(f"{sample_name}{_format_labels(names, values)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing count"""
+
+    type_name = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: object) -> None:
+        """
+        Increase the count
+
+        Args:
+            amount: Non-negative increment
+            **labels: Label values
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield self.name, self.labelnames, key, value
+
+
+class Gauge(Metric):
+    """Value that can go up and down, or be read from a callback"""
+
+    type_name = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """
+        Read the value from ``function`` at collection time
+
+        Only for gauges without labels.
+
+        Args:
+            function: Returns the current value
+        """
+        if self.labelnames:
+            raise ValueError(f"Gauge {self.name} has labels; set values explicitly")
+        self._function = function
+
+    def value(self, **labels: object) -> float:
+        if self._function is not None:
+            return self._function()
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        if self._function is not None:
+            try:
+                value = float(self._function())
+            except Exception as e:
+                logger.debug(f"Gauge {self.name} callback failed: {e}")
+                return
+            yield self.name, (), (), value
+            return
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield self.name, self.labelnames, key, value
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets"""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the histogram
+
+        Args:
+            name: Metric name, e.g. ``speculum_ai_request_seconds``
+            documentation: Help text shown in the exposition
+            labelnames: Names of the labels every sample must carry
+            buckets: Upper bounds, in increasing order; ``+Inf`` is added
+        """
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(bound) for bound in buckets)
+        if not bounds or not math.isinf(bounds[-1]):
+            bounds.append(math.inf)
+        self.buckets = tuple(bounds)
+        # Label values -> (per-bucket counts, sum, count)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._values[key] = (counts, total + value, count + 1)
+
+    def count(self, **labels: object) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def sum(self, **labels: object) -> float:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+        return entry[1] if entry else 0.0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, (list(counts), total, count))
+                           for key, (counts, total, count) in self._values.items())
+        bucket_labels = self.labelnames + ('le',)
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket", bucket_labels, key + (_format_value(bound),), cumulative
+            yield f"{self.name}_sum", self.labelnames, key, total
+            yield f"{self.name}_count", self.labelnames, key, count
+
+
+class MetricsRegistry:
+    """Named metrics rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered with a different type or labels")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter"""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge"""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Get or create a histogram"""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[Metric]:
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+_shared_registry: Optional[MetricsRegistry] = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_registry() -> MetricsRegistry:
+    """Registry shared by every component in the process"""
+    global _shared_registry
+    if _shared_registry is None:
+        with _shared_registry_lock:
+            if _shared_registry is None:
+                _shared_registry = MetricsRegistry()
+    return _shared_registry
+
+
+def write_textfile(path: Union[str, Path], registry: Optional[MetricsRegistry] = None) -> None:
+    """
+    Write metrics for the node exporter's textfile collector
+
+    The file is replaced atomically so the collector never reads a partial
+    file.
+
+    Args:
+        path: Output ``.prom`` file
+        registry: Registry to render (defaults to the shared registry)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = (registry or get_registry()).render()
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            file.write(content)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def write_textfile_on_exit(path: Union[str, Path]) -> None:
+    """Write the shared registry to ``path`` when the process exits"""
+    atexit.register(write_textfile, path)
+
+
+class MetricsServer:
+    """Serves ``/metrics`` from a background thread"""
+
+    def __init__(self, port: int, host: str = '127.0.0.1', registry: Optional[MetricsRegistry] = None):
+        """
+        Start serving
+
+        Args:
+            port: Port to listen on (0 picks a free port)
+            host: Interface to bind; local only by default
+            registry: Registry to serve (defaults to the shared registry)
+        """
+        # Imported here: only long-running deployments serve metrics
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = registry or get_registry()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("Metrics request: " + format, *args)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name='metrics-server', daemon=True)
+        self._thread.start()
+        logger.info(f"Serving metrics on http://{host}:{self.port}/metrics")
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+def start_http_server(port: int, host: str = '127.0.0.1') -> MetricsServer:
+    """Serve the shared registry on ``http://host:port/metrics``"""
+    return MetricsServer(port, host)
+
+
+def record_stage_durations(tracer: Optional[Tracer] = None,
+                           registry: Optional[MetricsRegistry] = None) -> None:
+    """
+    Feed every finished tracing span into per-stage metrics
+
+    Each span adds to ``speculum_stage_duration_seconds{stage=...}``, and
+    spans that raised to ``speculum_stage_errors_total``, so git operations,
+    template renders and the other traced stages need no metrics code of
+    their own.
+
+    Args:
+        tracer: Tracer to listen to (defaults to the shared tracer)
+        registry: Registry to record into (defaults to the shared registry)
+    """
+    registry = registry or get_registry()
+    durations = registry.histogram(
+        'speculum_stage_duration_seconds', "Duration of traced pipeline stages", ['stage']
+    )
+    errors = registry.counter(
+        'speculum_stage_errors_total', "Traced pipeline stages that raised", ['stage']
+    )
+
+    def observe(span: Span) -> None:
+        durations.observe(span.duration_ms / 1000, stage=span.name)
+        if 'error' in span.attributes:
+            errors.inc(stage=span.name)
+
+    (tracer or get_tracer()).add_listener(observe)
+
+
+def setup_metrics(port: Optional[Union[int, str]] = None,
+                  textfile: Optional[Union[str, Path]] = None) -> Optional[MetricsServer]:
+    """
+    Expose the shared registry
+
+    Does nothing unless a port or textfile is given, so one-shot runs pay
+    nothing for per-stage metrics they never export.
+
+    Args:
+        port: Serve ``/metrics`` on this local port
+        textfile: Write a textfile-collector file here when the process exits
+
+    Returns:
+        The metrics server, if one was started
+    """
+    if not port and not textfile:
+        return None
+    record_stage_durations()
+    if textfile:
+        write_textfile_on_exit(textfile)
+    return start_http_server(int(port)) if port else None
@@ -0,0 +1,233 @@
+"""
+Pattern Extractor
+
+Deterministic extraction of indicators and simple entities from issue text,
+run before any AI extraction.
+
+All patterns are compiled into one alternation, so a single ``finditer`` pass
+over the text finds every URL, email address, IPv4 address, domain, file hash,
+CVE ID, date, money amount and suffixed organization name (``Acme Corp``).
+Where patterns overlap, the earlier kind in the alternation wins: a domain
+inside a URL or an email address is reported as part of that URL or address.
+Common defanging (``hxxp://``, ``evil[.]com``) is undone in reported values.
+
+Indicators can be replaced in the text by short references such as
+``[IOC-3]`` (see ``LocalExtraction.redact``), which keeps long values such as
+hashes and URLs out of AI prompts; ``LocalExtraction.resolve`` maps the
+references in a model's answer back to the values.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# Kinds that are indicators (IOCs); the rest are entities
+INDICATOR_KINDS = ('url', 'email', 'ipv4', 'domain', 'sha256', 'sha1', 'md5', 'cve')
+ENTITY_KINDS = ('organization', 'date', 'money')
+
+ORGANIZATION_SUFFIXES = (
+    'Inc', 'Corp', 'Corporation', 'Company', 'Co', 'LLC', 'Ltd', 'Limited', 'GmbH',
+    'PLC', 'LLP', 'AG', 'Agency', 'Department', 'Division', 'Group', 'Holdings',
+)
+
+# File extensions that look like top-level domains in text such as "config.yaml"
+_FILE_EXTENSIONS = frozenset({
+    'bat', 'cfg', 'csv', 'dll', 'doc', 'docx', 'exe', 'gif', 'gz', 'htm', 'html', 'ini',
+    'jpeg', 'jpg', 'js', 'json', 'log', 'md', 'pdf', 'png', 'ps1', 'py', 'sh', 'tar',
+    'toml', 'ts', 'txt', 'xml', 'yaml', 'yml', 'zip',
+})
+
+_DOT = r'(?:\.|\[\.\]|\(\.\))'
+_LABEL = r'[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?'
+_HOST = rf'(?:{_LABEL}{_DOT})+[a-z]{{2,24}}'
+_OCTET = r'(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
+_MONTH = (r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+          r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)')
+_AMOUNT = r'\d[\d,]*(?:\.\d+)?'
+_SCALE = r'(?:\s?(?:million|billion|trillion|thousand|bn|[kmb])\b)'
+_NAME_WORD = r"[A-Z][\w&'-]*"
+
+# Every kind starts at a word boundary; the leading lookbehind rejects
+# mid-word positions before any alternative is tried
+_PATTERN = re.compile(r'(?<!\w)(?:' + '|'.join([
+    rf'(?P<url>\b(?:https?|hxxps?|ftp)(?::\/\/|\[:\/\/\])[^\s<>"\'`]+)',
+    rf'(?P<email>\b[a-z0-9._%+-]+@{_HOST}\b)',
+    r'(?P<cve>\bcve-\d{4}-\d{4,7}\b)',
+    r'(?P<sha256>\b[a-f0-9]{64}\b)',
+    r'(?P<sha1>\b[a-f0-9]{40}\b)',
+    r'(?P<md5>\b[a-f0-9]{32}\b)',
+    r'(?P<date>\b\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])'
+    r'(?:[t ]\d{2}:\d{2}(?::\d{2})?(?:z|[+-]\d{2}:?\d{2})?)?\b'
+    r'|\b\d{1,2}/\d{1,2}/\d{4}\b'
+    rf'|\b{_MONTH}\.?\s+\d{{1,2}}(?:st|nd|rd|th)?,?\s+\d{{4}}\b'
+    rf'|\b\d{{1,2}}(?:st|nd|rd|th)?\s+{_MONTH}\.?,?\s+\d{{4}}\b)',
+    rf'(?P<ipv4>(?<![\w.]){_OCTET}(?:{_DOT}{_OCTET}){{3}}(?!\.?\d))',
+    rf'(?P<domain>\b{_HOST}\b)',
+    rf'(?P<money>(?:[$€£¥]\s?|\b(?:usd|eur|gbp)\s?){_AMOUNT}{_SCALE}?'
+    rf'|\b{_AMOUNT}{_SCALE}?\s?(?:usd|eur|gbp|dollars|euros|pounds)\b)',
+    # Names are matched case-sensitively so lowercase words are not swept in
+    rf'(?P<organization>(?-i:\b{_NAME_WORD}(?:\s+(?:&\s+)?{_NAME_WORD}){{0,4}},?\s+'
+    rf'(?:{"|".join(ORGANIZATION_SUFFIXES)})\b))',
+]) + ')', re.IGNORECASE)
+
+_REFERENCE = re.compile(r'\[IOC-(\d+)\]')
+_WORD_CHARACTER = re.compile(r'\w')
+_NUMERIC_HOST = re.compile(r'[\d.]+')
+_URL_TRAILING = '.,;:!?)]\'"'
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """One occurrence of an extracted value"""
+    kind: str
+    value: str
+    start: int
+    end: int
+
+
+@dataclass
+class LocalExtraction:
+    """Everything the patterns found in one text"""
+    text: str
+    matches: List[PatternMatch] = field(default_factory=list)
+
+    def values(self, kind: str) -> List[str]:
+        """Distinct values of one kind, in order of first occurrence"""
+        return list(dict.fromkeys(match.value for match in self.matches if match.kind == kind))
+
+    def by_kind(self) -> Dict[str, List[str]]:
+        """Distinct values for every kind that was found"""
+        found: Dict[str, Dict[str, None]] = {}
+        for match in self.matches:
+            found.setdefault(match.kind, {})[match.value] = None
+        return {kind: list(values) for kind, values in found.items()}
+
+    @property
+    def indicators(self) -> List[Tuple[str, str]]:
+        """Distinct (kind, value) indicators, in order of first occurrence"""
+        return list(dict.fromkeys(
+            (match.kind, match.value) for match in self.matches if match.kind in INDICATOR_KINDS))
+
+    def indicator_coverage(self, start: int = 0) -> float:
+        """
+        Share of the text's word characters that belong to indicators
+
+        Args:
+            start: Offset to measure from, e.g. to skip a title
+
+        Returns:
+            0.0-1.0; close to 1.0 when the text is little more than an indicator list
+        """
+        total = len(_WORD_CHARACTER.findall(self.text, start))
+        if not total:
+            return 0.0
+        covered = 0
+        position = start
+        for match in self.matches:
+            # A URL's host shares the URL's span
+            if match.kind in INDICATOR_KINDS and match.end > position:
+                covered += len(_WORD_CHARACTER.findall(self.text, max(match.start, position), match.end))
+                position = match.end
+        return covered / total
+
+    def references(self) -> Dict[str, Tuple[str, str]]:
+        """Reference -> (kind, value) for every indicator, as used by ``redact``"""
+        return {f'[IOC-{number}]': indicator
+                for number, indicator in enumerate(self.indicators, start=1)}
+
+    def redact(self, start: int = 0) -> str:
+        """
+        The text from ``start`` with each indicator replaced by its reference
+
+        Args:
+            start: Offset to redact from
+
+        Returns:
+            Redacted text
+        """
+        numbers = {indicator: number for number, indicator in enumerate(self.indicators, start=1)}
+        parts = []
+        position = start
+        for match in self.matches:
+            if match.kind not in INDICATOR_KINDS or match.start < position:
+                continue
+            parts.append(self.text[position:match.start])
+            parts.append(f'[IOC-{numbers[(match.kind, match.value)]}]')
+            position = match.end
+        parts.append(self.text[position:])
+        return ''.join(parts)
+
+    def resolve(self, text: Optional[str]) -> Optional[str]:
+        """Replace indicator references in ``text`` with their values"""
+        if not text or '[IOC-' not in text:
+            return text
+        indicators = self.indicators
+
+        def value(reference: re.Match) -> str:
+            number = int(reference.group(1))
+            if 1 <= number <= len(indicators):
+                return indicators[number - 1][1]
+            return reference.group(0)
+
+        return _REFERENCE.sub(value, text)
+
+
+def extract_patterns(text: Optional[str]) -> LocalExtraction:
+    """
+    Extract indicators and entities from text in one pass
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        The matches, in text order
+    """
+    text = text or ''
+    extraction = LocalExtraction(text=text)
+    for found in _PATTERN.finditer(text):
+        kind = found.lastgroup
+        start, end = found.span()
+        value = found.group()
+        if kind == 'url':
+            stripped = value.rstrip(_URL_TRAILING)
+            end -= len(value) - len(stripped)
+            value = _refang(stripped)
+        elif kind in ('domain', 'email'):
+            value = _refang(value).lower()
+            if kind == 'domain' and value.rsplit('.', 1)[-1] in _FILE_EXTENSIONS:
+                continue
+        elif kind == 'ipv4':
+            value = _refang(value)
+        elif kind in ('sha256', 'sha1', 'md5'):
+            value = value.lower()
+        elif kind == 'cve':
+            value = value.upper()
+        else:
+            value = ' '.join(value.split())
+        extraction.matches.append(PatternMatch(kind, value, start, end))
+        if kind == 'url':
+            host = _url_host(value)
+            if host:
+                # The URL's host is also a domain worth researching
+                extraction.matches.append(PatternMatch('domain', host, start, end))
+    return extraction
+
+
+def _refang(value: str) -> str:
+    for defanged, plain in (('[.]', '.'), ('(.)', '.'), ('[://]', '://')):
+        value = value.replace(defanged, plain)
+    if value[:4].lower() == 'hxxp':
+        value = 'http' + value[4:]
+    return value
+
+
+def _url_host(url: str) -> Optional[str]:
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        return None
+    if not host or _NUMERIC_HOST.fullmatch(host):
+        return None
+    return host
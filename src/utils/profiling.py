@@ -0,0 +1,374 @@
+"""
+Profiling
+
+Captures where a CLI run spends CPU time and memory, for runs that are slow
+or memory-hungry:
+
+- cProfile statistics (``.pstats``), for ``python -m pstats`` or snakeviz
+- sampled stacks from every thread in collapsed format (``.collapsed``), for
+  flamegraph.pl, speedscope or inferno
+- the top allocation sites from ``tracemalloc`` (``.allocations.txt``)
+- per-scope attribution (``.scopes.json``): wall time, thread CPU time and
+  samples for each labelled scope, e.g. each issue of a batch
+
+``main.py --profile <command>`` profiles a whole subcommand. Code marks the
+work it does for one item with ``profile_scope``, which costs nothing when no
+profile is being captured.
+"""
+
+import atexit
+import json
+import sys
+import threading
+import time
+from collections import Counter as CounterDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+DEFAULT_SAMPLE_INTERVAL_MS = 10.0
+DEFAULT_TOP_N = 25
+
+
+@dataclass
+class ScopeStats:
+    """Time attributed to one labelled scope"""
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    samples: int = 0
+    top_frames: List[str] = field(default_factory=list)
+
+
+def _frame_name(frame) -> str:
+    module = frame.f_globals.get('__name__', '?')
+    return f"{module}:{frame.f_code.co_name}"
+
+
+class StackSampler:
+    """Samples the stacks of all threads on a fixed interval"""
+
+    def __init__(self, interval_seconds: float, labels: Dict[int, str]):
+        """
+        Initialize the sampler
+
+        Args:
+            interval_seconds: Time between samples
+            labels: Thread id -> scope label, read at sampling time
+        """
+        self.interval_seconds = interval_seconds
+        self.labels = labels
+        self.stacks: CounterDict = CounterDict()
+        self.leaf_frames: Dict[str, CounterDict] = {}
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval_seconds):
+            frames = sys._current_frames()
+            if len(names) != threading.active_count():
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in frames.items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_name(frame))
+                    frame = frame.f_back
+                if not stack:
+                    continue
+                label = self.labels.get(thread_id)
+                root = label or names.get(thread_id, f"thread-{thread_id}")
+                self.stacks[';'.join([root.replace(' ', '_')] + stack[::-1])] += 1
+                if label:
+                    self.leaf_frames.setdefault(label, CounterDict())[stack[0]] += 1
+            self.samples += 1
+
+    def write_collapsed(self, path: Path) -> None:
+        """Write ``stack count`` lines for flame graph tools"""
+        with open(path, 'w', encoding='utf-8') as file:
+            for stack, count in sorted(self.stacks.items()):
+                file.write(f"{stack} {count}\n")
+
+
+class ProfileSession:
+    """CPU and memory profile of one run"""
+
+    def __init__(self,
+                 output_dir: Union[str, Path] = 'profiles',
+                 name: str = 'profile',
+                 sample_interval_ms: float = DEFAULT_SAMPLE_INTERVAL_MS,
+                 trace_memory: bool = True,
+                 memory_frames: int = 10,
+                 top_n: int = DEFAULT_TOP_N):
+        """
+        Initialize the session
+
+        Args:
+            output_dir: Directory the profile files are written to on exit
+            name: File name stem for the profile files
+            sample_interval_ms: Stack sampling interval; 0 disables sampling
+            trace_memory: Whether to trace allocations with tracemalloc
+            memory_frames: Frames stored per traced allocation
+            top_n: Entries in the allocation report
+        """
+        self.output_dir = Path(output_dir)
+        self.name = name
+        self.sample_interval_ms = sample_interval_ms
+        self.trace_memory = trace_memory
+        self.memory_frames = memory_frames
+        self.top_n = top_n
+
+        self.scopes: Dict[str, ScopeStats] = {}
+        self.written: Dict[str, str] = {}
+        self._labels: Dict[int, str] = {}
+        self._profiles: List[Any] = []
+        self._profile = None
+        self._sampler: Optional[StackSampler] = None
+        self._started_tracemalloc = False
+        self._main_thread_id = 0
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start capturing; the calling thread is profiled by cProfile"""
+        global _active_session
+        import cProfile
+        import tracemalloc
+
+        with _active_session_lock:
+            if _active_session is not None:
+                raise RuntimeError("A profile session is already running")
+            _active_session = self
+
+        self._main_thread_id = threading.get_ident()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start(self.memory_frames)
+            self._started_tracemalloc = True
+        if self.sample_interval_ms > 0:
+            self._sampler = StackSampler(self.sample_interval_ms / 1000, self._labels)
+            self._sampler.start()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def stop(self) -> None:
+        """Stop capturing, keeping the collected data for ``write``"""
+        global _active_session
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+        with _active_session_lock:
+            if _active_session is self:
+                _active_session = None
+
+    def __enter__(self) -> 'ProfileSession':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+        try:
+            self.written = self.write(self.output_dir, self.name)
+            logger.info(f"Profile written to {self.output_dir} ({', '.join(self.written)})")
+        finally:
+            if self._started_tracemalloc:
+                import tracemalloc
+                tracemalloc.stop()
+
+    @contextmanager
+    def scope(self, label: str) -> Iterator[None]:
+        """
+        Attribute the enclosed work on this thread to ``label``
+
+        Worker threads get their own cProfile profiler for the duration of
+        the outermost scope, merged into the session's statistics.
+
+        Args:
+            label: Scope label, e.g. ``issue-123``
+        """
+        thread_id = threading.get_ident()
+        outer_label = self._labels.get(thread_id)
+        self._labels[thread_id] = label
+        profile = None
+        if outer_label is None and thread_id != self._main_thread_id:
+            import cProfile
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Python 3.12+ allows one cProfile profiler per process;
+                # the stack sampler still covers this thread
+                profile = None
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            if profile is not None:
+                profile.disable()
+            if outer_label is None:
+                del self._labels[thread_id]
+            else:
+                self._labels[thread_id] = outer_label
+            with self._lock:
+                stats = self.scopes.setdefault(label, ScopeStats())
+                stats.calls += 1
+                stats.wall_seconds += wall
+                stats.cpu_seconds += cpu
+                if profile is not None:
+                    self._profiles.append(profile)
+
+    def scope_report(self) -> Dict[str, Dict[str, Any]]:
+        """Per-scope attribution, including each scope's hottest sampled frames"""
+        with self._lock:
+            scopes = {label: ScopeStats(**asdict(stats)) for label, stats in self.scopes.items()}
+        if self._sampler is not None:
+            for label, stats in scopes.items():
+                leaves = self._sampler.leaf_frames.get(label, CounterDict())
+                stats.samples = sum(leaves.values())
+                stats.top_frames = [f"{frame} ({count})" for frame, count in leaves.most_common(5)]
+        return {
+            label: {**asdict(stats),
+                    'wall_seconds': round(stats.wall_seconds, 6),
+                    'cpu_seconds': round(stats.cpu_seconds, 6)}
+            for label, stats in sorted(scopes.items(), key=lambda item: -item[1].wall_seconds)
+        }
+
+    def write(self, directory: Union[str, Path], stem: str) -> Dict[str, str]:
+        """
+        Write everything captured so far
+
+        Args:
+            directory: Output directory
+            stem: File name stem
+
+        Returns:
+            Kind of output -> file path
+        """
+        import pstats
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths: Dict[str, str] = {}
+
+        # Snapshot memory first so the report leaves out building the others
+        allocations = self._allocation_report()
+        if allocations is not None:
+            path = directory / f"{stem}.allocations.txt"
+            path.write_text(allocations, encoding='utf-8')
+            paths['allocations'] = str(path)
+
+        stats = None
+        if self._profile is not None:
+            # create_stats() disables the profiler; resume it if still running
+            running = _active_session is self and threading.get_ident() == self._main_thread_id
+            stats = pstats.Stats(self._profile)
+            if running:
+                self._profile.enable()
+        with self._lock:
+            profiles = list(self._profiles)
+        for profile in profiles:
+            stats = stats.add(profile) if stats is not None else pstats.Stats(profile)
+        if stats is not None:
+            path = directory / f"{stem}.pstats"
+            stats.dump_stats(str(path))
+            paths['pstats'] = str(path)
+
+        if self._sampler is not None:
+            path = directory / f"{stem}.collapsed"
+            self._sampler.write_collapsed(path)
+            paths['collapsed_stacks'] = str(path)
+
+        path = directory / f"{stem}.scopes.json"
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.scope_report(), file, indent=2)
+        paths['scopes'] = str(path)
+        return paths
+
+    def _allocation_report(self) -> Optional[str]:
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+            tracemalloc.Filter(False, '<unknown>'),
+        ))
+        lines = [
+            f"Traced memory: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB",
+            "",
+            f"Top {self.top_n} allocation sites by size:",
+        ]
+        for index, stat in enumerate(snapshot.statistics('lineno')[:self.top_n], 1):
+            frame = stat.traceback[0]
+            lines.append(
+                f"{index:>3}. {frame.filename}:{frame.lineno}: "
+                f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+            )
+        return '\n'.join(lines) + '\n'
+
+
+_active_session: Optional[ProfileSession] = None
+_active_session_lock = threading.Lock()
+
+
+def active_session() -> Optional[ProfileSession]:
+    """The running profile session, if any"""
+    return _active_session
+
+
+@contextmanager
+def profile_scope(label: str) -> Iterator[None]:
+    """Attribute the enclosed work to ``label`` in the running session, if any"""
+    session = _active_session
+    if session is None:
+        yield
+        return
+    with session.scope(label):
+        yield
+
+
+def profile_until_exit(output_dir: Union[str, Path], name: str,
+                       sample_interval_ms: float = DEFAULT_SAMPLE_INTERVAL_MS) -> ProfileSession:
+    """
+    Profile from now until the process exits, then write the profile files
+
+    Args:
+        output_dir: Directory for the profile files
+        name: File name stem
+        sample_interval_ms: Stack sampling interval; 0 disables sampling
+
+    Returns:
+        The running session
+    """
+    session = ProfileSession(output_dir, name, sample_interval_ms=sample_interval_ms)
+    session.start()
+
+    def finish() -> None:
+        session.__exit__(None, None, None)
+        for kind, path in session.written.items():
+            print(f"Profile {kind}: {path}", file=sys.stderr)
+
+    atexit.register(finish)
+    return session
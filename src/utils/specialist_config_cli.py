@@ -15,10 +15,6 @@ from ..workflow.specialist_workflow_config import (
     SpecialistWorkflowConfigManager,
     SpecialistType
 )
-from ..workflow.specialist_registry import (
-    SpecialistWorkflowRegistry,
-    SpecialistAssignment
-)
 from ..utils.logging_config import get_logger, log_exception
 from .cli_helpers import ProgressReporter
 
@@ -277,6 +273,7 @@ def _handle_show_stats(args) -> int:
         print_info("Gathering specialist configuration statistics...")
         
         # Initialize registry
+        from ..workflow.specialist_registry import SpecialistWorkflowRegistry
         registry = SpecialistWorkflowRegistry(args.config)
         registry.initialize()
         
@@ -359,6 +356,7 @@ def _handle_test_assignment(args) -> int:
             print_info(f"Content: {args.content[:100]}...")
         
         # Initialize registry
+        from ..workflow.specialist_registry import SpecialistWorkflowRegistry
         registry = SpecialistWorkflowRegistry(args.config)
         registry.initialize()
         
@@ -0,0 +1,308 @@
+"""
+Tracing
+
+Lightweight spans that show where time goes inside the monitor → process →
+deliver pipeline. A span times one stage (a search query, a GitHub fetch, an
+AI completion, a template render, a git commit, ...) and carries attributes
+such as the issue number, model, token counts or bytes written. Spans nest
+through context variables, and finished spans are kept in a bounded
+in-memory buffer.
+
+Spans can be exported as JSON lines or as a Chrome trace (open it in
+``chrome://tracing`` or https://ui.perfetto.dev), and summarized into
+per-stage percentiles. Set ``SPECULUM_TRACE_FILE`` to write the process's
+spans when it exits.
+"""
+
+import atexit
+import functools
+import itertools
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, TypeVar, Union
+
+
+DEFAULT_MAX_SPANS = 20000
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """One timed stage"""
+    name: str
+    span_id: int
+    parent_id: Optional[int]
+    thread_id: int
+    start_ns: int
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def set(self, **attributes: Any) -> 'Span':
+        """Add or replace attributes"""
+        self.attributes.update(attributes)
+        return self
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def to_dict(self, epoch_ns: int = 0) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'thread_id': self.thread_id,
+            'start_ms': (self.start_ns - epoch_ns) / 1e6,
+            'duration_ms': self.duration_ms,
+            'attributes': self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Stands in for a span while tracing is disabled"""
+
+    def set(self, **attributes: Any) -> '_NoopSpan':
+        return self
+
+
+_NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar('speculum_current_span', default=None)
+
+
+class Tracer:
+    """Records spans into a bounded buffer"""
+
+    def __init__(self, max_spans: int = DEFAULT_MAX_SPANS, enabled: bool = True):
+        """
+        Initialize the tracer
+
+        Args:
+            max_spans: Finished spans kept in memory; older ones are dropped
+            enabled: Whether spans are recorded at all
+        """
+        self.enabled = enabled
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._finished = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Span], None]] = []
+        # Span times are exported relative to this, next to its wall-clock time
+        self.epoch_ns = time.perf_counter_ns()
+        self.epoch_time = time.time()
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Union[Span, _NoopSpan]]:
+        """
+        Time the enclosed block as a child of the current span
+
+        Args:
+            name: Stage name, e.g. ``github.fetch``
+            **attributes: Initial attributes
+
+        Yields:
+            The span, to add attributes while it runs
+        """
+        if not self.enabled:
+            yield _NOOP_SPAN
+            return
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent else None,
+            thread_id=threading.get_ident(),
+            start_ns=time.perf_counter_ns(),
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.attributes['error'] = type(e).__name__
+            raise
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            _current_span.reset(token)
+            with self._lock:
+                self._spans.append(span)
+                self._finished += 1
+            for listener in self._listeners:
+                listener(span)
+
+    def add_listener(self, listener: Callable[[Span], None]) -> None:
+        """
+        Call ``listener`` with every span as it finishes
+
+        Args:
+            listener: Called on the thread that ran the span; must be quick
+        """
+        with self._lock:
+            self._listeners = self._listeners + [listener]
+
+    def mark(self) -> int:
+        """Position to pass to ``spans`` to get only spans finished after now"""
+        with self._lock:
+            return self._finished
+
+    def spans(self, since: int = 0) -> List[Span]:
+        """
+        Finished spans still in the buffer
+
+        Args:
+            since: Position from ``mark``
+
+        Returns:
+            Spans in the order they finished
+        """
+        with self._lock:
+            buffered = list(self._spans)
+            first_buffered = self._finished - len(buffered)
+        return buffered[max(since - first_buffered, 0):]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._finished = 0
+
+    def export(self, path: Union[str, Path], since: int = 0) -> int:
+        """
+        Write finished spans to a file
+
+        ``.jsonl`` files get one span per line; anything else gets the
+        Chrome trace event format.
+
+        Args:
+            path: Output file
+            since: Position from ``mark``
+
+        Returns:
+            Number of spans written
+        """
+        spans = self.spans(since)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            if path.suffix == '.jsonl':
+                for span in spans:
+                    file.write(json.dumps(span.to_dict(self.epoch_ns), default=str) + "\n")
+            else:
+                json.dump(self._chrome_trace(spans), file, default=str)
+        return len(spans)
+
+    def _chrome_trace(self, spans: List[Span]) -> Dict[str, Any]:
+        pid = os.getpid()
+        events = [
+            {
+                'name': span.name,
+                'cat': span.name.split('.', 1)[0],
+                'ph': 'X',
+                'ts': (span.start_ns - self.epoch_ns) / 1000,
+                'dur': span.duration_ms * 1000,
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': span.attributes,
+            }
+            for span in spans
+        ]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms',
+                'otherData': {'epoch_time': self.epoch_time}}
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """
+    Nearest-rank percentile
+
+    Args:
+        sorted_values: Non-empty values in ascending order
+        percent: Percentile between 0 and 100
+
+    Returns:
+        The smallest value with at least ``percent`` percent of values at or below it
+    """
+    rank = max(math.ceil(len(sorted_values) * percent / 100), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def stage_statistics(spans: List[Span]) -> Dict[str, Dict[str, float]]:
+    """
+    Per-stage latency summary
+
+    Args:
+        spans: Finished spans
+
+    Returns:
+        Stage name -> count, total, p50, p95 and max in milliseconds, with the
+        stages taking the most total time first
+    """
+    durations: Dict[str, List[float]] = {}
+    for span in spans:
+        durations.setdefault(span.name, []).append(span.duration_ms)
+    stats = {}
+    for name, values in durations.items():
+        values.sort()
+        stats[name] = {
+            'count': len(values),
+            'total_ms': round(sum(values), 3),
+            'p50_ms': round(percentile(values, 50), 3),
+            'p95_ms': round(percentile(values, 95), 3),
+            'max_ms': round(values[-1], 3),
+        }
+    return dict(sorted(stats.items(), key=lambda item: item[1]['total_ms'], reverse=True))
+
+
+_shared_tracer: Optional[Tracer] = None
+_shared_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Tracer shared by every component in the process"""
+    global _shared_tracer
+    if _shared_tracer is None:
+        with _shared_tracer_lock:
+            if _shared_tracer is None:
+                _shared_tracer = Tracer()
+    return _shared_tracer
+
+
+def span(name: str, **attributes: Any):
+    """Time a block with the shared tracer (see ``Tracer.span``)"""
+    return get_tracer().span(name, **attributes)
+
+
+def current_span() -> Union[Span, _NoopSpan]:
+    """The innermost running span, or a no-op span outside any span"""
+    return _current_span.get() or _NOOP_SPAN
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """
+    Decorator running each call of a function inside a span
+
+    The function can add attributes with ``current_span().set(...)``.
+
+    Args:
+        name: Stage name
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(name):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def export_on_exit(path: Union[str, Path]) -> None:
+    """Write the shared tracer's spans to ``path`` when the process exits"""
+    atexit.register(get_tracer().export, path)
@@ -29,6 +29,7 @@ from .deliverable_generator import DeliverableGenerator, DeliverableSpec
 from .workflow_matcher import WorkflowInfo
 from ..clients.github_models_client import GitHubModelsClient, AIResponse
 from ..agents.specialist_agents import AnalysisResult, SpecialistType
+from ..utils.keyword_matcher import get_keyword_matcher, register_keywords
 from ..utils.logging_config import get_logger
 from ..utils.config_manager import ConfigManager
 
@@ -45,6 +46,19 @@ class ContentType(Enum):
     CONCLUSION = "conclusion"
 
 
+# Patterns in generated content that mark a section worth AI enhancement
+register_keywords('enhancement.executive_summary', ["executive summary", "summary", "overview"])
+register_keywords('enhancement.analysis', ["analysis", "assessment", "findings"])
+register_keywords('enhancement.recommendations', ["recommendations", "actions", "next steps"])
+register_keywords('enhancement.risk_assessment', ["risk", "threat", "vulnerability"])
+_SECTION_PATTERN_DICTIONARIES = {
+    'enhancement.executive_summary': ContentType.EXECUTIVE_SUMMARY,
+    'enhancement.analysis': ContentType.ANALYSIS,
+    'enhancement.recommendations': ContentType.RECOMMENDATIONS,
+    'enhancement.risk_assessment': ContentType.RISK_ASSESSMENT,
+}
+
+
 @dataclass
 class ContentGenerationSpec:
     """
@@ -474,20 +488,11 @@ Generate a thorough risk assessment that helps stakeholders understand and prepa
         """Identify which sections should be AI enhanced"""
         sections = set()
         
-        # Check for common section patterns
-        content_lower = content.lower()
-        
-        if any(pattern in content_lower for pattern in ["executive summary", "summary", "overview"]):
-            sections.add(ContentType.EXECUTIVE_SUMMARY)
-            
-        if any(pattern in content_lower for pattern in ["analysis", "assessment", "findings"]):
-            sections.add(ContentType.ANALYSIS)
-            
-        if any(pattern in content_lower for pattern in ["recommendations", "actions", "next steps"]):
-            sections.add(ContentType.RECOMMENDATIONS)
-            
-        if any(pattern in content_lower for pattern in ["risk", "threat", "vulnerability"]):
-            sections.add(ContentType.RISK_ASSESSMENT)
+        # Check for common section patterns in one pass over the content
+        hits = get_keyword_matcher().scan(content, _SECTION_PATTERN_DICTIONARIES)
+        for name, content_type in _SECTION_PATTERN_DICTIONARIES.items():
+            if hits[name]:
+                sections.add(content_type)
         
         # Default enhancement for intelligence deliverables
         if deliverable_spec.type == "intelligence" or "intelligence" in deliverable_spec.name:
@@ -22,9 +22,30 @@ from .specialist_workflow_config import (
     QualityRequirement
 )
 from .workflow_matcher import WorkflowMatcher, WorkflowInfo
+from ..utils.keyword_matcher import get_keyword_matcher, register_keywords
 from ..utils.logging_config import get_logger, log_exception
 
 
+# Content keywords suggesting each specialist, matched as substrings
+_SPECIALIST_KEYWORD_DICTIONARIES = (
+    'specialist.intelligence_analyst',
+    'specialist.osint_researcher',
+    'specialist.target_profiler',
+)
+register_keywords('specialist.intelligence_analyst', [
+    "threat", "analysis", "intelligence", "strategic", "geopolitical",
+    "campaign", "apt", "threat-actor", "adversary", "attack"
+])
+register_keywords('specialist.osint_researcher', [
+    "osint", "reconnaissance", "verification", "research", "investigation",
+    "digital footprint", "social media", "public records", "source analysis"
+])
+register_keywords('specialist.target_profiler', [
+    "target", "organization", "profile", "stakeholder", "business",
+    "company", "personnel", "leadership", "organizational"
+])
+
+
 @dataclass
 class SpecialistAssignment:
     """Result of specialist assignment process."""
@@ -239,33 +260,9 @@ class SpecialistWorkflowRegistry:
         if not content:
             return []
         
-        # Simple keyword extraction - can be enhanced with NLP
-        content_lower = content.lower()
-        
-        # Predefined intelligence keywords
-        intelligence_keywords = [
-            "threat", "analysis", "intelligence", "strategic", "geopolitical",
-            "campaign", "apt", "threat-actor", "adversary", "attack"
-        ]
-        
-        osint_keywords = [
-            "osint", "reconnaissance", "verification", "research", "investigation",
-            "digital footprint", "social media", "public records", "source analysis"
-        ]
-        
-        profiler_keywords = [
-            "target", "organization", "profile", "stakeholder", "business",
-            "company", "personnel", "leadership", "organizational"
-        ]
-        
-        found_keywords = []
-        all_keywords = intelligence_keywords + osint_keywords + profiler_keywords
-        
-        for keyword in all_keywords:
-            if keyword in content_lower:
-                found_keywords.append(keyword)
-        
-        return found_keywords
+        # One pass over the content for all specialists' keywords
+        hits = get_keyword_matcher().scan(content, _SPECIALIST_KEYWORD_DICTIONARIES)
+        return [keyword for name in _SPECIALIST_KEYWORD_DICTIONARIES for keyword in hits[name]]
     
     def _matches_deliverable_conditions(self, 
                                       deliverable_spec: DeliverableSpec, 
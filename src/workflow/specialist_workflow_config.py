@@ -15,7 +15,6 @@ from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
-from ..utils.config_manager import ConfigManager
 from ..utils.logging_config import get_logger, log_exception
 
 
@@ -24,6 +24,8 @@ from typing import Dict, Any, List, Optional, Union, TextIO
 from dataclasses import dataclass
 import yaml
 
+from ..utils.tracing import current_span, traced
+
 
 @dataclass
 class TemplateMetadata:
@@ -133,6 +135,7 @@ class TemplateEngine:
         except Exception as e:
             raise ValueError(f"Failed to load template '{template_name}': {e}")
     
+    @traced("template.render")
     def render_template(self, 
                        template_name: str, 
                        context: Dict[str, Any], 
@@ -169,6 +172,7 @@ class TemplateEngine:
         # Render template
         try:
             rendered = self._render_content(template_content, context)
+            current_span().set(template=template_name, bytes=len(rendered))
             return rendered
         except Exception as e:
             raise ValueError(f"Failed to render template '{template_name}': {e}")
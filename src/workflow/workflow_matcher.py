@@ -5,12 +5,16 @@ Handles discovery and matching of workflows based on GitHub issue labels
 
 import os
 import yaml
+import json
+import hashlib
 import logging
+import threading
 import time
 import functools
-from typing import Dict, List, Optional, Tuple, Set, Any
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Set, Any
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 
 from .workflow_schemas import WorkflowSchemaValidator
@@ -85,18 +89,42 @@ def retry_on_io_error(max_attempts: int = 3, delay_seconds: float = 0.5):
     return decorator
 
 
-@dataclass
+def _freeze(value: Any) -> Any:
+    """Read-only copy of parsed YAML data: dicts become mapping proxies and lists tuples"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Plain dict/list copy of data frozen by ``_freeze``"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
 class WorkflowInfo:
-    """Information about a discovered workflow"""
+    """
+    Information about a discovered workflow
+
+    Instances are immutable: the lists and dicts passed in are stored as
+    read-only copies (tuples and mapping proxies), so one parsed workflow
+    can be shared by every matcher and thread.
+    """
     path: str
     name: str
     description: str
     version: str
-    trigger_labels: List[str]
-    deliverables: List[Dict]
-    processing: Dict
-    validation: Dict
-    output: Dict
+    trigger_labels: Sequence[str]
+    deliverables: Sequence[Mapping[str, Any]]
+    processing: Mapping[str, Any]
+    validation: Mapping[str, Any]
+    output: Mapping[str, Any]
     
     def __post_init__(self):
         """Validate workflow info after creation"""
@@ -112,6 +140,199 @@ class WorkflowInfo:
                 workflow_path=self.path,
                 error_code="NO_DELIVERABLES"
             )
+        for name in ('trigger_labels', 'deliverables', 'processing', 'validation', 'output'):
+            object.__setattr__(self, name, _freeze(getattr(self, name)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain (mutable, JSON-serializable) copy of the workflow"""
+        return {field.name: _thaw(getattr(self, field.name)) for field in fields(self)}
+
+
+# Bump when WorkflowInfo or workflow validation changes so stale cache files are ignored
+WORKFLOW_CACHE_VERSION = 1
+
+# Parses a list of workflow files into (workflows by path, (path, error) pairs)
+WorkflowParser = Callable[[List[Path]], Tuple[Dict[str, WorkflowInfo], List[Tuple[str, str]]]]
+
+
+@dataclass(frozen=True)
+class WorkflowSnapshot:
+    """
+    Immutable set of the workflows parsed from one directory.
+
+    The snapshot, its mapping and the frozen ``WorkflowInfo`` objects in it
+    are shared by every matcher that holds the snapshot.
+    """
+    directory: str
+    content_hash: Optional[str]
+    workflows: Mapping[str, WorkflowInfo]
+    errors: Tuple[Tuple[str, str], ...]
+
+
+class WorkflowRegistry:
+    """
+    Process-wide cache of parsed workflow directories.
+
+    Snapshots are kept in memory until a workflow file's mtime or size
+    changes; snapshots with parse errors are never cached. Parsed snapshots
+    are also written to a cache directory under a hash of the workflow
+    files' contents, so a new process whose workflows have not changed
+    skips YAML parsing and schema validation.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            cache_dir: Directory for snapshot cache files (defaults to
+                ``$SPECULUM_CACHE_DIR`` or ``~/.cache/speculum-principum``);
+                an empty string disables the on-disk cache
+        """
+        if cache_dir is None:
+            cache_dir = os.getenv('SPECULUM_CACHE_DIR') or os.path.join(
+                os.path.expanduser('~'), '.cache', 'speculum-principum'
+            )
+        self.cache_dir = Path(cache_dir) / 'workflows' if cache_dir else None
+        self._lock = threading.Lock()
+        self._snapshots: Dict[Tuple[str, str], Tuple[tuple, WorkflowSnapshot]] = {}
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'parses': 0}
+
+    def clear(self) -> None:
+        """Forget all in-memory snapshots"""
+        with self._lock:
+            self._snapshots.clear()
+
+    def snapshot(self,
+                 directory: Path,
+                 workflow_files: List[Path],
+                 parse: WorkflowParser,
+                 force: bool = False) -> WorkflowSnapshot:
+        """
+        Get the workflows of a directory, parsing only if they changed.
+
+        Args:
+            directory: Workflow directory, as passed to the matcher
+            workflow_files: Workflow files found in the directory
+            parse: Parser used when no cached snapshot matches
+            force: Ignore the in-memory snapshot and re-check file contents
+
+        Returns:
+            Snapshot of the directory's workflows
+        """
+        key = (os.path.abspath(directory), str(directory))
+        files = sorted(workflow_files, key=str)
+        fingerprint = self._fingerprint(files)
+
+        if fingerprint is not None and not force:
+            with self._lock:
+                cached = self._snapshots.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self.stats['memory_hits'] += 1
+                return cached[1]
+
+        content_hash = self._content_hash(key, files)
+        snapshot = self._read_cache_file(str(directory), content_hash) if content_hash else None
+        if snapshot is not None:
+            self.stats['disk_hits'] += 1
+            logger.debug(f"Loaded {len(snapshot.workflows)} workflow(s) from cache for {directory}")
+        else:
+            self.stats['parses'] += 1
+            workflows, errors = parse(files)
+            snapshot = WorkflowSnapshot(
+                directory=str(directory),
+                content_hash=content_hash,
+                workflows=MappingProxyType(dict(workflows)),
+                errors=tuple(errors)
+            )
+            if errors:
+                # Failures may be transient (e.g. unreadable files), so retry them next time
+                return snapshot
+            if content_hash:
+                self._write_cache_file(snapshot)
+
+        if fingerprint is not None:
+            with self._lock:
+                self._snapshots[key] = (fingerprint, snapshot)
+        return snapshot
+
+    @staticmethod
+    def _fingerprint(files: List[Path]) -> Optional[tuple]:
+        """(path, mtime, size) of each file, or None if any cannot be stat'ed"""
+        try:
+            return tuple(
+                (str(path), stat.st_mtime_ns, stat.st_size)
+                for path, stat in ((path, path.stat()) for path in files)
+            )
+        except OSError:
+            return None
+
+    @staticmethod
+    def _content_hash(key: Tuple[str, str], files: List[Path]) -> Optional[str]:
+        """Hash of the directory and every workflow file's path and bytes"""
+        digest = hashlib.sha256(f"v{WORKFLOW_CACHE_VERSION}\0{key[0]}\0{key[1]}\0".encode('utf-8'))
+        try:
+            for path in files:
+                data = path.read_bytes()
+                digest.update(f"{path}\0{len(data)}\0".encode('utf-8'))
+                digest.update(data)
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def _cache_file(self, content_hash: str) -> Optional[Path]:
+        return self.cache_dir / f"{content_hash}.json" if self.cache_dir else None
+
+    def _read_cache_file(self, directory: str, content_hash: str) -> Optional[WorkflowSnapshot]:
+        """Load a snapshot written by a previous process, if one exists"""
+        cache_file = self._cache_file(content_hash)
+        if cache_file is None or not cache_file.exists():
+            return None
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            workflows = {path: WorkflowInfo(**info) for path, info in data['workflows'].items()}
+        except (OSError, ValueError, KeyError, TypeError, WorkflowMatcherError) as e:
+            logger.debug(f"Ignoring unreadable workflow cache file {cache_file}: {e}")
+            return None
+        return WorkflowSnapshot(
+            directory=directory,
+            content_hash=content_hash,
+            workflows=MappingProxyType(workflows),
+            errors=()
+        )
+
+    def _write_cache_file(self, snapshot: WorkflowSnapshot) -> None:
+        """Persist a snapshot; failures only cost the next cold start"""
+        cache_file = self._cache_file(snapshot.content_hash)
+        if cache_file is None:
+            return
+        try:
+            payload = json.dumps({
+                'workflows': {path: info.to_dict() for path, info in snapshot.workflows.items()}
+            })
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(temp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write workflow cache file {cache_file}: {e}")
+
+
+_shared_registry: Optional[WorkflowRegistry] = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_workflow_registry() -> WorkflowRegistry:
+    """Get the process-wide workflow registry, creating it on first use"""
+    global _shared_registry
+
+    if _shared_registry is None:
+        with _shared_registry_lock:
+            if _shared_registry is None:
+                _shared_registry = WorkflowRegistry()
+    return _shared_registry
 
 
 class WorkflowMatcher:
@@ -156,10 +377,16 @@ class WorkflowMatcher:
                 error_code="INITIALIZATION_FAILED"
             ) from e
 
-    def _load_workflows(self) -> None:
+    def _load_workflows(self, force: bool = False) -> None:
         """
         Load and cache all workflow definitions from the workflow directory.
         
+        Parsed workflows come from the process-wide :class:`WorkflowRegistry`,
+        so matchers for the same directory share one parse.
+        
+        Args:
+            force: Re-check file contents even if no file's mtime changed
+        
         Raises:
             WorkflowLoadError: If workflow directory doesn't exist or no valid workflows found
         """
@@ -210,24 +437,12 @@ class WorkflowMatcher:
             self._last_scan_time = datetime.now()
             return
         
-        loaded_count = 0
-        error_count = 0
-        
-        for workflow_file in workflow_files:
-            try:
-                workflow_info = self._parse_workflow_file(workflow_file)
-                if workflow_info:
-                    self._workflow_cache[str(workflow_file)] = workflow_info
-                    logger.debug(f"Loaded workflow: {workflow_info.name} from {workflow_file}")
-                    loaded_count += 1
-            except WorkflowValidationError as e:
-                logger.error(f"Workflow validation failed for {workflow_file}: {e}")
-                error_count += 1
-                continue
-            except Exception as e:
-                log_exception(logger, f"Failed to load workflow from {workflow_file}", e)
-                error_count += 1
-                continue
+        snapshot = get_workflow_registry().snapshot(
+            self.workflow_directory, workflow_files, self._parse_workflow_files, force=force
+        )
+        self._workflow_cache = dict(snapshot.workflows)
+        loaded_count = len(snapshot.workflows)
+        error_count = len(snapshot.errors)
         
         self._last_scan_time = datetime.now()
         
@@ -246,6 +461,36 @@ class WorkflowMatcher:
         
         logger.info(f"Loaded {loaded_count} workflow(s) with {error_count} error(s)")
 
+    def _parse_workflow_files(self, workflow_files: List[Path]) -> Tuple[Dict[str, WorkflowInfo], List[Tuple[str, str]]]:
+        """
+        Parse workflow files, collecting per-file errors instead of raising.
+        
+        Args:
+            workflow_files: Workflow YAML files to parse
+            
+        Returns:
+            Tuple of (workflows keyed by file path, (file path, error) pairs)
+        """
+        workflows: Dict[str, WorkflowInfo] = {}
+        errors: List[Tuple[str, str]] = []
+        
+        for workflow_file in workflow_files:
+            try:
+                workflow_info = self._parse_workflow_file(workflow_file)
+                if workflow_info:
+                    workflows[str(workflow_file)] = workflow_info
+                    logger.debug(f"Loaded workflow: {workflow_info.name} from {workflow_file}")
+            except WorkflowValidationError as e:
+                logger.error(f"Workflow validation failed for {workflow_file}: {e}")
+                errors.append((str(workflow_file), str(e)))
+                continue
+            except Exception as e:
+                log_exception(logger, f"Failed to load workflow from {workflow_file}", e)
+                errors.append((str(workflow_file), str(e)))
+                continue
+        
+        return workflows, errors
+
     @retry_on_io_error(max_attempts=3, delay_seconds=0.5)
     def _parse_workflow_file(self, workflow_file: Path) -> Optional[WorkflowInfo]:
         """
@@ -394,7 +639,7 @@ class WorkflowMatcher:
     def refresh_workflows(self) -> None:
         """Force refresh of workflow cache from disk."""
         logger.info("Forcing workflow refresh")
-        self._load_workflows()
+        self._load_workflows(force=True)
     
     def get_available_workflows(self) -> List[WorkflowInfo]:
         """
@@ -3,7 +3,6 @@ Workflow Schema Validation Module
 Defines and validates the schema for workflow YAML files
 """
 
-import jsonschema
 from typing import Dict, List, Any, Tuple
 import logging
 import re
@@ -166,6 +165,9 @@ class WorkflowSchemaValidator:
         Returns:
             Tuple of (is_valid, error_messages)
         """
+        # Imported here because it is slow to import and cached workflows skip validation
+        import jsonschema
+        
         errors = []
         
         try:
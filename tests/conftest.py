@@ -9,7 +9,18 @@ from github import Github
 from github.Repository import Repository
 from github.Issue import Issue
 from github.GithubException import GithubException
-from src.utils.config_manager import MonitorConfig, SiteConfig, GitHubConfig, SearchConfig
+from src.utils.config_manager import MonitorConfig, SiteConfig, GitHubConfig, SearchConfig, clear_config_cache
+from src.workflow import workflow_matcher
+
+
+@pytest.fixture(autouse=True)
+def isolated_registries(monkeypatch, tmp_path):
+    """Give each test its own config cache and workflow registry"""
+    clear_config_cache()
+    monkeypatch.setattr(workflow_matcher, '_shared_registry',
+                        workflow_matcher.WorkflowRegistry(str(tmp_path / "registry-cache")))
+    yield
+    clear_config_cache()
 
 
 @pytest.fixture
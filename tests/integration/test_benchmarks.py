@@ -0,0 +1,64 @@
+"""
+Smoke tests for the pipeline benchmarks
+
+Runs every benchmark once at a tiny scale so the suite keeps working as the
+code it drives changes. Timings are not checked here.
+"""
+
+from benchmarks.bench_pipeline import (
+    BENCHMARKS, BenchParams, append_record, build_record, previous_record, regressions, run
+)
+from benchmarks.fakes import FakeGitHub, ServiceProfile
+
+
+class TestPipelineBenchmarks:
+    """Run the suite against the fakes"""
+
+    def test_every_benchmark_runs_without_failures(self):
+        results = run(BenchParams(urls=200, issues=2), rounds=1)
+
+        assert [result.name for result in results] == list(BENCHMARKS)
+        assert all(result.failures == 0 for result in results)
+        assert all(len(result.rounds) == 1 and result.ops > 0 for result in results)
+
+    def test_throttled_services_are_counted_as_failures(self):
+        params = BenchParams(urls=200, issues=4, rate_limit=1, rate_window=60)
+
+        batch, = run(params, rounds=1, only=['batch'])
+
+        assert batch.failures > 0
+        assert batch.services['github']['throttled'] > 0
+
+
+class TestFakes:
+    """Service stand-ins behave like the APIs they replace"""
+
+    def test_fake_github_shapes_issue_data(self):
+        github = FakeGitHub(ServiceProfile())
+
+        data = github.get_issue_data(7)
+
+        assert data['number'] == 7
+        assert 'site-monitor' in data['labels']
+
+
+class TestHistory:
+    """Stored results and regression checks"""
+
+    def test_compares_with_previous_run_at_same_params(self, tmp_path):
+        history = tmp_path / "history.jsonl"
+        params = BenchParams(urls=200, issues=2)
+        results = run(params, rounds=1, only=['workflow'])
+        first = build_record(params, results)
+        append_record(first, history)
+        append_record(build_record(BenchParams(urls=400, issues=2), results), history)
+
+        previous = previous_record(params, history)
+        slower = dict(first, results={
+            name: dict(result, median_seconds=result['median_seconds'] * 2)
+            for name, result in first['results'].items()
+        })
+
+        assert previous['params'] == first['params']
+        assert regressions(slower, previous, threshold_percent=50) == ['workflow.match']
+        assert regressions(first, previous, threshold_percent=50) == []
@@ -157,6 +157,23 @@ class TestMainApplication:
         
         assert exc_info.value.code == 2
 
+    
+    @patch('main.load_dotenv')
+    def test_main_merge_dedup_without_github_env(self, mock_load_dotenv, tmp_path, monkeypatch, capsys):
+        """Test that merge-dedup runs locally without GitHub credentials"""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("GITHUB_REPOSITORY", raising=False)
+        shard = tmp_path / "shard.json"
+        shard.write_text('{"metadata": {}, "entries": []}')
+        output = tmp_path / "merged.json"
+        monkeypatch.setattr(sys, "argv", ["main.py", "merge-dedup", str(shard), "--output", str(output)])
+        
+        main.main()
+        
+        captured = capsys.readouterr()
+        assert "[1/1]" in captured.out
+        assert "Wrote 0 unique entries" in captured.out
+        assert output.exists()
 
 class TestArgumentParsing:
     """Test cases for CLI argument parsing"""
@@ -0,0 +1,103 @@
+"""
+Import-time budget tests for CLI startup
+
+Each check runs a fresh interpreter with ``-X importtime`` and fails if a
+cheap command starts importing the heavy stack again or its import time
+grows past a budget. Budgets can be scaled for slow machines with
+``STARTUP_BUDGET_SCALE``.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+BUDGET_SCALE = float(os.getenv('STARTUP_BUDGET_SCALE', '1'))
+
+# Milliseconds of imports on top of a bare interpreter
+HELP_BUDGET_MS = 250
+STATUS_BUDGET_MS = 600
+
+# What the status command imports before it does any work
+STATUS_IMPORTS = "import main, src.core.site_monitor"
+
+# Only needed by commands that process issues or search
+HEAVY_MODULES = {
+    'googleapiclient.discovery',
+    'jsonschema',
+    'src.core.issue_processor',
+    'src.core.batch_processor',
+    'src.agents.ai_workflow_assignment_agent',
+    'src.workflow.workflow_matcher',
+}
+
+
+def _import_report(*args: str) -> Dict[str, Tuple[int, bool]]:
+    """
+    Run Python with ``-X importtime``
+
+    Returns:
+        Module name -> (cumulative microseconds, whether imported at top level)
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+    report = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Nested imports are indented by two spaces per level
+        report[name.strip()] = (int(cumulative), not name[1:].startswith(' '))
+    return report
+
+
+def _startup_ms(*args: str) -> float:
+    """Import time of a run minus the interpreter's own startup imports"""
+    baseline = _import_report('-c', 'pass')
+    report = _import_report(*args)
+    return sum(cumulative for name, (cumulative, top_level) in report.items()
+               if top_level and name not in baseline) / 1000
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_bytecode():
+    """Compile once so the budgets measure imports, not byte-compiling"""
+    subprocess.run([sys.executable, 'main.py', '--help'], cwd=PROJECT_ROOT,
+                   capture_output=True, timeout=60)
+
+
+class TestStartupImports:
+    """Cheap commands must not import the full stack"""
+
+    def test_help_skips_heavy_modules(self):
+        imported = set(_import_report('main.py', '--help'))
+
+        assert not HEAVY_MODULES & imported
+        assert 'github' not in imported
+
+    def test_status_skips_issue_processing_stack(self):
+        imported = set(_import_report('-c', STATUS_IMPORTS))
+
+        assert 'src.core.site_monitor' in imported
+        assert not HEAVY_MODULES & imported
+
+
+class TestStartupBudget:
+    """Import-time budgets for cheap commands"""
+
+    def test_help_import_budget(self):
+        assert _startup_ms('main.py', '--help') < HELP_BUDGET_MS * BUDGET_SCALE
+
+    def test_status_import_budget(self):
+        elapsed = _startup_ms('-c', STATUS_IMPORTS)
+
+        assert elapsed < STATUS_BUDGET_MS * BUDGET_SCALE
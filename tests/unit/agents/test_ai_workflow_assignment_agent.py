@@ -15,6 +15,9 @@ from src.agents.ai_workflow_assignment_agent import (
     GitHubModelsClient, 
     ContentAnalysis
 )
+from src.agents.assignment_history import AssignmentHistoryStore
+from src.agents.workflow_preclassifier import TrainingExample, WorkflowPreclassifier
+from src.utils.config_manager import AIPreclassifierConfig
 from src.workflow.workflow_matcher import WorkflowInfo
 
 
@@ -306,6 +309,139 @@ class TestAIWorkflowAssignmentAgent:
         assert agent.MEDIUM_CONFIDENCE_THRESHOLD == 0.6
 
 
+class TestLocalPreclassifier:
+    """Test the local fast path in front of the AI"""
+    
+    @staticmethod
+    def _trained_classifier():
+        classifier = WorkflowPreclassifier()
+        for number in range(12):
+            classifier.add_example(TrainingExample(
+                title=f"Analyze market trends {number}",
+                body="market research, competitor analysis and growth projections",
+                labels=['site-monitor', 'research'],
+                workflow='Research Analysis',
+                content_type='research'
+            ))
+            classifier.add_example(TrainingExample(
+                title=f"Review code change {number}",
+                body="technical review of the architecture and implementation",
+                labels=['site-monitor', 'technical-review'],
+                workflow='Technical Review',
+                content_type='technical'
+            ))
+        classifier.fit()
+        return classifier
+    
+    @patch('src.agents.ai_workflow_assignment_agent.GitHubIssueCreator')
+    @patch('src.agents.ai_workflow_assignment_agent.WorkflowMatcher')
+    def test_confident_issue_skips_ai(self, mock_matcher, mock_github, mock_github_token, mock_repo_name,
+                                      sample_workflows, sample_issue_data):
+        """Confident local decisions need neither the AI nor GitHub Actions"""
+        mock_matcher.return_value.get_available_workflows.return_value = sample_workflows
+        agent = AIWorkflowAssignmentAgent(github_token=mock_github_token, repo_name=mock_repo_name)
+        agent.preclassifier = self._trained_classifier()
+        agent.preclassifier_config = AIPreclassifierConfig(decide_threshold=0.8, min_margin=0.3, min_examples=10)
+        
+        with patch.object(agent.ai_client, 'analyze_issue_content') as mock_ai:
+            workflow, analysis, message = agent.analyze_issue_with_ai(sample_issue_data)
+        
+        mock_ai.assert_not_called()
+        assert workflow.name == "Research Analysis"
+        assert analysis.source == "local"
+        assert analysis.content_type == "research"
+        assert analysis.confidence_scores["Research Analysis"] >= agent.HIGH_CONFIDENCE_THRESHOLD
+        assert "Local classifier" in message
+        assert agent.fast_path_stats == {'ai_calls': 0, 'ai_calls_avoided': 1}
+    
+    @patch.dict(os.environ, {'GITHUB_ACTIONS': 'true'})
+    @patch('src.agents.ai_workflow_assignment_agent.GitHubIssueCreator')
+    @patch('src.agents.ai_workflow_assignment_agent.WorkflowMatcher')
+    def test_uncertain_issue_escalates_to_ai(self, mock_matcher, mock_github, mock_github_token,
+                                             mock_repo_name, sample_workflows, sample_issue_data, mock_ai_response):
+        """Issues below the escalation thresholds go to the AI"""
+        mock_matcher.return_value.get_available_workflows.return_value = sample_workflows
+        mock_matcher.return_value.find_matching_workflows.return_value = [sample_workflows[0]]
+        agent = AIWorkflowAssignmentAgent(github_token=mock_github_token, repo_name=mock_repo_name)
+        agent.preclassifier = self._trained_classifier()
+        agent.preclassifier_config = AIPreclassifierConfig(decide_threshold=0.999, min_examples=10)
+        mock_analysis = ContentAnalysis(**{key: mock_ai_response[key] for key in (
+            'summary', 'key_topics', 'suggested_workflows', 'confidence_scores',
+            'technical_indicators', 'urgency_level', 'content_type')})
+        
+        with patch.object(agent.ai_client, 'analyze_issue_content', return_value=mock_analysis) as mock_ai:
+            workflow, analysis, _ = agent.analyze_issue_with_ai(sample_issue_data)
+        
+        mock_ai.assert_called_once()
+        assert analysis.source == "ai"
+        assert agent.fast_path_stats == {'ai_calls': 1, 'ai_calls_avoided': 0}
+    
+    @patch('src.agents.ai_workflow_assignment_agent.GitHubIssueCreator')
+    @patch('src.agents.ai_workflow_assignment_agent.WorkflowMatcher')
+    def test_batch_learns_from_ai_assignments(self, mock_matcher, mock_github, mock_github_token,
+                                              mock_repo_name, sample_workflows, sample_issue_data, tmp_path):
+        """AI auto-assignments become training examples saved after the batch"""
+        mock_matcher.return_value.get_available_workflows.return_value = sample_workflows
+        agent = AIWorkflowAssignmentAgent(github_token=mock_github_token, repo_name=mock_repo_name)
+        model_path = tmp_path / 'classifier.json'
+        agent.preclassifier = self._trained_classifier()
+        agent.preclassifier_config = AIPreclassifierConfig(model_path=str(model_path))
+        agent.assignment_history = AssignmentHistoryStore(tmp_path / 'history.jsonl')
+        ai_analysis = ContentAnalysis(
+            summary="Research", key_topics=[], suggested_workflows=["Research Analysis"],
+            confidence_scores={"Research Analysis": 0.9}, technical_indicators=[],
+            urgency_level="medium", content_type="research"
+        )
+        
+        with patch.object(agent, 'get_unassigned_site_monitor_issues', return_value=[sample_issue_data]), \
+             patch.object(agent, 'analyze_issue_with_ai', return_value=(sample_workflows[0], ai_analysis, "AI")), \
+             patch('src.agents.ai_workflow_assignment_agent.GitHubMutationQueue') as mock_queue, \
+             patch('src.agents.ai_workflow_assignment_agent.time.sleep'):
+            mock_queue.return_value.flush.return_value = None
+            result = agent.process_issues_batch(limit=1, dry_run=False)
+        
+        assert result['statistics']['auto_assigned'] == 1
+        assert result['fast_path'] == {'ai_calls': 0, 'ai_calls_avoided': 0}
+        saved = WorkflowPreclassifier.load(model_path)
+        assert saved.trained_examples == 25
+        assert saved.examples[-1].title == sample_issue_data['title']
+        history = AssignmentHistoryStore(tmp_path / 'history.jsonl')
+        assert history.summary()['records'] == 1
+        # The assignment is a decision, not an outcome, so the rate keeps the prior
+        assert history.success_rate("Research Analysis", "research") == 0.5
+    
+    @patch('src.agents.ai_workflow_assignment_agent.GitHubIssueCreator')
+    @patch('src.agents.ai_workflow_assignment_agent.WorkflowMatcher')
+    def test_update_retrains_from_scratch_every_n_examples(self, mock_matcher, mock_github, mock_github_token,
+                                                          mock_repo_name, tmp_path):
+        """New examples update the weights until retrain_every is reached"""
+        agent = AIWorkflowAssignmentAgent(github_token=mock_github_token, repo_name=mock_repo_name)
+        agent.preclassifier = self._trained_classifier()
+        agent.preclassifier_config = AIPreclassifierConfig(model_path=str(tmp_path / 'classifier.json'),
+                                                           retrain_every=3)
+        analysis = ContentAnalysis(
+            summary="Research", key_topics=[], suggested_workflows=["Research Analysis"],
+            confidence_scores={"Research Analysis": 0.9}, technical_indicators=[],
+            urgency_level="medium", content_type="research"
+        )
+        issue = {'title': "Analyze pricing", 'body': "market research", 'labels': ['research']}
+        
+        agent._learn_from_assignment(issue, "Research Analysis", analysis)
+        with patch.object(agent.preclassifier, 'fit', wraps=agent.preclassifier.fit) as fit:
+            assert agent.update_preclassifier() is True
+            fit.assert_not_called()
+            assert agent.preclassifier.incremental_examples == 1
+            
+            for _ in range(2):
+                agent._learn_from_assignment(issue, "Research Analysis", analysis)
+            assert agent.update_preclassifier() is True
+            fit.assert_called_once()
+        
+        assert agent.preclassifier.incremental_examples == 0
+        assert agent.preclassifier.trained_examples == 27
+        assert agent.update_preclassifier() is False
+
+
 class TestIntegration:
     """Integration tests for the complete AI workflow assignment system"""
     
@@ -0,0 +1,112 @@
+"""
+Tests for the concurrent assignment engine
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.agents.assignment_engine import ConcurrentAssignmentEngine, ThroughputReport
+from src.utils.tracing import span
+
+
+def _issues(count):
+    return [{'number': number} for number in range(1, count + 1)]
+
+
+class TestConcurrentAssignmentEngine:
+
+    def test_results_keep_issue_order(self):
+        def process(issue):
+            # Later issues finish first
+            time.sleep(0.001 * (10 - issue['number']))
+            return issue['number']
+
+        results, report = ConcurrentAssignmentEngine(max_workers=4).run(_issues(8), process, Mock())
+
+        assert results == list(range(1, 9))
+        assert report.issues == 8
+
+    def test_concurrency_is_bounded(self):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def process(issue):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return issue['number']
+
+        ConcurrentAssignmentEngine(max_workers=3).run(_issues(12), process, Mock())
+
+        assert 1 < peak <= 3
+
+    def test_errors_become_results(self):
+        def process(issue):
+            if issue['number'] == 2:
+                raise ValueError("bad issue")
+            return 'ok'
+
+        results, _ = ConcurrentAssignmentEngine().run(
+            _issues(3), process, lambda issue, error: f"error: {error}")
+
+        assert results == ['ok', 'error: bad issue', 'ok']
+
+    def test_writes_are_flushed_in_the_background(self):
+        queue = Mock()
+
+        def process(issue):
+            queue.add_comment(issue['number'], 'comment')
+            # Give the writer a chance to run between issues
+            time.sleep(0.005)
+            return issue['number']
+
+        _, report = ConcurrentAssignmentEngine(max_workers=1, flush_every=2).run(
+            _issues(6), process, Mock(), mutation_queue=queue)
+
+        assert queue.flush.call_count >= 1
+        assert report.write_flushes == queue.flush.call_count
+
+    def test_small_batches_leave_flushing_to_the_caller(self):
+        queue = Mock()
+
+        ConcurrentAssignmentEngine(flush_every=25).run(_issues(3), lambda issue: 1, Mock(),
+                                                       mutation_queue=queue)
+
+        queue.flush.assert_not_called()
+
+    def test_report_includes_latency_and_ai_stage(self):
+        def process(issue):
+            with span('ai.completion'):
+                time.sleep(0.002)
+            return issue['number']
+
+        _, report = ConcurrentAssignmentEngine(max_workers=2).run(_issues(4), process, Mock())
+        data = report.to_dict()
+
+        assert data['ai_calls'] == 4
+        assert data['ai_p95_ms'] >= 2
+        assert data['issue_p95_ms'] >= data['issue_p50_ms'] > 0
+        assert data['issues_per_minute'] > 0
+
+    def test_empty_batch(self):
+        results, report = ConcurrentAssignmentEngine().run([], Mock(), Mock())
+
+        assert results == []
+        assert report.to_dict()['ai_p95_ms'] is None
+
+
+class TestThroughputReport:
+
+    def test_issues_per_minute(self):
+        report = ThroughputReport(issues=30, max_workers=4, duration_seconds=15.0)
+
+        assert report.issues_per_minute == pytest.approx(120.0)
+        assert ThroughputReport(issues=1, max_workers=1, duration_seconds=0).issues_per_minute == 0.0
@@ -0,0 +1,128 @@
+"""
+Tests for the assignment history store
+"""
+
+import json
+
+import pytest
+
+from src.agents.assignment_history import (
+    PRIOR_SUCCESS_RATE,
+    AssignmentHistoryStore,
+    AssignmentRecord,
+)
+
+
+def _record(number, workflow='Research Analysis', content_type='research', outcome='completed'):
+    return AssignmentRecord(issue_number=number, workflow=workflow, content_type=content_type,
+                            confidence=0.9, outcome=outcome)
+
+
+class TestAssignmentHistoryStore:
+
+    def test_unknown_workflow_uses_prior(self, tmp_path):
+        store = AssignmentHistoryStore(tmp_path / 'history.jsonl')
+
+        assert store.success_rate('Research Analysis', 'research') == PRIOR_SUCCESS_RATE
+
+    def test_rates_update_as_records_arrive(self, tmp_path):
+        store = AssignmentHistoryStore(tmp_path / 'history.jsonl')
+        for number in range(8):
+            store.record(_record(number))
+        store.record(_record(8, outcome='failed'))
+
+        # 8 of 9 succeeded, smoothed toward the prior by two virtual records
+        assert store.success_rate('Research Analysis', 'research') == pytest.approx(9 / 11)
+
+    def test_falls_back_to_workflow_rate_for_new_content_type(self, tmp_path):
+        store = AssignmentHistoryStore(tmp_path / 'history.jsonl')
+        store.record(_record(1, outcome='failed'))
+        store.record(_record(2, outcome='reassigned'))
+
+        assert store.success_rate('Research Analysis', 'security') == pytest.approx(1 / 4)
+
+    def test_records_are_written_only_on_flush(self, tmp_path):
+        path = tmp_path / 'nested' / 'history.jsonl'
+        store = AssignmentHistoryStore(path)
+        store.record(_record(1))
+        store.record(_record(2))
+
+        assert not path.exists()
+        assert store.pending_count == 2
+        assert store.flush() == 2
+        assert store.pending_count == 0
+        assert store.flush() == 0
+        assert [json.loads(line)['issue_number'] for line in path.read_text().splitlines()] == [1, 2]
+
+    def test_flush_appends_to_existing_history(self, tmp_path):
+        path = tmp_path / 'history.jsonl'
+        first = AssignmentHistoryStore(path)
+        first.record(_record(1))
+        first.flush()
+
+        second = AssignmentHistoryStore(path)
+        second.record(_record(2, outcome='failed'))
+        second.flush()
+
+        reloaded = AssignmentHistoryStore(path)
+        assert reloaded.summary() == {
+            'records': 2,
+            'workflows': {'Research Analysis': {'records': 2, 'success_rate': 0.5}}
+        }
+
+    def test_unreadable_lines_are_skipped(self, tmp_path):
+        path = tmp_path / 'history.jsonl'
+        path.write_text('{"issue_number": 1}\nnot json\n\n', encoding='utf-8')
+        store = AssignmentHistoryStore(path)
+        store.record(_record(2))
+
+        assert store.summary()['records'] == 1
+
+    def test_memory_only_store_does_not_write(self):
+        store = AssignmentHistoryStore(None)
+        store.record(_record(1))
+
+        assert store.flush() == 0
+        assert store.success_rate('Research Analysis', 'research') > PRIOR_SUCCESS_RATE
+
+    def test_assignment_decisions_do_not_count(self, tmp_path):
+        store = AssignmentHistoryStore(tmp_path / 'history.jsonl')
+        for number in range(5):
+            store.record(_record(number, outcome='auto_assigned'))
+
+        assert store.success_rate('Research Analysis', 'research') == PRIOR_SUCCESS_RATE
+        assert store.summary() == {'records': 5, 'workflows': {}}
+
+    def test_outcome_uses_the_assignment_decision(self, tmp_path):
+        path = tmp_path / 'history.jsonl'
+        store = AssignmentHistoryStore(path)
+        decision = _record(7, content_type='security', outcome='auto_assigned')
+        decision.source = 'local'
+        store.record(decision)
+        store.flush()
+
+        reopened = AssignmentHistoryStore(path)
+        [outcome] = reopened.record_outcome(7, 'Research Analysis', succeeded=True)
+
+        assert (outcome.outcome, outcome.content_type, outcome.source) == ('completed', 'security', 'local')
+        assert reopened.success_rate('Research Analysis', 'security') == pytest.approx(2 / 3)
+
+    def test_changed_workflow_counts_as_reassigned(self, tmp_path):
+        store = AssignmentHistoryStore(tmp_path / 'history.jsonl')
+        store.record(_record(3, outcome='auto_assigned'))
+
+        records = store.record_outcome(3, 'Technical Review', succeeded=False)
+
+        assert [(record.workflow, record.outcome) for record in records] == [
+            ('Research Analysis', 'reassigned'), ('Technical Review', 'failed')]
+        assert records[1].source == 'human'
+        assert store.success_rate('Research Analysis', 'research') == pytest.approx(1 / 3)
+        assert store.success_rate('Technical Review', 'research') == pytest.approx(1 / 3)
+
+    def test_outcome_without_decision(self, tmp_path):
+        store = AssignmentHistoryStore(tmp_path / 'history.jsonl')
+
+        [outcome] = store.record_outcome(9, 'Research Analysis', succeeded=True)
+
+        assert (outcome.content_type, outcome.source) == ('unknown', 'human')
+        assert store.pending_count == 1
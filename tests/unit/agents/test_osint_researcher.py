@@ -224,6 +224,15 @@ class TestOSINTResearcherAgent:
         opportunities = analysis['findings']['digital_footprint']['opportunities']
         assert any('example.com' in str(opp) for opp in opportunities)
 
+    def test_digital_entities_from_issue_text(self, osint_agent, sample_osint_issue):
+        """Test domains and addresses in the issue text are used without extracted content"""
+        sample_osint_issue['body'] += ' Contact admin@example.net; server 198.51.100.23.'
+        
+        analysis = osint_agent._perform_fallback_osint_analysis({'entities': {}}, sample_osint_issue)
+        
+        opportunities = analysis['findings']['digital_footprint']['opportunities']
+        assert opportunities == ['example.com', 'admin@example.net', '198.51.100.23']
+
     def test_verification_target_identification(self, osint_agent, sample_structured_content, sample_osint_issue):
         """Test identification of entities requiring verification"""
         # Add low-confidence entity that should require verification
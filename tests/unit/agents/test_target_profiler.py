@@ -186,6 +186,20 @@ class TestTargetProfilerAgent:
         # Should find at least some personnel
         assert len(personnel) >= 0  # May be 0 depending on regex patterns
     
+    def test_extract_organizations_ignores_ordinary_words(self, target_profiler_agent):
+        """Test acronyms are matched case-sensitively alongside suffixed names"""
+        content = "The FBI briefed ABC Corporation and Google LLC about the campaign"
+        organizations = target_profiler_agent._extract_organizations(content)
+        
+        assert organizations == ["ABC Corporation", "Google LLC", "FBI", "ABC"]
+    
+    def test_extract_personnel_names(self, target_profiler_agent):
+        """Test names are taken from next to executive titles"""
+        content = "CEO John Smith and CTO Sarah Johnson met Maria Garcia, Director of Sales"
+        personnel = target_profiler_agent._extract_personnel(content)
+        
+        assert personnel == ["John Smith", "Sarah Johnson", "Maria Garcia"]
+    
     def test_extract_financial_indicators(self, target_profiler_agent):
         """Test financial indicator extraction"""
         content = "Annual revenue of $250M with recent funding and investment growth"
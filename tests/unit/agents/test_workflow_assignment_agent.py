@@ -449,6 +449,36 @@ class TestWorkflowAssignmentAgent:
         assert stats[AssignmentAction.ASSIGN_WORKFLOW.value] == 1
         assert stats[AssignmentAction.REQUEST_CLARIFICATION.value] == 1
     
+    def test_process_issues_batch_queues_writes(self, agent):
+        """Test that batch writes are queued and flushed once"""
+        agent.get_unassigned_site_monitor_issues = Mock(return_value=[
+            {'number': 1, 'labels': ['site-monitor', 'research']},
+            {'number': 2, 'labels': ['site-monitor', 'research']},
+        ])
+        mock_workflow = Mock()
+        mock_workflow.name = "Research Workflow"
+        mock_workflow.trigger_labels = ['research-active']
+        agent.workflow_matcher.get_best_workflow_match.return_value = (mock_workflow, "Matched")
+        mock_issue = Mock()
+        mock_issue.labels = []
+        agent.github.repo.get_issue.return_value = mock_issue
+
+        queue = Mock()
+        queue.flush.return_value = {'failed_issues': {2: 'Issue is locked'}}
+        with patch('src.agents.workflow_assignment_agent.GitHubMutationQueue', return_value=queue):
+            result = agent.process_issues_batch()
+
+        mock_issue.add_to_labels.assert_not_called()
+        mock_issue.create_comment.assert_not_called()
+        queue.add_labels.assert_any_call(1, ['research-active'])
+        assert queue.add_comment.call_count == 2
+        queue.flush.assert_called_once()
+        assert agent.mutation_queue is None
+        assert result['results'][0].action == AssignmentAction.ASSIGN_WORKFLOW
+        assert result['results'][1].action == AssignmentAction.ERROR
+        assert result['statistics'][AssignmentAction.ERROR.value] == 1
+        assert result['write_stats'] == queue.flush.return_value
+
     def test_process_issues_batch_no_issues(self, agent):
         """Test processing batch when no issues found"""
         agent.get_unassigned_site_monitor_issues = Mock(return_value=[])
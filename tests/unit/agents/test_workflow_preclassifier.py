@@ -0,0 +1,211 @@
+"""
+Tests for the local workflow pre-classifier
+"""
+
+import json
+
+import pytest
+
+from src.agents.workflow_preclassifier import (
+    TrainingExample,
+    WorkflowPreclassifier,
+    extract_features,
+)
+
+
+RESEARCH_TOPICS = ['market trends', 'competitor landscape', 'industry growth', 'consumer survey',
+                   'pricing study', 'adoption forecast', 'sector overview', 'regional demand']
+SECURITY_TOPICS = ['ransomware campaign', 'phishing kit', 'exploit chain', 'malware loader',
+                   'credential leak', 'botnet infrastructure', 'vulnerability disclosure', 'c2 beacon']
+
+
+def _examples():
+    examples = []
+    for topic in RESEARCH_TOPICS:
+        examples.append(TrainingExample(
+            title=f"Research {topic}",
+            body=f"Market research on {topic}, analysis of trends and competitors",
+            labels=['site-monitor', 'research'],
+            workflow='Research Analysis',
+            content_type='research'
+        ))
+    for topic in SECURITY_TOPICS:
+        examples.append(TrainingExample(
+            title=f"Investigate {topic}",
+            body=f"Threat report on {topic} with indicators of compromise and malware samples",
+            labels=['site-monitor', 'security'],
+            workflow='Security Assessment',
+            content_type='security'
+        ))
+    return examples
+
+
+@pytest.fixture
+def trained():
+    classifier = WorkflowPreclassifier()
+    for example in _examples():
+        classifier.add_example(example)
+    classifier.fit()
+    return classifier
+
+
+class TestExtractFeatures:
+
+    def test_features_are_normalized_and_stable(self):
+        first = extract_features("Ransomware report", "New ransomware group", ['security'])
+        second = extract_features("Ransomware report", "New ransomware group", ['security'])
+
+        assert first == second
+        assert sum(value * value for value in first.values()) == pytest.approx(1.0)
+
+    def test_title_body_and_labels_hash_separately(self):
+        in_title = extract_features("ransomware", "", [])
+        in_body = extract_features("", "ransomware", [])
+        as_label = extract_features("", "", ['ransomware'])
+
+        assert set(in_title) != set(in_body) != set(as_label)
+
+    def test_empty_issue_has_no_features(self):
+        assert extract_features("", "", []) == {}
+
+
+class TestWorkflowPreclassifier:
+
+    def test_untrained_classifier_escalates(self):
+        decision = WorkflowPreclassifier().decide("Anything", "", [], threshold=0.5,
+                                                  min_margin=0.0, min_examples=1)
+
+        assert decision.decided is False
+        assert decision.workflow is None
+
+    def test_single_class_is_not_trained(self):
+        classifier = WorkflowPreclassifier()
+        classifier.fit(_examples()[:3])
+
+        assert classifier.is_trained is False
+        assert classifier.predict("Research pricing", "", []) == {}
+
+    def test_predicts_the_matching_workflow(self, trained):
+        scores = trained.predict("Investigate exploit kit", "malware samples and indicators", ['security'])
+
+        assert max(scores, key=scores.get) == 'Security Assessment'
+        assert sum(scores.values()) == pytest.approx(1.0)
+
+    def test_confident_issue_is_decided_locally(self, trained):
+        decision = trained.decide("Research market trends", "analysis of competitors",
+                                  ['site-monitor', 'research'],
+                                  threshold=0.8, min_margin=0.3, min_examples=10)
+
+        assert decision.decided is True
+        assert decision.workflow == 'Research Analysis'
+        assert decision.confidence >= 0.8
+        assert trained.content_types['Research Analysis'] == 'research'
+
+    def test_thresholds_escalate_uncertain_issues(self, trained):
+        decision = trained.decide("Weekly update", "", ['site-monitor'],
+                                  threshold=0.99, min_margin=0.9, min_examples=10)
+
+        assert decision.decided is False
+        assert decision.workflow is not None
+
+    def test_requires_minimum_examples(self, trained):
+        decision = trained.decide("Research market trends", "", ['research'],
+                                  threshold=0.5, min_margin=0.0, min_examples=100)
+
+        assert decision.decided is False
+        assert "16 examples" in decision.reason
+
+    def test_removed_workflow_is_never_chosen(self, trained):
+        decision = trained.decide("Research market trends", "analysis of competitors", ['research'],
+                                  threshold=0.5, min_margin=0.0, min_examples=1,
+                                  allowed_workflows=['Security Assessment'])
+
+        assert decision.decided is False
+
+    def test_partial_fit_updates_current_weights(self):
+        examples = _examples()
+        classifier = WorkflowPreclassifier()
+        classifier.fit(examples[::2])
+        before = classifier.predict("Investigate c2 beacon", "malware samples", ['security'])
+
+        for example in examples[1::2]:
+            classifier.add_example(example)
+        assert classifier.partial_fit(examples[1::2]) == 16
+
+        after = classifier.predict("Investigate c2 beacon", "malware samples", ['security'])
+        assert classifier.incremental_examples == 8
+        assert after['Security Assessment'] > before['Security Assessment']
+        assert max(after, key=after.get) == 'Security Assessment'
+
+    def test_partial_fit_learns_new_workflows(self, trained):
+        new = [TrainingExample(f"Due diligence on vendor {number}", "vendor contracts and ownership",
+                               ['compliance'], 'Vendor Review', 'business')
+               for number in range(6)]
+        for example in new:
+            trained.add_example(example)
+
+        trained.partial_fit(new)
+
+        scores = trained.predict("Due diligence on vendor 9", "vendor contracts and ownership", ['compliance'])
+        assert trained.classes == ['Research Analysis', 'Security Assessment', 'Vendor Review']
+        assert max(scores, key=scores.get) == 'Vendor Review'
+        assert trained.content_types['Vendor Review'] == 'business'
+
+    def test_partial_fit_trains_untrained_model_from_scratch(self):
+        classifier = WorkflowPreclassifier()
+        for example in _examples():
+            classifier.add_example(example)
+
+        assert classifier.partial_fit(_examples()[:2]) == 16
+        assert classifier.incremental_examples == 0
+
+    def test_fit_resets_incremental_count(self, trained):
+        trained.partial_fit(_examples()[:4])
+        trained.fit()
+
+        assert trained.incremental_examples == 0
+        assert trained.trained_examples == 16
+
+    def test_stored_examples_are_bounded_and_truncated(self, monkeypatch):
+        monkeypatch.setattr('src.agents.workflow_preclassifier.MAX_STORED_EXAMPLES', 3)
+        classifier = WorkflowPreclassifier()
+        for number in range(5):
+            classifier.add_example(TrainingExample(f"title {number}", "x" * 5000, [], 'A'))
+
+        assert [example.title for example in classifier.examples] == ['title 2', 'title 3', 'title 4']
+        assert len(classifier.examples[0].body) == 2000
+
+    def test_save_and_load_round_trip(self, trained, tmp_path):
+        path = tmp_path / 'model' / 'classifier.json'
+        trained.save(path)
+        loaded = WorkflowPreclassifier.load(path)
+
+        issue = ("Investigate phishing kit", "indicators of compromise", ['security'])
+        assert loaded.trained_examples == trained.trained_examples
+        assert len(loaded.examples) == len(trained.examples)
+        assert loaded.predict(*issue) == pytest.approx(trained.predict(*issue), abs=1e-4)
+
+    def test_only_the_largest_weights_are_saved(self, trained, monkeypatch):
+        monkeypatch.setattr('src.agents.workflow_preclassifier.MAX_STORED_WEIGHTS', 10)
+        weights = trained.weights['Research Analysis']
+        weights[1] = 1e-6
+        largest = sorted(weights, key=lambda index: abs(weights[index]), reverse=True)[:10]
+
+        saved = trained.to_dict()['weights']['Research Analysis']
+
+        assert sorted(saved) == sorted(str(index) for index in largest)
+
+    def test_load_missing_or_corrupt_file_starts_untrained(self, tmp_path):
+        corrupt = tmp_path / 'corrupt.json'
+        corrupt.write_text("{not json", encoding='utf-8')
+
+        assert WorkflowPreclassifier.load(tmp_path / 'missing.json').is_trained is False
+        assert WorkflowPreclassifier.load(corrupt).is_trained is False
+
+    def test_saved_file_is_json(self, trained, tmp_path):
+        path = tmp_path / 'classifier.json'
+        trained.save(path)
+
+        data = json.loads(path.read_text(encoding='utf-8'))
+        assert data['classes'] == ['Research Analysis', 'Security Assessment']
+        assert list(tmp_path.iterdir()) == [path]
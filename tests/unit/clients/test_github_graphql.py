@@ -0,0 +1,105 @@
+"""
+Unit tests for the GitHub GraphQL module
+"""
+
+from unittest.mock import Mock
+
+from src.clients.github_graphql import GitHubGraphQLClient, graphql_issue_to_rest
+
+
+def _issue_node(number, comments=None, assignees=None):
+    return {
+        'number': number,
+        'title': f"Issue {number}",
+        'body': "Body",
+        'url': f"https://github.com/owner/repo/issues/{number}",
+        'state': 'OPEN',
+        'createdAt': '2025-01-01T00:00:00Z',
+        'updatedAt': '2025-01-02T00:00:00Z',
+        'assignees': {'nodes': [{'login': login} for login in assignees or []]},
+        'labels': {'nodes': [{'name': 'site-monitor'}]},
+        'comments': {
+            'totalCount': len(comments or []),
+            'nodes': [{'body': body, 'author': {'__typename': 'User', 'login': login}}
+                      for login, body in comments or []]
+        }
+    }
+
+
+def _page(nodes, has_next=False, cursor=None):
+    return ({}, {'data': {'repository': {'issues': {
+        'pageInfo': {'hasNextPage': has_next, 'endCursor': cursor},
+        'nodes': nodes
+    }}}})
+
+
+class TestGitHubGraphQLClient:
+    """Test cases for GitHubGraphQLClient"""
+
+    def test_iter_issues_paginates(self):
+        requester = Mock()
+        requester.graphql_query.side_effect = [
+            _page([_issue_node(3), _issue_node(2)], has_next=True, cursor='c1'),
+            _page([_issue_node(1)])
+        ]
+        client = GitHubGraphQLClient(requester, "owner/repo")
+
+        issues = list(client.iter_issues_with_comments(labels=['site-monitor'], comment_window=5))
+
+        assert [issue['number'] for issue in issues] == [3, 2, 1]
+        assert requester.graphql_query.call_count == 2
+        first_vars = requester.graphql_query.call_args_list[0][0][1]
+        second_vars = requester.graphql_query.call_args_list[1][0][1]
+        assert first_vars['owner'] == 'owner'
+        assert first_vars['name'] == 'repo'
+        assert first_vars['labels'] == ['site-monitor']
+        assert first_vars['comments'] == 5
+        assert second_vars['after'] == 'c1'
+
+    def test_iteration_is_lazy(self):
+        requester = Mock()
+        requester.graphql_query.side_effect = [
+            _page([_issue_node(2)], has_next=True, cursor='c1'),
+            _page([_issue_node(1)])
+        ]
+        client = GitHubGraphQLClient(requester, "owner/repo")
+
+        next(client.iter_issues_with_comments())
+
+        assert requester.graphql_query.call_count == 1
+
+
+class TestGraphqlIssueToRest:
+    """Test conversion of GraphQL nodes"""
+
+    def test_conversion(self):
+        node = _issue_node(7, comments=[('octocat', 'Looks good')], assignees=['agent'])
+
+        issue = graphql_issue_to_rest(node)
+
+        assert issue['number'] == 7
+        assert issue['state'] == 'open'
+        assert issue['html_url'].endswith('/issues/7')
+        assert issue['labels'] == [{'name': 'site-monitor'}]
+        assert issue['assignee'] == {'login': 'agent'}
+        assert issue['comment_count'] == 1
+        assert issue['comments'] == [{'login': 'octocat', 'type': 'User', 'body': 'Looks good', 'created_at': None}]
+
+    def test_bot_authors_keep_their_type(self):
+        node = _issue_node(9)
+        node['author'] = {'__typename': 'Bot', 'login': 'github-actions'}
+        node['comments']['nodes'] = [{'body': 'Done', 'author': {'__typename': 'Bot', 'login': 'copilot'}}]
+
+        issue = graphql_issue_to_rest(node)
+
+        assert issue['user'] == {'login': 'github-actions', 'type': 'Bot'}
+        assert issue['comments'][0]['type'] == 'Bot'
+
+    def test_missing_author(self):
+        node = _issue_node(8)
+        node['comments']['nodes'] = [{'body': 'ghost comment', 'author': None}]
+
+        issue = graphql_issue_to_rest(node)
+
+        assert issue['comments'] == [{'login': '', 'type': '', 'body': 'ghost comment', 'created_at': None}]
+        assert issue['assignee'] is None
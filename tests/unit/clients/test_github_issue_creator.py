@@ -4,6 +4,7 @@ Unit tests for GitHub operations module
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+from github import Auth, Github
 import sys
 import os
 
@@ -221,7 +222,36 @@ class TestGitHubIssueCreator:
         # Assertions
         mock_repo.get_issue.assert_called_once_with(123)
         assert result == mock_issue
-    
+
+    @patch('src.clients.github_issue_creator.Github')
+    def test_get_api_usage_stats(self, mock_github_class, mock_github_token, mock_repository_name):
+        """Test that the shared caching transport is installed and reported"""
+        mock_github_instance = Mock()
+        # A real requester, so installation fails if PyGithub drops the attribute
+        mock_github_instance.requester = Github(auth=Auth.Token(mock_github_token)).requester
+        mock_github_class.return_value = mock_github_instance
+
+        creator = GitHubIssueCreator(mock_github_token, mock_repository_name)
+        stats = creator.get_api_usage_stats()
+
+        assert vars(mock_github_instance.requester)['_Requester__connectionClass'] is creator.transport.connection_class
+        assert 'hit_rate' in stats['cache']
+        assert 'resources' in stats['rate_limit']
+
+    @patch('src.clients.github_issue_creator.Github')
+    def test_close(self, mock_github_class, mock_github_token, mock_repository_name, tmp_path):
+        """Test that closing releases the HTTP connections and the mirror handle"""
+        mock_github_instance = Mock()
+        mock_github_class.return_value = mock_github_instance
+        creator = GitHubIssueCreator(mock_github_token, mock_repository_name,
+                                     issue_mirror_path=str(tmp_path / "mirror.sqlite3"))
+        assert creator.issue_mirror is not None
+
+        creator.close()
+
+        mock_github_instance.close.assert_called_once()
+        assert creator._issue_mirror is None
+
     @patch('src.clients.github_issue_creator.Github')
     def test_get_issues_with_labels(self, mock_github_class, mock_github_token, mock_repository_name):
         """Test getting issues with specific labels"""
@@ -268,6 +298,143 @@ class TestGitHubIssueCreator:
         mock_issue.add_to_assignees.assert_called_once_with("user1", "user2")
         assert result is True
 
+    @staticmethod
+    def _graphql_issue(number, assignee=None, comments=None):
+        return {
+            'number': number,
+            'title': f"Issue {number}",
+            'body': '',
+            'html_url': f"https://github.com/testuser/testrepo/issues/{number}",
+            'state': 'open',
+            'created_at': '2025-01-01T00:00:00Z',
+            'updated_at': '2025-01-01T00:00:00Z',
+            'labels': [{'name': 'site-monitor'}],
+            'assignees': [assignee] if assignee else [],
+            'assignee': assignee,
+            'comment_count': len(comments or []),
+            'comments': comments or []
+        }
+
+    @patch('src.clients.github_issue_creator.Github')
+    def test_get_unprocessed_monitoring_issues_graphql(self, mock_github_class, mock_github_token,
+                                                       mock_repository_name, tmp_path):
+        """Test a single GraphQL scan filters assigned, indexed and commented issues"""
+        mock_github_instance = Mock()
+        mock_repo = Mock()
+        mock_repo.url = "https://api.github.com/repos/testuser/testrepo"
+        mock_github_class.return_value = mock_github_instance
+        mock_github_instance.get_repo.return_value = mock_repo
+
+        creator = GitHubIssueCreator(mock_github_token, mock_repository_name,
+                                     activity_index_path=str(tmp_path / "activity.json"))
+        creator.activity_index.record_activity(3, 'comment')
+        creator.graphql = Mock()
+        creator.graphql.iter_issues_with_comments.return_value = iter([
+            self._graphql_issue(5),
+            self._graphql_issue(4, assignee={'login': 'someone'}),
+            self._graphql_issue(3),
+            self._graphql_issue(2, comments=[{'login': 'github-actions[bot]', 'type': 'Bot', 'body': 'Done'}]),
+            # GraphQL reports bot logins without the [bot] suffix
+            self._graphql_issue(6, comments=[{'login': 'copilot-swe-agent', 'type': 'Bot', 'body': 'On it'}]),
+            self._graphql_issue(1, comments=[{'login': 'octocat', 'type': 'User', 'body': 'Interesting'}]),
+        ])
+
+        result = creator.get_unprocessed_monitoring_issues()
+
+        assert [issue.number for issue in result] == [5, 1]
+        assert result[0].title == "Issue 5"
+        assert result[1].comments == 1
+        # Completed issues answer unfetched fields without a REST call
+        assert result[0].milestone is None
+        assert result[0].url == "https://api.github.com/repos/testuser/testrepo/issues/5"
+        mock_github_instance.requester.requestJsonAndCheck.assert_not_called()
+        assert creator.activity_index.has_activity(2)
+        assert creator.activity_index.has_activity(6)
+        mock_repo.get_issues.assert_not_called()
+
+    @patch('src.clients.github_issue_creator.Github')
+    def test_get_unprocessed_monitoring_issues_rest_fallback(self, mock_github_class, mock_github_token,
+                                                             mock_repository_name, tmp_path):
+        """Test REST fallback consults the activity index before reading comments"""
+        mock_github_instance = Mock()
+        mock_repo = Mock()
+        mock_github_class.return_value = mock_github_instance
+        mock_github_instance.get_repo.return_value = mock_repo
+
+        indexed_issue = Mock(number=1, assignee=None)
+        fresh_issue = Mock(number=2, assignee=None)
+        fresh_issue.get_comments.return_value = []
+        mock_repo.get_issues.return_value = [indexed_issue, fresh_issue]
+
+        creator = GitHubIssueCreator(mock_github_token, mock_repository_name,
+                                     activity_index_path=str(tmp_path / "activity.json"))
+        creator.activity_index.record_activity(1, 'comment')
+        creator.graphql = Mock()
+        creator.graphql.iter_issues_with_comments.side_effect = MockGitHubException("Bad gateway")
+
+        result = creator.get_unprocessed_monitoring_issues()
+
+        assert result == [fresh_issue]
+        indexed_issue.get_comments.assert_not_called()
+
+    @patch('src.clients.github_issue_creator.Github')
+    def test_get_mirrored_issues_syncs_incrementally(self, mock_github_class, mock_github_token,
+                                                     mock_repository_name, tmp_path):
+        """Test mirror reads reuse a recent sync and survive sync failures"""
+        from src.clients.issue_discovery import IssueQuery
+
+        mock_github_class.return_value = Mock()
+        creator = GitHubIssueCreator(mock_github_token, mock_repository_name,
+                                     issue_mirror_path=str(tmp_path / "mirror.sqlite3"))
+        creator.graphql = Mock()
+        creator.graphql.iter_issues_with_comments.return_value = iter([
+            self._graphql_issue(1), self._graphql_issue(2)
+        ])
+
+        first = creator.get_mirrored_issues(IssueQuery(labels=['site-monitor']))
+        second = creator.get_mirrored_issues(IssueQuery(labels=['site-monitor']), limit=1)
+
+        assert [issue['number'] for issue in first] == [2, 1]
+        assert [issue['number'] for issue in second] == [2]
+        assert creator.graphql.iter_issues_with_comments.call_count == 1
+
+        # A failed sync falls back to the previously mirrored data
+        creator.graphql.iter_issues_with_comments.side_effect = MockGitHubException("Bad gateway")
+        stats = creator.sync_issue_mirror()
+        assert stats['stale'] is True
+        assert len(creator.get_mirrored_issues(IssueQuery(), max_age_seconds=0)) == 2
+
+    @patch('src.clients.github_issue_creator.Github')
+    def test_get_mirrored_issues_without_initial_sync(self, mock_github_class, mock_github_token,
+                                                      mock_repository_name, tmp_path):
+        """Test that an unsynced mirror reports sync failures"""
+        from src.clients.issue_discovery import IssueQuery
+
+        mock_github_class.return_value = Mock()
+        creator = GitHubIssueCreator(mock_github_token, mock_repository_name,
+                                     issue_mirror_path=str(tmp_path / "mirror.sqlite3"))
+        creator.graphql = Mock()
+        creator.graphql.iter_issues_with_comments.side_effect = MockGitHubException("Bad gateway")
+
+        with pytest.raises(RuntimeError, match="Failed to sync issue mirror: Bad gateway"):
+            creator.get_mirrored_issues(IssueQuery())
+
+    @patch('src.clients.github_issue_creator.Github')
+    def test_add_comment_records_agent_activity(self, mock_github_class, mock_github_token,
+                                                mock_repository_name, tmp_path):
+        """Test that agent comments update the activity index"""
+        mock_github_instance = Mock()
+        mock_repo = Mock()
+        mock_github_class.return_value = mock_github_instance
+        mock_github_instance.get_repo.return_value = mock_repo
+
+        creator = GitHubIssueCreator(mock_github_token, mock_repository_name,
+                                     activity_index_path=str(tmp_path / "activity.json"))
+        creator.add_comment(9, "🤖 Deliverable generated")
+
+        mock_repo.get_issue.return_value.create_comment.assert_called_once_with("🤖 Deliverable generated")
+        assert creator.activity_index.has_activity(9)
+
 
 @pytest.mark.integration
 class TestGitHubOperationsIntegration:
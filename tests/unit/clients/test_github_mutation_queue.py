@@ -0,0 +1,309 @@
+"""
+Unit tests for the batched GitHub mutation queue
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from github.GithubException import GithubException, RateLimitExceededException
+
+from src.clients.github_mutation_queue import GitHubMutationQueue, COMMENT_SEPARATOR, apply_issue_updates
+
+
+def _resolve_response(variables):
+    """Answer an ID resolution query: every issue, label and user exists"""
+    repository = {}
+    data = {'repository': repository}
+    for key, value in variables.items():
+        if key.startswith('n'):
+            repository['i' + key[1:]] = {'id': f"ISSUE_{value}"}
+        elif key.startswith('l'):
+            repository[key] = {'id': f"LABEL_{value}"}
+        elif key.startswith('u'):
+            data[key] = {'id': f"USER_{value}"}
+    return data, []
+
+
+@pytest.fixture
+def github_client():
+    client = Mock()
+    client.graphql.owner = 'owner'
+    client.graphql.name = 'repo'
+    client._extract_github_error_message.side_effect = lambda e: str(e)
+
+    def execute(query, variables):
+        if query.startswith('query'):
+            return _resolve_response(variables)
+        return {}, []
+
+    client.graphql.execute.side_effect = execute
+    return client
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with patch('src.clients.github_mutation_queue.time.sleep') as sleep:
+        yield sleep
+
+
+def _mutations(client):
+    return [call for call in client.graphql.execute.call_args_list if call[0][0].startswith('mutation')]
+
+
+class TestQueueing:
+    """Test coalescing of queued changes"""
+
+    def test_changes_are_coalesced_per_issue(self, github_client):
+        queue = GitHubMutationQueue(github_client)
+        queue.add_labels(1, ['research', 'analysis'])
+        queue.add_comment(1, 'first')
+        queue.add_comment(1, 'second')
+        queue.add_labels(2, ['security'])
+
+        assert queue.pending_count == 2
+        assert queue.stats.requested_operations == 5
+
+        stats = queue.flush()
+
+        assert queue.pending_count == 0
+        assert stats['issues_flushed'] == 2
+        assert stats['api_calls'] == 2
+        assert stats['calls_saved'] == 3
+        mutations = _mutations(github_client)
+        assert len(mutations) == 1
+        document, variables = mutations[0][0]
+        assert 'i0_labels: addLabelsToLabelable' in document
+        assert 'i0_comment: addComment' in document
+        assert 'i1_labels: addLabelsToLabelable' in document
+        assert variables['i0_labels'] == ['LABEL_research', 'LABEL_analysis']
+        assert variables['i0_comment'] == f"first{COMMENT_SEPARATOR}second"
+        github_client.activity_index.record_activity.assert_called_once_with(1, 'comment', save=False)
+        github_client.activity_index.save.assert_called_once()
+
+    def test_later_removal_cancels_addition(self, github_client):
+        queue = GitHubMutationQueue(github_client)
+        queue.add_labels(1, ['needs-review'])
+        queue.remove_labels(1, ['needs-review'])
+
+        queue.flush()
+
+        document, variables = _mutations(github_client)[0][0]
+        assert 'removeLabelsFromLabelable' in document
+        assert 'addLabelsToLabelable' not in document
+
+    def test_label_ids_are_cached_between_batches(self, github_client):
+        queue = GitHubMutationQueue(github_client, batch_size=1, max_batch_size=1)
+        queue.add_labels(1, ['research'])
+        queue.add_labels(2, ['research'])
+
+        queue.flush()
+
+        resolve_calls = [call for call in github_client.graphql.execute.call_args_list
+                         if call[0][0].startswith('query')]
+        assert 'l0' in resolve_calls[0][0][1]
+        assert 'l0' not in resolve_calls[1][0][1]
+
+    def test_empty_flush_makes_no_calls(self, github_client):
+        stats = GitHubMutationQueue(github_client).flush()
+
+        assert stats['api_calls'] == 0
+        github_client.graphql.execute.assert_not_called()
+
+
+class TestFailures:
+    """Test partial failures, fallbacks and rate limiting"""
+
+    def test_mutation_errors_identify_failed_issue(self, github_client):
+        def execute(query, variables):
+            if query.startswith('query'):
+                return _resolve_response(variables)
+            return {'i0_comment': None}, [{'path': ['i1_comment'], 'message': 'Issue is locked'}]
+
+        github_client.graphql.execute.side_effect = execute
+        queue = GitHubMutationQueue(github_client)
+        queue.add_comment(1, 'ok')
+        queue.add_comment(2, 'fails')
+
+        stats = queue.flush()
+
+        assert stats['failed_issues'] == {2: 'Issue is locked'}
+        github_client.activity_index.record_activity.assert_called_once_with(1, 'comment', save=False)
+
+    def test_missing_issue_is_reported(self, github_client):
+        github_client.graphql.execute.side_effect = None
+        github_client.graphql.execute.return_value = ({'repository': {'i0': None}}, [
+            {'path': ['repository', 'i0'], 'type': 'NOT_FOUND', 'message': 'Could not resolve'}
+        ])
+        queue = GitHubMutationQueue(github_client)
+        queue.add_comment(99, 'hello')
+
+        stats = queue.flush()
+
+        assert stats['failed_issues'] == {99: 'Issue not found'}
+
+    def test_unknown_label_falls_back_to_rest(self, github_client):
+        def execute(query, variables):
+            data, errors = _resolve_response(variables)
+            if query.startswith('query'):
+                data['repository']['l0'] = None
+            return data, errors
+
+        github_client.graphql.execute.side_effect = execute
+        issue = Mock()
+        github_client.repo.get_issue.return_value = issue
+        queue = GitHubMutationQueue(github_client)
+        queue.add_labels(1, ['brand-new'])
+        queue.add_comment(1, 'hello')
+
+        stats = queue.flush()
+
+        issue.add_to_labels.assert_called_once_with('brand-new')
+        issue.create_comment.assert_not_called()
+        assert stats['rest_calls'] == 2
+        assert stats['failed_issues'] == {}
+
+    def test_rate_limit_halves_batch_size_and_retries(self, github_client, no_sleep):
+        calls = {'mutations': 0}
+
+        def execute(query, variables):
+            if query.startswith('query'):
+                return _resolve_response(variables)
+            calls['mutations'] += 1
+            if calls['mutations'] == 1:
+                raise RateLimitExceededException(403, {'message': 'API rate limit exceeded'}, {})
+            return {}, []
+
+        github_client.graphql.execute.side_effect = execute
+        queue = GitHubMutationQueue(github_client, batch_size=4)
+        for number in range(1, 5):
+            queue.add_comment(number, 'hello')
+
+        stats = queue.flush()
+
+        assert stats['rate_limit_retries'] == 1
+        assert stats['failed_issues'] == {}
+        assert stats['issues_flushed'] == 4
+        no_sleep.assert_called_once()
+        assert len(_mutations(github_client)[1][0][1]) == 4  # two issues: id + comment each
+
+    def test_rate_limited_operation_is_requeued(self, github_client):
+        calls = {'mutations': 0}
+
+        def execute(query, variables):
+            if query.startswith('query'):
+                return _resolve_response(variables)
+            calls['mutations'] += 1
+            if calls['mutations'] == 1:
+                return {}, [{'path': ['i0_comment'], 'type': 'RATE_LIMITED', 'message': 'slow down'}]
+            return {}, []
+
+        github_client.graphql.execute.side_effect = execute
+        queue = GitHubMutationQueue(github_client)
+        queue.add_labels(1, ['research'])
+        queue.add_comment(1, 'hello')
+
+        stats = queue.flush()
+
+        retry_document = _mutations(github_client)[1][0][0]
+        assert 'addComment' in retry_document
+        assert 'addLabelsToLabelable' not in retry_document
+        assert stats['failed_issues'] == {}
+
+    def test_graphql_failure_falls_back_to_rest(self, github_client):
+        github_client.graphql.execute.side_effect = GithubException(502, {'message': 'Bad gateway'}, {})
+        issue = Mock()
+        github_client.repo.get_issue.return_value = issue
+        queue = GitHubMutationQueue(github_client)
+        queue.add_labels(1, ['research'])
+        queue.add_comment(1, 'hello')
+
+        stats = queue.flush()
+
+        issue.add_to_labels.assert_called_once_with('research')
+        issue.create_comment.assert_called_once_with('hello')
+        assert stats['failed_issues'] == {}
+
+    def test_retries_are_counted_per_issue(self, github_client):
+        calls = {'mutations': 0}
+
+        def execute(query, variables):
+            if query.startswith('query'):
+                return _resolve_response(variables)
+            calls['mutations'] += 1
+            if calls['mutations'] in (1, 3):
+                raise RateLimitExceededException(403, {'message': 'API rate limit exceeded'}, {})
+            return {}, []
+
+        github_client.graphql.execute.side_effect = execute
+        queue = GitHubMutationQueue(github_client, batch_size=1, max_retries=1)
+        queue.add_comment(1, 'hello')
+        queue.add_comment(2, 'hello')
+
+        stats = queue.flush()
+
+        assert stats['rate_limit_retries'] == 2
+        assert stats['failed_issues'] == {}
+        assert stats['issues_flushed'] == 2
+
+    def test_issue_fails_after_max_retries(self, github_client):
+        def execute(query, variables):
+            if query.startswith('query'):
+                return _resolve_response(variables)
+            raise RateLimitExceededException(403, {'message': 'API rate limit exceeded'}, {})
+
+        github_client.graphql.execute.side_effect = execute
+        queue = GitHubMutationQueue(github_client, max_retries=2)
+        queue.add_comment(1, 'hello')
+
+        stats = queue.flush()
+
+        assert len(_mutations(github_client)) == 3
+        assert stats['failed_issues'] == {1: "Rate limited"}
+
+    def test_failed_mutation_request_does_not_repost_comment(self, github_client):
+        def execute(query, variables):
+            if query.startswith('query'):
+                return _resolve_response(variables)
+            raise GithubException(502, {'message': 'Bad gateway'}, {})
+
+        github_client.graphql.execute.side_effect = execute
+        posted, missing = Mock(), Mock()
+        posted.get_comments.return_value = [Mock(body='hello')]
+        missing.get_comments.return_value = [Mock(body='unrelated')]
+        github_client.repo.get_issue.side_effect = lambda number: {1: posted, 2: missing}[number]
+        queue = GitHubMutationQueue(github_client)
+        queue.add_labels(1, ['research'])
+        queue.add_comment(1, 'hello')
+        queue.add_comment(2, 'hello')
+
+        stats = queue.flush()
+
+        posted.add_to_labels.assert_called_once_with('research')
+        posted.create_comment.assert_not_called()
+        missing.create_comment.assert_called_once_with('hello')
+        assert 'since' in posted.get_comments.call_args.kwargs
+        assert stats['issues_flushed'] == 2
+        assert stats['failed_issues'] == {}
+
+
+class TestApplyIssueUpdates:
+    """Test the write helper shared by the assignment agents"""
+
+    def test_writes_are_queued_during_a_batch(self, github_client):
+        queue = GitHubMutationQueue(github_client)
+        issue = Mock()
+
+        apply_issue_updates(queue, issue, 7, ['research'], 'Assigned')
+        apply_issue_updates(queue, issue, 8, [], 'Needs review')
+
+        assert queue.pending_count == 2
+        issue.add_to_labels.assert_not_called()
+        issue.create_comment.assert_not_called()
+
+    def test_writes_go_straight_to_rest_without_a_queue(self):
+        issue = Mock()
+
+        apply_issue_updates(None, issue, 7, ['research', 'analysis'], 'Assigned')
+
+        assert [c.args for c in issue.add_to_labels.call_args_list] == [('research',), ('analysis',)]
+        issue.create_comment.assert_called_once_with('Assigned')
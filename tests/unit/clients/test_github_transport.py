@@ -0,0 +1,236 @@
+"""
+Unit tests for the GitHub transport module
+"""
+
+import time
+import pytest
+import requests
+import responses
+from unittest.mock import Mock, patch
+from github import Github, Auth
+
+from src.clients.github_transport import (
+    GitHubResponseCache, RateLimitScheduler, GitHubTransport, cache_key, get_shared_transport
+)
+
+
+API_URL = "https://api.github.com/repos/owner/repo/issues/1"
+
+
+def _rate_headers(remaining=4999, limit=5000, reset=None, resource='core'):
+    return {
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Used': str(limit - remaining),
+        'X-RateLimit-Reset': str(int(reset if reset is not None else time.time() + 3600)),
+        'X-RateLimit-Resource': resource,
+    }
+
+
+@pytest.fixture
+def transport():
+    """Transport with write pacing disabled so tests do not sleep"""
+    return GitHubTransport(scheduler=RateLimitScheduler(min_write_interval=0.0))
+
+
+@pytest.fixture
+def session(transport):
+    session = requests.Session()
+    session.mount('https://', transport.create_adapter())
+    return session
+
+
+class TestGitHubResponseCache:
+    """Test the LRU response cache"""
+
+    def test_store_requires_validator(self):
+        cache = GitHubResponseCache()
+        response = Mock(headers={}, content=b'{}', encoding='utf-8')
+
+        cache.store(API_URL, response)
+
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = GitHubResponseCache(max_entries=2)
+        for index in range(3):
+            response = Mock(headers={'ETag': f'"{index}"'}, content=b'{}', encoding='utf-8')
+            cache.store(f"{API_URL}/{index}", response)
+
+        assert len(cache) == 2
+        assert cache.get(f"{API_URL}/0") is None
+        assert cache.get_stats()['evictions'] == 1
+
+
+class TestCachingHTTPAdapter:
+    """Test conditional request handling"""
+
+    @responses.activate
+    def test_not_modified_served_from_cache(self, transport, session):
+        responses.add(responses.GET, API_URL, json={'number': 1},
+                      headers={'ETag': '"abc"', **_rate_headers(4999)})
+        responses.add(responses.GET, API_URL, status=304,
+                      headers={'ETag': '"abc"', **_rate_headers(4999)})
+
+        first = session.get(API_URL)
+        second = session.get(API_URL)
+
+        assert first.json() == {'number': 1}
+        assert second.status_code == 200
+        assert second.json() == {'number': 1}
+        assert responses.calls[1].request.headers['If-None-Match'] == '"abc"'
+
+        stats = transport.cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+
+    @responses.activate
+    def test_changed_resource_replaces_cache_entry(self, transport, session):
+        responses.add(responses.GET, API_URL, json={'state': 'open'}, headers={'ETag': '"v1"'})
+        responses.add(responses.GET, API_URL, json={'state': 'closed'}, headers={'ETag': '"v2"'})
+
+        session.get(API_URL)
+        second = session.get(API_URL)
+
+        assert second.json() == {'state': 'closed'}
+        [key] = transport.cache._entries
+        assert key.startswith(API_URL)
+        assert transport.cache.get(key).etag == '"v2"'
+
+    @responses.activate
+    def test_cache_is_separate_per_token_and_media_type(self, transport, session):
+        responses.add(responses.GET, API_URL, json={'number': 1}, headers={'ETag': '"abc"'})
+
+        session.get(API_URL, headers={'Authorization': 'token first'})
+        session.get(API_URL, headers={'Authorization': 'token second'})
+        session.get(API_URL, headers={'Authorization': 'token first', 'Accept': 'application/vnd.github.raw+json'})
+        session.get(API_URL, headers={'Authorization': 'token first'})
+
+        assert [call.request.headers.get('If-None-Match') for call in responses.calls] == [None, None, None, '"abc"']
+        assert len(transport.cache) == 3
+        assert all('token' not in key for key in transport.cache._entries)
+
+    def test_cache_key_hashes_credentials(self):
+        key = cache_key(API_URL, {'Authorization': 'token secret', 'Accept': 'application/json'})
+
+        assert key.startswith(f"{API_URL} application/json ")
+        assert 'secret' not in key
+        assert key != cache_key(API_URL, {'Authorization': 'token other', 'Accept': 'application/json'})
+
+    @responses.activate
+    def test_writes_are_not_cached(self, transport, session):
+        responses.add(responses.POST, API_URL, json={'id': 1}, status=201, headers={'ETag': '"w"'})
+
+        session.post(API_URL, json={'body': 'hi'})
+
+        assert len(transport.cache) == 0
+        assert transport.scheduler.get_status()['writes_made'] == 1
+
+    @responses.activate
+    def test_installs_into_pygithub(self, transport):
+        # PyGithub builds request URLs with an explicit port
+        repo_url = "https://api.github.com:443/repos/owner/repo"
+        payload = {'full_name': 'owner/repo', 'name': 'repo', 'url': repo_url}
+        responses.add(responses.GET, repo_url, json=payload,
+                      headers={'ETag': '"repo"', **_rate_headers(4990)})
+        responses.add(responses.GET, repo_url, status=304, headers=_rate_headers(4990))
+
+        github = Github(auth=Auth.Token("test-token"))
+        assert transport.install(github) is True
+
+        assert github.get_repo("owner/repo").full_name == 'owner/repo'
+        assert github.get_repo("owner/repo").full_name == 'owner/repo'
+
+        stats = transport.get_stats()
+        assert stats['cache']['hits'] == 1
+        assert stats['rate_limit']['resources']['core']['remaining'] == 4990
+
+
+class TestRateLimitScheduler:
+    """Test rate-limit header tracking and pacing"""
+
+    def test_resource_for_url(self):
+        assert RateLimitScheduler.resource_for_url("https://api.github.com/graphql") == 'graphql'
+        assert RateLimitScheduler.resource_for_url("https://api.github.com/search/issues?q=x") == 'search'
+        assert RateLimitScheduler.resource_for_url(API_URL) == 'core'
+
+    def test_update_from_response(self):
+        scheduler = RateLimitScheduler()
+        scheduler.update_from_response(API_URL, 200, _rate_headers(remaining=42, limit=5000))
+
+        core = scheduler.get_status()['resources']['core']
+        assert core['remaining'] == 42
+        assert core['limit'] == 5000
+        assert core['used'] == 4958
+
+    @patch('src.clients.github_transport.time.sleep')
+    def test_writes_are_spaced(self, mock_sleep):
+        scheduler = RateLimitScheduler(min_write_interval=1.0)
+
+        assert scheduler.before_request('GET', API_URL) == 0
+        assert scheduler.before_request('POST', API_URL) == 0
+        assert scheduler.before_request('PATCH', API_URL) > 0.9
+
+        mock_sleep.assert_called_once()
+
+    @patch('src.clients.github_transport.time.sleep')
+    def test_low_budget_spreads_writes(self, mock_sleep):
+        scheduler = RateLimitScheduler(min_write_interval=1.0, reserve_requests=50)
+        scheduler.update_from_response(API_URL, 200, _rate_headers(remaining=10, reset=time.time() + 100))
+
+        scheduler.before_request('POST', API_URL)
+        wait = scheduler.before_request('POST', API_URL)
+
+        assert wait > 5
+
+    @patch('src.clients.github_transport.time.sleep')
+    def test_exhausted_budget_waits_for_reset(self, mock_sleep):
+        scheduler = RateLimitScheduler()
+        scheduler.update_from_response(API_URL, 200, _rate_headers(remaining=0, reset=time.time() + 30))
+
+        wait = scheduler.before_request('GET', API_URL)
+
+        assert 25 < wait <= 30
+        # Other resources are unaffected
+        assert scheduler.before_request('GET', "https://api.github.com/search/issues") == 0
+
+    @patch('src.clients.github_transport.time.sleep')
+    def test_retry_after_blocks_requests(self, mock_sleep):
+        scheduler = RateLimitScheduler()
+        scheduler.update_from_response(API_URL, 403, {'Retry-After': '60'})
+
+        wait = scheduler.before_request('GET', API_URL)
+
+        assert 55 < wait <= 60
+        assert scheduler.get_status()['secondary_limit_hits'] == 1
+
+
+class TestTransportInstallation:
+    """Test transport installation and sharing"""
+
+    def test_install_rejects_unknown_client(self, transport):
+        assert transport.install(object()) is False
+
+    def test_install_requires_the_requester_attribute(self, transport):
+        # A Mock answers every hasattr, but does not own the attribute
+        github = Mock()
+
+        assert transport.install(github) is False
+
+    def test_install_sets_connection_class_on_real_requester(self, transport):
+        github = Github(auth=Auth.Token("test-token"))
+
+        assert transport.install(github) is True
+        assert vars(github.requester)['_Requester__connectionClass'] is transport.connection_class
+
+    def test_install_skips_unsupported_pygithub(self, transport):
+        github = Github(auth=Auth.Token("test-token"))
+        original = github.requester._Requester__connectionClass
+
+        with patch('src.clients.github_transport._pygithub_version', return_value=(3, 0)):
+            assert transport.install(github) is False
+        assert github.requester._Requester__connectionClass is original
+
+    def test_shared_transport_is_singleton(self):
+        assert get_shared_transport() is get_shared_transport()
@@ -0,0 +1,174 @@
+"""
+Unit tests for the issue discovery module
+"""
+
+from datetime import datetime, timezone, timedelta
+from unittest.mock import Mock
+
+from src.clients.issue_discovery import IssueQuery, IssueDiscovery, NO_ASSIGNEE
+
+
+def _issue(number, labels=(), pull_request=None):
+    issue = Mock()
+    issue.number = number
+    issue.labels = []
+    for name in labels:
+        label = Mock()
+        label.name = name  # Mock(name=...) names the mock itself
+        issue.labels.append(label)
+    issue.pull_request = pull_request
+    return issue
+
+
+def _github(recent=()):
+    """GitHub client whose issue list endpoint returns ``recent``"""
+    github = Mock()
+    github.get_repo.return_value.get_issues.side_effect = lambda **parameters: iter(recent)
+    return github
+
+
+class _SearchResults:
+    """Search results that report GitHub's total_count"""
+
+    def __init__(self, issues, total_count):
+        self.issues = issues
+        self.totalCount = total_count
+
+    def __iter__(self):
+        return iter(self.issues)
+
+
+class TestIssueQuery:
+    """Test compilation of filters into search queries"""
+
+    def test_default_query(self):
+        query = IssueQuery(labels=['site-monitor'])
+
+        assert query.to_search_query('owner/repo') == (
+            'repo:owner/repo is:issue state:open label:site-monitor sort:created-desc'
+        )
+
+    def test_all_filters(self):
+        query = IssueQuery(
+            labels=['site-monitor'],
+            any_labels=['intelligence-analyst', 'needs review'],
+            assignee=NO_ASSIGNEE,
+            updated_since=datetime(2025, 3, 1, 12, 30, tzinfo=timezone(timedelta(hours=2))),
+            sort=''
+        )
+
+        assert query.to_search_query('owner/repo') == (
+            'repo:owner/repo is:issue state:open label:site-monitor '
+            'label:intelligence-analyst,"needs review" no:assignee updated:>=2025-03-01T10:30:00Z'
+        )
+
+    def test_assignee_and_any_state(self):
+        query = IssueQuery(assignee='octocat', state='all')
+
+        search = query.to_search_query('owner/repo')
+
+        assert 'assignee:octocat' in search
+        assert 'state:' not in search
+
+
+class TestIssueDiscovery:
+    """Test lazy pagination of search results"""
+
+    def test_stops_at_limit(self):
+        consumed = []
+
+        def results():
+            for number in range(1, 100):
+                consumed.append(number)
+                yield _issue(number)
+
+        github = _github()
+        github.search_issues.return_value = results()
+        discovery = IssueDiscovery(github, 'owner/repo')
+
+        issues = list(discovery.iter_issues(IssueQuery(labels=['site-monitor']), limit=3))
+
+        assert [issue.number for issue in issues] == [1, 2, 3]
+        assert consumed == [1, 2, 3]
+
+    def test_multiple_queries_deduplicate(self):
+        github = _github()
+        github.search_issues.side_effect = [
+            iter([_issue(1), _issue(2)]),
+            iter([_issue(2), _issue(3)])
+        ]
+        discovery = IssueDiscovery(github, 'owner/repo')
+
+        issues = list(discovery.iter_issues([IssueQuery(assignee='a'), IssueQuery(assignee='b')]))
+
+        assert [issue.number for issue in issues] == [1, 2, 3]
+        assert github.search_issues.call_count == 2
+
+    def test_later_queries_not_run_when_limit_reached(self):
+        github = _github()
+        github.search_issues.return_value = iter([_issue(1)])
+        discovery = IssueDiscovery(github, 'owner/repo')
+
+        list(discovery.iter_issues([IssueQuery(assignee='a'), IssueQuery(assignee='b')], limit=1))
+
+        github.search_issues.assert_called_once()
+
+    def test_zero_limit(self):
+        github = _github()
+        discovery = IssueDiscovery(github, 'owner/repo')
+
+        assert list(discovery.iter_issues(IssueQuery(), limit=0)) == []
+        github.search_issues.assert_not_called()
+
+    def test_recent_issues_come_from_list_endpoint(self):
+        github = _github(recent=[_issue(9), _issue(8, pull_request=Mock())])
+        github.search_issues.return_value = iter([_issue(9), _issue(2)])
+        discovery = IssueDiscovery(github, 'owner/repo')
+
+        issues = list(discovery.iter_issues(IssueQuery(labels=['site-monitor'], assignee=NO_ASSIGNEE)))
+
+        assert [issue.number for issue in issues] == [9, 2]
+        parameters = github.get_repo.return_value.get_issues.call_args.kwargs
+        assert parameters['labels'] == ['site-monitor']
+        assert parameters['assignee'] == NO_ASSIGNEE
+        assert datetime.now(timezone.utc) - parameters['since'] < timedelta(minutes=6)
+
+    def test_capped_search_falls_back_to_list_endpoint(self):
+        listed = [_issue(number) for number in range(1, 4)]
+        github = _github()
+        github.get_repo.return_value.get_issues.side_effect = [iter([]), iter(listed)]
+        github.search_issues.return_value = _SearchResults([_issue(1)], total_count=1500)
+        discovery = IssueDiscovery(github, 'owner/repo')
+
+        issues = list(discovery.iter_issues(IssueQuery(labels=['site-monitor'])))
+
+        assert [issue.number for issue in issues] == [1, 2, 3]
+        assert 'since' not in github.get_repo.return_value.get_issues.call_args.kwargs
+
+    def test_fresh_query_skips_search(self):
+        github = _github(recent=[_issue(5)])
+        discovery = IssueDiscovery(github, 'owner/repo')
+        query = IssueQuery(updated_since=datetime.now(timezone.utc) - timedelta(minutes=1))
+
+        assert [issue.number for issue in discovery.iter_issues(query)] == [5]
+        github.search_issues.assert_not_called()
+
+
+class TestListEndpointFilters:
+    """Test translation of filters for the issue list endpoint"""
+
+    def test_list_parameters(self):
+        since = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        query = IssueQuery(labels=['site-monitor'], assignee='octocat', state='all', sort='updated-asc')
+
+        assert query.to_list_parameters(since) == {
+            'state': 'all', 'labels': ['site-monitor'], 'assignee': 'octocat',
+            'since': since, 'sort': 'updated', 'direction': 'asc'
+        }
+
+    def test_any_labels_and_pull_requests_are_checked_locally(self):
+        query = IssueQuery(any_labels=['intelligence-analyst', 'osint-researcher'])
+
+        assert query.matches(_issue(1, labels=['site-monitor', 'osint-researcher']))
+        assert not query.matches(_issue(2, labels=['site-monitor']))
+        assert not query.matches(_issue(3, labels=['osint-researcher'], pull_request=Mock()))
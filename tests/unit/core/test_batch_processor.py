@@ -27,6 +27,9 @@ from src.core.issue_processor import (
     IssueProcessor, IssueProcessingStatus, ProcessingResult, IssueData
 )
 from src.clients.github_issue_creator import GitHubIssueCreator
+from src.storage.git_manager import GitManager
+from src.utils.profiling import ProfileSession, profile_scope
+from src.utils.tracing import span
 
 
 class TestBatchConfig:
@@ -202,79 +205,49 @@ class TestBatchProcessor:
     
     def test_find_site_monitor_issues(self, batch_processor, mock_github_client):
         """Test finding site-monitor issues."""
-        # Mock GitHub API response
-        mock_label1 = Mock()
-        mock_label1.name = 'site-monitor'
-        mock_label2 = Mock()
-        mock_label2.name = 'urgent'
-        
-        mock_issue1 = Mock()
-        mock_issue1.number = 123
-        mock_issue1.assignee = None
-        mock_issue1.labels = [mock_label1, mock_label2]
-        
-        mock_label3 = Mock()
-        mock_label3.name = 'site-monitor'
-        
-        mock_issue2 = Mock()
-        mock_issue2.number = 124
-        mock_issue2.assignee = Mock(login='user1')
-        mock_issue2.labels = [mock_label3]
-        
-        mock_github_client.get_issues_with_labels.return_value = [mock_issue1, mock_issue2]
+        # Assigned issues are excluded by the mirror query itself
+        mock_github_client.get_mirrored_issues.return_value = [
+            {'number': 123, 'assignee': None, 'labels': ['site-monitor', 'urgent']}
+        ]
         
         # Test with default filters (should exclude assigned issues)
         issue_numbers = batch_processor._find_site_monitor_issues({})
         
         assert issue_numbers == [123]  # Only unassigned issue
-        mock_github_client.get_issues_with_labels.assert_called_once_with(['site-monitor'], state='open')
+        query = mock_github_client.get_mirrored_issues.call_args[0][0]
+        assert query.labels == ['site-monitor']
+        assert query.state == 'open'
+        assert query.assignee == 'none'
     
     def test_find_site_monitor_issues_with_assignee_filter(self, batch_processor, mock_github_client):
         """Test finding issues with assignee filter."""
-        mock_label = Mock()
-        mock_label.name = 'site-monitor'
-        
-        mock_issue = Mock()
-        mock_issue.number = 123
-        mock_issue.assignee = Mock(login='user1')
-        mock_issue.labels = [mock_label]
-        
-        mock_github_client.get_issues_with_labels.return_value = [mock_issue]
+        mock_github_client.get_mirrored_issues.return_value = [
+            {'number': 123, 'assignee': 'user1', 'labels': ['site-monitor']}
+        ]
         
         # Test with specific assignee filter
         filters = {'assignee': 'user1'}
         issue_numbers = batch_processor._find_site_monitor_issues(filters)
         
         assert issue_numbers == [123]
+        query = mock_github_client.get_mirrored_issues.call_args[0][0]
+        assert query.assignee == 'user1'
     
     def test_find_site_monitor_issues_with_label_filter(self, batch_processor, mock_github_client):
         """Test finding issues with additional label filter."""
-        # Create mock labels properly
-        mock_site_label1 = Mock()
-        mock_site_label1.name = 'site-monitor'
-        mock_urgent_label = Mock()
-        mock_urgent_label.name = 'urgent'
-        
-        mock_issue1 = Mock()
-        mock_issue1.number = 123
-        mock_issue1.assignee = None
-        mock_issue1.labels = [mock_site_label1, mock_urgent_label]
-        
-        mock_site_label2 = Mock()
-        mock_site_label2.name = 'site-monitor'
-        
-        mock_issue2 = Mock()
-        mock_issue2.number = 124
-        mock_issue2.assignee = None
-        mock_issue2.labels = [mock_site_label2]
-        
-        mock_github_client.get_issues_with_labels.return_value = [mock_issue1, mock_issue2]
+        # Issues lacking the urgent label are excluded by the mirror query
+        mock_github_client.get_mirrored_issues.return_value = [
+            {'number': 123, 'assignee': None, 'labels': ['site-monitor', 'urgent']}
+        ]
         
         # Test with additional label filter
         filters = {'additional_labels': ['urgent']}
         issue_numbers = batch_processor._find_site_monitor_issues(filters)
         
         assert issue_numbers == [123]  # Only issue with urgent label
+        query = mock_github_client.get_mirrored_issues.call_args[0][0]
+        assert query.labels == ['site-monitor']
+        assert query.any_labels == ['urgent']
     
     def test_process_single_issue_success(self, batch_processor, mock_issue_processor, mock_github_client):
         """Test successful single issue processing."""
@@ -423,6 +396,88 @@ class TestBatchProcessor:
         assert metrics.error_count == 1
         assert len(batch_results) == 2
     
+    def test_process_issues_records_stage_timings(self, batch_processor, mock_issue_processor, mock_github_client, tmp_path):
+        """Test that spans opened while processing are summarized per stage."""
+        mock_github_client.get_issue_data.return_value = {
+            'title': 'Test Issue',
+            'body': 'Test body',
+            'labels': ['site-monitor'],
+            'assignees': [],
+            'url': 'https://github.com/repo/issues/123'
+        }
+        
+        def process_issue(issue_data):
+            with span("issue.process", issue_number=issue_data.number):
+                return ProcessingResult(issue_number=issue_data.number, status=IssueProcessingStatus.COMPLETED)
+        
+        mock_issue_processor.process_issue.side_effect = process_issue
+        
+        metrics, _ = batch_processor.process_issues([123, 124])
+        output_path = tmp_path / "results.json"
+        batch_processor.save_batch_results([], str(output_path))
+        
+        import json
+        saved = json.loads(output_path.read_text())
+        
+        assert metrics.stage_timings['issue.process']['count'] == 2
+        assert saved['stage_timings'] == metrics.stage_timings
+    
+    def test_save_batch_results_includes_active_profile(self, batch_processor, tmp_path):
+        """Test that a running profile is written next to the batch results."""
+        output_path = tmp_path / "results.json"
+        
+        with ProfileSession(tmp_path / "profiles", "run", sample_interval_ms=0, trace_memory=False):
+            with profile_scope("issue-123"):
+                pass
+            batch_processor.save_batch_results([], str(output_path))
+        
+        import json
+        profile = json.loads(output_path.read_text())['profile']
+        
+        assert profile['files']['pstats'] == str(tmp_path / "results.profile.pstats")
+        assert profile['issues']['issue-123']['calls'] == 1
+    
+    def test_worktree_mode_fetches_once_per_batch(self, batch_processor, mock_issue_processor, mock_github_client):
+        """Test that worktree mode prepares the base once per batch and closes the pool."""
+        git_manager = Mock(spec=GitManager)
+        git_manager.use_worktrees = True
+        mock_issue_processor.git_manager = git_manager
+        mock_github_client.get_issue_data.return_value = {'title': 'Test Issue', 'labels': []}
+        mock_issue_processor.process_issue.side_effect = lambda issue: ProcessingResult(
+            issue_number=issue.number, status=IssueProcessingStatus.COMPLETED
+        )
+        
+        with patch('src.core.batch_processor.time.sleep'):
+            batch_processor.process_issues([1, 2, 3, 4])
+        
+        assert git_manager.prepare_batch.call_count == 2  # Two batches of two issues
+        git_manager.close_worktrees.assert_called_once()
+        # Pushes are deferred and sent once per batch (plus a final flush)
+        assert git_manager.flush_pushes.call_count == 3
+        assert git_manager.defer_pushes is False
+    
+    def test_direct_commits_are_flushed_once_per_batch(self, batch_processor, mock_issue_processor,
+                                                       mock_github_client):
+        """Test that direct commits are deferred and written before each batch's pushes."""
+        git_manager = Mock(spec=GitManager)
+        git_manager.use_worktrees = False
+        git_manager.direct_commits = True
+        mock_issue_processor.git_manager = git_manager
+        mock_github_client.get_issue_data.return_value = {'title': 'Test Issue', 'labels': []}
+        
+        def process(issue):
+            assert git_manager.defer_commits is True
+            return ProcessingResult(issue_number=issue.number, status=IssueProcessingStatus.COMPLETED)
+        mock_issue_processor.process_issue.side_effect = process
+        
+        with patch('src.core.batch_processor.time.sleep'):
+            batch_processor.process_issues([1, 2, 3, 4])
+        
+        flushes = [name for name, _, _ in git_manager.method_calls
+                   if name in ('flush_commits', 'flush_pushes')]
+        assert flushes == ['flush_commits', 'flush_pushes'] * 3  # Two batches plus a final flush
+        assert git_manager.defer_commits is False
+    
     def test_process_site_monitor_issues(self, batch_processor, mock_github_client):
         """Test processing all site-monitor issues."""
         # Mock finding issues
@@ -434,7 +489,7 @@ class TestBatchProcessor:
         mock_issue.assignee = None
         mock_issue.labels = [mock_label]
         
-        mock_github_client.get_issues_with_labels.return_value = [mock_issue]
+        mock_github_client.get_mirrored_issues.return_value = [{'number': 123, 'assignee': None, 'labels': ['site-monitor']}]
         
         # Mock batch processing
         with patch.object(batch_processor, 'process_issues') as mock_process:
@@ -590,7 +645,7 @@ class TestBatchProcessorIntegration:
         mock_issue.assignee = None
         mock_issue.labels = [mock_label]
         
-        github_client.get_issues_with_labels.return_value = [mock_issue]
+        github_client.get_mirrored_issues.return_value = [{'number': 123, 'assignee': None, 'labels': ['site-monitor']}]
         github_client.get_issue_data.return_value = {
             'title': 'Test Issue',
             'body': 'Test body',
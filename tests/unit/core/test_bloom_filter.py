@@ -0,0 +1,107 @@
+"""
+Unit tests for Bloom filters
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from src.core.bloom_filter import BloomFilter, DailyBloomFilter
+
+
+class TestBloomFilter:
+    """Test the fixed-size filter"""
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        keys = [f"https://example.com/{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+        assert bloom.is_full
+
+    def test_false_positive_rate_near_target(self):
+        bloom = BloomFilter(capacity=2000, error_rate=0.01)
+        for i in range(2000):
+            bloom.add(f"seen-{i}")
+
+        false_positives = sum(1 for i in range(10000) if f"unseen-{i}" in bloom)
+
+        assert false_positives < 250
+
+    def test_round_trip(self):
+        bloom = BloomFilter(capacity=100)
+        bloom.add("a")
+
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+
+        assert "a" in restored
+        assert "b" not in restored
+        assert restored.count == 1
+        assert restored.num_hashes == bloom.num_hashes
+
+    def test_rejects_invalid_data(self):
+        with pytest.raises(ValueError):
+            BloomFilter.from_bytes(b"XXXX" + bytes(60))
+
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=10, error_rate=1.5)
+
+
+class TestDailyBloomFilter:
+    """Test day-bucketed filters"""
+
+    def test_persists_buckets_and_metadata(self, tmp_path):
+        bloom = DailyBloomFilter(str(tmp_path / "filter"), retention_days=30)
+        assert not bloom.exists
+        bloom.add("url:a", date.today())
+        bloom.save({'store': [1, 2]})
+
+        reloaded = DailyBloomFilter(str(tmp_path / "filter"), retention_days=30)
+
+        assert reloaded.exists
+        assert reloaded.metadata == {'store': [1, 2]}
+        assert reloaded.might_contain("url:a")
+        assert not reloaded.might_contain("url:b")
+        assert len(reloaded) == 1
+
+    def test_rotation_drops_expired_days(self, tmp_path):
+        today = date(2025, 3, 31)
+        bloom = DailyBloomFilter(str(tmp_path / "filter"), retention_days=7)
+        bloom.add("old", today - timedelta(days=10))
+        bloom.add("recent", today - timedelta(days=2))
+        bloom.save({})
+
+        dropped = bloom.rotate(today)
+        bloom.save()
+
+        assert dropped == 1
+        assert not bloom.might_contain("old")
+        assert bloom.might_contain("recent")
+        assert sorted(path.name for path in (tmp_path / "filter").glob("*.bloom")) == ["2025-03-29.0.bloom"]
+
+    def test_busy_day_grows_another_filter(self, tmp_path):
+        bloom = DailyBloomFilter(str(tmp_path / "filter"), capacity_per_day=10)
+        for i in range(25):
+            bloom.add(f"key-{i}", date(2025, 1, 1))
+        bloom.save({})
+
+        files = sorted(path.name for path in (tmp_path / "filter").glob("*.bloom"))
+
+        assert files == ["2025-01-01.0.bloom", "2025-01-01.1.bloom", "2025-01-01.2.bloom"]
+        assert all(bloom.might_contain(f"key-{i}") for i in range(25))
+
+    def test_corrupt_bucket_is_discarded(self, tmp_path):
+        bloom = DailyBloomFilter(str(tmp_path / "filter"))
+        bloom.add("a", date(2025, 1, 1))
+        bloom.save({'store': None})
+        (tmp_path / "filter" / "2025-01-01.0.bloom").write_bytes(b"garbage")
+
+        reloaded = DailyBloomFilter(str(tmp_path / "filter"))
+
+        assert not reloaded.exists
+        assert len(reloaded) == 0
@@ -210,16 +210,20 @@ class TestCopilotAssignmentDetection:
             # Patch the method directly to return test data
             with patch.object(processor, '_should_process_copilot_issue', return_value=True):
                 with patch.object(processor, '_convert_issue_to_dict', return_value={'number': 123, 'title': 'Test Issue'}):
-                    # Mock repo.get_issues to return our mock_issue
-                    processor.github.repo.get_issues = Mock(return_value=[mock_issue])
+                    # Mock issue discovery to return our mock_issue
+                    processor.github.discover_issues = Mock(return_value=iter([mock_issue]))
                     
                     issues = processor.get_copilot_assigned_issues()
                     
                     assert len(issues) == 1
                     assert issues[0]['number'] == 123
+                    queries = processor.github.discover_issues.call_args[0][0]
+                    assert [query.assignee for query in queries] == [
+                        'github-copilot[bot]', 'copilot', 'github-actions[bot]'
+                    ]
                     
                     # Test with limit
-                    processor.github.repo.get_issues = Mock(return_value=[])  # Empty for limit test
+                    processor.github.discover_issues = Mock(return_value=iter([]))  # Empty for limit test
                     issues = processor.get_copilot_assigned_issues(limit=0)
                     assert len(issues) == 0
 
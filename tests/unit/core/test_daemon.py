@@ -0,0 +1,152 @@
+"""
+Unit tests for the service daemon and its scheduler
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.daemon import DaemonComponents, Scheduler, ServiceDaemon
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _components() -> DaemonComponents:
+    monitor_service = Mock()
+    monitor_service.run_monitoring_cycle.return_value = {
+        'success': True, 'new_results_found': 2, 'individual_issues_created': 2
+    }
+    processor = Mock()
+    processor.flush_processing_state.return_value = True
+    orchestrator = Mock()
+    orchestrator.process_all_site_monitor_issues.return_value = (
+        SimpleNamespace(processed_count=2, total_issues=2, error_count=0), []
+    )
+    return DaemonComponents(monitor_service, processor, orchestrator)
+
+
+class TestScheduler:
+    """Test job timing"""
+
+    def test_runs_due_jobs_at_their_interval(self):
+        clock = FakeClock()
+        scheduler = Scheduler(clock)
+        calls = []
+        scheduler.add_job('fast', 10, lambda: calls.append('fast'))
+        scheduler.add_job('slow', 30, lambda: calls.append('slow'), run_immediately=False)
+
+        assert scheduler.run_pending() == ['fast']
+        clock.now = 10
+        assert scheduler.run_pending() == ['fast']
+        clock.now = 30
+        assert scheduler.run_pending() == ['fast', 'slow']
+        assert scheduler.seconds_until_next() == 10
+
+    def test_failure_is_recorded_and_rescheduled(self):
+        clock = FakeClock()
+        scheduler = Scheduler(clock)
+        job = scheduler.add_job('broken', 5, Mock(side_effect=RuntimeError("quota")))
+
+        scheduler.run_pending()
+
+        assert job.failures == 1
+        assert job.last_error == "quota"
+        assert job.next_run == 5
+
+    def test_overrunning_job_does_not_queue_missed_runs(self):
+        clock = FakeClock()
+        scheduler = Scheduler(clock)
+
+        def slow():
+            clock.now += 25
+
+        job = scheduler.add_job('slow', 10, slow)
+        scheduler.run_pending()
+
+        assert job.next_run == 25
+
+    def test_rejects_non_positive_interval(self):
+        with pytest.raises(ValueError):
+            Scheduler().add_job('never', 0, lambda: None)
+
+
+class TestServiceDaemon:
+    """Test the daemon's jobs, checkpoints and reloads"""
+
+    def test_once_runs_monitor_process_and_checkpoint(self):
+        components = _components()
+        daemon = ServiceDaemon(build=lambda: components, batch_size=5)
+
+        daemon.run(once=True)
+
+        components.monitor_service.run_monitoring_cycle.assert_called_once_with(create_individual_issues=True)
+        components.orchestrator.process_all_site_monitor_issues.assert_called_once_with(batch_size=5)
+        assert components.processor.defer_state_saves is True
+        assert components.processor.flush_processing_state.called
+        assert components.monitor_service.dedup_manager.save_processed_entries.called
+
+    def test_failed_monitoring_cycle_counts_as_job_failure(self):
+        components = _components()
+        components.monitor_service.run_monitoring_cycle.return_value = {'success': False, 'error': "boom"}
+        daemon = ServiceDaemon(build=lambda: components, process_interval=0)
+
+        daemon.run(once=True)
+
+        monitor = next(job for job in daemon.scheduler.status() if job['name'] == 'monitor')
+        assert "boom" in monitor['last_error']
+
+    def test_reload_replaces_components(self):
+        builds = [_components(), _components()]
+        daemon = ServiceDaemon(build=lambda: builds.pop(0))
+        daemon.start()
+        first = daemon.components
+
+        assert daemon.reload() is True
+        assert daemon.components is not first
+        first.processor.flush_processing_state.assert_called_once()
+        first.processor.close.assert_called_once()
+        first.monitor_service.github_client.close.assert_called_once()
+        daemon.components.processor.close.assert_not_called()
+
+    def test_close_failures_do_not_stop_reload(self):
+        builds = [_components(), _components()]
+        daemon = ServiceDaemon(build=lambda: builds.pop(0))
+        daemon.start()
+        first = daemon.components
+        first.processor.close.side_effect = OSError("worktree busy")
+
+        assert daemon.reload() is True
+        first.monitor_service.github_client.close.assert_called_once()
+
+    def test_failed_reload_keeps_previous_components(self):
+        components = _components()
+        build = Mock(side_effect=[components, ValueError("bad config")])
+        daemon = ServiceDaemon(build=build)
+        daemon.start()
+
+        assert daemon.reload() is False
+        assert daemon.components is components
+        components.processor.close.assert_not_called()
+
+    def test_stop_request_ends_run_loop(self, tmp_path):
+        components = _components()
+        daemon = ServiceDaemon(build=lambda: components, process_interval=0,
+                               metrics_file=str(tmp_path / "speculum.prom"))
+        components.monitor_service.run_monitoring_cycle.side_effect = lambda **kwargs: (
+            daemon.request_stop() or {'success': True, 'new_results_found': 0, 'individual_issues_created': 0}
+        )
+
+        daemon.run()
+
+        assert components.monitor_service.run_monitoring_cycle.call_count == 1
+        assert (tmp_path / "speculum.prom").exists()
+        components.processor.close.assert_called_once()
@@ -11,9 +11,9 @@ from unittest.mock import patch
 
 from src.core.deduplication import (
     ProcessedEntry, DeduplicationManager, create_url_fingerprint, 
-    merge_deduplication_files
+    iter_stored_entries, merge_deduplication_files
 )
-from src.clients.search_client import SearchResult
+from src.clients.search_client import SearchResult, normalize_url
 
 
 class TestProcessedEntry:
@@ -117,6 +117,52 @@ class TestProcessedEntry:
         assert entry.issue_number == 42
         assert entry.content_hash == 'testhash123456'
 
+    def test_from_dict_trusts_stored_values(self):
+        """Test that stored normalized URLs and hashes are not recomputed"""
+        data = {
+            'url': "https://example.com/page?utm_source=feed",
+            'title': "Test Page",
+            'site_name': "Example Site",
+            'processed_at': "2025-01-01T12:30:45.123456",
+            'content_hash': 'storedhash000000',
+            'normalized_url': "https://example.com/page"
+        }
+
+        with patch('src.core.deduplication.normalize_url') as mock_normalize:
+            entry = ProcessedEntry.from_dict(data)
+
+        mock_normalize.assert_not_called()
+        assert entry.normalized_url == "https://example.com/page"
+        assert entry.content_hash == 'storedhash000000'
+        assert entry.processed_at == datetime(2025, 1, 1, 12, 30, 45, 123456)
+
+    def test_compact_representation(self):
+        """Test slotted entries with integer timestamps and interned site names"""
+        processed_at = datetime(2025, 1, 1, 12, 0, 0, 500)
+        entry1 = ProcessedEntry("https://example.com/a", "A", "".join(["Example", " Site"]),
+                                processed_at=processed_at)
+        entry2 = ProcessedEntry("https://example.com/b", "B", "".join(["Example ", "Site"]))
+
+        assert not hasattr(entry1, '__dict__')
+        assert isinstance(entry1.processed_us, int)
+        assert entry1.processed_at == processed_at
+        assert entry1.site_name is entry2.site_name
+        assert entry1.url is entry1.normalized_url
+
+        entry1.processed_at = datetime(2024, 6, 1)
+        assert entry1.processed_at == datetime(2024, 6, 1)
+
+    def test_to_json_matches_to_dict(self):
+        """Test that the fast serializer produces the same object as to_dict"""
+        entry = ProcessedEntry(
+            url='https://example.com/page?q="quoted"',
+            title='Ünïcode \\ title\twith "quotes"',
+            site_name="Example Site",
+            issue_number=7
+        )
+
+        assert json.loads(entry.to_json()) == entry.to_dict()
+
 
 class TestDeduplicationManager:
     """Test the DeduplicationManager class"""
@@ -282,7 +328,12 @@ class TestDeduplicationManager:
             assert len(manager2.processed_entries) == 2
             assert manager2.is_result_processed(result1, "Site 1") is True
             assert manager2.is_result_processed(result2, "Site 2") is True
-    
+
+            # Entries are written one per line
+            with open(storage_path, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            assert sum(1 for line in lines if line.strip().startswith('{"url"')) == 2
+
     def test_cleanup_old_entries(self):
         """Test cleaning up old entries"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -335,10 +386,161 @@ class TestDeduplicationManager:
             assert stats['entries_by_site']['Site B'] == 1
             assert 'oldest_entry' in stats
             assert 'newest_entry' in stats
-    
 
 
 
+
+class TestNearDuplicates:
+    """Test near-duplicate detection in the manager"""
+
+    ORIGINAL = SearchResult(
+        "Meta Quest 3 review",
+        "https://site-a.example.com/quest-3-review",
+        "Meta's new headset brings mixed reality passthrough and a faster chip to the Quest line."
+    )
+    RETITLED = SearchResult(
+        "Review: Meta Quest 3",
+        "https://site-b.example.com/reviews/meta-quest-3",
+        "The Meta Quest 3 headset brings mixed reality passthrough and a faster chip."
+    )
+
+    def test_retitled_result_reports_original_issue(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = DeduplicationManager(storage_path=os.path.join(temp_dir, "processed.json"),
+                                           near_duplicate_threshold=0.7)
+            manager.mark_result_processed(self.ORIGINAL, "Site A", issue_number=12)
+
+            match = manager.find_near_duplicate(self.RETITLED)
+            new_results = manager.filter_new_results([self.RETITLED], "Site B")
+
+            assert match.issue_number == 12
+            assert match.url == self.ORIGINAL.link
+            assert match.similarity >= 0.7
+            assert new_results == []
+            assert manager.last_near_duplicates[0][1].issue_number == 12
+            assert manager.get_processed_stats()['near_duplicates_detected'] == 1
+
+    def test_disabled_by_default(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = DeduplicationManager(storage_path=os.path.join(temp_dir, "processed.json"))
+            manager.mark_result_processed(self.ORIGINAL, "Site A", issue_number=12)
+
+            assert manager.find_near_duplicate(self.RETITLED) is None
+            assert manager.is_result_processed(self.RETITLED, "Site B") is False
+
+    def test_no_signature_stored_when_disabled(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = DeduplicationManager(storage_path=os.path.join(temp_dir, "processed.json"))
+            entry = manager.mark_result_processed(self.ORIGINAL, "Site A", issue_number=12)
+
+            assert entry.minhash is None
+            assert 'minhash' not in entry.to_dict()
+            assert json.loads(entry.to_json()) == entry.to_dict()
+
+    def test_signatures_persist_and_expire(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_path = os.path.join(temp_dir, "processed.json")
+            manager = DeduplicationManager(storage_path=storage_path, near_duplicate_threshold=0.7)
+            manager.mark_result_processed(self.ORIGINAL, "Site A", issue_number=12)
+            manager.save_processed_entries()
+
+            reloaded = DeduplicationManager(storage_path=storage_path, near_duplicate_threshold=0.7)
+            assert reloaded.find_near_duplicate(self.RETITLED).issue_number == 12
+
+            entry = next(iter(reloaded.processed_entries.values()))
+            entry.processed_at = datetime.utcnow() - timedelta(days=60)
+            reloaded._cleanup_old_entries()
+            assert reloaded.find_near_duplicate(self.RETITLED) is None
+
+
+class TestPrefilter:
+    """Test the Bloom prefilter in front of the store"""
+
+    SEEN = SearchResult("Quest 3 review", "https://example.com/quest-3", "Mixed reality headset review")
+    NEW = SearchResult("Valve Index price cut", "https://example.com/index", "Valve reduces the price")
+
+    def _seed_store(self, storage_path):
+        manager = DeduplicationManager(storage_path=storage_path, prefilter=True)
+        manager.mark_result_processed(self.SEEN, "Site A", issue_number=5)
+        manager.save_processed_entries()
+
+    def test_definite_miss_does_not_load_store(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_path = os.path.join(temp_dir, "processed.json")
+            self._seed_store(storage_path)
+
+            with patch.object(DeduplicationManager, '_load_processed_entries') as load:
+                manager = DeduplicationManager(storage_path=storage_path, prefilter=True)
+                assert manager.is_result_processed(self.NEW, "Site A") is False
+
+            load.assert_not_called()
+            assert manager.prefilter_stats == {'definitely_new': 1, 'possible_matches': 0}
+
+    def test_possible_match_loads_store(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_path = os.path.join(temp_dir, "processed.json")
+            self._seed_store(storage_path)
+
+            manager = DeduplicationManager(storage_path=storage_path, prefilter=True)
+
+            assert manager.is_result_processed(self.SEEN, "Site B") is True
+            assert manager.prefilter_stats['possible_matches'] == 1
+
+    def test_lazy_marks_are_journaled_and_merged(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_path = os.path.join(temp_dir, "processed.json")
+            self._seed_store(storage_path)
+
+            lazy = DeduplicationManager(storage_path=storage_path, prefilter=True)
+            lazy.mark_result_processed(self.NEW, "Site B", issue_number=6)
+            lazy.save_processed_entries()
+
+            assert os.path.exists(f"{storage_path}.journal")
+            with open(storage_path) as file:
+                assert len(json.load(file)['entries']) == 1
+
+            # The prefilter describes the journal too, so it is still trusted
+            with patch.object(DeduplicationManager, '_load_processed_entries') as load:
+                trusted = DeduplicationManager(storage_path=storage_path, prefilter=True)
+            load.assert_not_called()
+            assert trusted.is_result_processed(self.NEW, "Site C") is True
+            assert len(trusted.processed_entries) == 2
+
+            trusted.save_processed_entries()
+            assert not os.path.exists(f"{storage_path}.journal")
+            with open(storage_path) as file:
+                assert len(json.load(file)['entries']) == 2
+
+    def test_store_changed_elsewhere_rebuilds_filter(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_path = os.path.join(temp_dir, "processed.json")
+            self._seed_store(storage_path)
+
+            # Written without the prefilter, e.g. by a merge
+            plain = DeduplicationManager(storage_path=storage_path)
+            plain.mark_result_processed(self.NEW, "Site B")
+            plain.save_processed_entries()
+
+            manager = DeduplicationManager(storage_path=storage_path, prefilter=True)
+
+            assert manager.prefilter.might_contain(f"url:{normalize_url(self.NEW.link)}")
+            assert manager.is_result_processed(self.NEW, "Site B") is True
+
+    def test_near_duplicate_bands_pass_prefilter(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage_path = os.path.join(temp_dir, "processed.json")
+            seed = DeduplicationManager(storage_path=storage_path, near_duplicate_threshold=0.7,
+                                        prefilter=True)
+            seed.mark_result_processed(TestNearDuplicates.ORIGINAL, "Site A", issue_number=12)
+            seed.save_processed_entries()
+
+            manager = DeduplicationManager(storage_path=storage_path, near_duplicate_threshold=0.7,
+                                           prefilter=True)
+
+            assert manager.filter_new_results([TestNearDuplicates.RETITLED], "Site B") == []
+            assert manager.last_near_duplicates[0][1].issue_number == 12
+
+
 class TestUtilityFunctions:
     """Test utility functions"""
     
@@ -474,6 +676,113 @@ class TestUtilityFunctions:
             assert merged_data['entries'][0]['processed_at'] == new_time
 
 
+
+def _entry(number, processed_at, issue_number=None):
+    return {
+        'url': f"https://example.com/page{number}",
+        'title': f"Page {number}",
+        'site_name': "Site",
+        'processed_at': processed_at.isoformat(),
+        'content_hash': f"hash{number:04d}",
+        'normalized_url': f"https://example.com/page{number}",
+        'issue_number': issue_number
+    }
+
+
+class TestStreamingMerge:
+    """Test streaming reads and the k-way merge"""
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_iter_stored_entries_with_small_chunks(self, indent):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "store.json")
+            entries = [_entry(i, datetime.utcnow(), issue_number=i * 1000) for i in range(50)]
+            with open(path, 'w') as f:
+                json.dump({'entries': entries, 'metadata': {'total_entries': 50, 'version': 12345}}, f,
+                          indent=indent)
+
+            streamed = list(iter_stored_entries(path, chunk_size=7))
+
+            assert streamed == entries
+
+    def test_iter_stored_entries_reads_saved_store(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "store.json")
+            manager = DeduplicationManager(storage_path=path)
+            manager.mark_result_processed(SearchResult("Title \"quoted\"", "https://example.com/a", ""), "Site")
+            manager.save_processed_entries()
+
+            assert [entry['title'] for entry in iter_stored_entries(path)] == ['Title "quoted"']
+
+    def test_iter_stored_entries_rejects_truncated_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "store.json")
+            with open(path, 'w') as f:
+                f.write('{"entries": [{"url": "https://example.com"')
+
+            with pytest.raises(ValueError):
+                list(iter_stored_entries(path))
+
+    def test_merge_across_runs_keeps_latest_and_drops_expired(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            now = datetime.utcnow()
+            paths = []
+            for shard in range(3):
+                path = os.path.join(temp_dir, f"shard{shard}.json")
+                entries = [_entry(i, now - timedelta(minutes=10 - shard), issue_number=shard)
+                           for i in range(shard, 40, 2)]
+                entries.append(_entry(900 + shard, now - timedelta(days=45)))
+                with open(path, 'w') as f:
+                    json.dump({'metadata': {}, 'entries': entries}, f)
+                paths.append(path)
+            output_path = os.path.join(temp_dir, "merged.json")
+            progress = []
+
+            stats = merge_deduplication_files(paths, output_path, chunk_size=5,
+                                              progress_callback=progress.append)
+
+            with open(output_path) as f:
+                merged = json.load(f)
+            hashes = [entry['content_hash'] for entry in merged['entries']]
+            by_hash = {entry['content_hash']: entry for entry in merged['entries']}
+
+            assert hashes == sorted(hashes) == [f"hash{i:04d}" for i in range(40)]
+            assert by_hash['hash0002']['issue_number'] == 2  # shard 2 is the most recent
+            assert by_hash['hash0003']['issue_number'] == 1
+            assert merged['metadata']['total_entries'] == 40
+            assert stats['expired_entries'] == 3
+            assert stats['runs'] > 3
+            assert [p['phase'] for p in progress if p['phase'] == 'read'] == ['read'] * 3
+            assert progress[-1]['phase'] == 'done'
+            assert not [name for name in os.listdir(temp_dir) if name.startswith('dedup-merge-')]
+
+    def test_merge_includes_journal(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "processed.json")
+            manager = DeduplicationManager(storage_path=path, prefilter=True)
+            manager.mark_result_processed(SearchResult("A", "https://example.com/a", ""), "Site")
+            manager.save_processed_entries()
+            lazy = DeduplicationManager(storage_path=path, prefilter=True)
+            lazy.mark_result_processed(SearchResult("B", "https://example.com/b", ""), "Site")
+            lazy.save_processed_entries()
+
+            output_path = os.path.join(temp_dir, "merged.json")
+            stats = merge_deduplication_files([path], output_path)
+
+            assert stats['unique_entries'] == 2
+
+    def test_merge_without_retention_keeps_old_entries(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "old.json")
+            with open(path, 'w') as f:
+                json.dump({'entries': [_entry(1, datetime.utcnow() - timedelta(days=400))]}, f)
+
+            stats = merge_deduplication_files([path], path, retention_days=None)
+
+            with open(path) as f:
+                assert len(json.load(f)['entries']) == 1
+            assert stats['unique_entries'] == 1
+
 class TestEdgeCases:
     """Test edge cases and error conditions"""
     
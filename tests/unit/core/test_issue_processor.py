@@ -6,6 +6,8 @@ Tests core issue processing logic without GitHub integration
 import pytest
 import tempfile
 import json
+import subprocess
+from dataclasses import replace
 from pathlib import Path
 from datetime import datetime, timezone
 from unittest.mock import Mock, patch, MagicMock
@@ -14,6 +16,7 @@ from src.core.issue_processor import (
     IssueProcessor, IssueProcessingStatus, ProcessingResult, IssueData,
     IssueProcessingError, ProcessingTimeoutError
 )
+from src.storage.git_manager import GitManager
 from src.workflow.workflow_matcher import WorkflowInfo, WorkflowValidationError
 
 
@@ -459,6 +462,43 @@ output:
             assert state['status'] == IssueProcessingStatus.PENDING.value
             assert state['test_data'] == 'test_value'
     
+    def test_deferred_state_saves_written_on_flush(self, temp_config_dir):
+        """Test that deferred state changes reach disk only when flushed."""
+        config_file = temp_config_dir / "test_config.yaml"
+        state_file = temp_config_dir / "study" / ".processing_state.json"
+        
+        with patch('src.core.issue_processor.WorkflowMatcher'):
+            processor = IssueProcessor(
+                config_path=str(config_file),
+                output_base_dir=str(temp_config_dir / "study")
+            )
+            processor.defer_state_saves = True
+            
+            processor._update_issue_status(123, IssueProcessingStatus.PENDING)
+            assert not state_file.exists()
+            
+            assert processor.flush_processing_state() is True
+            assert '"123"' in state_file.read_text()
+            assert processor.flush_processing_state() is False
+    
+    def test_failed_flush_keeps_state_dirty(self, temp_config_dir):
+        """Test that state stays marked for the next flush when the write fails."""
+        config_file = temp_config_dir / "test_config.yaml"
+        
+        with patch('src.core.issue_processor.WorkflowMatcher'):
+            processor = IssueProcessor(
+                config_path=str(config_file),
+                output_base_dir=str(temp_config_dir / "study")
+            )
+            processor.defer_state_saves = True
+            processor._update_issue_status(123, IssueProcessingStatus.PENDING)
+            
+            with patch.object(processor, '_write_processing_state', side_effect=OSError("disk full")):
+                with pytest.raises(OSError):
+                    processor.flush_processing_state()
+            
+            assert processor.flush_processing_state() is True
+    
     def test_file_creation_and_structure(self, temp_config_dir, sample_issue_data, mock_workflow_matcher):
         """Test that files are created with correct structure."""
         config_file = temp_config_dir / "test_config.yaml"
@@ -485,4 +525,77 @@ output:
                 # Check file content
                 content = file_obj.read_text()
                 assert sample_issue_data.title in content
-                assert str(sample_issue_data.number) in content
\ No newline at end of file
+                assert str(sample_issue_data.number) in content
+    
+    def test_direct_commits_are_batched_without_touching_checkout(self, temp_config_dir, sample_issue_data,
+                                                                  mock_workflow_matcher):
+        """Test that direct-commit deliverables are queued in memory and written in one stream."""
+        def git(*args):
+            return subprocess.run(['git', *args], cwd=temp_config_dir, check=True,
+                                  capture_output=True, text=True).stdout
+        git('init', '--quiet', '--initial-branch=main')
+        git('-c', 'user.name=Test User', '-c', 'user.email=test@example.com',
+            'commit', '--quiet', '--allow-empty', '-m', 'Initial commit')
+        git('config', 'user.name', 'Test User')
+        git('config', 'user.email', 'test@example.com')
+        config_file = temp_config_dir / "test_config.yaml"
+        
+        with patch('src.core.issue_processor.WorkflowMatcher', return_value=mock_workflow_matcher):
+            processor = IssueProcessor(
+                config_path=str(config_file),
+                output_base_dir=str(temp_config_dir / "study"),
+                enable_state_saving=False
+            )
+        processor.enable_git = True
+        processor.git_manager = GitManager(repo_path=str(temp_config_dir), branch_prefix="agent",
+                                              direct_commits=True)
+        processor.git_manager.defer_commits = True
+        
+        second_issue = replace(sample_issue_data, number=124)
+        results = [processor.process_issue(issue) for issue in (sample_issue_data, second_issue)]
+        
+        assert all(result.status == IssueProcessingStatus.COMPLETED for result in results)
+        assert not any(Path(path).exists() for result in results for path in result.created_files)
+        assert len(processor.git_manager.pending_commits) == 2
+        
+        with patch('src.storage.git_manager.subprocess.run', wraps=subprocess.run) as run:
+            commit_infos = processor.git_manager.flush_commits()
+        
+        assert run.call_count == 3  # committer identity + for-each-ref + fast-import
+        branch = next(name for name in commit_infos if name.startswith('agent-123-'))
+        assert sample_issue_data.title in git('show', f"{branch}:study/issue_123/research-document.md")
+        assert 'study' not in git('status', '--porcelain', '--untracked-files=all')
+
+class TestOutcomeRecording:
+    """Test that processing outcomes reach the assignment history"""
+    
+    @patch('src.agents.content_extraction_agent.ContentExtractionAgent')
+    @patch('src.core.issue_processor.GitHubIssueCreator')
+    @patch('src.core.issue_processor.DeliverableGenerator')
+    @patch('src.core.issue_processor.WorkflowMatcher')
+    @patch('src.core.issue_processor.ConfigManager')
+    def test_outcomes_are_appended_to_history(self, mock_config_manager, mock_matcher, mock_generator,
+                                             mock_github, mock_extraction_agent, tmp_path):
+        """Completed and failed workflows are recorded as outcomes."""
+        from src.agents.assignment_history import AssignmentHistoryStore
+        from src.core.issue_processor import GitHubIntegratedIssueProcessor
+        
+        history_path = tmp_path / 'history.jsonl'
+        mock_config = Mock()
+        mock_config.ai.enabled = True
+        mock_config.ai.history.file_path = str(history_path)
+        mock_config.agent.output_directory = str(tmp_path / 'study')
+        mock_config.agent.git = None
+        mock_config_manager.load_config_with_env_substitution.return_value = mock_config
+        processor = GitHubIntegratedIssueProcessor('token', 'owner/repo', output_base_dir=str(tmp_path / 'study'))
+        
+        processor._handle_processing_result(1, ProcessingResult(
+            issue_number=1, status=IssueProcessingStatus.COMPLETED, workflow_name='Research Analysis'))
+        processor._handle_processing_result(2, ProcessingResult(
+            issue_number=2, status=IssueProcessingStatus.ERROR, workflow_name='Research Analysis',
+            error_message='template missing'))
+        
+        records = [json.loads(line) for line in history_path.read_text().splitlines()]
+        assert [(record['issue_number'], record['outcome']) for record in records] == [
+            (1, 'completed'), (2, 'failed')]
+        assert AssignmentHistoryStore(history_path).success_rate('Research Analysis', 'unknown') == 0.5
@@ -0,0 +1,109 @@
+"""
+Unit tests for MinHash near-duplicate detection
+"""
+
+import pytest
+
+from src.core.near_duplicate import (
+    MinHashLSHIndex, decode_signature, encode_signature, estimate_similarity,
+    lsh_parameters, result_signature, tokenize
+)
+
+
+SYNDICATED = (
+    ("Apple Vision Pro launches in China",
+     "Apple's headset goes on sale in China next month, the company said."),
+    ("Apple Vision Pro launches in China - Road to VR",
+     "Apple's headset goes on sale in China next month, the company said on Tuesday."),
+)
+
+
+class TestSignatures:
+    """Test tokenization and signatures"""
+
+    def test_tokenize_drops_punctuation_and_stopwords(self):
+        assert tokenize("Review: The Meta Quest 3!") == ['review', 'meta', 'quest', '3']
+
+    def test_reordered_title_has_identical_signature(self):
+        assert result_signature("Meta Quest 3 review") == result_signature("Review: Meta Quest 3")
+
+    def test_similarity_estimates(self):
+        first = result_signature(*SYNDICATED[0])
+        second = result_signature(*SYNDICATED[1])
+        unrelated = result_signature("Valve Index price cut", "Valve reduces the price of its Index headset")
+
+        assert estimate_similarity(first, second) > 0.7
+        assert estimate_similarity(first, unrelated) < 0.3
+
+    def test_empty_text_has_no_signature(self):
+        assert result_signature("", "") is None
+        assert result_signature("The", "of a") is None
+
+    def test_signature_encoding_round_trip(self):
+        signature = result_signature("Meta Quest 3 review")
+
+        assert decode_signature(encode_signature(signature)) == signature
+        assert encode_signature(None) is None
+        assert decode_signature(None) is None
+
+
+class TestLSHParameters:
+    """Test band selection"""
+
+    @pytest.mark.parametrize("threshold", [0.3, 0.5, 0.7, 0.9])
+    def test_pairs_at_threshold_are_likely_candidates(self, threshold):
+        bands, rows = lsh_parameters(threshold)
+
+        assert bands * rows <= 64
+        assert 1 - (1 - threshold ** rows) ** bands >= 0.95
+
+    def test_higher_threshold_uses_wider_bands(self):
+        assert lsh_parameters(0.9)[1] > lsh_parameters(0.5)[1]
+
+    @pytest.mark.parametrize("threshold", [0, -0.1, 1.5])
+    def test_invalid_threshold(self, threshold):
+        with pytest.raises(ValueError):
+            lsh_parameters(threshold)
+
+
+class TestMinHashLSHIndex:
+    """Test the LSH index"""
+
+    def test_finds_near_duplicate(self):
+        index = MinHashLSHIndex(threshold=0.7)
+        index.add('original', result_signature(*SYNDICATED[0]))
+        index.add('other', result_signature("Valve Index price cut", "Valve reduces the price"))
+
+        key, similarity = index.nearest(result_signature(*SYNDICATED[1]))
+
+        assert key == 'original'
+        assert similarity >= 0.7
+
+    def test_remove(self):
+        index = MinHashLSHIndex()
+        signature = result_signature(*SYNDICATED[0])
+        index.add('a', signature)
+        index.add('b', signature)
+
+        index.remove('a')
+
+        assert 'a' not in index
+        assert [key for key, _ in index.query(signature)] == ['b']
+        index.remove('b')
+        assert index.nearest(signature) is None
+        assert len(index) == 0
+
+    def test_lookup_only_compares_bucket_candidates(self):
+        index = MinHashLSHIndex(threshold=0.7)
+        for number in range(2000):
+            index.add(f"k{number}", result_signature(f"Unrelated article {number} topic{number}",
+                                                     f"snippet words w{number} x{number * 7} y{number * 13}"))
+
+        compared = []
+        original = index._signatures.__getitem__
+        index._signatures = type('Tracking', (dict,), {
+            '__getitem__': lambda self, key: compared.append(key) or original(key)
+        })(index._signatures)
+
+        assert index.nearest(result_signature(*SYNDICATED[0])) is None
+        assert len(compared) < 100
@@ -24,6 +24,7 @@ class TestSiteMonitorService:
         """Test initializing the SiteMonitorService"""
         mock_github_instance = Mock()
         mock_dedup_instance = Mock()
+        mock_dedup_instance.last_near_duplicates = []
         mock_search_instance = Mock()
         
         mock_github_creator.return_value = mock_github_instance
@@ -42,7 +43,9 @@ class TestSiteMonitorService:
         mock_search_client.assert_called_once_with(sample_config.search)
         mock_dedup_manager.assert_called_once_with(
             storage_path="test_processed.json",
-            retention_days=30
+            retention_days=30,
+            near_duplicate_threshold=None,
+            prefilter=False
         )
         mock_github_creator.assert_called_once_with(
             token="test-token",
@@ -58,6 +61,7 @@ class TestSiteMonitorService:
         # Setup mocks
         mock_github_instance = Mock()
         mock_dedup_instance = Mock()
+        mock_dedup_instance.last_near_duplicates = []
         mock_search_instance = Mock()
         
         mock_github_creator.return_value = mock_github_instance
@@ -128,6 +132,7 @@ class TestSiteMonitorService:
         # Setup mocks
         mock_github_instance = Mock()
         mock_dedup_instance = Mock()
+        mock_dedup_instance.last_near_duplicates = []
         mock_search_instance = Mock()
         
         mock_github_creator.return_value = mock_github_instance
@@ -175,6 +180,7 @@ class TestSiteMonitorService:
         # Setup mocks
         mock_github_instance = Mock()
         mock_dedup_instance = Mock()
+        mock_dedup_instance.last_near_duplicates = []
         mock_search_instance = Mock()
         
         mock_github_creator.return_value = mock_github_instance
@@ -217,6 +223,7 @@ class TestSiteMonitorService:
         # Setup mocks
         mock_github_instance = Mock()
         mock_dedup_instance = Mock()
+        mock_dedup_instance.last_near_duplicates = []
         mock_search_instance = Mock()
         
         mock_github_creator.return_value = mock_github_instance
@@ -245,6 +252,7 @@ class TestSiteMonitorService:
         # Setup mocks
         mock_github_instance = Mock()
         mock_dedup_instance = Mock()
+        mock_dedup_instance.last_near_duplicates = []
         mock_search_instance = Mock()
         
         mock_github_creator.return_value = mock_github_instance
@@ -270,6 +278,7 @@ class TestSiteMonitorService:
         # Setup mocks
         mock_github_instance = Mock()
         mock_dedup_instance = Mock()
+        mock_dedup_instance.last_near_duplicates = []
         mock_search_instance = Mock()
         
         mock_github_creator.return_value = mock_github_instance
@@ -313,6 +322,7 @@ class TestSiteMonitorService:
         # Setup mocks
         mock_github_instance = Mock()
         mock_dedup_instance = Mock()
+        mock_dedup_instance.last_near_duplicates = []
         mock_search_instance = Mock()
         
         mock_github_creator.return_value = mock_github_instance
@@ -379,6 +389,7 @@ class TestFilterAndProcessing:
         # Setup mocks
         mock_github_instance = Mock()
         mock_dedup_instance = Mock()
+        mock_dedup_instance.last_near_duplicates = []
         mock_search_instance = Mock()
         
         mock_github_creator.return_value = mock_github_instance
@@ -424,6 +435,7 @@ class TestFilterAndProcessing:
         # Setup mocks
         mock_github_instance = Mock()
         mock_dedup_instance = Mock()
+        mock_dedup_instance.last_near_duplicates = []
         mock_search_instance = Mock()
         
         mock_github_creator.return_value = mock_github_instance
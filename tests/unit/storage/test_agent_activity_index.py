@@ -0,0 +1,74 @@
+"""
+Unit tests for the agent activity index
+"""
+
+import json
+import threading
+
+from src.storage.agent_activity_index import AgentActivityIndex
+
+
+class TestAgentActivityIndex:
+    """Test cases for AgentActivityIndex"""
+
+    def test_record_and_persist(self, tmp_path):
+        path = tmp_path / "activity.json"
+        index = AgentActivityIndex(str(path))
+
+        index.record_activity(42, 'comment')
+
+        assert index.has_activity(42)
+        assert not index.has_activity(7)
+        assert index.get_activity(42)['source'] == 'comment'
+
+        reloaded = AgentActivityIndex(str(path))
+        assert reloaded.has_activity(42)
+        assert len(reloaded) == 1
+
+    def test_deferred_save(self, tmp_path):
+        path = tmp_path / "activity.json"
+        index = AgentActivityIndex(str(path))
+
+        index.record_activity(1, 'scan', save=False)
+        assert not path.exists()
+
+        index.save()
+        data = json.loads(path.read_text())
+        assert data['metadata']['total_issues'] == 1
+        assert '1' in data['issues']
+
+    def test_forget(self, tmp_path):
+        index = AgentActivityIndex(str(tmp_path / "activity.json"))
+        index.record_activity(5, 'comment')
+
+        index.forget(5)
+
+        assert not index.has_activity(5)
+        assert not AgentActivityIndex(str(tmp_path / "activity.json")).has_activity(5)
+
+    def test_corrupted_file_starts_empty(self, tmp_path):
+        path = tmp_path / "activity.json"
+        path.write_text("{not json")
+
+        index = AgentActivityIndex(str(path))
+
+        assert len(index) == 0
+
+    def test_concurrent_saves_leave_complete_index(self, tmp_path):
+        path = tmp_path / "activity.json"
+        index = AgentActivityIndex(str(path))
+
+        def record(start):
+            for number in range(start, start + 25):
+                index.record_activity(number, 'comment')
+
+        threads = [threading.Thread(target=record, args=(start,)) for start in (0, 100, 200, 300)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        data = json.loads(path.read_text())
+        assert data['metadata']['total_issues'] == 100
+        assert len(data['issues']) == 100
+        assert [p.name for p in tmp_path.iterdir()] == ["activity.json"]
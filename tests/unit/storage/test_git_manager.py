@@ -353,6 +353,289 @@ class TestBranchManagement:
         assert isinstance(is_merged, bool)
 
 
+
+class TestWorktreePool:
+    """Test per-issue worktrees."""
+    
+    @pytest.fixture
+    def worktree_manager(self, temp_git_repo):
+        manager = GitManager(
+            repo_path=str(temp_git_repo),
+            base_branch="main",
+            branch_prefix="test-issue",
+            use_worktrees=True
+        )
+        yield manager
+        manager.close_worktrees()
+    
+    def _commit_in_worktree(self, manager, issue_number):
+        branch_info = manager.create_issue_branch(issue_number=issue_number, title="Parallel work")
+        deliverable = Path(branch_info.worktree_path) / 'study' / f'issue_{issue_number}.md'
+        deliverable.parent.mkdir(parents=True, exist_ok=True)
+        deliverable.write_text(f"# Issue {issue_number}\n")
+        commit_info = manager.commit_deliverables(
+            file_paths=[str(deliverable)],
+            issue_number=issue_number,
+            workflow_name="parallel",
+            worktree_path=branch_info.worktree_path
+        )
+        manager.release_worktree(branch_info)
+        return branch_info, commit_info
+    
+    def test_concurrent_issues_commit_to_their_own_branches(self, worktree_manager, temp_git_repo):
+        """Test that concurrent workers never share a checkout."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda number: self._commit_in_worktree(worktree_manager, number), range(3001, 3009)
+            ))
+        
+        for branch_info, commit_info in results:
+            files = subprocess.run(
+                ['git', 'ls-tree', '-r', '--name-only', branch_info.name],
+                cwd=temp_git_repo, check=True, capture_output=True, text=True
+            ).stdout.split()
+            assert files == ['README.md', f'study/issue_{branch_info.issue_number}.md']
+            assert commit_info.files_changed == [f'study/issue_{branch_info.issue_number}.md']
+        
+        # The main working tree never left the base branch
+        assert worktree_manager._get_current_branch() == "main"
+        assert not (temp_git_repo / 'study').exists()
+        assert len(worktree_manager._idle_worktrees) <= 4
+    
+    def test_worktrees_are_reused(self, worktree_manager):
+        """Test that sequential issues reuse one pooled worktree."""
+        first, _ = self._commit_in_worktree(worktree_manager, 3101)
+        second, _ = self._commit_in_worktree(worktree_manager, 3102)
+        
+        assert worktree_manager._worktree_counter == 1
+        assert worktree_manager._idle_worktrees == [Path(worktree_manager._worktree_root()) / 'worktree-0']
+    
+    def test_branches_start_from_prepared_base(self, worktree_manager, temp_git_repo):
+        """Test that the base is resolved once per batch, not per issue."""
+        base_commit = worktree_manager.prepare_batch()
+        (temp_git_repo / 'later.md').write_text('later\n')
+        subprocess.run(['git', 'add', 'later.md'], cwd=temp_git_repo, check=True)
+        subprocess.run(['git', 'commit', '-m', 'Later commit'], cwd=temp_git_repo, check=True,
+                       capture_output=True)
+        
+        branch_info = worktree_manager.create_issue_branch(issue_number=3201)
+        worktree_manager.release_worktree(branch_info)
+        
+        branch_head = subprocess.run(['git', 'rev-parse', branch_info.name], cwd=temp_git_repo,
+                                     check=True, capture_output=True, text=True).stdout.strip()
+        assert branch_head == base_commit
+    
+    def test_close_removes_worktrees(self, worktree_manager):
+        """Test that closing the pool deletes idle worktrees."""
+        self._commit_in_worktree(worktree_manager, 3301)
+        root = worktree_manager._worktree_root()
+        
+        worktree_manager.close_worktrees()
+        
+        assert not (root / 'worktree-0').exists()
+        worktrees = worktree_manager._run_git_command(['worktree', 'list', '--porcelain'])
+        assert worktrees.count('worktree ') == 1
+
+
+class TestDirectCommits:
+    """Test commits written straight to branch refs."""
+    
+    @pytest.fixture
+    def direct_manager(self, temp_git_repo):
+        return GitManager(
+            repo_path=str(temp_git_repo),
+            base_branch="main",
+            branch_prefix="test-issue",
+            direct_commits=True
+        )
+    
+    def _git(self, repo, *args):
+        return subprocess.run(['git', *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+    
+    def test_commit_without_checkout(self, direct_manager, temp_git_repo, sample_files):
+        """Test that deliverables land on the branch while the working tree stays on main."""
+        main_head = self._git(temp_git_repo, 'rev-parse', 'main').strip()
+        
+        commit_info = direct_manager.commit_deliverables_to_branch(
+            file_paths=sample_files,
+            issue_number=4001,
+            workflow_name="direct",
+            title="Direct commit"
+        )
+        
+        assert commit_info.branch == "test-issue-4001-direct-commit"
+        assert commit_info.files_changed == ['study/deliverable1.md', 'study/deliverable2.md']
+        assert commit_info.message == "Add direct deliverables for issue #4001"
+        assert commit_info.author == "Test User"
+        assert self._git(temp_git_repo, 'rev-parse', commit_info.branch).strip() == commit_info.hash
+        assert self._git(temp_git_repo, 'rev-parse', f"{commit_info.hash}^").strip() == main_head
+        assert self._git(temp_git_repo, 'show', f"{commit_info.hash}:study/deliverable1.md") == \
+            '# Deliverable 1\nContent here...'
+        # Working tree, index and HEAD are untouched
+        assert direct_manager._get_current_branch() == "main"
+        assert self._git(temp_git_repo, 'rev-parse', 'HEAD').strip() == main_head
+        assert self._git(temp_git_repo, 'diff', '--cached', '--name-only') == ''
+    
+    def test_second_commit_builds_on_branch(self, direct_manager, temp_git_repo, sample_files):
+        """Test that an existing branch is extended rather than reset."""
+        first = direct_manager.commit_deliverables_to_branch(sample_files[:1], 4002, "direct")
+        second = direct_manager.commit_deliverables_to_branch(sample_files[1:], 4002, "direct")
+        
+        assert self._git(temp_git_repo, 'rev-parse', f"{second.hash}^").strip() == first.hash
+        files = self._git(temp_git_repo, 'ls-tree', '-r', '--name-only', second.branch).split()
+        assert files == ['README.md', 'study/deliverable1.md', 'study/deliverable2.md']
+    
+    def test_batch_uses_constant_process_count(self, direct_manager, temp_git_repo):
+        """Test that several issues are committed in one fast-import stream."""
+        from src.storage.git_manager import BranchCommit
+        
+        commits = [
+            BranchCommit(branch_name=f"test-issue-{number}", issue_number=number,
+                         message=f"Deliverables for #{number}",
+                         files={f"study/issue_{number}/report.md": f"# {number}\n".encode(),
+                                f"study/issue_{number}/notes.md": b"notes\n"})
+            for number in range(4100, 4110)
+        ]
+        direct_manager._committer_identity()
+        
+        with patch('src.storage.git_manager.subprocess.run', wraps=subprocess.run) as run:
+            commit_infos = direct_manager.commit_to_branches(commits)
+        
+        assert run.call_count == 2  # for-each-ref + fast-import
+        assert [info.branch for info in commit_infos] == [commit.branch_name for commit in commits]
+        assert self._git(temp_git_repo, 'show', 'test-issue-4105:study/issue_4105/report.md') == '# 4105\n'
+    
+    def test_rejects_duplicate_branches_and_outside_files(self, direct_manager, tmp_path):
+        """Test input validation."""
+        from src.storage.git_manager import BranchCommit
+        
+        commit = BranchCommit(branch_name="test-issue-1", issue_number=1, message="m", files={"a.md": b""})
+        with pytest.raises(GitOperationError):
+            direct_manager.commit_to_branches([commit, commit])
+        
+        outside = tmp_path / "outside.md"
+        outside.write_text("outside")
+        with pytest.raises(GitOperationError):
+            direct_manager.commit_deliverables_to_branch([str(outside)], 1, "direct")
+    
+    def test_queued_commits_flush_in_one_stream(self, direct_manager, temp_git_repo):
+        """Test that queued commits are written together and folded per branch."""
+        direct_manager.queue_commit(direct_manager.branch_commit({"study/a.md": b"a\n"}, 4201, "direct"))
+        direct_manager.queue_commit(direct_manager.branch_commit({"study/b.md": b"b\n"}, 4201, "direct"))
+        direct_manager.queue_commit(direct_manager.branch_commit({"study/c.md": b"c\n"}, 4202, "direct"))
+        assert direct_manager.pending_commits == ["test-issue-4201", "test-issue-4202"]
+        direct_manager._committer_identity()
+        
+        with patch('src.storage.git_manager.subprocess.run', wraps=subprocess.run) as run:
+            commit_infos = direct_manager.flush_commits()
+        
+        assert run.call_count == 2  # for-each-ref + fast-import
+        assert commit_infos["test-issue-4201"].files_changed == ["study/a.md", "study/b.md"]
+        assert self._git(temp_git_repo, 'show', 'test-issue-4202:study/c.md') == 'c\n'
+        assert direct_manager.pending_commits == []
+        assert direct_manager.flush_commits() == {}
+    
+    def test_failed_flush_drops_queued_pushes(self, direct_manager):
+        """Test that branches whose commit failed are not pushed."""
+        direct_manager.queue_commit(direct_manager.branch_commit({"a.md": b""}, 4301, "direct"))
+        direct_manager.queue_push("test-issue-4301")
+        direct_manager.queue_push("test-issue-other")
+        
+        with patch.object(direct_manager, 'commit_to_branches', side_effect=GitOperationError("boom")):
+            assert direct_manager.flush_commits() == {"test-issue-4301": None}
+        
+        assert direct_manager.pending_pushes == ["test-issue-other"]
+
+
+class TestBatchedRemoteOperations:
+    """Test deferred pushes and batched branch cleanup against a local bare repository."""
+    
+    @pytest.fixture
+    def bare_remote(self, temp_git_repo, tmp_path):
+        remote = tmp_path / 'origin.git'
+        subprocess.run(['git', 'init', '--bare', str(remote)], check=True, capture_output=True)
+        subprocess.run(['git', 'remote', 'add', 'origin', str(remote)], cwd=temp_git_repo, check=True)
+        subprocess.run(['git', 'push', 'origin', 'main'], cwd=temp_git_repo, check=True, capture_output=True)
+        return remote
+    
+    def _branch(self, repo, name, start='main'):
+        subprocess.run(['git', 'branch', name, start], cwd=repo, check=True)
+    
+    def _local_branches(self, repo):
+        output = subprocess.run(['git', 'for-each-ref', '--format=%(refname:short)', 'refs/heads/'],
+                                cwd=repo, check=True, capture_output=True, text=True).stdout
+        return output.split()
+    
+    def test_flush_pushes_all_branches_at_once(self, git_manager, temp_git_repo, bare_remote):
+        """Test that queued branches go out in a single push."""
+        branches = [f"test-issue-{number}" for number in range(5001, 5005)]
+        for branch in branches:
+            self._branch(temp_git_repo, branch)
+            git_manager.queue_push(branch)
+        git_manager.queue_push(branches[0])  # Queued twice, pushed once
+        
+        with patch('src.storage.git_manager.subprocess.run', wraps=subprocess.run) as run:
+            results = git_manager.flush_pushes()
+        
+        assert run.call_count == 1
+        assert results == {branch: True for branch in branches}
+        assert self._local_branches(bare_remote) == ['main'] + branches
+        assert git_manager.pending_pushes == []
+        upstream = subprocess.run(['git', 'config', f'branch.{branches[0]}.remote'], cwd=temp_git_repo,
+                                  check=True, capture_output=True, text=True).stdout.strip()
+        assert upstream == 'origin'
+    
+    def test_flush_reports_rejected_branches(self, git_manager, temp_git_repo, bare_remote):
+        """Test that one rejected ref does not hide the others' results."""
+        self._branch(temp_git_repo, 'test-issue-5101')
+        subprocess.run(['git', 'push', 'origin', 'test-issue-5101'], cwd=temp_git_repo, check=True,
+                       capture_output=True)
+        # Rewrite the local branch so the remote rejects a non-fast-forward
+        subprocess.run(['git', 'checkout', '-q', '--orphan', 'unrelated'], cwd=temp_git_repo, check=True)
+        subprocess.run(['git', 'commit', '-q', '-m', 'Unrelated'], cwd=temp_git_repo, check=True)
+        subprocess.run(['git', 'branch', '-f', 'test-issue-5101', 'unrelated'], cwd=temp_git_repo, check=True)
+        subprocess.run(['git', 'checkout', '-q', 'main'], cwd=temp_git_repo, check=True)
+        self._branch(temp_git_repo, 'test-issue-5102')
+        git_manager.queue_push('test-issue-5101')
+        git_manager.queue_push('test-issue-5102')
+        
+        results = git_manager.flush_pushes()
+        
+        assert results == {'test-issue-5101': False, 'test-issue-5102': True}
+    
+    def test_flush_without_remote_fails_every_branch(self, git_manager, temp_git_repo):
+        """Test flushing when no remote is configured."""
+        self._branch(temp_git_repo, 'test-issue-5201')
+        git_manager.queue_push('test-issue-5201')
+        
+        assert git_manager.flush_pushes() == {'test-issue-5201': False}
+        assert git_manager.flush_pushes() == {}
+    
+    def test_cleanup_deletes_merged_branches_in_one_transaction(self, git_manager, temp_git_repo):
+        """Test batched cleanup of merged branches."""
+        for branch in ('test-issue-1', 'test-issue-2', 'other-branch'):
+            self._branch(temp_git_repo, branch)
+        # Unmerged branch
+        subprocess.run(['git', 'checkout', '-q', '-b', 'test-issue-3'], cwd=temp_git_repo, check=True)
+        (temp_git_repo / 'unmerged.md').write_text('unmerged\n')
+        subprocess.run(['git', 'add', 'unmerged.md'], cwd=temp_git_repo, check=True)
+        subprocess.run(['git', 'commit', '-q', '-m', 'Unmerged'], cwd=temp_git_repo, check=True)
+        subprocess.run(['git', 'checkout', '-q', 'main'], cwd=temp_git_repo, check=True)
+        # Merged but checked out in another worktree
+        subprocess.run(['git', 'worktree', 'add', '-q', str(temp_git_repo / 'wt'), '-b', 'test-issue-4'],
+                       cwd=temp_git_repo, check=True)
+        
+        assert git_manager.cleanup_merged_branches(dry_run=True) == ['test-issue-1', 'test-issue-2']
+        
+        with patch('src.storage.git_manager.subprocess.run', wraps=subprocess.run) as run:
+            deleted = git_manager.cleanup_merged_branches()
+        
+        assert deleted == ['test-issue-1', 'test-issue-2']
+        assert run.call_count == 2  # for-each-ref + update-ref --stdin
+        assert self._local_branches(temp_git_repo) == ['main', 'other-branch', 'test-issue-3', 'test-issue-4']
+
 class TestErrorHandling:
     """Test error handling and edge cases."""
     
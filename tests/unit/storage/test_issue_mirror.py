@@ -0,0 +1,160 @@
+"""
+Unit tests for the SQLite issue mirror
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from src.clients.issue_discovery import IssueQuery, NO_ASSIGNEE
+from src.storage.issue_mirror import IssueMirror
+
+
+def _issue(number, labels=('site-monitor',), assignees=(), state='open',
+           updated_at='2025-01-01T00:00:00Z', comments=None):
+    return {
+        'number': number,
+        'title': f"Issue {number}",
+        'body': f"Body {number}",
+        'html_url': f"https://github.com/owner/repo/issues/{number}",
+        'state': state,
+        'created_at': f"2025-01-{number:02d}T00:00:00Z",
+        'updated_at': updated_at,
+        'user': {'login': 'reporter'},
+        'labels': [{'name': label} for label in labels],
+        'assignees': [{'login': login} for login in assignees],
+        'assignee': {'login': assignees[0]} if assignees else None,
+        'comment_count': len(comments or []),
+        'comments': comments or []
+    }
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    return IssueMirror(str(tmp_path / "mirror.sqlite3"), "owner/repo")
+
+
+class TestIssueMirrorSync:
+    """Test incremental syncing"""
+
+    def test_first_sync_is_full_then_incremental(self, mirror):
+        graphql = Mock()
+        graphql.iter_issues_with_comments.return_value = iter([
+            _issue(1, updated_at='2025-01-01T00:00:00Z'),
+            _issue(2, updated_at='2025-01-03T00:00:00Z'),
+        ])
+
+        stats = mirror.sync(graphql)
+
+        assert stats == {'updated': 2, 'cursor': '2025-01-03T00:00:00Z', 'full_sync': True}
+        first_call = graphql.iter_issues_with_comments.call_args[1]
+        assert first_call['since'] is None
+        assert first_call['states'] == ['OPEN']
+        assert first_call['order_by'] == 'UPDATED_AT'
+
+        # Second sync only asks for the delta and mirrors closures
+        graphql.iter_issues_with_comments.return_value = iter([
+            _issue(2, state='closed', updated_at='2025-01-04T00:00:00Z')
+        ])
+
+        stats = mirror.sync(graphql)
+
+        second_call = graphql.iter_issues_with_comments.call_args[1]
+        assert second_call['since'] == '2025-01-03T00:00:00Z'
+        assert second_call['states'] == ['OPEN', 'CLOSED']
+        assert stats['cursor'] == '2025-01-04T00:00:00Z'
+        assert [issue['number'] for issue in mirror.query(IssueQuery())] == [1]
+
+    def test_empty_delta_keeps_cursor(self, mirror):
+        mirror.upsert_issues([_issue(1)])
+        graphql = Mock()
+        graphql.iter_issues_with_comments.return_value = iter([_issue(1, updated_at='2025-02-01T00:00:00Z')])
+        mirror.sync(graphql)
+
+        graphql.iter_issues_with_comments.return_value = iter([])
+        stats = mirror.sync(graphql)
+
+        assert stats['updated'] == 0
+        assert mirror.cursor == '2025-02-01T00:00:00Z'
+
+    def test_repository_change_resets_mirror(self, tmp_path):
+        path = str(tmp_path / "mirror.sqlite3")
+        IssueMirror(path, "owner/repo").upsert_issues([_issue(1)])
+
+        other = IssueMirror(path, "owner/other")
+
+        assert other.query(IssueQuery()) == []
+
+
+class TestIssueMirrorQuery:
+    """Test local filtering"""
+
+    @pytest.fixture
+    def populated(self, mirror):
+        mirror.upsert_issues([
+            _issue(1),
+            _issue(2, labels=('site-monitor', 'urgent')),
+            _issue(3, assignees=('octocat',)),
+            _issue(4, labels=('site-monitor', 'needs-review')),
+            _issue(5, labels=('bug',)),
+            _issue(6, state='closed'),
+        ])
+        return mirror
+
+    def test_label_and_state_filters(self, populated):
+        numbers = [issue['number'] for issue in populated.query(IssueQuery(labels=['site-monitor']))]
+
+        assert numbers == [4, 3, 2, 1]
+
+    def test_assignee_filters(self, populated):
+        unassigned = populated.query(IssueQuery(labels=['site-monitor'], assignee=NO_ASSIGNEE))
+        assigned = populated.query(IssueQuery(assignee='octocat'))
+
+        assert [issue['number'] for issue in unassigned] == [4, 2, 1]
+        assert [issue['number'] for issue in assigned] == [3]
+        assert assigned[0]['assignee'] == 'octocat'
+
+    def test_any_and_excluded_labels(self, populated):
+        urgent = populated.query(IssueQuery(any_labels=['urgent', 'bug']))
+        reviewed = populated.query(IssueQuery(labels=['site-monitor']), exclude_labels=['needs-review'])
+
+        assert [issue['number'] for issue in urgent] == [5, 2]
+        assert 4 not in [issue['number'] for issue in reviewed]
+
+    def test_limit_and_sort(self, populated):
+        oldest = populated.query(IssueQuery(sort='created-asc'), limit=2)
+
+        assert [issue['number'] for issue in oldest] == [1, 2]
+
+    def test_updated_since(self, mirror):
+        mirror.upsert_issues([
+            _issue(1, updated_at='2025-01-01T00:00:00Z'),
+            _issue(2, updated_at='2025-03-01T00:00:00Z'),
+        ])
+
+        recent = mirror.query(IssueQuery(updated_since=datetime(2025, 2, 1, tzinfo=timezone.utc)))
+
+        assert [issue['number'] for issue in recent] == [2]
+
+    def test_issue_dictionary_and_comment_summary(self, mirror):
+        mirror.upsert_issues([_issue(1, comments=[
+            {'login': 'octocat', 'body': 'first', 'created_at': '2025-01-02T00:00:00Z'},
+            {'login': 'github-actions[bot]', 'body': 'x' * 500, 'created_at': '2025-01-03T00:00:00Z'},
+        ])])
+
+        issue = mirror.query(IssueQuery())[0]
+
+        assert issue['title'] == "Issue 1"
+        assert issue['labels'] == ['site-monitor']
+        assert issue['url'].endswith('/issues/1')
+        assert issue['user'] == 'reporter'
+        assert issue['comment_count'] == 2
+        assert issue['last_comment']['author'] == 'github-actions[bot]'
+        assert len(issue['last_comment']['excerpt']) == 280
+
+    def test_stats(self, populated):
+        stats = populated.get_stats()
+
+        assert stats['open_issues'] == 5
+        assert stats['closed_issues'] == 1
@@ -588,4 +588,74 @@ class TestContentExtractionAgent:
         assert stats["agent_type"] == "ContentExtractionAgent"
         assert stats["ai_model"] == "gpt-4o"
         assert stats["confidence_threshold"] == 0.7
-        assert "rate_limit_status" in stats
\ No newline at end of file
+        assert "rate_limit_status" in stats
+    @patch('src.agents.content_extraction_agent.GitHubModelsClient')
+    def test_indicator_only_issue_skips_ai(self, mock_client_class):
+        """Test an issue that is only an indicator list is extracted locally"""
+        mock_client_class.return_value = self.mock_client
+        agent = ContentExtractionAgent("test-token", self.ai_config)
+        agent.ai_client = self.mock_client
+        
+        issue_data = {
+            "title": "IOCs from phishing campaign",
+            "body": "- 203.0.113.7\n- evil.example.com\n- e3b0c44298fc1c149afbf4c8996fb924\n- CVE-2024-3094",
+            "labels": [],
+            "number": 7
+        }
+        
+        result = agent.extract_content(issue_data)
+        
+        self.mock_client.chat_completion.assert_not_called()
+        assert result.success is True
+        assert result.ai_response_metadata["source"] == "local"
+        content = result.structured_content
+        assert [indicator.value for indicator in content.indicators] == [
+            "203.0.113.7", "evil.example.com", "e3b0c44298fc1c149afbf4c8996fb924", "CVE-2024-3094"]
+        assert content.indicators[-1].type == "vulnerability"
+        assert "#7" in content.summary
+        assert agent.pre_extraction_stats["ai_calls_avoided"] == 1
+    
+    @patch('src.agents.content_extraction_agent.GitHubModelsClient')
+    def test_indicators_are_sent_as_references(self, mock_client_class):
+        """Test indicators are redacted from the prompt and resolved in the answer"""
+        mock_client_class.return_value = self.mock_client
+        self.mock_client.chat_completion.return_value = AIResponse(
+            content=json.dumps({
+                "summary": "Acme Corp infrastructure used in an intrusion",
+                "entities": {"organizations": ["Acme Corp"]},
+                "relationships": [{
+                    "entity1": "Acme Corp",
+                    "entity2": "[IOC-1]",
+                    "relationship": "operates",
+                    "confidence": 0.8
+                }],
+                "events": [],
+                "indicators": [],
+                "key_topics": ["intrusion"],
+                "urgency_level": "high",
+                "content_type": "security",
+                "confidence_score": 0.85
+            }),
+            model="gpt-4o"
+        )
+        agent = ContentExtractionAgent("test-token", self.ai_config)
+        agent.ai_client = self.mock_client
+        
+        issue_data = {
+            "title": "Intrusion report",
+            "body": "Attackers used a server at 203.0.113.7 that belongs to Acme Corp, "
+                    "according to the incident responders who investigated the breach.",
+            "labels": [],
+            "number": 8
+        }
+        
+        result = agent.extract_content(issue_data)
+        
+        messages = self.mock_client.chat_completion.call_args.kwargs["messages"]
+        assert "203.0.113.7" not in messages[1]["content"]
+        assert "[IOC-1]" in messages[1]["content"]
+        assert "[IOC-1]" in messages[0]["content"]
+        content = result.structured_content
+        assert content.relationships[0].entity2 == "203.0.113.7"
+        assert [indicator.value for indicator in content.indicators] == ["203.0.113.7"]
+        assert [entity.name for entity in content.entities] == ["Acme Corp"]
@@ -174,6 +174,28 @@ class TestConfigLoader:
         assert isinstance(config.github, GitHubConfig)
         assert isinstance(config.search, SearchConfig)
     
+    def test_build_config_ai_preclassifier(self):
+        """Test the local workflow classifier settings are parsed with defaults"""
+        config_data = self.create_test_config()
+        config_data['ai'] = {'enabled': True, 'preclassifier': {'decide_threshold': 0.95, 'min_examples': 50}}
+        config = ConfigLoader._build_config(config_data)
+        
+        assert config.ai.preclassifier.decide_threshold == 0.95
+        assert config.ai.preclassifier.min_examples == 50
+        assert config.ai.preclassifier.enabled is False
+        assert config.ai.preclassifier.model_path == ".workflow_classifier.json"
+        assert config.ai.preclassifier.retrain_every == 500
+
+    def test_build_config_ai_pre_extraction(self):
+        """Test the local pre-extraction settings are parsed with defaults"""
+        config_data = self.create_test_config()
+        config_data['ai'] = {'enabled': True, 'pre_extraction': {'skip_ai_coverage': 0.9}}
+        config = ConfigLoader._build_config(config_data)
+
+        assert config.ai.pre_extraction.skip_ai_coverage == 0.9
+        assert config.ai.pre_extraction.min_indicators == 3
+        assert config.ai.pre_extraction.redact_indicators is True
+
     
 
 
@@ -318,4 +340,69 @@ class TestCompleteConfigFlow:
                 assert config.log_level == 'DEBUG'
                 
             finally:
-                os.unlink(f.name)
\ No newline at end of file
+                os.unlink(f.name)
+
+    def test_documented_preclassifier_settings_load(self, sample_config, tmp_path):
+        """Test every documented preclassifier key passes schema validation"""
+        sample_config['ai'] = {
+            'enabled': True,
+            'preclassifier': {
+                'enabled': True,
+                'model_path': '.workflow_classifier.json',
+                'decide_threshold': 0.9,
+                'min_margin': 0.3,
+                'min_examples': 20,
+                'retrain_every': 500
+            }
+        }
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(sample_config))
+        
+        config = load_config_with_env_substitution(str(config_path))
+        
+        assert config.ai.preclassifier.enabled is True
+        assert config.ai.preclassifier.min_margin == 0.3
+        assert config.ai.preclassifier.retrain_every == 500
+
+
+class TestConfigCache:
+    """Test the process-wide config cache"""
+    
+    def test_unchanged_file_is_parsed_once(self, sample_config, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(sample_config))
+        
+        with patch('src.utils.config_manager._validate_config_data') as mock_validate:
+            first = ConfigLoader.load_config(str(config_path))
+            second = load_config_with_env_substitution(str(config_path))
+        
+        assert mock_validate.call_count == 1
+        assert first == second
+        assert first is not second
+    
+    def test_callers_get_independent_copies(self, sample_config, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(sample_config))
+        
+        first = ConfigLoader.load_config(str(config_path))
+        first.sites[0].keywords.append('mutated')
+        
+        assert 'mutated' not in ConfigLoader.load_config(str(config_path)).sites[0].keywords
+    
+    def test_changed_file_is_reloaded(self, sample_config, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(sample_config))
+        ConfigLoader.load_config(str(config_path))
+        
+        config_path.write_text(yaml.dump(dict(sample_config, log_level='WARNING')))
+        
+        assert ConfigLoader.load_config(str(config_path)).log_level == 'WARNING'
+    
+    def test_changed_environment_is_reloaded(self, sample_config, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(sample_config).replace('owner/repo', '${TEST_REPOSITORY}'))
+        
+        with patch.dict(os.environ, {'TEST_REPOSITORY': 'first/repo'}):
+            assert load_config_with_env_substitution(str(config_path)).github.repository == 'first/repo'
+        with patch.dict(os.environ, {'TEST_REPOSITORY': 'second/repo'}):
+            assert load_config_with_env_substitution(str(config_path)).github.repository == 'second/repo'
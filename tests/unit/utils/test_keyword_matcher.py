@@ -0,0 +1,92 @@
+"""
+Tests for the shared keyword matcher
+"""
+
+import pytest
+
+from src.utils import keyword_matcher
+from src.utils.keyword_matcher import KeywordMatcher, get_keyword_matcher, register_keywords
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Isolated shared registry"""
+    monkeypatch.setattr(keyword_matcher, '_dictionaries', {})
+    monkeypatch.setattr(keyword_matcher, '_shared_matcher', None)
+    return keyword_matcher
+
+
+class TestKeywordMatcher:
+
+    def test_hits_follow_dictionary_order(self):
+        matcher = KeywordMatcher({'terms': ['revenue', 'profit', 'budget']})
+
+        hits = matcher.scan("Budget cuts hit profit before revenue")
+
+        assert hits == {'terms': ['revenue', 'profit', 'budget']}
+
+    def test_duplicate_keywords_are_reported_like_substring_checks(self):
+        matcher = KeywordMatcher({'terms': ['risk', 'threat', 'risk']})
+
+        assert matcher.scan("risk")['terms'] == ['risk', 'risk']
+
+    def test_overlapping_keywords_all_match(self):
+        matcher = KeywordMatcher({
+            'short': ['threat', 'actor'],
+            'long': ['threat actor', 'eat'],
+        })
+
+        hits = matcher.scan("A new THREAT ACTOR emerged")
+
+        assert hits == {'short': ['threat', 'actor'], 'long': ['threat actor', 'eat']}
+
+    def test_keyword_inside_a_failed_longer_match(self):
+        matcher = KeywordMatcher({'terms': ['analysis report', 'sis']})
+
+        assert matcher.scan("analysis rep")['terms'] == ['sis']
+
+    def test_non_ascii_keywords(self):
+        matcher = KeywordMatcher({'agent': ['🤖', 'workflow matched']})
+
+        assert matcher.scan("🤖 Deliverable ready")['agent'] == ['🤖']
+
+    def test_scan_selected_dictionaries(self):
+        matcher = KeywordMatcher({'a': ['osint'], 'b': ['osint']})
+
+        assert matcher.scan("OSINT review", ['b']) == {'b': ['osint']}
+        assert matcher.scan("", ['a', 'b']) == {'a': [], 'b': []}
+
+    def test_contains_any(self):
+        matcher = KeywordMatcher({'a': ['research'], 'b': ['target']})
+
+        assert matcher.contains_any("Target profile", 'b')
+        assert not matcher.contains_any("Target profile", 'a')
+        assert not matcher.contains_any("", 'b')
+        assert not matcher.contains_any("research", 'unknown')
+
+    def test_unknown_dictionary_in_scan(self):
+        matcher = KeywordMatcher({'a': ['research']})
+
+        assert matcher.scan("research", ['unknown']) == {'unknown': []}
+
+
+class TestSharedMatcher:
+
+    def test_registration_rebuilds_shared_matcher(self, registry):
+        register_keywords('first', ['alpha'])
+        matcher = get_keyword_matcher()
+
+        assert get_keyword_matcher() is matcher
+
+        register_keywords('second', ['beta'])
+        rebuilt = get_keyword_matcher()
+
+        assert rebuilt is not matcher
+        assert rebuilt.scan("alpha beta") == {'first': ['alpha'], 'second': ['beta']}
+
+    def test_unchanged_registration_keeps_matcher(self, registry):
+        keywords = register_keywords('first', ['alpha', 'beta'])
+        matcher = get_keyword_matcher()
+
+        assert register_keywords('first', ['alpha', 'beta']) == keywords == ('alpha', 'beta')
+        assert get_keyword_matcher() is matcher
@@ -0,0 +1,102 @@
+"""
+Unit tests for logging configuration
+"""
+
+import logging
+import logging.handlers
+
+import pytest
+
+from src.utils.logging_config import LazyFormat, SamplingFilter, setup_logging, shutdown_logging
+
+
+@pytest.fixture
+def fresh_logging():
+    """Configure logging from scratch and restore the default afterwards"""
+    shutdown_logging()
+    yield
+    shutdown_logging()
+
+
+def _record(level: int = logging.DEBUG) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, "message", None, None)
+
+
+class TestSetupLogging:
+    """Test handler and level configuration"""
+
+    def test_file_level_follows_log_level_by_default(self, fresh_logging, tmp_path):
+        setup_logging(log_level="INFO", log_file=str(tmp_path / "app.log"), enable_console=False)
+
+        root = logging.getLogger()
+
+        assert root.level == logging.INFO
+        assert [handler.level for handler in root.handlers] == [logging.INFO]
+
+    def test_debug_file_lowers_root_level(self, fresh_logging, tmp_path):
+        setup_logging(log_level="WARNING", log_file=str(tmp_path / "app.log"), file_log_level="DEBUG")
+
+        assert logging.getLogger().level == logging.DEBUG
+
+    def test_queue_mode_writes_from_listener(self, fresh_logging, tmp_path):
+        log_file = tmp_path / "app.log"
+        setup_logging(log_level="INFO", log_file=str(log_file), enable_console=False, use_queue=True)
+
+        handlers = list(logging.getLogger().handlers)
+        logging.getLogger("queued").info("hello %s", "world")
+        shutdown_logging()
+
+        assert [type(handler) for handler in handlers] == [logging.handlers.QueueHandler]
+        assert "hello world" in log_file.read_text()
+
+    def test_shutdown_allows_reconfiguration(self, fresh_logging, tmp_path):
+        setup_logging(log_file=str(tmp_path / "first.log"), enable_console=False)
+        shutdown_logging()
+        setup_logging(log_file=str(tmp_path / "second.log"), enable_console=False)
+
+        logging.getLogger("again").warning("second run")
+        shutdown_logging()
+
+        assert "second run" in (tmp_path / "second.log").read_text()
+        assert "second run" not in (tmp_path / "first.log").read_text()
+
+
+class TestSamplingFilter:
+    """Test debug record sampling"""
+
+    def test_keeps_one_in_interval_debug_records(self):
+        sampler = SamplingFilter(0.25)
+
+        kept = sum(sampler.filter(_record()) for _ in range(100))
+
+        assert kept == 25
+
+    def test_never_drops_records_above_max_level(self):
+        sampler = SamplingFilter(0.01)
+
+        assert all(sampler.filter(_record(logging.WARNING)) for _ in range(10))
+
+    def test_rejects_invalid_rate(self):
+        with pytest.raises(ValueError):
+            SamplingFilter(0)
+
+
+class TestLazyFormat:
+    """Test deferred log arguments"""
+
+    def test_not_evaluated_when_level_disabled(self, fresh_logging, tmp_path):
+        setup_logging(log_level="INFO", log_file=str(tmp_path / "app.log"), enable_console=False)
+        calls = []
+
+        logging.getLogger("lazy").debug("payload %s", LazyFormat(calls.append, "x"))
+
+        assert calls == []
+
+    def test_evaluated_when_emitted(self, fresh_logging, tmp_path):
+        log_file = tmp_path / "app.log"
+        setup_logging(log_level="DEBUG", log_file=str(log_file), enable_console=False)
+
+        logging.getLogger("lazy").debug("payload %s", LazyFormat(sorted, [3, 1, 2]))
+        shutdown_logging()
+
+        assert "payload [1, 2, 3]" in log_file.read_text()
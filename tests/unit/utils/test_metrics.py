@@ -0,0 +1,118 @@
+"""
+Unit tests for the metrics registry
+"""
+
+import urllib.request
+
+import pytest
+
+from src.utils.metrics import MetricsRegistry, MetricsServer, record_stage_durations, write_textfile
+from src.utils.tracing import Tracer
+
+
+class TestMetrics:
+    """Test metric types and the exposition format"""
+
+    def test_counter_with_labels(self):
+        registry = MetricsRegistry()
+        queries = registry.counter('queries_total', "Queries sent", ['outcome'])
+
+        queries.inc(outcome='ok')
+        queries.inc(2, outcome='ok')
+        queries.inc(outcome='error')
+
+        assert queries.value(outcome='ok') == 3
+        assert 'queries_total{outcome="error"} 1' in registry.render()
+
+    def test_counter_rejects_decrease_and_wrong_labels(self):
+        counter = MetricsRegistry().counter('calls_total', "Calls", ['kind'])
+
+        with pytest.raises(ValueError):
+            counter.inc(-1, kind='read')
+        with pytest.raises(ValueError):
+            counter.inc(site='x')
+
+    def test_registry_returns_existing_metric(self):
+        registry = MetricsRegistry()
+
+        first = registry.counter('issues_total', "Issues")
+
+        assert registry.counter('issues_total', "Issues") is first
+        with pytest.raises(ValueError):
+            registry.gauge('issues_total', "Issues")
+
+    def test_gauge_function(self):
+        registry = MetricsRegistry()
+        registry.gauge('queue_depth', "Queued issues").set_function(lambda: 4)
+
+        assert 'queue_depth 4' in registry.render()
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram('latency_seconds', "Latency", buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.5, 0.7, 3.0):
+            latency.observe(value)
+
+        text = registry.render()
+        assert 'latency_seconds_bucket{le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{le="1"} 3' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+        assert 'latency_seconds_count 4' in text
+        assert 'latency_seconds_sum 4.25' in text
+
+    def test_help_and_type_lines(self):
+        registry = MetricsRegistry()
+        registry.counter('pushes_total', "Branches pushed").inc()
+
+        assert registry.render().startswith(
+            "# HELP pushes_total Branches pushed\n# TYPE pushes_total counter\npushes_total 1\n"
+        )
+
+
+class TestExposition:
+    """Test textfile and HTTP exposition"""
+
+    def test_write_textfile(self, tmp_path):
+        registry = MetricsRegistry()
+        registry.counter('cycles_total', "Cycles").inc()
+        path = tmp_path / "speculum.prom"
+
+        write_textfile(path, registry)
+
+        assert path.read_text() == registry.render()
+        assert [p.name for p in tmp_path.iterdir()] == ["speculum.prom"]
+
+    def test_http_server(self):
+        registry = MetricsRegistry()
+        registry.counter('served_total', "Served").inc(5)
+        server = MetricsServer(0, registry=registry)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics") as response:
+                body = response.read().decode()
+                content_type = response.headers['Content-Type']
+        finally:
+            server.close()
+
+        assert 'served_total 5' in body
+        assert content_type.startswith('text/plain; version=0.0.4')
+
+
+class TestStageDurations:
+    """Test feeding tracing spans into metrics"""
+
+    def test_spans_recorded_per_stage(self):
+        registry = MetricsRegistry()
+        tracer = Tracer()
+        record_stage_durations(tracer, registry)
+
+        with tracer.span("git.push"):
+            pass
+        with pytest.raises(RuntimeError):
+            with tracer.span("git.push"):
+                raise RuntimeError("rejected")
+
+        durations = registry.get('speculum_stage_duration_seconds')
+        errors = registry.get('speculum_stage_errors_total')
+        assert durations.count(stage="git.push") == 2
+        assert errors.value(stage="git.push") == 1
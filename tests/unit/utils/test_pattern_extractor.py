@@ -0,0 +1,77 @@
+"""
+Tests for the local pattern extractor
+"""
+
+from src.utils.pattern_extractor import extract_patterns
+
+
+SHA256 = 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'
+
+
+class TestExtractPatterns:
+
+    def test_indicator_kinds(self):
+        text = (f"Beacon to https://evil.example.com/gate.php, 203.0.113.7 and ops@Bad-Actor.net. "
+                f"Dropper {SHA256} exploits CVE-2024-3094.")
+
+        found = extract_patterns(text).by_kind()
+
+        assert found['url'] == ['https://evil.example.com/gate.php']
+        assert found['domain'] == ['evil.example.com']
+        assert found['ipv4'] == ['203.0.113.7']
+        assert found['email'] == ['ops@bad-actor.net']
+        assert found['sha256'] == [SHA256]
+        assert found['cve'] == ['CVE-2024-3094']
+
+    def test_defanged_indicators_are_refanged(self):
+        found = extract_patterns("C2 at hxxp://bad[.]example[.]org/x and 198.51.100[.]4").by_kind()
+
+        assert found['url'] == ['http://bad.example.org/x']
+        assert found['ipv4'] == ['198.51.100.4']
+
+    def test_entity_kinds(self):
+        text = ("On March 5, 2024 Acme Holdings paid $1.5 million to Globex Corp; "
+                "a second payment of 20,000 EUR followed on 2024-03-09.")
+
+        found = extract_patterns(text).by_kind()
+
+        assert found['date'] == ['March 5, 2024', '2024-03-09']
+        assert found['money'] == ['$1.5 million', '20,000 EUR']
+        assert found['organization'] == ['Acme Holdings', 'Globex Corp']
+
+    def test_lookalikes_are_not_indicators(self):
+        found = extract_patterns("See config.yaml, version 1.2.3.4.5 and the company inc. notes").by_kind()
+
+        assert found == {}
+
+    def test_values_are_distinct_in_order(self):
+        extraction = extract_patterns("10.0.0.2 then 10.0.0.1 then 10.0.0.2 again")
+
+        assert extraction.values('ipv4') == ['10.0.0.2', '10.0.0.1']
+        assert extraction.indicators == [('ipv4', '10.0.0.2'), ('ipv4', '10.0.0.1')]
+
+    def test_indicator_coverage(self):
+        title = "IOCs"
+        text = f"{title}\n\n- 203.0.113.7\n- {SHA256}\n- evil.example.com"
+        extraction = extract_patterns(text)
+
+        assert extraction.indicator_coverage(start=len(title) + 2) == 1.0
+        assert extraction.indicator_coverage() < 1.0
+        assert extract_patterns("Plain prose about 203.0.113.7 and more").indicator_coverage() < 0.5
+        assert extract_patterns("").indicator_coverage() == 0.0
+
+    def test_redact_and_resolve(self):
+        text = f"Host https://evil.example.com/a served {SHA256}; host https://evil.example.com/a again"
+        extraction = extract_patterns(text)
+
+        redacted = extraction.redact()
+
+        assert redacted == "Host [IOC-1] served [IOC-3]; host [IOC-1] again"
+        assert extraction.references()['[IOC-2]'] == ('domain', 'evil.example.com')
+        assert extraction.resolve("[IOC-1] delivers [IOC-3], not [IOC-9]") == (
+            f"https://evil.example.com/a delivers {SHA256}, not [IOC-9]")
+
+    def test_redact_from_offset(self):
+        extraction = extract_patterns("203.0.113.7\n\nsee 203.0.113.7")
+
+        assert extraction.redact(start=13) == "see [IOC-1]"
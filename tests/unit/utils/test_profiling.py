@@ -0,0 +1,79 @@
+"""
+Unit tests for CLI profiling
+"""
+
+import json
+import pstats
+import threading
+import time
+
+import pytest
+
+from src.utils.profiling import ProfileSession, active_session, profile_scope
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+class TestProfileSession:
+    """Test capturing and writing profiles"""
+
+    def test_writes_all_outputs(self, tmp_path):
+        with ProfileSession(tmp_path, "run", sample_interval_ms=1) as session:
+            _busy(0.05)
+
+        assert set(session.written) == {'pstats', 'collapsed_stacks', 'allocations', 'scopes'}
+        assert pstats.Stats(session.written['pstats']).total_calls > 0
+        lines = (tmp_path / "run.collapsed").read_text().splitlines()
+        assert lines and all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+        assert (tmp_path / "run.allocations.txt").read_text().startswith("Traced memory:")
+        assert active_session() is None
+
+    def test_attributes_worker_scopes(self, tmp_path):
+        def work(issue_number):
+            with profile_scope(f"issue-{issue_number}"):
+                _busy(0.03)
+
+        with ProfileSession(tmp_path, "batch", sample_interval_ms=1) as session:
+            threads = [threading.Thread(target=work, args=(n,)) for n in (1, 2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        scopes = json.loads((tmp_path / "batch.scopes.json").read_text())
+        assert set(scopes) == {"issue-1", "issue-2"}
+        assert scopes["issue-1"]['calls'] == 1
+        assert scopes["issue-1"]['cpu_seconds'] > 0
+        assert scopes["issue-1"]['samples'] > 0
+        collapsed = (tmp_path / "batch.collapsed").read_text()
+        assert any(line.startswith("issue-1;") for line in collapsed.splitlines())
+        functions = {func[2] for func in pstats.Stats(session.written['pstats']).stats}
+        assert "_busy" in functions
+
+    def test_write_while_running_keeps_profiling(self, tmp_path):
+        with ProfileSession(tmp_path, "final", sample_interval_ms=0) as session:
+            _busy(0.01)
+            midway = session.write(tmp_path, "midway")
+            _busy(0.01)
+
+        assert 'collapsed_stacks' not in midway
+        assert pstats.Stats(session.written['pstats']).total_calls > pstats.Stats(midway['pstats']).total_calls
+
+    def test_only_one_session_at_a_time(self, tmp_path):
+        with ProfileSession(tmp_path, "first", sample_interval_ms=0, trace_memory=False):
+            with pytest.raises(RuntimeError):
+                ProfileSession(tmp_path, "second").start()
+
+
+class TestProfileScope:
+    """Test scopes outside a session"""
+
+    def test_noop_without_session(self):
+        with profile_scope("issue-1"):
+            pass
+
+        assert active_session() is None
@@ -0,0 +1,156 @@
+"""
+Unit tests for tracing spans
+"""
+
+import json
+import threading
+
+import pytest
+
+from src.utils.tracing import Tracer, current_span, get_tracer, stage_statistics, traced
+
+
+class TestTracer:
+    """Test span recording"""
+
+    def test_nested_spans_link_to_parent(self):
+        tracer = Tracer()
+
+        with tracer.span("outer") as outer:
+            with tracer.span("inner", issue_number=7) as inner:
+                pass
+
+        assert inner.parent_id == outer.span_id
+        assert outer.parent_id is None
+        assert inner.attributes == {'issue_number': 7}
+        assert [s.name for s in tracer.spans()] == ["inner", "outer"]
+
+    def test_records_error_and_reraises(self):
+        tracer = Tracer()
+
+        with pytest.raises(KeyError):
+            with tracer.span("failing"):
+                raise KeyError("missing")
+
+        assert tracer.spans()[0].attributes['error'] == 'KeyError'
+
+    def test_spans_since_mark(self):
+        tracer = Tracer()
+        with tracer.span("before"):
+            pass
+
+        mark = tracer.mark()
+        with tracer.span("after"):
+            pass
+
+        assert [s.name for s in tracer.spans(mark)] == ["after"]
+
+    def test_buffer_drops_oldest_spans(self):
+        tracer = Tracer(max_spans=2)
+        mark = tracer.mark()
+
+        for name in ("a", "b", "c"):
+            with tracer.span(name):
+                pass
+
+        assert [s.name for s in tracer.spans(mark)] == ["b", "c"]
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = Tracer(enabled=False)
+
+        with tracer.span("ignored") as span:
+            span.set(bytes=1)
+
+        assert tracer.spans() == []
+
+    def test_threads_start_new_roots(self):
+        tracer = Tracer()
+
+        with tracer.span("main"):
+            worker = threading.Thread(target=self._run_span, args=(tracer,))
+            worker.start()
+            worker.join()
+
+        worker_span = next(s for s in tracer.spans() if s.name == "worker")
+        assert worker_span.parent_id is None
+
+    @staticmethod
+    def _run_span(tracer):
+        with tracer.span("worker"):
+            pass
+
+
+class TestExport:
+    """Test span export formats"""
+
+    def test_jsonl_export(self, tmp_path):
+        tracer = Tracer()
+        with tracer.span("git.commit", files=2):
+            pass
+
+        path = tmp_path / "trace.jsonl"
+        written = tracer.export(path)
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert written == 1
+        assert lines[0]['name'] == "git.commit"
+        assert lines[0]['attributes'] == {'files': 2}
+
+    def test_chrome_trace_export(self, tmp_path):
+        tracer = Tracer()
+        with tracer.span("ai.completion", model="gpt-4o"):
+            pass
+
+        path = tmp_path / "trace.json"
+        tracer.export(path)
+
+        event = json.loads(path.read_text())['traceEvents'][0]
+        assert event['ph'] == 'X'
+        assert event['cat'] == 'ai'
+        assert event['args'] == {'model': 'gpt-4o'}
+
+
+class TestStageStatistics:
+    """Test per-stage summaries"""
+
+    def test_nearest_rank_percentiles(self):
+        tracer = Tracer()
+        for duration_ms in range(1, 21):
+            with tracer.span("stage") as span:
+                pass
+            span.start_ns, span.end_ns = 0, duration_ms * 1_000_000
+
+        stats = stage_statistics(tracer.spans())['stage']
+
+        assert stats['count'] == 20
+        assert stats['p50_ms'] == 10
+        assert stats['p95_ms'] == 19
+        assert stats['max_ms'] == 20
+        assert stats['total_ms'] == 210
+
+    def test_orders_stages_by_total_time(self):
+        tracer = Tracer()
+        for name, duration_ms in (("fast", 1), ("slow", 50), ("fast", 1)):
+            with tracer.span(name) as span:
+                pass
+            span.start_ns, span.end_ns = 0, duration_ms * 1_000_000
+
+        assert list(stage_statistics(tracer.spans())) == ["slow", "fast"]
+
+
+class TestTraced:
+    """Test the decorator on the shared tracer"""
+
+    def test_decorated_function_sets_attributes(self):
+        @traced("test.decorated")
+        def work():
+            current_span().set(items=3)
+            return "done"
+
+        mark = get_tracer().mark()
+
+        assert work() == "done"
+        assert get_tracer().spans(mark)[-1].attributes == {'items': 3}
+
+    def test_current_span_outside_span_is_noop(self):
+        current_span().set(ignored=True)
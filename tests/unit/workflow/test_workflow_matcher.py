@@ -6,11 +6,14 @@ import pytest
 import yaml
 import tempfile
 import shutil
+from dataclasses import FrozenInstanceError, replace
 from pathlib import Path
 from unittest.mock import patch, Mock
 from datetime import datetime, timedelta
 
-from src.workflow.workflow_matcher import WorkflowMatcher, WorkflowInfo, WorkflowValidationError, WorkflowLoadError
+from src.workflow.workflow_matcher import (
+    WorkflowMatcher, WorkflowInfo, WorkflowValidationError, WorkflowLoadError, get_workflow_registry
+)
 
 
 class TestWorkflowMatcher:
@@ -198,16 +201,19 @@ class TestWorkflowMatcher:
         matcher = WorkflowMatcher(temp_workflow_dir)
         
         # Both workflows could match if we had overlapping labels
-        # For this test, we'll modify one workflow temporarily by finding the research workflow
-        research_workflow = None
-        for workflow in matcher._workflow_cache.values():
+        # For this test, replace the research workflow in this matcher only
+        research_path = None
+        for path, workflow in matcher._workflow_cache.items():
             if workflow.name == 'Research Analysis':
-                research_workflow = workflow
+                research_path = path
                 break
         
-        assert research_workflow is not None
+        assert research_path is not None
         # Add technical-review to research workflow to create overlap
-        research_workflow.trigger_labels.append('technical-review')
+        research_workflow = matcher._workflow_cache[research_path]
+        matcher._workflow_cache[research_path] = replace(
+            research_workflow, trigger_labels=[*research_workflow.trigger_labels, 'technical-review']
+        )
         
         labels = ['site-monitor', 'technical-review']
         matches = matcher.find_matching_workflows(labels)
@@ -382,7 +388,7 @@ class TestWorkflowInfo:
         )
         
         assert workflow.name == "Test Workflow"
-        assert workflow.trigger_labels == ["test"]
+        assert workflow.trigger_labels == ("test",)
     
     def test_workflow_info_creation_no_trigger_labels(self):
         """Test creating WorkflowInfo without trigger labels"""
@@ -412,4 +418,107 @@ class TestWorkflowInfo:
                 processing={},
                 validation={},
                 output={}
-            )
\ No newline at end of file
+            )
+
+
+VALID_WORKFLOW = {
+    'name': 'Research Analysis',
+    'version': '1.0.0',
+    'trigger_labels': ['research'],
+    'deliverables': [{'name': 'overview', 'title': 'Overview', 'description': 'Overview of findings'}]
+}
+
+
+class TestWorkflowRegistry:
+    """Test the process-wide workflow registry"""
+    
+    @pytest.fixture
+    def workflow_dir(self, tmp_path):
+        workflow_dir = tmp_path / "workflows"
+        workflow_dir.mkdir()
+        (workflow_dir / "research.yaml").write_text(yaml.dump(VALID_WORKFLOW))
+        return workflow_dir
+    
+    def test_matchers_share_one_parse(self, workflow_dir):
+        first = WorkflowMatcher(str(workflow_dir))
+        second = WorkflowMatcher(str(workflow_dir))
+        
+        stats = get_workflow_registry().stats
+        assert stats['parses'] == 1
+        assert stats['memory_hits'] == 1
+        assert first.get_workflow_by_name('Research Analysis') is second.get_workflow_by_name('Research Analysis')
+    
+    def test_snapshot_is_read_only(self, workflow_dir):
+        matcher = WorkflowMatcher(str(workflow_dir))
+        snapshot = get_workflow_registry().snapshot(
+            matcher.workflow_directory, [workflow_dir / "research.yaml"], matcher._parse_workflow_files
+        )
+        
+        with pytest.raises(TypeError):
+            snapshot.workflows['other'] = None
+        matcher._workflow_cache.clear()
+        assert len(snapshot.workflows) == 1
+    
+    def test_workflow_changes_do_not_leak_between_matchers(self, workflow_dir):
+        first = WorkflowMatcher(str(workflow_dir))
+        second = WorkflowMatcher(str(workflow_dir))
+        workflow = first.get_workflow_by_name('Research Analysis')
+        
+        with pytest.raises(FrozenInstanceError):
+            workflow.name = 'Renamed'
+        with pytest.raises(AttributeError):
+            workflow.trigger_labels.append('technical-review')
+        with pytest.raises(TypeError):
+            workflow.deliverables[0]['name'] = 'Renamed deliverable'
+        path = next(iter(first._workflow_cache))
+        first._workflow_cache[path] = replace(workflow, trigger_labels=['technical-review'])
+        
+        shared = second.get_workflow_by_name('Research Analysis')
+        assert shared.trigger_labels == tuple(VALID_WORKFLOW['trigger_labels'])
+        assert shared.deliverables[0]['name'] == VALID_WORKFLOW['deliverables'][0]['name']
+        assert second.find_matching_workflows(['site-monitor', 'technical-review']) == []
+    
+    def test_changed_file_is_reparsed(self, workflow_dir):
+        WorkflowMatcher(str(workflow_dir))
+        changed = dict(VALID_WORKFLOW, name='Renamed Analysis', description='A longer description')
+        (workflow_dir / "research.yaml").write_text(yaml.dump(changed))
+        
+        matcher = WorkflowMatcher(str(workflow_dir))
+        
+        assert get_workflow_registry().stats['parses'] == 2
+        assert matcher.get_workflow_by_name('Renamed Analysis') is not None
+    
+    def test_cold_start_skips_parsing(self, workflow_dir):
+        WorkflowMatcher(str(workflow_dir))
+        # A new process has an empty in-memory registry
+        get_workflow_registry().clear()
+        
+        with patch.object(WorkflowMatcher, '_parse_workflow_file') as parse:
+            matcher = WorkflowMatcher(str(workflow_dir))
+        
+        parse.assert_not_called()
+        assert get_workflow_registry().stats['disk_hits'] == 1
+        workflow = matcher.get_workflow_by_name('Research Analysis')
+        assert workflow.trigger_labels == ('research',)
+        assert workflow.path == str(workflow_dir / "research.yaml")
+    
+    def test_corrupt_cache_file_is_ignored(self, workflow_dir):
+        WorkflowMatcher(str(workflow_dir))
+        registry = get_workflow_registry()
+        for cache_file in registry.cache_dir.glob("*.json"):
+            cache_file.write_text("{not json")
+        registry.clear()
+        
+        matcher = WorkflowMatcher(str(workflow_dir))
+        
+        assert registry.stats['parses'] == 2
+        assert matcher.get_workflow_by_name('Research Analysis') is not None
+    
+    def test_failed_parses_are_not_cached(self, workflow_dir):
+        (workflow_dir / "broken.yaml").write_text("invalid: yaml: [")
+        WorkflowMatcher(str(workflow_dir))
+        WorkflowMatcher(str(workflow_dir))
+        
+        registry = get_workflow_registry()
+        assert registry.stats['parses'] == 2
+        assert not list(registry.cache_dir.glob("*.json"))